@@ -30,6 +30,7 @@ if TYPE_CHECKING:
         RateLimitError,
         ValidationError,
         WorkflowError,
+        WorkflowRejectedError,
     )
     from codeflow_engine.integrations.base import Integration
     from codeflow_engine.quality.metrics_collector import MetricsCollector
@@ -73,6 +74,7 @@ _LAZY_EXPORTS = {
     "RateLimitError": "codeflow_engine.exceptions:RateLimitError",
     "ValidationError": "codeflow_engine.exceptions:ValidationError",
     "WorkflowError": "codeflow_engine.exceptions:WorkflowError",
+    "WorkflowRejectedError": "codeflow_engine.exceptions:WorkflowRejectedError",
 }
 
 # Public API exports
@@ -105,6 +107,7 @@ __all__ = [
     "RateLimitError",
     "ValidationError",
     "WorkflowError",
+    "WorkflowRejectedError",
     # Utilities
     "configure_logging",
 ]
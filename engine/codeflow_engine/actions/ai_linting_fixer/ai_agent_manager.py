@@ -8,6 +8,7 @@ import json
 import logging
 from typing import Any
 
+from codeflow_engine.actions.ai_linting_fixer.context_extractor import CodeRegion
 from codeflow_engine.actions.ai_linting_fixer.detection import LintingIssue
 from codeflow_engine.actions.ai_linting_fixer.issue_converter import convert_detection_issues_to_model_issues
 from codeflow_engine.actions.ai_linting_fixer.specialists.base_specialist import AgentType
@@ -17,6 +18,9 @@ from codeflow_engine.actions.llm.manager import ActionLLMProviderManager
 
 logger = logging.getLogger(__name__)
 
+# Bump when the region prompt or patch format changes, to invalidate cached fixes
+REGION_PROMPT_VERSION = "region-patch-1"
+
 
 class AIAgentManager:
     """
@@ -114,6 +118,154 @@ class AIAgentManager:
             file_path, content, convert_detection_issues_to_model_issues(issues)
         )
 
+    def get_batch_user_prompt(
+        self, file_path: str, content: str, issues: list[LintingIssue]
+    ) -> str:
+        """
+        Generate a user prompt asking for fixes of several issues at once.
+
+        Args:
+            file_path: Path to the file being fixed
+            content: Current content of the file
+            issues: Issues to be fixed, each on a distinct line
+
+        Returns:
+            User prompt requesting a structured multi-fix response
+        """
+        issue_lines = "\n".join(
+            f"- Line {issue.line_number} [{issue.error_code}]: {issue.message}\n"
+            f"  Content: {issue.line_content}"
+            for issue in issues
+        )
+        response_format = (
+            '{"fixes": [{"line_number": <reported line>, "error_code": "<code>", '
+            '"fixed_code": "<replacement for that line>", "explanation": "<short reason>"}]}'
+        )
+        return f"""Fix the following issues in the Python file '{file_path}':
+
+{issue_lines}
+
+File content:
+```python
+{content}
+```
+
+Respond with JSON only, in this format:
+{response_format}
+
+Each "fixed_code" replaces exactly the reported line and may span several lines.
+Fix ONLY the listed issues and leave every other line unchanged.
+Omit any issue you cannot fix safely."""
+
+    def get_region_user_prompt(
+        self, file_path: str, region: CodeRegion, issues: list[LintingIssue]
+    ) -> str:
+        """
+        Generate a user prompt showing only the region of the file to fix.
+
+        Args:
+            file_path: Path to the file being fixed
+            region: Enclosing scope of the issues, with the imports block
+            issues: Issues to be fixed, all within the region
+
+        Returns:
+            User prompt requesting a line-range patch of the region
+        """
+        issue_lines = "\n".join(
+            f"- Line {issue.line_number} [{issue.error_code}]: {issue.message}"
+            for issue in issues
+        )
+        scope = f"{region.scope} '{region.name}'" if region.name else region.scope
+        imports = (
+            f"""Module imports, for reference only:
+```python
+{region.imports}
+```
+
+"""
+            if region.imports
+            else ""
+        )
+        lines = f"lines {region.start_line}-{region.end_line}"
+        response_format = (
+            '{"start_line": <first line replaced>, "end_line": <last line replaced>, '
+            '"replacement": "<new code for those lines, without line numbers>", '
+            '"explanation": "<short reason>"}'
+        )
+        return f"""Fix the following issues in the Python file '{file_path}':
+
+{issue_lines}
+
+{imports}Code of the {scope}, {lines}, each line prefixed with its number:
+```python
+{region.numbered_text()}
+```
+
+Respond with a patch as JSON only, in this format:
+{response_format}
+
+The replaced lines must lie within {lines}. Keep the original indentation.
+An empty "replacement" deletes the lines. Fix ONLY the listed issues and replace \
+as few lines as possible."""
+
+    def parse_patch_response(self, content: str) -> dict[str, Any]:
+        """
+        Parse a line-range patch response.
+
+        Args:
+            content: Raw AI response content
+
+        Returns:
+            Parsed response with ``success``, ``start_line``, ``end_line`` and
+            ``replacement``, or an error response
+        """
+        parsed = self._extract_json_response(content)
+        if not parsed:
+            return self._create_error_response("No JSON patch in response", content)
+
+        start_line = parsed.get("start_line")
+        end_line = parsed.get("end_line")
+        replacement = parsed.get("replacement")
+        if not (
+            isinstance(start_line, int)
+            and isinstance(end_line, int)
+            and not isinstance(start_line, bool)
+            and not isinstance(end_line, bool)
+            and start_line <= end_line
+            and isinstance(replacement, str)
+        ):
+            return self._create_error_response("Malformed patch in response", content)
+        return {**parsed, "success": True}
+
+    def parse_batch_response(self, content: str) -> dict[int, dict[str, Any]]:
+        """
+        Parse a structured multi-fix response.
+
+        Args:
+            content: Raw AI response content
+
+        Returns:
+            Mapping of line number to its fix; malformed entries are dropped
+        """
+        parsed = self._extract_json_response(content)
+        if not parsed or not isinstance(parsed.get("fixes"), list):
+            return {}
+
+        fixes: dict[int, dict[str, Any]] = {}
+        for fix in parsed["fixes"]:
+            if not isinstance(fix, dict):
+                continue
+            line_number = fix.get("line_number")
+            fixed_code = fix.get("fixed_code")
+            if (
+                isinstance(line_number, int)
+                and not isinstance(line_number, bool)
+                and isinstance(fixed_code, str)
+                and fixed_code.strip()
+            ):
+                fixes[line_number] = fix
+        return fixes
+
     def parse_ai_response(self, content: str) -> dict[str, Any]:
         """
         Parse the AI response and extract the fix information.
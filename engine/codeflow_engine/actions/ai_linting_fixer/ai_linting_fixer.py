@@ -5,14 +5,20 @@ A comprehensive AI-powered linting fixer that automatically detects and fixes Py
 using advanced language models and specialized agents.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import threading
 import time
 from typing import Any
 
 from codeflow_engine.actions.ai_linting_fixer.ai_agent_manager import AIAgentManager
 from codeflow_engine.actions.ai_linting_fixer.code_analyzer import CodeAnalyzer
 from codeflow_engine.actions.ai_linting_fixer.detection import IssueDetector
+from codeflow_engine.actions.ai_linting_fixer.deterministic_fixer import (
+    ROUTE_AI,
+    DeterministicFixer,
+)
 from codeflow_engine.actions.ai_linting_fixer.display import (
     AILintingFixerDisplay,
     DisplayConfig,
@@ -181,6 +187,7 @@ class AILintingFixer:
                 "AI agent manager not initialized - no LLM provider available"
             )
         self.file_manager = FileManager()
+        self.deterministic_fixer = DeterministicFixer(self.file_manager)
 
         # Initialize issue fixer only if AI agent manager is available
         if self.ai_agent_manager is not None:
@@ -206,6 +213,18 @@ class AILintingFixer:
             logger.warning("Failed to initialize database: %s", e)
             self.database = None
 
+        # Initialize the persistent fix cache next to the interaction database
+        try:
+            from codeflow_engine.actions.ai_linting_fixer.fix_cache import AIFixCache
+
+            if self.database is not None:
+                self.fix_cache: AIFixCache | None = AIFixCache(self.database.db_path)
+            else:
+                self.fix_cache = AIFixCache()
+        except Exception as e:
+            logger.warning("Failed to initialize fix cache: %s", e)
+            self.fix_cache = None
+
         logger.info("AI Linting Fixer initialized with modular components")
 
     def _analyze_error(self, error: Exception) -> dict[str, Any]:
@@ -484,110 +503,79 @@ class AILintingFixer:
                 backup_count = self.file_manager.create_backups(unique_files)
                 self.display.error.show_info(f"Created {backup_count} backup files")
 
-            # Step 3: Check AI availability before processing
-            if not self.is_ai_available():
+            # Limit to max_fixes
+            issues_to_process = filtered_issues[: inputs.max_fixes]
+
+            # Step 3: Fix mechanical issues without the LLM
+            deterministic_fixed: list[Any] = []
+            deterministic_files: set[str] = set()
+            if getattr(inputs, "deterministic_fixes", True):
+                deterministic = self.deterministic_fixer.fix_issues(
+                    issues_to_process, dry_run=getattr(inputs, "dry_run", False)
+                )
+                deterministic_fixed = deterministic.fixed
+                deterministic_files = deterministic.files_modified
+                issues_to_process = deterministic.remaining
+                for error_code, routes in deterministic.routes.items():
+                    for route, count in routes.items():
+                        self.performance_tracker.record_fix_route(error_code, route, count)
+                if deterministic_fixed:
+                    self.display.error.show_info(
+                        f"Fixed {len(deterministic_fixed)} issues without AI; "
+                        f"{len(issues_to_process)} left for AI specialists"
+                    )
+            else:
+                for issue in issues_to_process:
+                    self.performance_tracker.record_fix_route(issue.error_code, ROUTE_AI)
+
+            # Step 4: Check AI availability before processing
+            if issues_to_process and not self.is_ai_available():
                 self.display.error.show_warning(self.get_ai_availability_message())
                 return AILintingFixerOutputs(
                     success=False,
                     total_issues_found=len(issues),
-                    issues_fixed=0,
-                    files_modified=[],
+                    issues_fixed=len(deterministic_fixed),
+                    files_modified=(
+                        []
+                        if getattr(inputs, "dry_run", False)
+                        else sorted(deterministic_files)
+                    ),
                     summary="AI features not available - no LLM providers configured",
                     total_issues_detected=len(issues),
-                    issues_processed=0,
-                    issues_failed=len(filtered_issues),
+                    issues_processed=len(deterministic_fixed),
+                    issues_failed=len(filtered_issues) - len(deterministic_fixed),
                     total_duration=time.time() - start_time,
                     backup_files_created=backup_count,
                     agent_stats={},
                     queue_stats={},
+                    fix_routing=self.performance_tracker.get_fix_routes(),
                     session_id=session_id,
                     processing_mode="detection_only",
                     dry_run=getattr(inputs, "dry_run", False),
                 )
 
-            # Step 4: Process issues with AI
+            # Step 5: Process the remaining issues with AI
             self.display.operation.show_processing_start(len(filtered_issues))
-
-            # Limit to max_fixes
-            issues_to_process = filtered_issues[: inputs.max_fixes]
             self.display.error.show_info(
                 f"Starting AI-powered fix for {len(issues_to_process)} issues"
             )
 
-            processed_issues = []
-            failed_issues = []
-            files_modified = set()
-
-            for i, issue in enumerate(issues_to_process, 1):
-                self.display.operation.show_processing_progress(
-                    i,
-                    len(issues_to_process),
-                    convert_detection_issue_to_model_issue(issue),
+            fix_cache = self.fix_cache if getattr(inputs, "use_fix_cache", True) else None
+            if self.issue_fixer is not None:
+                self.issue_fixer.fix_cache = fix_cache
+            processed_issues, failed_issues, files_modified = self._process_issues(
+                issues_to_process, inputs
+            )
+            processed_issues = deterministic_fixed + processed_issues
+            if not getattr(inputs, "dry_run", False):
+                files_modified |= deterministic_files
+            cache_stats = fix_cache.get_stats() if fix_cache is not None else {}
+            if cache_stats:
+                self.display.error.show_info(
+                    f"Fix cache: {cache_stats['hits']} hits, "
+                    f"{cache_stats['misses']} misses"
                 )
 
-                try:
-                    # Read current file content
-                    content = self.file_manager.read_file(issue.file_path)
-                    if content is None:
-                        self.display.error.show_warning(
-                            f"Could not read file: {issue.file_path}"
-                        )
-                        failed_issues.append(issue)
-                        continue
-
-                    # Fix the issue (with additional safety check)
-                    if self.issue_fixer is None:
-                        self.display.error.show_error(
-                            "Issue fixer not available - AI features not configured"
-                        )
-                        failed_issues.append(issue)
-                        continue
-
-                    result = self.issue_fixer.fix_single_issue(
-                        file_path=issue.file_path,
-                        content=content,
-                        issue=convert_detection_issue_to_model_issue(issue),
-                        provider=inputs.provider,
-                        model=inputs.model,
-                    )
-
-                    if result.get("success", False):
-                        # Write the fixed content
-                        if not hasattr(inputs, "dry_run") or not inputs.dry_run:
-                            success = self.file_manager.write_file(
-                                issue.file_path, result["content"]
-                            )
-                            if success:
-                                files_modified.add(issue.file_path)
-                                processed_issues.append(issue)
-                                confidence = result.get("confidence", 0.0)
-                                self.display.error.show_info(
-                                    f"✅ Fixed {issue.error_code} in {issue.file_path} "
-                                    f"(confidence: {confidence:.3f})"
-                                )
-                            else:
-                                failed_issues.append(issue)
-                                self.display.error.show_error(
-                                    f"Failed to write fixed content to {issue.file_path}"
-                                )
-                        else:
-                            processed_issues.append(issue)
-                            self.display.error.show_info(
-                                f"🔍 Would fix {issue.error_code} in {issue.file_path} (dry run)"
-                            )
-                    else:
-                        failed_issues.append(issue)
-                        error_msg = result.get("error", "Unknown error")
-                        self.display.error.show_warning(
-                            f"❌ Failed to fix {issue.error_code}: {error_msg}"
-                        )
-
-                except Exception as e:
-                    failed_issues.append(issue)
-                    self.display.error.show_error(
-                        f"Error processing {issue.error_code}: {e!s}"
-                    )
-
             # Show processing results
             self.display.operation.show_processing_results(
                 len(processed_issues), len(failed_issues)
@@ -632,6 +620,8 @@ class AILintingFixer:
                 backup_files_created=backup_count,
                 agent_stats=performance_summary.get("agent_performance", {}),
                 queue_stats=performance_summary.get("queue_statistics", {}),
+                cache_stats=cache_stats,
+                fix_routing=self.performance_tracker.get_fix_routes(),
                 session_id=session_id,
                 processing_mode="standalone",
                 dry_run=getattr(inputs, "dry_run", False),
@@ -663,6 +653,232 @@ class AILintingFixer:
             # Cleanup
             logger.info("AI Linting Fixer resources cleaned up")
 
+    def _process_issues(
+        self, issues: list[Any], inputs: AILintingFixerInputs
+    ) -> tuple[list[Any], list[Any], set[str]]:
+        """
+        Fix issues, working on different files concurrently.
+
+        Issues of one file are fixed in order by a single worker, each seeing the
+        edits of the previous ones, so the outcome matches sequential processing.
+        With ``batch_fixes``, compatible issues of a file share one LLM request.
+        At most ``max_workers`` files are processed at once and at most
+        ``max_concurrent_llm_requests`` fix requests are in flight.
+
+        Args:
+            issues: Detected issues to fix, in processing order
+            inputs: Fixer inputs
+
+        Returns:
+            Tuple of (fixed issues, failed issues, modified file paths), with
+            issues in their original order
+        """
+        issues_by_file: dict[str, list[tuple[int, Any]]] = {}
+        for index, issue in enumerate(issues):
+            issues_by_file.setdefault(issue.file_path, []).append((index, issue))
+
+        llm_slots = threading.BoundedSemaphore(
+            max(1, getattr(inputs, "max_concurrent_llm_requests", 1))
+        )
+        max_workers = min(max(1, getattr(inputs, "max_workers", 1)), len(issues_by_file))
+
+        def process_file(file_issues: list[tuple[int, Any]]) -> list[tuple[int, bool]]:
+            if getattr(inputs, "batch_fixes", False) and len(file_issues) > 1:
+                return self._process_file_batched(file_issues, len(issues), inputs, llm_slots)
+            # (original line, lines added) of every fix written to the file
+            line_shifts: list[tuple[int, int]] = []
+            return [
+                (
+                    index,
+                    self._process_issue(
+                        index + 1, len(issues), issue, inputs, llm_slots, line_shifts
+                    ),
+                )
+                for index, issue in file_issues
+            ]
+
+        if max_workers <= 1:
+            file_results = [process_file(file_issues) for file_issues in issues_by_file.values()]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="ai-lint-fixer"
+            ) as executor:
+                file_results = list(executor.map(process_file, issues_by_file.values()))
+
+        outcomes = dict(result for results in file_results for result in results)
+        processed_issues = [issue for i, issue in enumerate(issues) if outcomes[i]]
+        failed_issues = [issue for i, issue in enumerate(issues) if not outcomes[i]]
+        dry_run = getattr(inputs, "dry_run", False)
+        files_modified = (
+            set() if dry_run else {issue.file_path for issue in processed_issues}
+        )
+        return processed_issues, failed_issues, files_modified
+
+    def _process_file_batched(
+        self,
+        file_issues: list[tuple[int, Any]],
+        total: int,
+        inputs: AILintingFixerInputs,
+        llm_slots: threading.BoundedSemaphore,
+    ) -> list[tuple[int, bool]]:
+        """
+        Fix the issues of one file with batched LLM requests and write it once.
+
+        Args:
+            file_issues: Issues of the file with their positions in the run
+            total: Number of issues being processed
+            inputs: Fixer inputs
+            llm_slots: Semaphore bounding concurrent LLM requests
+
+        Returns:
+            (position, fixed) pairs for the file's issues
+        """
+        file_path = file_issues[0][1].file_path
+        model_issues = [convert_detection_issue_to_model_issue(issue) for _, issue in file_issues]
+        for (index, _), model_issue in zip(file_issues, model_issues, strict=True):
+            self.display.operation.show_processing_progress(index + 1, total, model_issue)
+
+        failed = [(index, False) for index, _ in file_issues]
+        try:
+            content = self.file_manager.read_file(file_path)
+            if content is None:
+                self.display.error.show_warning(f"Could not read file: {file_path}")
+                return failed
+            if self.issue_fixer is None:
+                self.display.error.show_error(
+                    "Issue fixer not available - AI features not configured"
+                )
+                return failed
+
+            with llm_slots:
+                result = self.issue_fixer.fix_issues_batched(
+                    file_path, content, model_issues, inputs.provider, inputs.model
+                )
+
+            dry_run = getattr(inputs, "dry_run", False)
+            if any(result["outcomes"]) and not dry_run:
+                if not self.file_manager.write_file(file_path, result["content"]):
+                    self.display.error.show_error(
+                        f"Failed to write fixed content to {file_path}"
+                    )
+                    return failed
+        except Exception as e:
+            self.display.error.show_error(f"Error processing {file_path}: {e!s}")
+            return failed
+
+        for (_, issue), fixed in zip(file_issues, result["outcomes"], strict=True):
+            if not fixed:
+                self.display.error.show_warning(f"❌ Failed to fix {issue.error_code}")
+            elif dry_run:
+                self.display.error.show_info(
+                    f"🔍 Would fix {issue.error_code} in {file_path} (dry run)"
+                )
+            else:
+                self.display.error.show_info(f"✅ Fixed {issue.error_code} in {file_path}")
+        self.display.error.show_info(
+            f"Fixed {sum(result['outcomes'])} of {len(file_issues)} issues in "
+            f"{file_path} with {result['requests']} LLM requests"
+        )
+        return [
+            (index, fixed)
+            for (index, _), fixed in zip(file_issues, result["outcomes"], strict=True)
+        ]
+
+    def _process_issue(
+        self,
+        position: int,
+        total: int,
+        issue: Any,
+        inputs: AILintingFixerInputs,
+        llm_slots: threading.BoundedSemaphore,
+        line_shifts: list[tuple[int, int]] | None = None,
+    ) -> bool:
+        """
+        Fix one issue against the current content of its file.
+
+        Args:
+            position: 1-based position of the issue, for progress display
+            total: Number of issues being processed
+            issue: Detected issue
+            inputs: Fixer inputs
+            llm_slots: Semaphore bounding concurrent LLM requests
+            line_shifts: (original line, lines added) of earlier fixes written to
+                the same file; the issue is moved by them and its own fix appended
+
+        Returns:
+            True if the issue was fixed (or would be, in dry-run mode)
+        """
+        model_issue = convert_detection_issue_to_model_issue(issue)
+        offset = sum(
+            delta for line, delta in line_shifts or () if line < issue.line_number
+        )
+        if offset:
+            model_issue = model_issue.model_copy(
+                update={"line_number": model_issue.line_number + offset}
+            )
+        self.display.operation.show_processing_progress(position, total, model_issue)
+
+        try:
+            # Read current file content
+            content = self.file_manager.read_file(issue.file_path)
+            if content is None:
+                self.display.error.show_warning(f"Could not read file: {issue.file_path}")
+                return False
+
+            # Fix the issue (with additional safety check)
+            if self.issue_fixer is None:
+                self.display.error.show_error(
+                    "Issue fixer not available - AI features not configured"
+                )
+                return False
+
+            with llm_slots:
+                result = self.issue_fixer.fix_single_issue(
+                    file_path=issue.file_path,
+                    content=content,
+                    issue=model_issue,
+                    provider=inputs.provider,
+                    model=inputs.model,
+                )
+
+            if not result.get("success", False):
+                error_msg = result.get("error", "Unknown error")
+                self.display.error.show_warning(
+                    f"❌ Failed to fix {issue.error_code}: {error_msg}"
+                )
+                return False
+
+            if getattr(inputs, "dry_run", False):
+                self.display.error.show_info(
+                    f"🔍 Would fix {issue.error_code} in {issue.file_path} (dry run)"
+                )
+                return True
+
+            # Write the fixed content
+            if not self.file_manager.write_file(issue.file_path, result["content"]):
+                self.display.error.show_error(
+                    f"Failed to write fixed content to {issue.file_path}"
+                )
+                return False
+            if line_shifts is not None:
+                line_shifts.append(
+                    (
+                        issue.line_number,
+                        result["content"].count("\n") - content.count("\n"),
+                    )
+                )
+
+            confidence = result.get("confidence", 0.0)
+            self.display.error.show_info(
+                f"✅ Fixed {issue.error_code} in {issue.file_path} "
+                f"(confidence: {confidence:.3f})"
+            )
+            return True
+
+        except Exception as e:
+            self.display.error.show_error(f"Error processing {issue.error_code}: {e!s}")
+            return False
+
     def __enter__(self) -> "AILintingFixer":
         """Context manager entry."""
         return self
@@ -683,6 +899,10 @@ class AILintingFixer:
             if hasattr(self.performance_tracker, "export_metrics"):
                 self.performance_tracker.export_metrics()
 
+            # Commit interactions still buffered by the database writer
+            if self.database is not None:
+                self.database.flush()
+
             # Use display module for user-facing messages
             if self.display:
                 self.display.error.show_info("🔧 AI Linting Fixer resources cleaned up")
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 class FileComplexityAnalyzer:
     """Analyzes file complexity using AST parsing."""
 
+    # Bump when analysis results change, so persisted cache entries miss
+    ANALYZER_VERSION = "1"
+
     def __init__(self, cache_manager: IntelligentCache | None = None):
         self.cache_manager = cache_manager or IntelligentCache(
             max_size_mb=50, default_ttl_seconds=1800
@@ -25,9 +28,9 @@ class FileComplexityAnalyzer:
 
     def analyze_file_complexity(self, file_path: str, content: str) -> dict[str, Any]:
         """Analyze file complexity with caching support."""
-        # Create stable, collision-resistant cache key using SHA-256
+        # Results depend only on the content, so identical files share an entry
         content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-        cache_key = f"complexity_analysis:{file_path}:{len(content)}:{content_hash}"
+        cache_key = f"complexity_analysis:v{self.ANALYZER_VERSION}:{content_hash}"
 
         # Try to get from cache first
         cached_result = self.cache_manager.get(cache_key)
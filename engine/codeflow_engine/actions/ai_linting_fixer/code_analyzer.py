@@ -146,6 +146,85 @@ class CodeAnalyzer:
             logger.debug(f"Error analyzing imports: {e}")
             return {"standard_library": [], "third_party": [], "local": []}
 
+    def find_enclosing_scopes(
+        self, content: str, line_number: int
+    ) -> list[dict[str, Any]]:
+        """
+        Find the functions and classes enclosing a line.
+
+        Args:
+            content: Python source
+            line_number: 1-based line number
+
+        Returns:
+            Scopes outermost first, each with ``kind`` ("function" or "class"),
+            ``name``, ``start_line`` (including decorators) and ``end_line``;
+            empty if the line is at module level or the source does not parse
+        """
+        try:
+            tree = ast.parse(content)
+        except Exception as e:
+            logger.debug(f"Error finding enclosing scopes: {e}")
+            return []
+
+        scopes = []
+        nodes = list(ast.iter_child_nodes(tree))
+        while nodes:
+            node = nodes.pop()
+            if not isinstance(
+                node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+            ):
+                nodes.extend(ast.iter_child_nodes(node))
+                continue
+            start_line = min(
+                [node.lineno, *(decorator.lineno for decorator in node.decorator_list)]
+            )
+            end_line = node.end_lineno or node.lineno
+            if start_line <= line_number <= end_line:
+                scopes.append(
+                    {
+                        "kind": "class" if isinstance(node, ast.ClassDef) else "function",
+                        "name": node.name,
+                        "start_line": start_line,
+                        "end_line": end_line,
+                    }
+                )
+                # Only the children of an enclosing scope can enclose the line too
+                nodes = list(ast.iter_child_nodes(node))
+        return scopes
+
+    def find_imports_block(self, content: str) -> tuple[int, int] | None:
+        """
+        Find the module-level imports block.
+
+        The block runs from the first to the last top-level import preceding
+        the first top-level function or class, so guarded imports and module
+        setup between imports are included.
+
+        Args:
+            content: Python source
+
+        Returns:
+            (first line, last line) of the block, or None if there are no imports
+        """
+        try:
+            tree = ast.parse(content)
+        except Exception as e:
+            logger.debug(f"Error finding imports block: {e}")
+            return None
+
+        block: tuple[int, int] | None = None
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+                break
+            has_import = any(
+                isinstance(child, ast.Import | ast.ImportFrom) for child in ast.walk(node)
+            )
+            if has_import:
+                end_line = node.end_lineno or node.lineno
+                block = (block[0] if block else node.lineno, end_line)
+        return block
+
     def count_lines_of_code(self, content: str) -> dict[str, int]:
         """Count different types of lines in the code."""
         lines = content.split("\n")
@@ -0,0 +1,241 @@
+"""
+Context Extractor Module
+
+Extracts the part of a file an LLM needs to see to fix one issue, and applies
+the line-range patches returned for such a region.
+"""
+
+from dataclasses import dataclass
+import logging
+import re
+from typing import Any
+
+from codeflow_engine.actions.ai_linting_fixer.code_analyzer import CodeAnalyzer
+
+
+logger = logging.getLogger(__name__)
+
+# Codes fixed inside the imports block
+IMPORT_SCOPE_CODES = ("F401", "E401", "E402", "I001", "I002", "UP035", "TID252")
+# Codes fixed on the reported line and its immediate neighbours
+LINE_SCOPE_CODES = ("E2", "E3", "E501", "E70", "E71", "W2", "W3", "W6")
+# Everything else is fixed within the enclosing function or class
+
+LINE_WINDOW = 3  # lines shown around the issue for line-scoped codes
+MAX_REGION_LINES = 120  # larger scopes are narrowed to a window around the issue
+
+
+@dataclass
+class CodeRegion:
+    """A contiguous range of lines sent to the LLM as the editable context."""
+
+    start_line: int
+    end_line: int
+    text: str
+    scope: str  # "function", "class", "imports" or "lines"
+    name: str | None = None
+    imports: str = ""  # read-only imports block shown alongside the region
+
+    def contains(self, start_line: int, end_line: int) -> bool:
+        """Check whether a line range lies within the region."""
+        return self.start_line <= start_line <= end_line <= self.end_line
+
+    def numbered_text(self) -> str:
+        """Get the region text with each line prefixed by its line number."""
+        width = len(str(self.end_line))
+        return "\n".join(
+            f"{line_number:>{width}}| {line}"
+            for line_number, line in enumerate(
+                self.text.split("\n"), start=self.start_line
+            )
+        )
+
+
+class ContextExtractor:
+    """Selects the enclosing scope of an issue, sized by its error code."""
+
+    def __init__(
+        self,
+        code_analyzer: CodeAnalyzer | None = None,
+        line_window: int = LINE_WINDOW,
+        max_region_lines: int = MAX_REGION_LINES,
+    ):
+        """
+        Initialize the context extractor.
+
+        Args:
+            code_analyzer: Analyzer used to locate scopes and the imports block
+            line_window: Lines of context around line-scoped issues
+            max_region_lines: Largest scope sent whole
+        """
+        self.code_analyzer = code_analyzer or CodeAnalyzer()
+        self.line_window = line_window
+        self.max_region_lines = max_region_lines
+
+    @staticmethod
+    def scope_for_code(error_code: str) -> str:
+        """
+        Get the kind of region needed to fix an error code.
+
+        Args:
+            error_code: Linter error code
+
+        Returns:
+            "imports", "lines" or "function"
+        """
+        if error_code.startswith(IMPORT_SCOPE_CODES):
+            return "imports"
+        if error_code.startswith(LINE_SCOPE_CODES):
+            return "lines"
+        return "function"
+
+    def extract(self, content: str, issue: Any) -> CodeRegion:
+        """
+        Extract the region needed to fix an issue.
+
+        Args:
+            content: Current file content
+            issue: Issue with ``line_number``, ``error_code`` and optionally
+                ``function_name`` / ``class_name`` context
+
+        Returns:
+            The region to send to the LLM
+        """
+        lines = content.split("\n")
+        line_number = min(max(issue.line_number, 1), len(lines))
+        scope = self.scope_for_code(issue.error_code)
+        imports_block = self.code_analyzer.find_imports_block(content)
+
+        if scope == "imports":
+            if imports_block and imports_block[0] <= line_number <= imports_block[1]:
+                return self._region(lines, *imports_block, "imports")
+            return self._window(lines, line_number, self.line_window)
+        if scope == "lines":
+            return self._window(lines, line_number, self.line_window)
+
+        region = None
+        scopes = self.code_analyzer.find_enclosing_scopes(content, line_number)
+        if not scopes:
+            scopes = self._scopes_from_context(lines, line_number, issue)
+        # Innermost scope small enough to send whole
+        for enclosing in reversed(scopes):
+            size = enclosing["end_line"] - enclosing["start_line"] + 1
+            if size <= self.max_region_lines:
+                region = self._region(
+                    lines,
+                    enclosing["start_line"],
+                    enclosing["end_line"],
+                    enclosing["kind"],
+                    enclosing["name"],
+                )
+                break
+        if region is None:
+            radius = self.line_window if not scopes else self.max_region_lines // 4
+            region = self._window(lines, line_number, radius)
+
+        if imports_block and imports_block[1] < region.start_line:
+            region.imports = "\n".join(lines[imports_block[0] - 1 : imports_block[1]])
+        logger.debug(
+            "Using %s region %d-%d of %d lines for %s",
+            region.scope,
+            region.start_line,
+            region.end_line,
+            len(lines),
+            issue.error_code,
+        )
+        return region
+
+    def apply_patch(
+        self,
+        content: str,
+        region: CodeRegion,
+        start_line: int,
+        end_line: int,
+        replacement: str,
+    ) -> str:
+        """
+        Replace a line range of the region.
+
+        Args:
+            content: File content the region was extracted from
+            region: Region the patch was produced for
+            start_line: First replaced line (1-based)
+            end_line: Last replaced line (inclusive)
+            replacement: New code for the range; empty to delete the lines
+
+        Returns:
+            The patched content
+
+        Raises:
+            ValueError: If the range is not within the region
+        """
+        if not region.contains(start_line, end_line):
+            msg = (
+                f"Patch lines {start_line}-{end_line} are outside the region "
+                f"{region.start_line}-{region.end_line}"
+            )
+            raise ValueError(msg)
+
+        lines = content.split("\n")
+        new_lines = replacement.removesuffix("\n").split("\n") if replacement else []
+        lines[start_line - 1 : end_line] = new_lines
+        return "\n".join(lines)
+
+    @staticmethod
+    def _region(
+        lines: list[str],
+        start_line: int,
+        end_line: int,
+        scope: str,
+        name: str | None = None,
+    ) -> CodeRegion:
+        return CodeRegion(
+            start_line=start_line,
+            end_line=end_line,
+            text="\n".join(lines[start_line - 1 : end_line]),
+            scope=scope,
+            name=name,
+        )
+
+    def _window(self, lines: list[str], line_number: int, radius: int) -> CodeRegion:
+        start_line = max(1, line_number - radius)
+        end_line = min(len(lines), line_number + radius)
+        return self._region(lines, start_line, end_line, "lines")
+
+    @staticmethod
+    def _scopes_from_context(
+        lines: list[str], line_number: int, issue: Any
+    ) -> list[dict[str, Any]]:
+        """Locate the scope named by the issue context when the file does not parse."""
+        scopes = []
+        for kind, keyword, name in (
+            ("class", "class", getattr(issue, "class_name", None)),
+            ("function", "(?:async +)?def", getattr(issue, "function_name", None)),
+        ):
+            if not name:
+                continue
+            header = re.compile(rf"^(\s*){keyword}\s+{re.escape(name)}\b")
+            for index in range(line_number - 1, -1, -1):
+                match = header.match(lines[index])
+                if not match:
+                    continue
+                indent = len(match.group(1))
+                end_line = len(lines)
+                for offset, line in enumerate(lines[index + 1 :], start=index + 2):
+                    if line.strip() and len(line) - len(line.lstrip()) <= indent:
+                        end_line = offset - 1
+                        break
+                while end_line > index + 1 and not lines[end_line - 1].strip():
+                    end_line -= 1
+                if end_line >= line_number:
+                    scopes.append(
+                        {
+                            "kind": kind,
+                            "name": name,
+                            "start_line": index + 1,
+                            "end_line": end_line,
+                        }
+                    )
+                break
+        return sorted(scopes, key=lambda item: item["start_line"])
+
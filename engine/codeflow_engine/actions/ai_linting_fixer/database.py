@@ -5,30 +5,188 @@ Handles AI interaction logging, performance metrics, and full-text search
 for the modular AI linting system.
 """
 
+import atexit
 import json
 import logging
+import queue
 import sqlite3
+import threading
+import time
 from datetime import UTC, datetime
+from itertools import groupby
 from pathlib import Path
 from typing import Any
 
+from codeflow_engine.actions.ai_linting_fixer.interaction_blobs import (
+    BODY_FIELDS,
+    HASH_COLUMNS,
+    EncodedBody,
+    delete_orphan_bodies,
+    encode_body,
+    init_blob_tables,
+    load_bodies,
+    write_bodies,
+)
+from codeflow_engine.actions.ai_linting_fixer.interaction_rollups import (
+    LATENCY_BUCKET_COLUMNS,
+    init_rollup_tables,
+    latency_bucket_labels,
+    rebuild_rollups,
+    remove_rollups_before,
+    update_rollups,
+)
 from codeflow_engine.actions.ai_linting_fixer.queue_manager import IssueQueueManager
 from codeflow_engine.actions.ai_linting_fixer.reporting import \
     get_database_info as _get_db_info
+from codeflow_engine.actions.ai_linting_fixer.sqlite_connections import (
+    DEFAULT_SYNCHRONOUS,
+    ThreadLocalConnections,
+    open_connection,
+)
+from codeflow_engine.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WRITE_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL_MS = 250
+DEFAULT_MAX_PENDING_WRITES = 10000
+LEGACY_MIGRATION_BATCH_SIZE = 500
+
+# Fields of an interaction as returned by search and export
+INTERACTION_FIELDS = (
+    "id",
+    "timestamp",
+    "file_path",
+    "issue_type",
+    "issue_details",
+    "provider_used",
+    "model_used",
+    "system_prompt",
+    "user_prompt",
+    "ai_response",
+    "fix_successful",
+    "confidence_score",
+    "fixed_codes",
+    "error_message",
+    "syntax_valid_before",
+    "syntax_valid_after",
+    "file_size_chars",
+    "prompt_tokens",
+    "response_tokens",
+    "processing_duration",
+    "api_response_time",
+    "queue_wait_time",
+    "file_complexity_score",
+    "parallel_worker_id",
+    "retry_count",
+    "memory_usage_mb",
+    "tokens_per_second",
+    "agent_type",
+)
+
+_INSERT_INTERACTION = """
+    INSERT INTO ai_interactions (
+        timestamp, file_path, issue_type, issue_details,
+        provider_used, model_used, system_prompt_hash, user_prompt_hash,
+        ai_response_hash, fix_successful, confidence_score,
+        fixed_codes, error_message, syntax_valid_before,
+        syntax_valid_after, file_size_chars, prompt_tokens,
+        response_tokens, processing_duration, api_response_time,
+        queue_wait_time, file_complexity_score,
+        parallel_worker_id, retry_count, memory_usage_mb,
+        tokens_per_second, agent_type
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+              ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-class AIInteractionDB:
-    """Database for storing detailed AI interactions with full-text search."""
+# Full-text indexed fields, as columns of interaction_search_fts
+SEARCH_FIELDS = (*BODY_FIELDS, "issue_type", "file_path")
 
-    def __init__(self, db_path: str = "ai_linting_interactions.db"):
+_INSERT_SESSION = """
+    INSERT INTO performance_sessions (
+        session_timestamp, total_duration, files_processed, issues_found,
+        issues_fixed, success_rate, average_confidence, throughput_files_per_sec,
+        throughput_issues_per_sec, parallel_workers, total_tokens, total_api_calls,
+        average_api_response_time, provider_used, model_used
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SEARCH = f"""
+    INSERT INTO interaction_search_fts (rowid, {", ".join(SEARCH_FIELDS)})
+    VALUES (?, {", ".join("?" for _ in SEARCH_FIELDS)})
+"""
+
+_DELETE_SEARCH = f"""
+    INSERT INTO interaction_search_fts (
+        interaction_search_fts, rowid, {", ".join(SEARCH_FIELDS)}
+    ) VALUES ('delete', ?, {", ".join("?" for _ in SEARCH_FIELDS)})
+"""
+
+# Queue sentinels: commit the current batch now / also stop the writer
+_FLUSH = object()
+_STOP = object()
+
+
+class AIInteractionDB:
+    """Database for storing detailed AI interactions with full-text search.
+
+    Rows are written by a background thread that commits them in batches,
+    so logging an interaction does not wait on SQLite locks or fsyncs.
+    Readers flush pending rows first and see everything logged before.
+    Prompt and response bodies are stored once in ai_blobs and referenced
+    by hash; a contentless full-text index per interaction keeps search
+    queries (multi-term, column filters) working as on the inline columns.
+    Statistics come from rollup tables updated with each batch.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "ai_linting_interactions.db",
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+        max_pending: int = DEFAULT_MAX_PENDING_WRITES,
+        synchronous: str = DEFAULT_SYNCHRONOUS,
+        compress_bodies: bool = True,
+        migrate_legacy: bool = False,
+    ):
+        """
+        Initialize the interaction database.
+
+        Args:
+            db_path: SQLite database file
+            batch_size: Rows committed together by the writer
+            flush_interval_ms: Longest time a row waits for its batch to fill
+            max_pending: Rows buffered before logging blocks
+            synchronous: SQLite synchronous level
+            compress_bodies: zlib compress large prompt and response bodies
+            migrate_legacy: Move the bodies of a database with inline prompt
+                columns into ai_blobs. This rewrites every row and drops the
+                inline columns, so it cannot be undone; without it such a
+                database is refused
+
+        Raises:
+            ConfigurationError: The database has inline prompt columns and
+                migrate_legacy is not set
+        """
         self.db_path = db_path
-        self.init_database()
+        self.compress_bodies = compress_bodies
+        self.migrate_legacy = migrate_legacy
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.synchronous = synchronous
+        self._connections = ThreadLocalConnections(db_path, synchronous)
+        self._pending: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        try:
+            self.init_database()
+        except ConfigurationError:
+            self._connections.close()
+            raise
 
     def init_database(self):
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connections.transaction() as conn:
             # Create main interactions table with enhanced metrics
             conn.execute(
                 """
@@ -40,9 +198,10 @@ class AIInteractionDB:
                     issue_details TEXT NOT NULL,
                     provider_used TEXT NOT NULL,
                     model_used TEXT NOT NULL,
-                    system_prompt TEXT NOT NULL,
-                    user_prompt TEXT NOT NULL,
-                    ai_response TEXT NOT NULL,
+                    -- Bodies live in ai_blobs
+                    system_prompt_hash TEXT,
+                    user_prompt_hash TEXT,
+                    ai_response_hash TEXT,
                     fix_successful BOOLEAN NOT NULL,
                     confidence_score REAL,
                     fixed_codes TEXT,
@@ -67,53 +226,49 @@ class AIInteractionDB:
             """
             )
 
-            # Create FTS virtual table for searching prompts and responses
-            conn.execute(
-                """
-                CREATE VIRTUAL TABLE IF NOT EXISTS interactions_fts USING fts5(
-                    system_prompt,
-                    user_prompt,
-                    ai_response,
-                    issue_type,
-                    file_path,
-                    content='ai_interactions',
-                    content_rowid='id'
+            migrated = False
+            if self._has_legacy_bodies(conn):
+                if not self.migrate_legacy:
+                    msg = (
+                        f"{self.db_path} stores AI interaction bodies inline; run "
+                        f"'codeflow migrate-linting-db --db {self.db_path}' to move "
+                        "them into the blob table (this cannot be undone)"
+                    )
+                    raise ConfigurationError(msg, config_key="migrate_legacy")
+                init_blob_tables(conn)
+                migrated = self._migrate_legacy_bodies(conn)
+            else:
+                init_blob_tables(conn)
+
+            for column in HASH_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_interactions_{column} "
+                    f"ON ai_interactions({column})"
                 )
-            """
-            )
 
-            # Create triggers to keep FTS table in sync
+            # Contentless, since bodies live compressed in ai_blobs; the
+            # writer indexes each interaction with its body text
+            search_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'interaction_search_fts'"
+            ).fetchone()
             conn.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS interactions_ai 
-                AFTER INSERT ON ai_interactions BEGIN
-                    INSERT INTO interactions_fts(
-                        rowid, system_prompt, user_prompt, ai_response, 
-                        issue_type, file_path
-                    ) VALUES (
-                        new.id, new.system_prompt, new.user_prompt, 
-                        new.ai_response, new.issue_type, new.file_path
-                    );
-                END;
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS interaction_search_fts USING fts5(
+                    {", ".join(SEARCH_FIELDS)},
+                    content=''
+                )
             """
             )
+            if migrated or not search_exists:
+                self._build_search_index(conn)
 
             conn.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS interactions_ad 
-                AFTER DELETE ON ai_interactions BEGIN
-                    INSERT INTO interactions_fts(
-                        interactions_fts, rowid, system_prompt, 
-                        user_prompt, ai_response, issue_type, file_path
-                    )
-                    VALUES(
-                        'delete', old.id, old.system_prompt, 
-                        old.user_prompt, old.ai_response, old.issue_type, 
-                        old.file_path
-                    );
-                END;
-            """
+                "CREATE INDEX IF NOT EXISTS idx_interactions_timestamp "
+                "ON ai_interactions(timestamp)"
             )
+            if init_rollup_tables(conn):
+                # Databases from before rollups existed
+                rebuild_rollups(conn)
 
             # Create performance metrics table
             conn.execute(
@@ -190,156 +345,386 @@ class AIInteractionDB:
                 "linting_issues_queue(session_id, status)"
             )
 
-            conn.commit()
+    @staticmethod
+    def _has_legacy_bodies(conn: sqlite3.Connection) -> bool:
+        """Whether ai_interactions still has the inline body columns."""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(ai_interactions)")}
+        return set(BODY_FIELDS) <= columns
+
+    def _migrate_legacy_bodies(self, conn: sqlite3.Connection) -> bool:
+        """
+        Move bodies of a database with inline prompt columns into ai_blobs.
+
+        Runs inside the caller's transaction, so an interrupted migration
+        leaves the database unchanged. Only called when migrate_legacy is set.
+
+        Returns:
+            Whether a legacy table was migrated
+        """
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(ai_interactions)")}
+        if not set(BODY_FIELDS) <= columns:
+            return False
+
+        logger.info("Moving AI interaction bodies into the blob table")
+        conn.execute("DROP TRIGGER IF EXISTS interactions_ai")
+        conn.execute("DROP TRIGGER IF EXISTS interactions_ad")
+        conn.execute("DROP TABLE IF EXISTS interactions_fts")
+        for column in HASH_COLUMNS:
+            if column not in columns:
+                conn.execute(f"ALTER TABLE ai_interactions ADD COLUMN {column} TEXT")
+
+        while True:
+            rows = conn.execute(
+                f"""
+                SELECT id, {", ".join(BODY_FIELDS)} FROM ai_interactions
+                WHERE system_prompt_hash IS NULL
+                LIMIT ?
+                """,
+                (LEGACY_MIGRATION_BATCH_SIZE,),
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for row in rows:
+                bodies = [
+                    encode_body(row[field] or "", self.compress_bodies)
+                    for field in BODY_FIELDS
+                ]
+                write_bodies(conn, bodies)
+                updates.append((*(body[0] for body in bodies), row["id"]))
+            conn.executemany(
+                f"""
+                UPDATE ai_interactions
+                SET {", ".join(f"{column} = ?" for column in HASH_COLUMNS)}
+                WHERE id = ?
+                """,
+                updates,
+            )
 
-    def log_interaction(self, interaction_data: dict[str, Any]):
-        """Log a complete AI interaction to the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO ai_interactions (
-                    timestamp, file_path, issue_type, issue_details,
-                    provider_used, model_used, system_prompt, user_prompt,
-                    ai_response, fix_successful, confidence_score,
-                    fixed_codes, error_message, syntax_valid_before,
-                    syntax_valid_after, file_size_chars, prompt_tokens,
-                    response_tokens, processing_duration, api_response_time,
-                    queue_wait_time, file_complexity_score,
-                    parallel_worker_id, retry_count, memory_usage_mb,
-                    tokens_per_second, agent_type
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                          ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        for field in BODY_FIELDS:
+            conn.execute(f"ALTER TABLE ai_interactions DROP COLUMN {field}")
+        return True
+
+    @staticmethod
+    def _search_row(row: sqlite3.Row, bodies: dict[str, str]) -> tuple[Any, ...]:
+        """Values of SEARCH_FIELDS for a stored interaction, rowid first."""
+        return (
+            row["id"],
+            *(bodies.get(row[column], "") for column in HASH_COLUMNS),
+            row["issue_type"],
+            row["file_path"],
+        )
+
+    def _build_search_index(self, conn: sqlite3.Connection) -> None:
+        """Index every stored interaction, replacing earlier search tables."""
+        # Split indexes of an earlier schema matched terms per table only
+        conn.execute("DROP TRIGGER IF EXISTS interaction_fields_ai")
+        conn.execute("DROP TRIGGER IF EXISTS interaction_fields_ad")
+        conn.execute("DROP TABLE IF EXISTS interaction_fields_fts")
+        conn.execute("DROP TABLE IF EXISTS ai_blobs_fts")
+        conn.execute(
+            "INSERT INTO interaction_search_fts(interaction_search_fts) VALUES('delete-all')"
+        )
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                f"""
+                SELECT id, issue_type, file_path, {", ".join(HASH_COLUMNS)}
+                FROM ai_interactions WHERE id > ? ORDER BY id LIMIT ?
+                """,
+                (last_id, LEGACY_MIGRATION_BATCH_SIZE),
+            ).fetchall()
+            if not rows:
+                break
+            bodies = load_bodies(
+                conn, (row[column] for row in rows for column in HASH_COLUMNS)
+            )
+            conn.executemany(
+                _INSERT_SEARCH, [self._search_row(row, bodies) for row in rows]
+            )
+            last_id = rows[-1]["id"]
+
+    def _unindex_interactions(
+        self, conn: sqlite3.Connection, where: str, params: tuple[Any, ...]
+    ) -> None:
+        """Remove matching interactions from the contentless search index."""
+        rows = conn.execute(
+            f"""
+            SELECT id, issue_type, file_path, {", ".join(HASH_COLUMNS)}
+            FROM ai_interactions WHERE {where}
             """,
-                (
-                    interaction_data["timestamp"],
-                    interaction_data["file_path"],
-                    interaction_data["issue_type"],
-                    interaction_data["issue_details"],
-                    interaction_data["provider_used"],
-                    interaction_data["model_used"],
-                    interaction_data["system_prompt"],
-                    interaction_data["user_prompt"],
-                    interaction_data["ai_response"],
-                    interaction_data["fix_successful"],
-                    interaction_data.get("confidence_score"),
-                    json.dumps(interaction_data.get("fixed_codes", [])),
-                    interaction_data.get("error_message"),
-                    interaction_data.get("syntax_valid_before"),
-                    interaction_data.get("syntax_valid_after"),
-                    interaction_data.get("file_size_chars"),
-                    interaction_data.get("prompt_tokens"),
-                    interaction_data.get("response_tokens"),
-                    interaction_data.get("processing_duration"),
-                    interaction_data.get("api_response_time"),
-                    interaction_data.get("queue_wait_time"),
-                    interaction_data.get("file_complexity_score"),
-                    interaction_data.get("parallel_worker_id"),
-                    interaction_data.get("retry_count", 0),
-                    interaction_data.get("memory_usage_mb"),
-                    interaction_data.get("tokens_per_second"),
-                    interaction_data.get("agent_type"),
-                ),
+            params,
+        ).fetchall()
+        # Stay below SQLite's bound parameter limit when loading bodies
+        for start in range(0, len(rows), LEGACY_MIGRATION_BATCH_SIZE):
+            chunk = rows[start : start + LEGACY_MIGRATION_BATCH_SIZE]
+            bodies = load_bodies(
+                conn, (row[column] for row in chunk for column in HASH_COLUMNS)
             )
-            conn.commit()
+            # Contentless rows are deleted by passing back the indexed text
+            conn.executemany(
+                _DELETE_SEARCH, [self._search_row(row, bodies) for row in chunk]
+            )
+
+    def log_interaction(self, interaction_data: dict[str, Any]):
+        """Log a complete AI interaction to the database."""
+        bodies = tuple(
+            encode_body(interaction_data[field], self.compress_bodies)
+            for field in BODY_FIELDS
+        )
+        self._submit(
+            _INSERT_INTERACTION,
+            (
+                interaction_data["timestamp"],
+                interaction_data["file_path"],
+                interaction_data["issue_type"],
+                interaction_data["issue_details"],
+                interaction_data["provider_used"],
+                interaction_data["model_used"],
+                *(body[0] for body in bodies),
+                interaction_data["fix_successful"],
+                interaction_data.get("confidence_score"),
+                json.dumps(interaction_data.get("fixed_codes", [])),
+                interaction_data.get("error_message"),
+                interaction_data.get("syntax_valid_before"),
+                interaction_data.get("syntax_valid_after"),
+                interaction_data.get("file_size_chars"),
+                interaction_data.get("prompt_tokens"),
+                interaction_data.get("response_tokens"),
+                interaction_data.get("processing_duration"),
+                interaction_data.get("api_response_time"),
+                interaction_data.get("queue_wait_time"),
+                interaction_data.get("file_complexity_score"),
+                interaction_data.get("parallel_worker_id"),
+                interaction_data.get("retry_count", 0),
+                interaction_data.get("memory_usage_mb"),
+                interaction_data.get("tokens_per_second"),
+                interaction_data.get("agent_type"),
+            ),
+            bodies,
+        )
 
     def log_performance_session(self, session_data: dict[str, Any]):
         """Log overall session performance metrics."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO performance_sessions (
-                    session_timestamp, total_duration, files_processed, issues_found,
-                    issues_fixed, success_rate, average_confidence, throughput_files_per_sec,
-                    throughput_issues_per_sec, parallel_workers, total_tokens, total_api_calls,
-                    average_api_response_time, provider_used, model_used
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    session_data["session_timestamp"],
-                    session_data["total_duration"],
-                    session_data["files_processed"],
-                    session_data["issues_found"],
-                    session_data["issues_fixed"],
-                    session_data["success_rate"],
-                    session_data["average_confidence"],
-                    session_data["throughput_files_per_sec"],
-                    session_data["throughput_issues_per_sec"],
-                    session_data["parallel_workers"],
-                    session_data["total_tokens"],
-                    session_data["total_api_calls"],
-                    session_data["average_api_response_time"],
-                    session_data["provider_used"],
-                    session_data["model_used"],
-                ),
+        self._submit(
+            _INSERT_SESSION,
+            (
+                session_data["session_timestamp"],
+                session_data["total_duration"],
+                session_data["files_processed"],
+                session_data["issues_found"],
+                session_data["issues_fixed"],
+                session_data["success_rate"],
+                session_data["average_confidence"],
+                session_data["throughput_files_per_sec"],
+                session_data["throughput_issues_per_sec"],
+                session_data["parallel_workers"],
+                session_data["total_tokens"],
+                session_data["total_api_calls"],
+                session_data["average_api_response_time"],
+                session_data["provider_used"],
+                session_data["model_used"],
+            ),
+        )
+
+    def _submit(
+        self, sql: str, params: tuple[Any, ...], bodies: tuple[EncodedBody, ...] = ()
+    ) -> None:
+        """Queue a row for the writer thread, blocking while the buffer is full."""
+        if self._writer is None:
+            self._start_writer()
+        self._pending.put((sql, params, bodies))
+
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._write_loop, name="ai-interaction-writer", daemon=True
             )
+            self._writer.start()
+            # Rows still buffered at interpreter exit are written out
+            atexit.register(self.close)
+
+    def _write_loop(self) -> None:
+        conn = open_connection(self.db_path, self.synchronous)
+        try:
+            stop = False
+            while not stop:
+                batch = []
+                control = 0
+                item = self._pending.get()
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    if item is _FLUSH or item is _STOP:
+                        control += 1
+                        stop = item is _STOP
+                        break
+                    batch.append(item)
+                    remaining = deadline - time.monotonic()
+                    if len(batch) >= self.batch_size or remaining <= 0:
+                        break
+                    try:
+                        item = self._pending.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    self._write_batch(conn, batch)
+                for _ in range(len(batch) + control):
+                    self._pending.task_done()
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list[Any]) -> None:
+        """Commit a batch in one transaction, falling back to row by row."""
+        try:
+            # IMMEDIATE so no other writer adds interactions the rollup
+            # update below would pick up
+            conn.execute("BEGIN IMMEDIATE")
+            last_id = self._last_interaction_id(conn)
+            write_bodies(conn, (body for _, _, bodies in batch for body in bodies))
+            for sql, rows in groupby(batch, key=lambda item: item[0]):
+                conn.executemany(sql, [params for _, params, _ in rows])
+            self._index_new_interactions(conn, last_id, batch)
+            update_rollups(conn, last_id)
             conn.commit()
+            return
+        except Exception:
+            conn.rollback()
+            logger.exception("Failed to write %d rows in batch", len(batch))
+
+        # Isolate the bad rows instead of losing the whole batch
+        for sql, params, bodies in batch:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                last_id = self._last_interaction_id(conn)
+                write_bodies(conn, bodies)
+                conn.execute(sql, params)
+                self._index_new_interactions(conn, last_id, [(sql, params, bodies)])
+                update_rollups(conn, last_id)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                logger.exception("Failed to write AI interaction row")
+
+    @staticmethod
+    def _index_new_interactions(
+        conn: sqlite3.Connection, last_id: int, batch: list[Any]
+    ) -> None:
+        """Index the interactions of a batch just inserted after last_id."""
+        logged = [
+            (params, bodies) for sql, params, bodies in batch if sql is _INSERT_INTERACTION
+        ]
+        if not logged:
+            return
+        new_ids = [
+            row[0]
+            for row in conn.execute(
+                "SELECT id FROM ai_interactions WHERE id > ? ORDER BY id", (last_id,)
+            )
+        ]
+        # Rows get increasing ids in the order they were inserted
+        conn.executemany(
+            _INSERT_SEARCH,
+            [
+                (row_id, *(body[3] for body in bodies), params[2], params[1])
+                for row_id, (params, bodies) in zip(new_ids, logged, strict=True)
+            ],
+        )
+
+    @staticmethod
+    def _last_interaction_id(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(MAX(id), 0) FROM ai_interactions").fetchone()[0]
+
+    def flush(self) -> None:
+        """Wait until all logged rows are committed."""
+        if self._writer is not None:
+            self._pending.put(_FLUSH)
+            self._pending.join()
 
     def search_interactions(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search through AI interactions using full-text search."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        self.flush()
+        with self._connections.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT ai.* FROM ai_interactions ai
-                JOIN interactions_fts fts ON ai.id = fts.rowid
-                WHERE interactions_fts MATCH ?
+                JOIN interaction_search_fts fts ON ai.id = fts.rowid
+                WHERE interaction_search_fts MATCH ?
                 ORDER BY ai.timestamp DESC
                 LIMIT ?
             """,
                 (query, limit),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return self._with_bodies(conn, cursor.fetchall())
+
+    @staticmethod
+    def _with_bodies(
+        conn: sqlite3.Connection, rows: list[sqlite3.Row]
+    ) -> list[dict[str, Any]]:
+        """Resolve body hashes of interaction rows into their text."""
+        bodies = load_bodies(conn, (row[column] for row in rows for column in HASH_COLUMNS))
+        interactions = []
+        for row in rows:
+            data = dict(row)
+            for field, column in zip(BODY_FIELDS, HASH_COLUMNS, strict=True):
+                data[field] = bodies.get(data[column], "")
+            interactions.append({field: data[field] for field in INTERACTION_FIELDS})
+        return interactions
 
     def get_statistics(self) -> dict[str, Any]:
         """Get comprehensive statistics from the interaction database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            # Basic stats
-            total_interactions = conn.execute(
-                "SELECT COUNT(*) as count FROM ai_interactions"
-            ).fetchone()["count"]
-            successful_fixes = conn.execute(
-                "SELECT COUNT(*) as count FROM ai_interactions WHERE fix_successful = 1"
-            ).fetchone()["count"]
-            failed_fixes = conn.execute(
-                "SELECT COUNT(*) as count FROM ai_interactions WHERE fix_successful = 0"
-            ).fetchone()["count"]
+        self.flush()
+        with self._connections.transaction() as conn:
 
-            # Confidence statistics
-            confidence_stats = conn.execute(
-                """
+            # Totals across all rollups
+            totals = conn.execute(
+                f"""
                 SELECT
-                    AVG(confidence_score) as average_confidence,
-                    MIN(confidence_score) as min_confidence,
-                    MAX(confidence_score) as max_confidence,
-                    COUNT(CASE WHEN confidence_score > 0.8 THEN 1 END) as high_confidence_count,
-                    COUNT(CASE WHEN confidence_score < 0.5 THEN 1 END) as low_confidence_count,
-                    COUNT(confidence_score) as total_confidence_scores
-                FROM ai_interactions
-                WHERE confidence_score IS NOT NULL
+                    COALESCE(SUM(attempts), 0) as total_interactions,
+                    COALESCE(SUM(successes), 0) as successful_fixes,
+                    COALESCE(SUM(failures), 0) as failed_fixes,
+                    COALESCE(SUM(confidence_count), 0) as total_confidence_scores,
+                    SUM(confidence_sum) as confidence_sum,
+                    MIN(confidence_min) as min_confidence,
+                    MAX(confidence_max) as max_confidence,
+                    COALESCE(SUM(high_confidence_count), 0) as high_confidence_count,
+                    COALESCE(SUM(low_confidence_count), 0) as low_confidence_count,
+                    COALESCE(SUM(prompt_tokens), 0) as prompt_tokens,
+                    COALESCE(SUM(response_tokens), 0) as response_tokens,
+                    COALESCE(SUM(file_size_count), 0) as file_size_count,
+                    SUM(file_size_sum) as file_size_sum,
+                    COALESCE(SUM(latency_count), 0) as latency_count,
+                    SUM(latency_sum) as latency_sum,
+                    {", ".join(f"COALESCE(SUM({c}), 0) as {c}" for c in LATENCY_BUCKET_COLUMNS)}
+                FROM interaction_rollups
                 """
             ).fetchone()
+            total_interactions = totals["total_interactions"]
+            successful_fixes = totals["successful_fixes"]
+            failed_fixes = totals["failed_fixes"]
 
             # Calculate confidence percentages
-            if confidence_stats and confidence_stats["total_confidence_scores"] > 0:
+            total_confidence_scores = totals["total_confidence_scores"]
+            if total_confidence_scores > 0:
+                average_confidence = totals["confidence_sum"] / total_confidence_scores
                 high_confidence_percentage = (
-                    confidence_stats["high_confidence_count"]
-                    / confidence_stats["total_confidence_scores"]
+                    totals["high_confidence_count"] / total_confidence_scores
                 ) * 100
                 low_confidence_percentage = (
-                    confidence_stats["low_confidence_count"]
-                    / confidence_stats["total_confidence_scores"]
+                    totals["low_confidence_count"] / total_confidence_scores
                 ) * 100
             else:
+                average_confidence = None
                 high_confidence_percentage = 0.0
                 low_confidence_percentage = 0.0
 
             # Issue type breakdown
             issue_type_breakdown = conn.execute(
                 """
-                SELECT issue_type, COUNT(*) as count
-                FROM ai_interactions
+                SELECT issue_type, SUM(attempts) as count
+                FROM interaction_rollups
                 GROUP BY issue_type
                 ORDER BY count DESC
                 """
@@ -350,44 +735,35 @@ class AIInteractionDB:
                 """
                 SELECT
                     provider_used,
-                    COUNT(*) as attempts,
-                    SUM(CASE WHEN fix_successful = 1 THEN 1 ELSE 0 END) 
-                        as successes,
-                    AVG(CASE WHEN confidence_score IS NOT NULL 
-                        THEN confidence_score END) as average_confidence
-                FROM ai_interactions
+                    SUM(attempts) as attempts,
+                    SUM(successes) as successes,
+                    SUM(confidence_sum) / NULLIF(SUM(confidence_count), 0)
+                        as average_confidence
+                FROM interaction_rollups
                 GROUP BY provider_used
                 """
             ).fetchall()
 
-            # Recent activity
+            # Recent activity, an index range scan over the last 30 days
             recent_activity = conn.execute(
                 """
                 SELECT
                     COUNT(CASE WHEN timestamp >= datetime('now', '-1 day') THEN 1 END) as last_24h,
                     COUNT(CASE WHEN timestamp >= datetime('now', '-7 days') THEN 1 END) as last_7d,
-                    COUNT(CASE WHEN timestamp >= datetime('now', '-30 days') THEN 1 END) as last_30d
+                    COUNT(*) as last_30d
                 FROM ai_interactions
+                WHERE timestamp >= datetime('now', '-30 days')
                 """
             ).fetchone()
 
             # File statistics
-            file_stats = conn.execute(
-                """
-                SELECT
-                    COUNT(DISTINCT file_path) as unique_files,
-                    AVG(file_size_chars) as average_file_size
-                FROM ai_interactions
-                """
-            ).fetchone()
-
-            # Most processed file
+            unique_files = conn.execute(
+                "SELECT COUNT(*) as count FROM file_rollups"
+            ).fetchone()["count"]
             most_processed_file = conn.execute(
                 """
-                SELECT file_path, COUNT(*) as count
-                FROM ai_interactions
-                GROUP BY file_path
-                ORDER BY count DESC
+                SELECT file_path FROM file_rollups
+                ORDER BY interactions DESC
                 LIMIT 1
                 """
             ).fetchone()
@@ -402,28 +778,12 @@ class AIInteractionDB:
                     else 0
                 ),
                 "confidence_stats": {
-                    "average_confidence": (
-                        confidence_stats["average_confidence"]
-                        if confidence_stats
-                        else 0.0
-                    ),
+                    "average_confidence": average_confidence,
                     "median_confidence": 0.0,  # Would need more complex query
-                    "min_confidence": (
-                        confidence_stats["min_confidence"] if confidence_stats else 0.0
-                    ),
-                    "max_confidence": (
-                        confidence_stats["max_confidence"] if confidence_stats else 0.0
-                    ),
-                    "high_confidence_count": (
-                        confidence_stats["high_confidence_count"]
-                        if confidence_stats
-                        else 0
-                    ),
-                    "low_confidence_count": (
-                        confidence_stats["low_confidence_count"]
-                        if confidence_stats
-                        else 0
-                    ),
+                    "min_confidence": totals["min_confidence"],
+                    "max_confidence": totals["max_confidence"],
+                    "high_confidence_count": totals["high_confidence_count"],
+                    "low_confidence_count": totals["low_confidence_count"],
                     "high_confidence_percentage": high_confidence_percentage,
                     "low_confidence_percentage": low_confidence_percentage,
                 },
@@ -442,14 +802,16 @@ class AIInteractionDB:
                     for row in provider_performance
                 },
                 "recent_activity": {
-                    "last_24h": recent_activity["last_24h"] if recent_activity else 0,
-                    "last_7d": recent_activity["last_7d"] if recent_activity else 0,
-                    "last_30d": recent_activity["last_30d"] if recent_activity else 0,
+                    "last_24h": recent_activity["last_24h"],
+                    "last_7d": recent_activity["last_7d"],
+                    "last_30d": recent_activity["last_30d"],
                 },
                 "file_stats": {
-                    "unique_files": file_stats["unique_files"] if file_stats else 0,
+                    "unique_files": unique_files,
                     "average_file_size": (
-                        file_stats["average_file_size"] if file_stats else 0
+                        totals["file_size_sum"] / totals["file_size_count"]
+                        if totals["file_size_count"]
+                        else None
                     ),
                     "most_processed_file": (
                         most_processed_file["file_path"]
@@ -457,12 +819,36 @@ class AIInteractionDB:
                         else "None"
                     ),
                 },
+                "token_usage": {
+                    "prompt_tokens": totals["prompt_tokens"],
+                    "response_tokens": totals["response_tokens"],
+                },
+                "latency_stats": {
+                    "average_api_response_time": (
+                        totals["latency_sum"] / totals["latency_count"]
+                        if totals["latency_count"]
+                        else 0.0
+                    ),
+                    "histogram": {
+                        label: totals[column]
+                        for label, column in zip(
+                            latency_bucket_labels(), LATENCY_BUCKET_COLUMNS, strict=True
+                        )
+                    },
+                },
             }
 
+    def rebuild_statistics(self) -> None:
+        """Rebuild the statistics rollups from all stored interactions."""
+        self.flush()
+        with self._connections.transaction(immediate=True) as conn:
+            rebuild_rollups(conn)
+        logger.info("Rebuilt AI interaction statistics rollups")
+
     def get_all_interactions(self, limit: int = 1000) -> list[dict[str, Any]]:
         """Get all interactions from the database (for export functionality)."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        self.flush()
+        with self._connections.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM ai_interactions
@@ -471,12 +857,12 @@ class AIInteractionDB:
                 """,
                 (limit,),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return self._with_bodies(conn, cursor.fetchall())
 
     def get_session_performance(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get recent session performance data."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        self.flush()
+        with self._connections.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM performance_sessions
@@ -489,8 +875,16 @@ class AIInteractionDB:
 
     def cleanup_old_interactions(self, days_to_keep: int = 30):
         """Clean up old interactions to keep database size manageable."""
-        with sqlite3.connect(self.db_path) as conn:
+        self.flush()
+        with self._connections.transaction(immediate=True) as conn:
             cutoff_date = datetime.now(UTC).isoformat()[:10]  # YYYY-MM-DD format
+            cutoff_day = conn.execute(
+                "SELECT DATE(?, ?)", (cutoff_date, f"-{days_to_keep} days")
+            ).fetchone()[0]
+            remove_rollups_before(conn, cutoff_day)
+            self._unindex_interactions(
+                conn, "DATE(timestamp) < DATE(?, ?)", (cutoff_date, f"-{days_to_keep} days")
+            )
 
             # Delete old interactions (keeping last N days)
             conn.execute(
@@ -510,13 +904,15 @@ class AIInteractionDB:
                 (cutoff_date, f"-{days_to_keep} days"),
             )
 
-            conn.commit()
+            # Drop bodies only deleted interactions referenced
+            delete_orphan_bodies(conn)
 
-            # Optimize database after cleanup
-            conn.execute("VACUUM")
+        # Optimize database after cleanup (not allowed inside a transaction)
+        self._connections.connection().execute("VACUUM")
 
     def get_database_info(self) -> dict[str, Any]:
         """Get information about the database file and tables."""
+        self.flush()
         db_path = Path(self.db_path)
 
         info: dict[str, Any] = {
@@ -533,10 +929,14 @@ class AIInteractionDB:
         return info
 
     def close(self) -> None:
-        """Close the database connection (placeholder for compatibility)."""
-        # SQLite connections are automatically closed when using context managers
-        # This method exists for compatibility with the main module
-        pass
+        """Write out buffered rows, stop the writer and close connections."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._pending.put(_STOP)
+            writer.join()
+            atexit.unregister(self.close)
+        self._connections.close()
 
 
 # Use IssueQueueManager from queue_manager module
@@ -628,8 +1028,13 @@ class DatabaseManager:
         logger.info("Database maintenance completed")
 
 
-# Global database instances for convenience
-default_db = AIInteractionDB()
+# Global database instances for convenience; a legacy database in the working
+# directory is left untouched until migrated explicitly
+try:
+    default_db: AIInteractionDB | None = AIInteractionDB()
+except ConfigurationError as e:
+    logger.warning(f"Default AI interaction database unavailable: {e}")
+    default_db = None
 issue_queue = IssueQueueManager("issue_queue.db")
 # Comment out the problematic global instance to avoid initialization errors
 # db_manager = DatabaseManager()
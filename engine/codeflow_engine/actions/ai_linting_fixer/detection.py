@@ -12,6 +12,8 @@ import operator
 import subprocess
 from typing import Any
 
+from codeflow_engine.actions.ai_linting_fixer.file_index import FileIndexCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -176,7 +178,10 @@ class Flake8Parser:
         self.classifier = IssueClassifier()
 
     def run_flake8(
-        self, target_path: str, config_file: str | None = None
+        self,
+        target_path: str,
+        config_file: str | None = None,
+        file_index: FileIndexCache | None = None,
     ) -> list[LintingIssue]:
         """Run flake8 and parse the results."""
         try:
@@ -191,23 +196,26 @@ class Flake8Parser:
             )
 
             if result.stdout.strip():
-                return self.parse_standard_output(result.stdout)
+                return self.parse_standard_output(result.stdout, file_index)
             return []
 
         except Exception as e:
             logger.exception(f"Error running flake8: {e}")
             return []
 
-    def parse_standard_output(self, output: str) -> list[LintingIssue]:
-        """Parse flake8 standard output format."""
+    def parse_standard_output(
+        self, output: str, file_index: FileIndexCache | None = None
+    ) -> list[LintingIssue]:
+        """Parse flake8 standard output format, reading each file once."""
         issues = []
+        file_index = file_index if file_index is not None else FileIndexCache()
 
         for line in output.strip().split("\n"):
             if not line.strip():
                 continue
 
             try:
-                issue = self._parse_flake8_line(line)
+                issue = self._parse_flake8_line(line, file_index)
                 if issue:
                     issues.append(issue)
             except Exception as e:
@@ -216,7 +224,9 @@ class Flake8Parser:
 
         return issues
 
-    def _parse_flake8_line(self, line: str) -> LintingIssue | None:
+    def _parse_flake8_line(
+        self, line: str, file_index: FileIndexCache | None = None
+    ) -> LintingIssue | None:
         """Parse a single line of flake8 output."""
         # Format: file:line:col: code message
         parts = line.split(":", 3)
@@ -239,10 +249,12 @@ class Flake8Parser:
             confidence = self.classifier.estimate_fix_confidence(error_code)
 
             # Get line content if possible
-            line_content = self._get_line_content(file_path, line_number)
+            line_content = self._get_line_content(file_path, line_number, file_index)
 
             # Extract context (function/class names)
-            function_name, class_name = self._extract_context(file_path, line_number)
+            function_name, class_name = self._extract_context(
+                file_path, line_number, file_index
+            )
 
             return LintingIssue(
                 file_path=file_path,
@@ -265,65 +277,25 @@ class Flake8Parser:
             logger.debug("Failed to parse flake8 line components: %s - %s", line, e)
             return None
 
-    def _get_line_content(self, file_path: str, line_number: int) -> str:
+    def _get_line_content(
+        self,
+        file_path: str,
+        line_number: int,
+        file_index: FileIndexCache | None = None,
+    ) -> str:
         """Get the content of a specific line from a file."""
-        try:
-            from pathlib import Path
-
-            with Path(file_path).open(encoding="utf-8") as f:
-                lines = f.readlines()
-                if 1 <= line_number <= len(lines):
-                    return lines[line_number - 1].rstrip("\n\r")
-        except Exception as e:
-            logger.debug(
-                "Failed to read line content from %s:%s - %s", file_path, line_number, e
-            )
-        return ""
+        file_index = file_index if file_index is not None else FileIndexCache()
+        return file_index.get_line(file_path, line_number)
 
     def _extract_context(
-        self, file_path: str, line_number: int
+        self,
+        file_path: str,
+        line_number: int,
+        file_index: FileIndexCache | None = None,
     ) -> tuple[str | None, str | None]:
         """Extract function and class context for the given line."""
-        try:
-            from pathlib import Path
-
-            with Path(file_path).open(encoding="utf-8") as f:
-                lines = f.readlines()
-
-            function_name = None
-            class_name = None
-
-            # Look backwards from the line to find function/class definitions
-            for i in range(min(line_number - 1, len(lines)), -1, -1):
-                line = lines[i].strip()
-
-                if line.startswith("def ") and function_name is None:
-                    # Extract function name
-                    try:
-                        func_part = line.split("(")[0]
-                        function_name = func_part.replace("def ", "").strip()
-                    except Exception:
-                        pass
-
-                if line.startswith("class ") and class_name is None:
-                    # Extract class name
-                    try:
-                        class_part = line.split("(")[0].split(":")[0]
-                        class_name = class_part.replace("class ", "").strip()
-                    except Exception:
-                        pass
-
-                # Stop if we found both or reached the beginning
-                if (function_name and class_name) or i == 0:
-                    break
-
-            return function_name, class_name
-
-        except Exception as e:
-            logger.debug(
-                "Failed to extract context from %s:%s - %s", file_path, line_number, e
-            )
-            return None, None
+        file_index = file_index if file_index is not None else FileIndexCache()
+        return file_index.get_context(file_path, line_number)
 
 
 class RuffParser:
@@ -333,7 +305,10 @@ class RuffParser:
         self.classifier = IssueClassifier()
 
     def run_ruff(
-        self, target_path: str, config_file: str | None = None
+        self,
+        target_path: str,
+        config_file: str | None = None,
+        file_index: FileIndexCache | None = None,
     ) -> list[LintingIssue]:
         """Run ruff and parse its output."""
         try:
@@ -349,14 +324,17 @@ class RuffParser:
                 logger.warning("Ruff command failed: %s", result.stderr)
                 return []
 
-            return self._parse_ruff_json(result.stdout)
+            return self._parse_ruff_json(result.stdout, file_index)
 
         except Exception as e:
             logger.exception("Failed to run ruff: %s", e)
             return []
 
-    def _parse_ruff_json(self, json_output: str) -> list[LintingIssue]:
-        """Parse ruff JSON output."""
+    def _parse_ruff_json(
+        self, json_output: str, file_index: FileIndexCache | None = None
+    ) -> list[LintingIssue]:
+        """Parse ruff JSON output, reading each file once."""
+        file_index = file_index if file_index is not None else FileIndexCache()
         try:
             import json
 
@@ -388,8 +366,11 @@ class RuffParser:
                     )
                     confidence = self.classifier.estimate_fix_confidence(item["code"])
 
-                    # Get line content if possible
+                    # Get line content and context if possible
                     line_content = self._get_line_content(
+                        item["filename"], item["location"]["row"], file_index
+                    )
+                    function_name, class_name = file_index.get_context(
                         item["filename"], item["location"]["row"]
                     )
 
@@ -403,6 +384,8 @@ class RuffParser:
                         category=category,
                         severity=severity,
                         line_content=line_content,
+                        function_name=function_name,
+                        class_name=class_name,
                         fix_priority=priority,
                         estimated_confidence=confidence,
                         requires_human_review=category == IssueCategory.CRITICAL,
@@ -418,20 +401,15 @@ class RuffParser:
             logger.exception("Failed to parse ruff JSON: %s", e)
             return []
 
-    def _get_line_content(self, file_path: str, line_number: int) -> str:
+    def _get_line_content(
+        self,
+        file_path: str,
+        line_number: int,
+        file_index: FileIndexCache | None = None,
+    ) -> str:
         """Get the content of a specific line from a file."""
-        try:
-            from pathlib import Path
-
-            with Path(file_path).open(encoding="utf-8") as f:
-                lines = f.readlines()
-                if 1 <= line_number <= len(lines):
-                    return lines[line_number - 1].rstrip("\n\r")
-        except Exception as e:
-            logger.debug(
-                "Failed to read line content from %s:%s - %s", file_path, line_number, e
-            )
-        return ""
+        file_index = file_index if file_index is not None else FileIndexCache()
+        return file_index.get_line(file_path, line_number)
 
 
 class IssueDetector:
@@ -453,13 +431,17 @@ class IssueDetector:
             tools = ["ruff"]  # Default to ruff instead of flake8
 
         all_issues = []
+        # Shared by all tools so each reported file is read once per run
+        file_index = FileIndexCache()
 
         for tool in tools:
             if tool == "flake8":
-                issues = self.flake8_parser.run_flake8(target_path, config_file)
+                issues = self.flake8_parser.run_flake8(
+                    target_path, config_file, file_index
+                )
                 all_issues.extend(issues)
             elif tool == "ruff":
-                issues = self.ruff_parser.run_ruff(target_path, config_file)
+                issues = self.ruff_parser.run_ruff(target_path, config_file, file_index)
                 all_issues.extend(issues)
             else:
                 logger.warning(f"Unsupported tool: {tool}")
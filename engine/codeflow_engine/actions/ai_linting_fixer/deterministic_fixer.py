@@ -0,0 +1,645 @@
+"""
+Deterministic Fixer Module
+
+Fixes mechanical linting issues without an LLM: one batched ruff run over all
+affected files, whose fixes are applied for the requested issues only, then
+source transforms for a few common codes. Only the issues left over are routed
+to the AI specialists.
+"""
+
+import ast
+from dataclasses import dataclass, field, replace
+import difflib
+import io
+import json
+import logging
+import re
+import shutil
+import subprocess
+import tokenize
+from typing import Any
+
+from codeflow_engine.actions.ai_linting_fixer.file_manager import FileManager
+
+
+logger = logging.getLogger(__name__)
+
+# Fix routes reported in the session metrics
+ROUTE_RUFF = "ruff"
+ROUTE_TRANSFORM = "transform"
+ROUTE_AI = "ai"
+
+# Codes whose ruff autofix is safe to apply unattended
+RUFF_FIX_CODES = frozenset(
+    {"F401", "F541", "I001", "UP006", "UP035", "W291", "W292", "W293"}
+)
+# Codes with a local source transform
+TRANSFORM_CODES = frozenset(
+    {"F401", "W291", "W292", "W293", "W391", "E302", "E303", "E305"}
+)
+# Transforms that edit the blank lines above the reported line
+BLANK_LINE_CODES = frozenset({"E302", "E303", "E305"})
+# Exceptions marking a try block as a module availability probe
+IMPORT_ERRORS = frozenset({"ImportError", "ModuleNotFoundError"})
+
+_UNUSED_IMPORT_RE = re.compile(r"[`'\"](.+?)[`'\"] imported but unused")
+
+
+@dataclass
+class DeterministicFixResult:
+    """Outcome of the deterministic fixer tier."""
+
+    fixed: list[Any] = field(default_factory=list)
+    remaining: list[Any] = field(default_factory=list)
+    # error code -> route -> number of issues
+    routes: dict[str, dict[str, int]] = field(default_factory=dict)
+    files_modified: set[str] = field(default_factory=set)
+
+    def record(self, error_code: str, route: str) -> None:
+        """Count one routing decision."""
+        by_route = self.routes.setdefault(error_code, {})
+        by_route[route] = by_route.get(route, 0) + 1
+
+
+class DeterministicFixer:
+    """Fixes mechanical issues with ruff and source transforms."""
+
+    def __init__(
+        self,
+        file_manager: FileManager | None = None,
+        use_ruff: bool = True,
+        ruff_command: tuple[str, ...] = ("ruff",),
+    ):
+        """
+        Initialize the deterministic fixer.
+
+        Args:
+            file_manager: File manager used to read and write files
+            use_ruff: Run ruff's autofix before the source transforms
+            ruff_command: Command prefix used to invoke ruff
+        """
+        self.file_manager = file_manager or FileManager()
+        self.use_ruff = use_ruff
+        self.ruff_command = ruff_command
+
+    @staticmethod
+    def can_fix(error_code: str) -> bool:
+        """Check whether an error code has a deterministic fix."""
+        return error_code in RUFF_FIX_CODES or error_code in TRANSFORM_CODES
+
+    def ruff_available(self) -> bool:
+        """Check whether the ruff executable can be found."""
+        return self.use_ruff and shutil.which(self.ruff_command[0]) is not None
+
+    def fix_issues(self, issues: list[Any], dry_run: bool = False) -> DeterministicFixResult:
+        """
+        Fix what can be fixed deterministically and route the rest to the AI.
+
+        Remaining issues of modified files get their line numbers remapped to
+        the new file content. Issues ruff reports without a safe fix (such as
+        re-exports and availability probes) are never transformed. In dry-run
+        mode nothing is written.
+
+        Args:
+            issues: Detected issues with ``file_path``, ``line_number``,
+                ``error_code`` and ``message``
+            dry_run: Compute fixes without writing files
+
+        Returns:
+            Fixed and remaining issues, per-code routes and modified files
+        """
+        result = DeterministicFixResult()
+        candidates = [issue for issue in issues if self.can_fix(issue.error_code)]
+        if not candidates:
+            for issue in issues:
+                result.record(issue.error_code, ROUTE_AI)
+            result.remaining = list(issues)
+            return result
+
+        files = sorted({issue.file_path for issue in candidates})
+        original = {path: self.file_manager.read_file(path) for path in files}
+        original = {path: content for path, content in original.items() if content is not None}
+        current = dict(original)
+        routes: dict[int, str] = {}
+        declined: set[int] = set()
+
+        ruff_issues = [
+            issue
+            for issue in candidates
+            if issue.error_code in RUFF_FIX_CODES and issue.file_path in original
+        ]
+        if ruff_issues and self.ruff_available():
+            fixed_indices, declined_indices = self._run_ruff_fix(
+                ruff_issues, original, current
+            )
+            for index in fixed_indices:
+                routes[id(ruff_issues[index])] = ROUTE_RUFF
+            declined = {id(ruff_issues[index]) for index in declined_indices}
+
+        for path in original:
+            pending = [
+                issue
+                for issue in candidates
+                if issue.file_path == path
+                and issue.error_code in TRANSFORM_CODES
+                and id(issue) not in routes
+                and id(issue) not in declined
+            ]
+            if not pending:
+                continue
+            # Transforms work on the ruff output, so move the issues there first
+            line_map = self._line_map(original[path], current[path])
+            located = [(issue, line_map.get(issue.line_number)) for issue in pending]
+            content, fixed = self._apply_transforms(
+                current[path],
+                [(issue, line) for issue, line in located if line],
+                is_package_init=path.replace("\\", "/").endswith("__init__.py"),
+            )
+            if fixed:
+                current[path] = content
+                for issue in fixed:
+                    routes[id(issue)] = ROUTE_TRANSFORM
+
+        for path, content in current.items():
+            if content == original[path]:
+                continue
+            if not dry_run:
+                if not self.file_manager.write_file(path, content):
+                    logger.warning("Failed to write deterministic fixes to %s", path)
+                    for issue in issues:
+                        if issue.file_path == path:
+                            routes.pop(id(issue), None)
+                    continue
+            result.files_modified.add(path)
+
+        for issue in issues:
+            route = routes.get(id(issue))
+            if route is not None and issue.file_path in result.files_modified:
+                result.fixed.append(issue)
+            else:
+                route = ROUTE_AI
+                result.remaining.append(issue)
+            result.record(issue.error_code, route)
+
+        if not dry_run:
+            result.remaining = self._remap_issues(
+                result.remaining, original, current, result.files_modified
+            )
+        logger.info(
+            "Deterministic fixes: %d fixed, %d routed to AI",
+            len(result.fixed),
+            len(result.remaining),
+        )
+        return result
+
+    def _run_ruff_fix(
+        self,
+        issues: list[Any],
+        original: dict[str, str],
+        current: dict[str, str],
+    ) -> tuple[set[int], set[int]]:
+        """
+        Run ruff once over all affected files and apply its fixes for the issues.
+
+        ruff is run without ``--fix``, since that would fix every occurrence
+        of the codes in the files. Instead the safe fixes it reports are
+        applied for the given issues only; a fix shared with diagnostics that
+        were not requested (like the removal of a whole import statement) is
+        left to the transforms.
+
+        Args:
+            issues: Issues with a ruff autofix
+            original: File contents ruff sees on disk
+            current: Updated in place with the fixed file contents
+
+        Returns:
+            Tuple of the indices of the issues fixed, and of the issues ruff
+            still reports without a safe fix
+        """
+        files = sorted({issue.file_path for issue in issues})
+        codes = sorted({issue.error_code for issue in issues})
+        cmd = [
+            *self.ruff_command,
+            "check",
+            "--select",
+            ",".join(codes),
+            "--output-format=json",
+            *files,
+        ]
+        try:
+            completed = subprocess.run(
+                cmd, check=False, capture_output=True, text=True, timeout=120
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("ruff check failed: %s", e)
+            return set(), set()
+        if completed.returncode not in (0, 1):
+            logger.warning("ruff check failed: %s", completed.stderr.strip())
+            return set(), set()
+        try:
+            diagnostics = json.loads(completed.stdout or "[]")
+        except json.JSONDecodeError as e:
+            logger.warning("Could not parse ruff output: %s", e)
+            return set(), set()
+
+        fixed: set[int] = set()
+        declined: set[int] = set()
+        for path in files:
+            reported = [
+                item
+                for item in diagnostics
+                if isinstance(item, dict)
+                and "location" in item
+                and self._same_path(item.get("filename", ""), path)
+            ]
+            # Diagnostics of one statement can share a single fix
+            fix_users: dict[str, set[tuple[str, int]]] = {}
+            by_issue: dict[tuple[str, int], Any] = {}
+            for item in reported:
+                issue_key = (item["code"], item["location"]["row"])
+                by_issue[issue_key] = item
+                if self._safe_fix(item):
+                    fix_users.setdefault(self._fix_key(item), set()).add(issue_key)
+
+            indexed = [
+                (index, issue)
+                for index, issue in enumerate(issues)
+                if issue.file_path == path
+            ]
+            requested = {(issue.error_code, issue.line_number) for _, issue in indexed}
+            fixes: dict[str, list[dict[str, Any]]] = {}
+            fix_of_issue: dict[int, str] = {}
+            for index, issue in indexed:
+                item = by_issue.get((issue.error_code, issue.line_number))
+                if item is None:
+                    continue
+                if not self._safe_fix(item):
+                    declined.add(index)
+                    continue
+                key = self._fix_key(item)
+                if fix_users[key] <= requested:
+                    fixes[key] = item["fix"]["edits"]
+                    fix_of_issue[index] = key
+
+            content, applied = self._apply_edits(original[path], fixes)
+            if applied:
+                current[path] = content
+                fixed.update(
+                    index for index, key in fix_of_issue.items() if key in applied
+                )
+        return fixed, declined
+
+    @staticmethod
+    def _safe_fix(item: dict[str, Any]) -> bool:
+        fix = item.get("fix")
+        return bool(fix and fix.get("applicability") == "safe" and fix.get("edits"))
+
+    @staticmethod
+    def _fix_key(item: dict[str, Any]) -> str:
+        return json.dumps(item["fix"]["edits"], sort_keys=True)
+
+    @staticmethod
+    def _apply_edits(
+        content: str, fixes: dict[str, list[dict[str, Any]]]
+    ) -> tuple[str, set[str]]:
+        """
+        Apply ruff fixes to a file, skipping fixes that overlap earlier ones.
+
+        Returns:
+            Tuple of (new content, keys of the fixes applied)
+        """
+        line_starts = [0]
+        for line in io.StringIO(content, newline="").readlines():
+            line_starts.append(line_starts[-1] + len(line))
+
+        def offset(location: dict[str, int]) -> int:
+            row = location["row"]
+            if row > len(line_starts) - 1:
+                return len(content)
+            return min(line_starts[row - 1] + location["column"] - 1, line_starts[row])
+
+        spans = sorted(
+            (
+                [
+                    (offset(edit["location"]), offset(edit["end_location"]), edit["content"])
+                    for edit in edits
+                ],
+                key,
+            )
+            for key, edits in fixes.items()
+        )
+        accepted: list[tuple[int, int, str]] = []
+        applied: set[str] = set()
+        for edits, key in spans:
+            # Ranges overlap, or two insertions land on the same offset
+            if any(
+                (start < other_end and other_start < end)
+                or start == end == other_start == other_end
+                for start, end, _ in edits
+                for other_start, other_end, _ in accepted
+            ):
+                continue
+            accepted.extend(edits)
+            applied.add(key)
+        for start, end, text in sorted(accepted, reverse=True):
+            content = content[:start] + text + content[end:]
+        return content, applied
+
+    @staticmethod
+    def _same_path(reported: str, path: str) -> bool:
+        reported = reported.replace("\\", "/")
+        path = path.replace("\\", "/").removeprefix("./")
+        return reported == path or reported.endswith(f"/{path}")
+
+    def _apply_transforms(
+        self,
+        content: str,
+        located: list[tuple[Any, int]],
+        is_package_init: bool = False,
+    ) -> tuple[str, list[Any]]:
+        """
+        Apply source transforms to one file.
+
+        Line-local transforms run bottom-up first, then the blank-line rules,
+        with their line numbers shifted by lines the first pass removed.
+
+        Args:
+            content: File content
+            located: (issue, current line number) pairs
+            is_package_init: The file is a package ``__init__.py``, whose
+                unused imports are usually re-exports
+
+        Returns:
+            Tuple of (new content, fixed issues)
+        """
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return content, []
+        lines = content.split("\n")
+        string_lines = self._string_interior_lines(content)
+        fixed: list[Any] = []
+        # (line, lines added) of edits made by the first pass
+        shifts: list[tuple[int, int]] = []
+
+        local = [item for item in located if item[0].error_code not in BLANK_LINE_CODES]
+        unused_imports: dict[int, list[Any]] = {}
+        for issue, line in local:
+            if issue.error_code == "F401":
+                unused_imports.setdefault(line, []).append(issue)
+
+        handled_lines: set[int] = set()
+        for issue, line in sorted(local, key=lambda item: item[1], reverse=True):
+            code = issue.error_code
+            if code == "F401":
+                if is_package_init or line in handled_lines:
+                    continue
+                handled_lines.add(line)
+                before = len(lines)
+                removed = self._remove_unused_imports(
+                    lines, tree, line, unused_imports[line]
+                )
+                fixed.extend(removed)
+                if len(lines) != before:
+                    shifts.append((line, len(lines) - before))
+            elif code in {"W291", "W293"}:
+                if line not in string_lines and lines[line - 1] != lines[line - 1].rstrip():
+                    lines[line - 1] = lines[line - 1].rstrip()
+                    fixed.append(issue)
+            elif code == "W292":
+                if lines[-1] != "":
+                    lines.append("")
+                    fixed.append(issue)
+            elif code == "W391":
+                end = len(lines)
+                while len(lines) > 1 and lines[-1] == "" and lines[-2].strip() == "":
+                    lines.pop()
+                if len(lines) != end:
+                    fixed.append(issue)
+
+        blank = [item for item in located if item[0].error_code in BLANK_LINE_CODES]
+        for issue, line in sorted(blank, key=lambda item: item[1], reverse=True):
+            line += sum(delta for edit_line, delta in shifts if edit_line < line)
+            if 1 <= line <= len(lines) and self._fix_blank_lines(lines, issue, line):
+                fixed.append(issue)
+
+        new_content = "\n".join(lines)
+        if fixed and not self._parses(new_content):
+            logger.warning("Source transforms produced invalid syntax; discarding them")
+            return content, []
+        return new_content, fixed
+
+    def _remove_unused_imports(
+        self, lines: list[str], tree: ast.Module, line: int, issues: list[Any]
+    ) -> list[Any]:
+        """Drop the unused names of the import statement on a line."""
+        parent_body, node = self._find_import(tree, line)
+        if (
+            node is None
+            or (isinstance(node, ast.ImportFrom) and node.module == "__future__")
+            or self._in_availability_probe(tree, node)
+        ):
+            return []
+        end_line = node.end_lineno or node.lineno
+        first, last = lines[node.lineno - 1], lines[end_line - 1]
+        statement_lines = lines[node.lineno - 1 : end_line]
+        # Leave statements sharing a line or carrying comments to the AI
+        if (
+            first[: node.col_offset].strip()
+            or last[node.end_col_offset or 0 :].strip()
+            or any("#" in text for text in statement_lines)
+        ):
+            return []
+
+        removed = []
+        keep = list(node.names)
+        for issue in issues:
+            match = _UNUSED_IMPORT_RE.search(issue.message)
+            if not match:
+                continue
+            alias = next(
+                (alias for alias in keep if self._alias_matches(node, alias, match.group(1))),
+                None,
+            )
+            if alias is not None:
+                keep.remove(alias)
+                removed.append(issue)
+        if not removed:
+            return []
+
+        indent = first[: node.col_offset]
+        names = [
+            f"{alias.name} as {alias.asname}" if alias.asname else alias.name
+            for alias in keep
+        ]
+        if not keep:
+            new_lines = [f"{indent}pass"] if len(parent_body) == 1 else []
+        elif isinstance(node, ast.Import):
+            new_lines = [f"{indent}import {', '.join(names)}"]
+        else:
+            module = "." * node.level + (node.module or "")
+            if end_line > node.lineno:
+                new_lines = [
+                    f"{indent}from {module} import (",
+                    *(f"{indent}    {name}," for name in names),
+                    f"{indent})",
+                ]
+            else:
+                new_lines = [f"{indent}from {module} import {', '.join(names)}"]
+        lines[node.lineno - 1 : end_line] = new_lines
+        return removed
+
+    @staticmethod
+    def _find_import(
+        tree: ast.Module, line: int
+    ) -> tuple[list[ast.stmt], ast.Import | ast.ImportFrom | None]:
+        for parent in ast.walk(tree):
+            for field_name in ("body", "orelse", "finalbody"):
+                body = getattr(parent, field_name, None)
+                if not isinstance(body, list):
+                    continue
+                for node in body:
+                    if isinstance(node, ast.Import | ast.ImportFrom) and (
+                        node.lineno <= line <= (node.end_lineno or node.lineno)
+                    ):
+                        return body, node
+        return [], None
+
+    @staticmethod
+    def _in_availability_probe(tree: ast.Module, node: ast.stmt) -> bool:
+        """Whether an import sits in a try body that catches ImportError."""
+        for parent in ast.walk(tree):
+            if not isinstance(parent, ast.Try | ast.TryStar):
+                continue
+            caught: set[str] = set()
+            for handler in parent.handlers:
+                if handler.type is None:
+                    caught.update(IMPORT_ERRORS)
+                    continue
+                types = (
+                    handler.type.elts
+                    if isinstance(handler.type, ast.Tuple)
+                    else [handler.type]
+                )
+                caught.update(
+                    getattr(exc, "id", None) or getattr(exc, "attr", "") for exc in types
+                )
+            if not caught & IMPORT_ERRORS:
+                continue
+            if any(
+                child is node
+                for statement in parent.body
+                for child in ast.walk(statement)
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _alias_matches(
+        node: ast.Import | ast.ImportFrom, alias: ast.alias, reported: str
+    ) -> bool:
+        name, _, asname = reported.partition(" as ")
+        candidates = {alias.name}
+        if isinstance(node, ast.ImportFrom) and node.module:
+            candidates.add(f"{node.module}.{alias.name}")
+        if asname:
+            return name in candidates and asname == alias.asname
+        return name in candidates or name == alias.asname
+
+    @staticmethod
+    def _fix_blank_lines(lines: list[str], issue: Any, line: int) -> bool:
+        """Apply a blank-line rule to the lines above ``line``."""
+        target = lines[line - 1]
+        if issue.error_code == "E303":
+            allowed = 2 if not target[:1].isspace() else 1
+            top = line - 1
+            while top >= 1 and not lines[top - 1].strip():
+                top -= 1
+            blanks = line - 1 - top
+            if blanks <= allowed:
+                return False
+            del lines[top : top + blanks - allowed]
+            return True
+
+        # E302 / E305: two blank lines before the statement and its comments
+        top = line - 1
+        while top >= 1 and lines[top - 1].lstrip().startswith("#"):
+            top -= 1
+        start = top
+        while start >= 1 and not lines[start - 1].strip():
+            start -= 1
+        if start == 0:
+            return False
+        blanks = top - start
+        if blanks == 2:
+            return False
+        lines[start:top] = ["", ""]
+        return True
+
+    @staticmethod
+    def _string_interior_lines(content: str) -> set[int]:
+        """Lines inside multi-line string literals, where whitespace is data."""
+        interior: set[int] = set()
+        string_types = {tokenize.STRING}
+        if hasattr(tokenize, "FSTRING_MIDDLE"):
+            string_types.add(tokenize.FSTRING_MIDDLE)
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(content).readline):
+                if token.type in string_types and token.end[0] > token.start[0]:
+                    interior.update(range(token.start[0], token.end[0]))
+        except (tokenize.TokenError, SyntaxError):
+            pass
+        return interior
+
+    @staticmethod
+    def _line_map(before: str, after: str) -> dict[int, int]:
+        """Map 1-based line numbers of ``before`` to their line in ``after``."""
+        old_lines, new_lines = before.split("\n"), after.split("\n")
+        if old_lines == new_lines:
+            return {number: number for number in range(1, len(old_lines) + 1)}
+        mapping: dict[int, int] = {}
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal" or (tag == "replace" and i2 - i1 == j2 - j1):
+                for offset in range(i2 - i1):
+                    mapping[i1 + offset + 1] = j1 + offset + 1
+        return mapping
+
+    def _remap_issues(
+        self,
+        issues: list[Any],
+        original: dict[str, str],
+        current: dict[str, str],
+        modified: set[str],
+    ) -> list[Any]:
+        """Move remaining issues of modified files to their new line numbers."""
+        line_maps = {
+            path: self._line_map(original[path], current[path]) for path in modified
+        }
+        remapped = []
+        for issue in issues:
+            line_map = line_maps.get(issue.file_path)
+            new_line = line_map.get(issue.line_number) if line_map else None
+            if line_map is None or new_line is None or new_line == issue.line_number:
+                remapped.append(issue)
+                continue
+            new_lines = current[issue.file_path].split("\n")
+            remapped.append(
+                self._with_line(issue, new_line, new_lines[new_line - 1])
+            )
+        return remapped
+
+    @staticmethod
+    def _with_line(issue: Any, line_number: int, line_content: str) -> Any:
+        update = {"line_number": line_number, "line_content": line_content}
+        if hasattr(issue, "model_copy"):
+            return issue.model_copy(update=update)
+        return replace(issue, **update)
+
+    @staticmethod
+    def _parses(content: str) -> bool:
+        try:
+            ast.parse(content)
+        except SyntaxError:
+            return False
+        return True
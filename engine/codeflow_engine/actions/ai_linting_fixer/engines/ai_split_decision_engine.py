@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class AISplitDecisionEngine:
     """AI-powered decision engine for file splitting."""
 
+    # Bump when decisions change, so persisted cache entries miss
+    DECISION_VERSION = "1"
+
     def __init__(
         self,
         llm_manager: LLMProviderManager,
@@ -35,9 +38,9 @@ class AISplitDecisionEngine:
         self, file_path: str, content: str, complexity: dict[str, Any]
     ) -> tuple[bool, float, str]:
         """Determine if a file should be split using AI analysis."""
-        # Create stable, collision-resistant cache key using SHA-256
+        # Decisions depend only on the content, so identical files share an entry
         content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        cache_key = f"split_decision:{file_path}:{content_hash}:{len(content)}"
+        cache_key = f"split_decision:v{self.DECISION_VERSION}:{content_hash}"
 
         # Try cache first
         cached_result = self.cache_manager.get(cache_key)
@@ -0,0 +1,185 @@
+"""
+File Index Module
+
+Per-run index of the source files referenced by linter output. Each file is
+read once; line lookups use stored line offsets and function/class context
+lookups bisect a sorted scope table built from the AST.
+"""
+
+import ast
+import bisect
+from dataclasses import dataclass
+import io
+import logging
+from pathlib import Path
+import re
+
+
+logger = logging.getLogger(__name__)
+
+_DEFINITION_PATTERN = re.compile(r"(?:async\s+)?(def|class)\s+(\w+)")
+
+
+@dataclass(frozen=True)
+class ScopeBoundary:
+    """Start of a line range sharing the same enclosing function and class."""
+
+    line: int
+    function_name: str | None
+    class_name: str | None
+
+
+class FileIndex:
+    """Line offsets and scope table of a single source file."""
+
+    def __init__(self, text: str):
+        """
+        Index the text of a file.
+
+        Args:
+            text: File content
+        """
+        self.text = text
+        # offsets[i] is where line i + 1 starts; the last entry is the text end
+        # Only \n, \r\n and \r end lines, as for linters; str.splitlines also
+        # splits on form feeds and other separators
+        self.offsets = [0]
+        for line in io.StringIO(text, newline="").readlines():
+            self.offsets.append(self.offsets[-1] + len(line))
+        self.boundaries = self._build_scope_table()
+        self._boundary_lines = [boundary.line for boundary in self.boundaries]
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the file."""
+        return len(self.offsets) - 1
+
+    def get_line(self, line_number: int) -> str:
+        """
+        Get the content of a line without its line ending.
+
+        Args:
+            line_number: 1-based line number
+
+        Returns:
+            Line content, or an empty string if out of range
+        """
+        if not 1 <= line_number <= self.line_count:
+            return ""
+        line = self.text[self.offsets[line_number - 1] : self.offsets[line_number]]
+        return line.rstrip("\n\r")
+
+    def get_context(self, line_number: int) -> tuple[str | None, str | None]:
+        """
+        Get the innermost function and class enclosing a line.
+
+        Args:
+            line_number: 1-based line number
+
+        Returns:
+            Tuple of (function name, class name), None where absent
+        """
+        position = bisect.bisect_right(self._boundary_lines, line_number) - 1
+        if position < 0:
+            return None, None
+        boundary = self.boundaries[position]
+        return boundary.function_name, boundary.class_name
+
+    def _build_scope_table(self) -> list[ScopeBoundary]:
+        """Build the sorted scope table, from the AST if the file parses."""
+        try:
+            tree = ast.parse(self.text)
+        except (SyntaxError, ValueError):
+            return self._scan_scope_table()
+
+        boundaries: list[ScopeBoundary] = []
+
+        def visit(node: ast.AST, function_name: str | None, class_name: str | None):
+            for child in ast.iter_child_nodes(node):
+                if not isinstance(
+                    child, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+                ):
+                    visit(child, function_name, class_name)
+                    continue
+                start_line = min(
+                    [child.lineno, *(d.lineno for d in child.decorator_list)]
+                )
+                end_line = child.end_lineno or child.lineno
+                if isinstance(child, ast.ClassDef):
+                    inner = (function_name, child.name)
+                else:
+                    inner = (child.name, class_name)
+                boundaries.append(ScopeBoundary(start_line, *inner))
+                visit(child, *inner)
+                boundaries.append(ScopeBoundary(end_line + 1, function_name, class_name))
+
+        visit(tree, None, None)
+        return boundaries
+
+    def _scan_scope_table(self) -> list[ScopeBoundary]:
+        """Build the scope table from indentation, for files that do not parse."""
+        boundaries: list[ScopeBoundary] = []
+        # Open scopes as (indent, function name, class name)
+        stack: list[tuple[int, str | None, str | None]] = []
+        for line_number in range(1, self.line_count + 1):
+            line = self.get_line(line_number)
+            stripped = line.lstrip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            indent = len(line) - len(stripped)
+            if stack and indent <= stack[-1][0]:
+                while stack and indent <= stack[-1][0]:
+                    stack.pop()
+                outer = stack[-1][1:] if stack else (None, None)
+                boundaries.append(ScopeBoundary(line_number, *outer))
+            match = _DEFINITION_PATTERN.match(stripped)
+            if match:
+                function_name, class_name = stack[-1][1:] if stack else (None, None)
+                if match.group(1) == "class":
+                    class_name = match.group(2)
+                else:
+                    function_name = match.group(2)
+                stack.append((indent, function_name, class_name))
+                boundaries.append(ScopeBoundary(line_number, function_name, class_name))
+        return boundaries
+
+
+class FileIndexCache:
+    """Per-run cache of file indexes keyed by path."""
+
+    def __init__(self):
+        self._indexes: dict[str, FileIndex | None] = {}
+
+    def get(self, file_path: str) -> FileIndex | None:
+        """
+        Get the index of a file, reading it on first use.
+
+        Args:
+            file_path: Path of the file
+
+        Returns:
+            File index, or None if the file cannot be read
+        """
+        if file_path not in self._indexes:
+            try:
+                text = Path(file_path).read_text(encoding="utf-8")
+                self._indexes[file_path] = FileIndex(text)
+            except Exception as e:
+                logger.debug("Failed to index %s - %s", file_path, e)
+                self._indexes[file_path] = None
+        return self._indexes[file_path]
+
+    def get_line(self, file_path: str, line_number: int) -> str:
+        """Get a line of a file, or an empty string if unavailable."""
+        index = self.get(file_path)
+        return index.get_line(line_number) if index else ""
+
+    def get_context(
+        self, file_path: str, line_number: int
+    ) -> tuple[str | None, str | None]:
+        """Get the function and class enclosing a line of a file."""
+        index = self.get(file_path)
+        return index.get_context(line_number) if index else (None, None)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
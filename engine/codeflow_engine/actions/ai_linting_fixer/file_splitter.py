@@ -14,6 +14,7 @@ from codeflow_engine.actions.ai_linting_fixer.engines.ai_split_decision_engine i
     AISplitDecisionEngine,
 )
 from codeflow_engine.actions.ai_linting_fixer.performance_optimizer import (
+    IntelligentCache,
     ParallelProcessor,
 )
 from codeflow_engine.actions.llm.manager import (
@@ -39,14 +40,15 @@ class FileSplitter:
         llm_manager: LLMProviderManager,
         metrics_collector: MetricsCollector | None = None,
         parallel_processor: ParallelProcessor | None = None,
+        cache_manager: IntelligentCache | None = None,
     ):
         self.llm_manager = llm_manager
         self.metrics_collector = metrics_collector or MetricsCollector()
 
         # Initialize components
         self.parallel_processor = parallel_processor or ParallelProcessor()
-        self.complexity_analyzer = FileComplexityAnalyzer()
-        self.ai_decision_engine = AISplitDecisionEngine(llm_manager)
+        self.complexity_analyzer = FileComplexityAnalyzer(cache_manager)
+        self.ai_decision_engine = AISplitDecisionEngine(llm_manager, cache_manager)
         self.component_splitter = ComponentSplitter(self.parallel_processor)
 
     async def split_file(
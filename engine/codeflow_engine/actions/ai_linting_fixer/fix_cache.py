@@ -0,0 +1,315 @@
+"""
+AI Fix Cache Module
+
+Persistent, content-addressed cache of AI fixes, stored in SQLite alongside
+the AI interaction log so repeated runs reuse fixes for unchanged snippets.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from codeflow_engine.actions.ai_linting_fixer.context_extractor import CodeRegion
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_AGE_DAYS = 90
+# Eviction trims the cache to this fraction of max_entries, so it runs rarely
+EVICTION_LOW_WATERMARK = 0.9
+
+
+def normalize_snippet(text: str) -> tuple[str, str]:
+    """
+    Normalize a code snippet for cache lookups.
+
+    Line endings and trailing whitespace are normalized and the indentation
+    common to all non-blank lines is removed, so the same code nested at a
+    different depth maps to the same entry.
+
+    Args:
+        text: Code snippet
+
+    Returns:
+        Tuple of (normalized snippet, removed common indentation)
+    """
+    lines = [line.rstrip() for line in text.replace("\r\n", "\n").split("\n")]
+    indents = [line[: len(line) - len(line.lstrip())] for line in lines if line]
+    indent = os.path.commonprefix(indents) if indents else ""
+    return "\n".join(line[len(indent) :] for line in lines), indent
+
+
+class AIFixCache:
+    """SQLite cache of region patches keyed by snippet, issue and model."""
+
+    def __init__(
+        self,
+        db_path: str = "ai_linting_interactions.db",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ):
+        """
+        Initialize the fix cache.
+
+        Args:
+            db_path: SQLite database file, shared with AIInteractionDB
+            max_entries: Entries kept before least recently used ones are evicted
+            max_age_days: Entries older than this are treated as misses
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "rejected": 0}
+        self.init_database()
+
+    def init_database(self):
+        """Create the cache table if needed."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ai_fix_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    error_code TEXT NOT NULL,
+                    agent_type TEXT NOT NULL,
+                    model_used TEXT NOT NULL,
+                    start_offset INTEGER NOT NULL,
+                    end_offset INTEGER NOT NULL,
+                    replacement TEXT NOT NULL,
+                    explanation TEXT,
+                    confidence_score REAL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_fix_cache_last_used "
+                "ON ai_fix_cache(last_used_at)"
+            )
+
+    @staticmethod
+    def make_key(
+        region: CodeRegion,
+        issue: Any,
+        agent_type: str,
+        model: str,
+        prompt_version: str,
+    ) -> str:
+        """
+        Build the cache key of a fix request.
+
+        Args:
+            region: Region sent to the LLM
+            issue: Issue being fixed, inside the region
+            agent_type: Specialist handling the issue
+            model: Model name
+            prompt_version: Version of the prompt format
+
+        Returns:
+            Hex digest identifying the request
+        """
+        snippet, _ = normalize_snippet(region.text)
+        imports, _ = normalize_snippet(region.imports)
+        payload = json.dumps(
+            [
+                snippet,
+                imports,
+                issue.line_number - region.start_line,
+                issue.error_code,
+                issue.message,
+                agent_type,
+                model,
+                prompt_version,
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str, region: CodeRegion) -> dict[str, Any] | None:
+        """
+        Look up a cached patch and rebase it onto a region.
+
+        Args:
+            cache_key: Key from make_key
+            region: Region the patch is applied to
+
+        Returns:
+            Patch with absolute ``start_line``, ``end_line``, re-indented
+            ``replacement``, ``explanation`` and ``confidence``, or None
+        """
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    """
+                    SELECT start_offset, end_offset, replacement, explanation,
+                           confidence_score, created_at
+                    FROM ai_fix_cache WHERE cache_key = ?
+                    """,
+                    (cache_key,),
+                ).fetchone()
+                if row is not None and now - row[5] > self.max_age_seconds:
+                    conn.execute("DELETE FROM ai_fix_cache WHERE cache_key = ?", (cache_key,))
+                    row = None
+                if row is not None:
+                    conn.execute(
+                        """
+                        UPDATE ai_fix_cache
+                        SET last_used_at = ?, hit_count = hit_count + 1
+                        WHERE cache_key = ?
+                        """,
+                        (now, cache_key),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Fix cache lookup failed: {e}")
+            row = None
+
+        with self._lock:
+            self._stats["hits" if row is not None else "misses"] += 1
+        if row is None:
+            return None
+
+        start_offset, end_offset, replacement, explanation, confidence, _ = row
+        _, indent = normalize_snippet(region.text)
+        return {
+            "start_line": region.start_line + start_offset,
+            "end_line": region.start_line + end_offset,
+            "replacement": "\n".join(
+                f"{indent}{line}" if line else line for line in replacement.split("\n")
+            )
+            if replacement
+            else "",
+            "explanation": explanation or "",
+            "confidence": confidence,
+        }
+
+    def put(
+        self,
+        cache_key: str,
+        region: CodeRegion,
+        patch: dict[str, Any],
+        error_code: str,
+        agent_type: str,
+        model: str,
+        confidence: float | None = None,
+    ) -> None:
+        """
+        Store a validated patch relative to its region.
+
+        Args:
+            cache_key: Key from make_key
+            region: Region the patch was produced for
+            patch: Patch with absolute ``start_line``, ``end_line`` and ``replacement``
+            error_code: Fixed error code
+            agent_type: Specialist that produced the fix
+            model: Model that produced the fix
+            confidence: Confidence score of the fix
+        """
+        _, indent = normalize_snippet(region.text)
+        replacement = "\n".join(
+            line.removeprefix(indent) for line in patch["replacement"].split("\n")
+        )
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO ai_fix_cache (
+                        cache_key, error_code, agent_type, model_used,
+                        start_offset, end_offset, replacement, explanation,
+                        confidence_score, created_at, last_used_at, hit_count
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                    """,
+                    (
+                        cache_key,
+                        error_code,
+                        agent_type,
+                        model,
+                        patch["start_line"] - region.start_line,
+                        patch["end_line"] - region.start_line,
+                        replacement if patch["replacement"] else "",
+                        patch.get("explanation", ""),
+                        confidence,
+                        now,
+                        now,
+                    ),
+                )
+                evicted = self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Fix cache store failed: {e}")
+            return
+
+        with self._lock:
+            self._stats["stores"] += 1
+            self._stats["evictions"] += evicted
+
+    def invalidate(self, cache_key: str) -> None:
+        """
+        Drop an entry whose fix no longer validates.
+
+        Args:
+            cache_key: Key from make_key
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM ai_fix_cache WHERE cache_key = ?", (cache_key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Fix cache invalidation failed: {e}")
+        with self._lock:
+            self._stats["rejected"] += 1
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Remove expired entries and, above max_entries, the least recently used."""
+        removed = conn.execute(
+            "DELETE FROM ai_fix_cache WHERE created_at < ?",
+            (time.time() - self.max_age_seconds,),
+        ).rowcount
+        count = conn.execute("SELECT COUNT(*) FROM ai_fix_cache").fetchone()[0]
+        if count > self.max_entries:
+            keep = int(self.max_entries * EVICTION_LOW_WATERMARK)
+            removed += conn.execute(
+                """
+                DELETE FROM ai_fix_cache WHERE cache_key IN (
+                    SELECT cache_key FROM ai_fix_cache
+                    ORDER BY last_used_at ASC LIMIT ?
+                )
+                """,
+                (count - keep,),
+            ).rowcount
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hits, misses, stores, evictions and rejected entries of this
+            instance, its hit rate, and the stored entry and lifetime hit counts
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                entries, total_hits = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM ai_fix_cache"
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Fix cache statistics failed: {e}")
+            entries, total_hits = 0, 0
+        stats["entries"] = entries
+        stats["lifetime_hits"] = total_hits
+        return stats
+
+    def clear(self) -> None:
+        """Remove all cached fixes."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM ai_fix_cache")
@@ -0,0 +1,100 @@
+"""
+Interaction Blobs Module
+
+Content-addressed storage for the prompt and response bodies of the AI
+interaction log. Each distinct body is stored once and referenced from
+interaction rows by its SHA-256 hash.
+"""
+
+from collections.abc import Iterable
+import hashlib
+import sqlite3
+import zlib
+
+
+# Interaction fields whose text lives in ai_blobs, with their hash columns
+BODY_FIELDS = ("system_prompt", "user_prompt", "ai_response")
+HASH_COLUMNS = tuple(f"{field}_hash" for field in BODY_FIELDS)
+
+# Bodies at least this long are zlib compressed when that makes them smaller
+COMPRESSION_THRESHOLD = 256
+
+# (hash, compressed, stored bytes, text)
+EncodedBody = tuple[str, bool, bytes, str]
+
+
+def init_blob_tables(conn: sqlite3.Connection) -> None:
+    """Create the blob table."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ai_blobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            hash TEXT NOT NULL UNIQUE,
+            compressed BOOLEAN NOT NULL,
+            body BLOB NOT NULL
+        )
+    """
+    )
+
+
+def encode_body(text: str, compress: bool = True) -> EncodedBody:
+    """Hash a body and encode it for storage."""
+    raw = text.encode("utf-8")
+    body_hash = hashlib.sha256(raw).hexdigest()
+    if compress and len(raw) >= COMPRESSION_THRESHOLD:
+        packed = zlib.compress(raw)
+        if len(packed) < len(raw):
+            return body_hash, True, packed, text
+    return body_hash, False, raw, text
+
+
+def decode_body(compressed: bool, body: bytes) -> str:
+    """Decode a stored body."""
+    return (zlib.decompress(body) if compressed else body).decode("utf-8")
+
+
+def write_bodies(conn: sqlite3.Connection, bodies: Iterable[EncodedBody]) -> int:
+    """
+    Store bodies not stored yet.
+
+    Args:
+        conn: Connection inside the caller's transaction
+        bodies: Encoded bodies, possibly repeated
+
+    Returns:
+        Number of new bodies
+    """
+    unique = {body[0]: body for body in bodies}
+    added = 0
+    for body_hash, compressed, body, _ in unique.values():
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO ai_blobs (hash, compressed, body) VALUES (?, ?, ?)",
+            (body_hash, compressed, body),
+        )
+        added += cursor.rowcount
+    return added
+
+
+def load_bodies(conn: sqlite3.Connection, hashes: Iterable[str | None]) -> dict[str, str]:
+    """Fetch and decode bodies by hash."""
+    wanted = list({body_hash for body_hash in hashes if body_hash})
+    bodies: dict[str, str] = {}
+    # Stay below SQLite's bound parameter limit
+    for start in range(0, len(wanted), 500):
+        chunk = wanted[start : start + 500]
+        placeholders = ",".join("?" for _ in chunk)
+        for body_hash, compressed, body in conn.execute(
+            f"SELECT hash, compressed, body FROM ai_blobs WHERE hash IN ({placeholders})",
+            chunk,
+        ):
+            bodies[body_hash] = decode_body(compressed, body)
+    return bodies
+
+
+def delete_orphan_bodies(conn: sqlite3.Connection) -> int:
+    """Delete bodies no interaction references any more."""
+    references = " UNION ".join(
+        f"SELECT {column} FROM ai_interactions WHERE {column} IS NOT NULL"
+        for column in HASH_COLUMNS
+    )
+    return conn.execute(f"DELETE FROM ai_blobs WHERE hash NOT IN ({references})").rowcount
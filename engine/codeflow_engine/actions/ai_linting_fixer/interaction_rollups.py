@@ -0,0 +1,184 @@
+"""
+Interaction Rollups Module
+
+Incrementally maintained aggregates of the AI interaction log, so
+statistics read a few rollup rows instead of scanning every interaction.
+Rollups are kept per day, provider, model, issue type and agent type, plus
+an interaction count per file.
+"""
+
+import sqlite3
+
+
+# Upper bounds in seconds of the API latency histogram buckets; a final
+# bucket counts everything slower than the last bound
+LATENCY_BUCKET_BOUNDS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+LATENCY_BUCKET_COLUMNS = tuple(
+    f"latency_bucket_{index}" for index in range(len(LATENCY_BUCKET_BOUNDS) + 1)
+)
+
+# Confidence thresholds of the high and low confidence counts
+HIGH_CONFIDENCE = 0.8
+LOW_CONFIDENCE = 0.5
+
+ROLLUP_KEY_COLUMNS = ("day", "provider_used", "model_used", "issue_type", "agent_type")
+
+# Rollup column -> aggregate over the ai_interactions rows being added
+_SUMMED_COLUMNS = {
+    "attempts": "COUNT(*)",
+    "successes": "SUM(fix_successful = 1)",
+    "failures": "SUM(fix_successful = 0)",
+    "confidence_count": "COUNT(confidence_score)",
+    "confidence_sum": "SUM(confidence_score)",
+    "high_confidence_count": f"SUM(confidence_score > {HIGH_CONFIDENCE})",
+    "low_confidence_count": f"SUM(confidence_score < {LOW_CONFIDENCE})",
+    "prompt_tokens": "SUM(prompt_tokens)",
+    "response_tokens": "SUM(response_tokens)",
+    "file_size_count": "COUNT(file_size_chars)",
+    "file_size_sum": "SUM(file_size_chars)",
+    "latency_count": "COUNT(api_response_time)",
+    "latency_sum": "SUM(api_response_time)",
+}
+_SUMMED_COLUMNS.update(
+    {
+        column: (
+            f"SUM(api_response_time > {lower} AND api_response_time <= {upper})"
+            if lower is not None
+            else f"SUM(api_response_time <= {upper})"
+        )
+        for column, lower, upper in zip(
+            LATENCY_BUCKET_COLUMNS[:-1],
+            (None, *LATENCY_BUCKET_BOUNDS[:-1]),
+            LATENCY_BUCKET_BOUNDS,
+            strict=True,
+        )
+    }
+)
+_SUMMED_COLUMNS[LATENCY_BUCKET_COLUMNS[-1]] = (
+    f"SUM(api_response_time > {LATENCY_BUCKET_BOUNDS[-1]})"
+)
+
+_REAL_COLUMNS = ("confidence_sum", "latency_sum")
+
+_UPDATE_ROLLUPS = f"""
+    INSERT INTO interaction_rollups (
+        {", ".join(ROLLUP_KEY_COLUMNS)}, {", ".join(_SUMMED_COLUMNS)},
+        confidence_min, confidence_max
+    )
+    SELECT
+        COALESCE(DATE(timestamp), ''), provider_used, model_used, issue_type,
+        COALESCE(agent_type, ''),
+        {", ".join(f"COALESCE({aggregate}, 0)" for aggregate in _SUMMED_COLUMNS.values())},
+        MIN(confidence_score), MAX(confidence_score)
+    FROM ai_interactions
+    WHERE id > ?
+    GROUP BY 1, 2, 3, 4, 5
+    ON CONFLICT ({", ".join(ROLLUP_KEY_COLUMNS)}) DO UPDATE SET
+        {", ".join(f"{column} = {column} + excluded.{column}" for column in _SUMMED_COLUMNS)},
+        confidence_min = CASE
+            WHEN confidence_min IS NULL OR excluded.confidence_min < confidence_min
+            THEN excluded.confidence_min ELSE confidence_min END,
+        confidence_max = CASE
+            WHEN confidence_max IS NULL OR excluded.confidence_max > confidence_max
+            THEN excluded.confidence_max ELSE confidence_max END
+"""
+
+_UPDATE_FILE_ROLLUPS = """
+    INSERT INTO file_rollups (file_path, interactions)
+    SELECT file_path, COUNT(*) FROM ai_interactions
+    WHERE id > ?
+    GROUP BY file_path
+    ON CONFLICT (file_path) DO UPDATE SET
+        interactions = interactions + excluded.interactions
+"""
+
+
+def init_rollup_tables(conn: sqlite3.Connection) -> bool:
+    """
+    Create the rollup tables.
+
+    Returns:
+        Whether the tables were new and need building from existing rows
+    """
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'interaction_rollups'"
+    ).fetchone()
+    summed = ",\n            ".join(
+        f"{column} {'REAL' if column in _REAL_COLUMNS else 'INTEGER'} NOT NULL DEFAULT 0"
+        for column in _SUMMED_COLUMNS
+    )
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS interaction_rollups (
+            day TEXT NOT NULL,
+            provider_used TEXT NOT NULL,
+            model_used TEXT NOT NULL,
+            issue_type TEXT NOT NULL,
+            agent_type TEXT NOT NULL,
+            {summed},
+            confidence_min REAL,
+            confidence_max REAL,
+            PRIMARY KEY ({", ".join(ROLLUP_KEY_COLUMNS)})
+        ) WITHOUT ROWID
+    """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS file_rollups (
+            file_path TEXT PRIMARY KEY,
+            interactions INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """
+    )
+    return not existed
+
+
+def update_rollups(conn: sqlite3.Connection, after_id: int) -> None:
+    """
+    Add interactions with ids above after_id to the rollups.
+
+    Args:
+        conn: Connection inside the caller's write transaction
+        after_id: Largest interaction id already rolled up
+    """
+    conn.execute(_UPDATE_ROLLUPS, (after_id,))
+    conn.execute(_UPDATE_FILE_ROLLUPS, (after_id,))
+
+
+def rebuild_rollups(conn: sqlite3.Connection) -> None:
+    """Rebuild the rollups from all stored interactions."""
+    conn.execute("DELETE FROM interaction_rollups")
+    conn.execute("DELETE FROM file_rollups")
+    update_rollups(conn, 0)
+
+
+def remove_rollups_before(conn: sqlite3.Connection, cutoff_day: str) -> None:
+    """
+    Take interactions from before cutoff_day out of the rollups.
+
+    Must run before those interactions are deleted.
+    """
+    # Like DATE(timestamp) < cutoff_day, unparsable timestamps ('') never match
+    conn.execute(
+        "DELETE FROM interaction_rollups WHERE day <> '' AND day < ?", (cutoff_day,)
+    )
+    conn.execute(
+        """
+        UPDATE file_rollups SET interactions = interactions - old.count
+        FROM (
+            SELECT file_path, COUNT(*) AS count FROM ai_interactions
+            WHERE DATE(timestamp) < ?
+            GROUP BY file_path
+        ) AS old
+        WHERE file_rollups.file_path = old.file_path
+        """,
+        (cutoff_day,),
+    )
+    conn.execute("DELETE FROM file_rollups WHERE interactions <= 0")
+
+
+def latency_bucket_labels() -> list[str]:
+    """Labels of the latency histogram buckets."""
+    return [f"<={bound}s" for bound in LATENCY_BUCKET_BOUNDS] + [
+        f">{LATENCY_BUCKET_BOUNDS[-1]}s"
+    ]
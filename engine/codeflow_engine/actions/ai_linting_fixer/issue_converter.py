@@ -33,6 +33,8 @@ def convert_detection_issue_to_model_issue(
         message=detection_issue.message,
         line_content=getattr(detection_issue, "line_content", ""),
         column=column_number,
+        function_name=getattr(detection_issue, "function_name", None),
+        class_name=getattr(detection_issue, "class_name", None),
     )
 
 
@@ -11,7 +11,15 @@ import logging
 import time
 from typing import Any, cast
 
-from codeflow_engine.actions.ai_linting_fixer.ai_agent_manager import AIAgentManager
+from codeflow_engine.actions.ai_linting_fixer.ai_agent_manager import (
+    REGION_PROMPT_VERSION,
+    AIAgentManager,
+)
+from codeflow_engine.actions.ai_linting_fixer.code_analyzer import CodeAnalyzer
+from codeflow_engine.actions.ai_linting_fixer.context_extractor import (
+    CodeRegion,
+    ContextExtractor,
+)
 from codeflow_engine.actions.ai_linting_fixer.error_handler import (
     ErrorCategory,
     ErrorHandler,
@@ -24,13 +32,26 @@ from codeflow_engine.actions.ai_linting_fixer.detection import (
     LintingIssue as DetectionLintingIssue,
 )
 from codeflow_engine.actions.ai_linting_fixer.file_manager import FileManager
+from codeflow_engine.actions.ai_linting_fixer.fix_cache import AIFixCache
 from codeflow_engine.actions.ai_linting_fixer.models import (
     LintingFixResult,
     LintingIssue,
 )
+from codeflow_engine.actions.ai_linting_fixer.validation_manager import (
+    ValidationConfig,
+    ValidationManager,
+    ValidationResult,
+)
 
 logger = logging.getLogger(__name__)
 
+# Batched fixing: issues of one file share a request while their listings fit
+# this budget; the file content is sent once per request, whatever its size
+BATCH_TOKEN_BUDGET = 8000
+CHARS_PER_TOKEN = 4  # rough prompt size estimate
+BATCH_PROMPT_OVERHEAD_CHARS = 1000  # instructions and response format
+MAX_BATCH_SIZE = 20
+
 
 class IssueFixer:
     """Handles the actual fixing of linting issues."""
@@ -41,12 +62,40 @@ class IssueFixer:
         file_manager: FileManager,
         error_handler: ErrorHandler,
         database=None,
+        batch_fixes: bool = False,
+        batch_token_budget: int = BATCH_TOKEN_BUDGET,
+        region_context: bool = True,
+        fix_cache: AIFixCache | None = None,
+        validation_manager: ValidationManager | None = None,
     ):
-        """Initialize the issue fixer."""
+        """
+        Initialize the issue fixer.
+
+        Args:
+            ai_agent_manager: AI agent manager building prompts and parsing responses
+            file_manager: File manager
+            error_handler: Error handler
+            database: Optional interaction database
+            batch_fixes: Fix compatible issues of a file in one LLM request
+            batch_token_budget: Approximate token budget of the issue listings
+                and instructions of a batch prompt, excluding the file content
+            region_context: Send only the enclosing scope of an issue and apply
+                the returned line-range patch, instead of the whole file
+            fix_cache: Optional cache of region patches, consulted before the LLM
+            validation_manager: Validates fixes taken from the cache; defaults
+                to all checks except running tests
+        """
         self.ai_agent_manager = ai_agent_manager
         self.file_manager = file_manager
         self.error_handler = error_handler
         self.database = database
+        self.batch_fixes = batch_fixes
+        self.batch_token_budget = batch_token_budget
+        self.context_extractor = ContextExtractor() if region_context else None
+        self.fix_cache = fix_cache
+        self.validation_manager = validation_manager or ValidationManager(
+            ValidationConfig(enable_test_validation=False)
+        )
 
     def fix_issues_with_ai(
         self,
@@ -194,10 +243,6 @@ class IssueFixer:
                 raise FileNotFoundError(msg)
 
             # Validate syntax before processing
-            from codeflow_engine.actions.ai_linting_fixer.code_analyzer import (
-                CodeAnalyzer,
-            )
-
             code_analyzer = CodeAnalyzer()
             syntax_valid_before = code_analyzer.validate_python_syntax(original_content)
             if not syntax_valid_before:
@@ -210,38 +255,49 @@ class IssueFixer:
             fixed_content = original_content
             fixed_issues = []
 
-            for issue in issues:
-                try:
-                    # Create issue-specific context
-                    issue_context = create_error_context(
-                        file_path=file_path,
-                        line_number=issue.line_number,
-                        function_name="_fix_file_issues",
-                        workflow_step="issue_fixing",
-                        provider=provider,
-                        model=model,
-                        error_code=issue.error_code,
-                    )
+            if self.batch_fixes:
+                batch_result = self.fix_issues_batched(
+                    file_path, original_content, issues, provider, model
+                )
+                fixed_content = batch_result["content"]
+                fixed_issues = [
+                    issue.error_code
+                    for issue, fixed in zip(issues, batch_result["outcomes"], strict=True)
+                    if fixed
+                ]
+            else:
+                for issue in issues:
+                    try:
+                        # Create issue-specific context
+                        issue_context = create_error_context(
+                            file_path=file_path,
+                            line_number=issue.line_number,
+                            function_name="_fix_file_issues",
+                            workflow_step="issue_fixing",
+                            provider=provider,
+                            model=model,
+                            error_code=issue.error_code,
+                        )
 
-                    # Attempt to fix the issue
-                    fix_result = self.fix_single_issue(
-                        file_path=file_path,
-                        content=fixed_content,
-                        issue=issue,
-                        provider=provider,
-                        model=model,
-                    )
+                        # Attempt to fix the issue
+                        fix_result = self.fix_single_issue(
+                            file_path=file_path,
+                            content=fixed_content,
+                            issue=issue,
+                            provider=provider,
+                            model=model,
+                        )
 
-                    if fix_result["success"]:
-                        fixed_content = fix_result["content"]
-                        fixed_issues.append(issue.error_code)
+                        if fix_result["success"]:
+                            fixed_content = fix_result["content"]
+                            fixed_issues.append(issue.error_code)
 
-                except Exception as e:
-                    # Handle issue-specific errors
-                    self._record_error(e, issue_context)
+                    except Exception as e:
+                        # Handle issue-specific errors
+                        self._record_error(e, issue_context)
 
-                    # Continue with next issue
-                    continue
+                        # Continue with next issue
+                        continue
 
             # Validate syntax after processing
             syntax_valid_after = code_analyzer.validate_python_syntax(fixed_content)
@@ -357,40 +413,41 @@ class IssueFixer:
             system_prompt = self.ai_agent_manager.get_specialized_system_prompt(
                 agent_type, [detection_issue]
             )
-            user_prompt = self.ai_agent_manager.get_user_prompt(
-                file_path, content, [detection_issue]
+            region = (
+                self.context_extractor.extract(content, issue)
+                if self.context_extractor
+                else None
             )
+            cache_key = None
+            if region is not None and self.fix_cache is not None:
+                cache_key = self.fix_cache.make_key(
+                    region, issue, agent_type, model or "gpt-4.1", REGION_PROMPT_VERSION
+                )
+                cached_result = self._apply_cached_fix(
+                    file_path, content, issue, region, cache_key, agent_type
+                )
+                if cached_result is not None:
+                    return cached_result
 
-            # Call AI - Honor provider override if a specific provider is requested
-            llm_mgr = self.ai_agent_manager.llm_manager
-            request_payload = {
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "model": model or "gpt-4.1",
-                "temperature": 0.1,
-                "max_tokens": 2000,
-            }
-            if provider:
-                request_payload["provider"] = provider
-
-            if provider and hasattr(llm_mgr, "get_llm"):
-                chosen = llm_mgr.get_llm(provider)
-                if chosen:
-                    response = chosen.complete(request_payload)
-                else:
-                    response = llm_mgr.complete(request_payload)
+            if region is not None:
+                user_prompt = self.ai_agent_manager.get_region_user_prompt(
+                    file_path, region, [detection_issue]
+                )
             else:
-                response = llm_mgr.complete(request_payload)
-
-            # Handle async/sync ambiguity - check if response is a coroutine
-            if inspect.isawaitable(response):
-                response = asyncio.run(cast(Coroutine[Any, Any, Any], response))
+                user_prompt = self.ai_agent_manager.get_user_prompt(
+                    file_path, content, [detection_issue]
+                )
 
-            # Parse response - safely extract content first
-            response_content = self._safe_extract_response_content(response)
-            parsed_response = self.ai_agent_manager.parse_ai_response(response_content)
+            # Call AI and parse response
+            response_content = self._complete(system_prompt, user_prompt, provider, model)
+            if region is not None:
+                parsed_response = self.ai_agent_manager.parse_patch_response(
+                    response_content
+                )
+            else:
+                parsed_response = self.ai_agent_manager.parse_ai_response(
+                    response_content
+                )
 
             if not parsed_response.get("success", False):
                 error_msg = parsed_response.get("error", "Unknown error")
@@ -443,9 +500,23 @@ class IssueFixer:
                     "raw_response": parsed_response.get("raw_response", ""),
                 }
 
-            # Apply the fix to the specific line
+            # Apply the patch to the region, or the fix to the specific line
             fixed_line = parsed_response.get("fixed_code", "")
-            if fixed_line and issue.line_number > 0:
+            if region is not None:
+                fixed_content, patch_error = self._apply_region_patch(
+                    content, region, parsed_response
+                )
+                if patch_error:
+                    logger.warning(
+                        f"Rejected patch for {issue.error_code} in {file_path}: "
+                        f"{patch_error}"
+                    )
+                    return {
+                        "success": False,
+                        "error": patch_error,
+                        "agent_type": agent_type,
+                    }
+            elif fixed_line and issue.line_number > 0:
                 # Split content into lines
                 lines = content.split("\n")
                 if 1 <= issue.line_number <= len(lines):
@@ -463,10 +534,9 @@ class IssueFixer:
             )
 
             # Log confidence score to performance tracker
-            if hasattr(self.ai_agent_manager, "performance_tracker"):
-                self.ai_agent_manager.performance_tracker.log_confidence_score(
-                    confidence
-                )
+            tracker = getattr(self.ai_agent_manager, "performance_tracker", None)
+            if hasattr(tracker, "log_confidence_score"):
+                tracker.log_confidence_score(confidence)
 
             # Log interaction to database if available
             if self.database:
@@ -504,6 +574,17 @@ class IssueFixer:
                 except Exception as e:
                     logger.warning(f"Failed to log interaction to database: {e}")
 
+            if cache_key is not None:
+                self.fix_cache.put(
+                    cache_key,
+                    region,
+                    parsed_response,
+                    issue.error_code,
+                    agent_type,
+                    model or "gpt-4.1",
+                    confidence,
+                )
+
             return {
                 "success": True,
                 "content": fixed_content,
@@ -519,6 +600,361 @@ class IssueFixer:
             )
             return {"success": False, "error": str(e), "agent_type": "unknown"}
 
+    def _apply_cached_fix(
+        self,
+        file_path: str,
+        content: str,
+        issue: LintingIssue,
+        region: CodeRegion,
+        cache_key: str,
+        agent_type: str,
+    ) -> dict[str, Any] | None:
+        """
+        Apply a cached patch without calling the LLM.
+
+        The patch goes through the same local checks as a fresh one and then
+        through the validation manager; entries that fail are dropped.
+
+        Returns:
+            Fix result, or None on a miss or when the cached patch is rejected
+        """
+        cached = self.fix_cache.get(cache_key, region)
+        if cached is None:
+            return None
+
+        fixed_content, patch_error = self._apply_region_patch(content, region, cached)
+        if patch_error is None:
+            keep, checks = self.validation_manager.validate_file_fix(
+                file_path, content, fixed_content, [issue.error_code]
+            )
+            if not keep:
+                failed = [
+                    check.message
+                    for check in checks
+                    if check.result == ValidationResult.FAILED
+                ]
+                patch_error = "; ".join(failed) or "Validation recommended rollback"
+        if patch_error:
+            logger.info(
+                f"Discarding cached fix for {issue.error_code} in {file_path}: "
+                f"{patch_error}"
+            )
+            self.fix_cache.invalidate(cache_key)
+            return None
+
+        logger.debug(f"Applied cached fix for {issue.error_code} in {file_path}")
+        return {
+            "success": True,
+            "content": fixed_content,
+            "confidence": cached["confidence"] or 0.0,
+            "agent_type": agent_type,
+            "changes_made": [],
+            "explanation": cached["explanation"],
+            "cached": True,
+        }
+
+    def _apply_region_patch(
+        self, content: str, region: CodeRegion, patch: dict[str, Any]
+    ) -> tuple[str, str | None]:
+        """
+        Apply a line-range patch and re-validate the result locally.
+
+        Args:
+            content: Content the region was extracted from
+            region: Region the patch was requested for
+            patch: Parsed patch response
+
+        Returns:
+            Tuple of (patched content, error); on error the content is unchanged
+        """
+        try:
+            fixed_content = self.context_extractor.apply_patch(
+                content,
+                region,
+                patch["start_line"],
+                patch["end_line"],
+                patch["replacement"],
+            )
+        except ValueError as e:
+            return content, str(e)
+
+        if fixed_content == content:
+            return content, "Patch does not change the code"
+        code_analyzer = self.context_extractor.code_analyzer
+        if code_analyzer.validate_python_syntax(
+            content
+        ) and not code_analyzer.validate_python_syntax(fixed_content):
+            return content, "Patch produced invalid syntax"
+        return fixed_content, None
+
+    def _complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        provider: str | None,
+        model: str | None,
+        max_tokens: int = 2000,
+    ) -> str:
+        """Send one chat request and return the normalized response content."""
+        # Honor provider override if a specific provider is requested
+        llm_mgr = self.ai_agent_manager.llm_manager
+        request_payload = {
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "model": model or "gpt-4.1",
+            "temperature": 0.1,
+            "max_tokens": max_tokens,
+        }
+        if provider:
+            request_payload["provider"] = provider
+
+        if provider and hasattr(llm_mgr, "get_llm"):
+            chosen = llm_mgr.get_llm(provider)
+            if chosen:
+                response = chosen.complete(request_payload)
+            else:
+                response = llm_mgr.complete(request_payload)
+        else:
+            response = llm_mgr.complete(request_payload)
+
+        # Handle async/sync ambiguity - check if response is a coroutine
+        if inspect.isawaitable(response):
+            response = asyncio.run(cast(Coroutine[Any, Any, Any], response))
+
+        return self._safe_extract_response_content(response)
+
+    def plan_issue_batches(self, issues: list[LintingIssue]) -> list[list[LintingIssue]]:
+        """
+        Group consecutive compatible issues of one file into request batches.
+
+        Issues are compatible when the same specialist handles them and they are
+        on different lines. A batch ends when its issue listings would exceed
+        the token budget or it reaches MAX_BATCH_SIZE issues. The file content
+        is not counted: every request carries it once, so splitting a batch
+        only repeats it.
+
+        Args:
+            issues: Issues of the file, in processing order
+
+        Returns:
+            Batches of issues, in processing order
+        """
+        budget_chars = self.batch_token_budget * CHARS_PER_TOKEN
+        batches: list[list[LintingIssue]] = []
+        current: list[LintingIssue] = []
+        current_agent = None
+        current_lines: set[int] = set()
+        current_chars = BATCH_PROMPT_OVERHEAD_CHARS
+
+        for issue in issues:
+            agent = self.ai_agent_manager.select_agent_for_issues(
+                [self._to_detection_issue(issue)]
+            )
+            issue_chars = len(issue.message) + len(issue.line_content) + 80
+            if current and (
+                agent != current_agent
+                or issue.line_number in current_lines
+                or len(current) >= MAX_BATCH_SIZE
+                or current_chars + issue_chars > budget_chars
+            ):
+                batches.append(current)
+                current, current_lines, current_chars = [], set(), BATCH_PROMPT_OVERHEAD_CHARS
+            current.append(issue)
+            current_agent = agent
+            current_lines.add(issue.line_number)
+            current_chars += issue_chars
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def fix_issues_batched(
+        self,
+        file_path: str,
+        content: str,
+        issues: list[LintingIssue],
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fix issues of one file with one LLM request per batch of issues.
+
+        Issues the batch response leaves unfixed, or all issues of a batch
+        whose fixes break the syntax, fall back to fix_single_issue. Line
+        numbers of later issues are shifted by the lines earlier fixes added.
+
+        Args:
+            file_path: Path to the file being fixed
+            content: Current file content
+            issues: Issues of the file, as reported against ``content``
+            provider: Optional LLM provider override
+            model: Optional model override
+
+        Returns:
+            Dictionary with the fixed ``content``, per-issue ``outcomes``
+            (aligned with ``issues``) and the number of LLM ``requests``
+        """
+        outcomes = dict.fromkeys(range(len(issues)), False)
+        positions = {id(issue): index for index, issue in enumerate(issues)}
+        # (original line, lines added) of every applied fix
+        line_shifts: list[tuple[int, int]] = []
+        requests = 0
+
+        def shifted(issue: LintingIssue) -> LintingIssue:
+            offset = sum(delta for line, delta in line_shifts if line < issue.line_number)
+            if not offset:
+                return issue
+            return issue.model_copy(update={"line_number": issue.line_number + offset})
+
+        for batch in self.plan_issue_batches(issues):
+            remaining = batch
+            if len(batch) > 1:
+                requests += 1
+                batch_result = self.fix_issue_batch(
+                    file_path, content, [shifted(issue) for issue in batch], provider, model
+                )
+                if batch_result["success"]:
+                    content = batch_result["content"]
+                    fixed_lines = batch_result["fixed_lines"]
+                    new_shifts = []
+                    for issue in batch:
+                        delta = fixed_lines.get(shifted(issue).line_number)
+                        if delta is not None:
+                            outcomes[positions[id(issue)]] = True
+                            new_shifts.append((issue.line_number, delta))
+                    line_shifts.extend(new_shifts)
+                    remaining = [
+                        issue for issue in batch if not outcomes[positions[id(issue)]]
+                    ]
+                if remaining:
+                    logger.info(
+                        "Batch fix left %d of %d issues in %s; fixing individually",
+                        len(remaining),
+                        len(batch),
+                        file_path,
+                    )
+
+            for issue in remaining:
+                requests += 1
+                result = self.fix_single_issue(
+                    file_path, content, shifted(issue), provider, model
+                )
+                if result.get("success", False):
+                    delta = len(result["content"].split("\n")) - len(content.split("\n"))
+                    content = result["content"]
+                    outcomes[positions[id(issue)]] = True
+                    line_shifts.append((issue.line_number, delta))
+
+        return {
+            "content": content,
+            "outcomes": [outcomes[index] for index in range(len(issues))],
+            "requests": requests,
+        }
+
+    def fix_issue_batch(
+        self,
+        file_path: str,
+        content: str,
+        issues: list[LintingIssue],
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fix several issues of one file with a single LLM request.
+
+        Args:
+            file_path: Path to the file being fixed
+            content: Current file content
+            issues: Issues to fix, each on a distinct line of ``content``
+            provider: Optional LLM provider override
+            model: Optional model override
+
+        Returns:
+            Dictionary with ``success``, the fixed ``content`` and
+            ``fixed_lines`` mapping each fixed line number to the number of
+            lines its fix added
+        """
+        start_time = time.time()
+        failure: dict[str, Any] = {"success": False, "content": content, "fixed_lines": {}}
+
+        try:
+            detection_issues = [self._to_detection_issue(issue) for issue in issues]
+            agent_type = self.ai_agent_manager.select_agent_for_issues(detection_issues)
+            system_prompt = self.ai_agent_manager.get_specialized_system_prompt(
+                agent_type, detection_issues
+            )
+            user_prompt = self.ai_agent_manager.get_batch_user_prompt(
+                file_path, content, detection_issues
+            )
+            response_content = self._complete(
+                system_prompt, user_prompt, provider, model, max_tokens=4000
+            )
+            fixes = self.ai_agent_manager.parse_batch_response(response_content)
+        except Exception as e:
+            logger.exception(f"Batch fix request failed for {file_path}: {e}")
+            return {**failure, "error": str(e)}
+
+        lines = content.split("\n")
+        fixed_lines: dict[int, int] = {}
+        # Apply bottom-up so earlier replacements do not move later lines
+        for issue in sorted(issues, key=lambda item: item.line_number, reverse=True):
+            fix = fixes.get(issue.line_number)
+            if fix is None or not 1 <= issue.line_number <= len(lines):
+                continue
+            replacement = self._reindent(lines[issue.line_number - 1], fix["fixed_code"])
+            lines[issue.line_number - 1 : issue.line_number] = replacement
+            fixed_lines[issue.line_number] = len(replacement) - 1
+
+        fixed_content = "\n".join(lines)
+        code_analyzer = CodeAnalyzer()
+        if code_analyzer.validate_python_syntax(
+            content
+        ) and not code_analyzer.validate_python_syntax(fixed_content):
+            logger.warning(f"Batch fix for {file_path} broke syntax; discarding it")
+            return {**failure, "error": "Batch fix produced invalid syntax"}
+
+        if self.database and fixed_lines:
+            try:
+                self.database.log_interaction(
+                    {
+                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                        "file_path": file_path,
+                        "issue_type": ",".join(sorted({i.error_code for i in issues})),
+                        "issue_details": f"Batch of {len(issues)} issues",
+                        "provider_used": provider or "azure_openai",
+                        "model_used": model or "gpt-4.1",
+                        "system_prompt": system_prompt[:1000],
+                        "user_prompt": user_prompt[:1000],
+                        "ai_response": response_content[:1000],
+                        "fix_successful": True,
+                        "confidence_score": len(fixed_lines) / len(issues),
+                        "fixed_codes": str(
+                            [i.error_code for i in issues if i.line_number in fixed_lines]
+                        ),
+                        "error_message": None,
+                        "syntax_valid_before": True,
+                        "syntax_valid_after": True,
+                        "file_size_chars": len(content),
+                        "processing_duration": time.time() - start_time,
+                        "agent_type": agent_type,
+                    }
+                )
+            except Exception as e:
+                logger.warning(f"Failed to log batch interaction to database: {e}")
+
+        return {"success": True, "content": fixed_content, "fixed_lines": fixed_lines}
+
+    @staticmethod
+    def _reindent(original_line: str, fixed_code: str) -> list[str]:
+        """Split a replacement into lines, keeping the original indentation."""
+        replacement = fixed_code.strip("\n").split("\n")
+        if replacement[0][:1] in {" ", "\t"}:
+            return replacement
+        indent = original_line[: len(original_line) - len(original_line.lstrip())]
+        return [f"{indent}{line}" if line.strip() else line for line in replacement]
+
     def fix_issues_sync_fallback(
         self,
         issues: list[LintingIssue],
@@ -539,6 +975,8 @@ class IssueFixer:
             error_code=issue.error_code,
             message=issue.message,
             line_content=issue.line_content,
+            function_name=issue.function_name,
+            class_name=issue.class_name,
         )
 
     def _create_error_info(self, error: Exception, context: Any) -> ErrorInfo:
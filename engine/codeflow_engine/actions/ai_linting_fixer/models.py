@@ -188,6 +188,8 @@ class LintingIssue(BaseModel):
     message: str
     line_content: str = ""
     column: int = 0  # Keep for backward compatibility
+    function_name: str | None = None
+    class_name: str | None = None
 
 
 class LintingFixResult(BaseModel):
@@ -246,6 +248,21 @@ class AILintingFixerInputs(BaseModel):
     max_workers: int = Field(
         default=4, description="Maximum number of parallel workers"
     )
+    max_concurrent_llm_requests: int = Field(
+        default=4, description="Maximum number of LLM fix requests in flight at once"
+    )
+    batch_fixes: bool = Field(
+        default=False,
+        description="Whether to fix compatible issues of a file in one LLM request",
+    )
+    deterministic_fixes: bool = Field(
+        default=True,
+        description="Whether to fix mechanical issues with ruff and source transforms before the AI",
+    )
+    use_fix_cache: bool = Field(
+        default=True,
+        description="Whether to reuse cached fixes for unchanged code before calling the LLM",
+    )
 
     # Additional fields for display compatibility
     max_fixes: int = Field(
@@ -302,6 +319,8 @@ class AILintingFixerOutputs(BaseModel):
     agent_stats: dict[str, Any] = Field(default_factory=dict)
     queue_stats: dict[str, Any] = Field(default_factory=dict)
     redis_stats: dict[str, Any] | None = None
+    cache_stats: dict[str, Any] = Field(default_factory=dict)
+    fix_routing: dict[str, dict[str, int]] = Field(default_factory=dict)
 
     # Additional metadata
     session_id: str | None = None
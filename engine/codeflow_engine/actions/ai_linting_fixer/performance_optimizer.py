@@ -16,21 +16,42 @@ from dataclasses import dataclass
 import functools
 import gc
 import hashlib
+import heapq
 import logging
 import mmap
 import os
 from pathlib import Path
+import sys
 import tempfile
 import threading
 import time
 from typing import Any
+import zlib
 
 import psutil
 
+from codeflow_engine.actions.ai_linting_fixer.persistent_cache import (
+    PersistentCacheTier,
+)
+
 
 logger = logging.getLogger(__name__)
 
 
+# Values below this many bytes or characters are never compressed
+COMPRESSION_THRESHOLD_BYTES = 4096
+
+# Objects visited when estimating the size of a nested value
+SIZE_ESTIMATE_MAX_OBJECTS = 256
+
+# Smallest shard worth having, so small caches keep near-global LRU order
+MIN_ENTRIES_PER_SHARD = 32
+
+# Characters encoded at a time when sizing or comparing large content, so no
+# full UTF-8 copy of it is ever held
+ENCODE_SLICE_CHARS = 1024 * 1024
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with metadata for intelligent eviction."""
@@ -40,10 +61,71 @@ class CacheEntry:
     access_count: int = 0
     size_bytes: int = 0
     ttl_seconds: int = 3600  # 1 hour default
+    expires_at: float = 0.0  # time.monotonic() deadline
+    compressed: bool = False
+    is_text: bool = False
+
+
+class _CacheShard:
+    """One lock-protected slice of an IntelligentCache."""
+
+    def __init__(self) -> None:
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        # (expires_at, key) min-heap; items for replaced or evicted entries
+        # stay until they surface and are skipped
+        self.expiry_heap: list[tuple[float, str]] = []
+        self.size_bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def remove(self, key: str) -> CacheEntry:
+        entry = self.entries.pop(key)
+        self.size_bytes -= entry.size_bytes
+        return entry
+
+    def purge_expired(self, now: float) -> None:
+        """Remove expired entries in deadline order; amortized O(log n)."""
+        heap = self.expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                self.remove(key)
+                logger.debug(f"Removed expired cache entry: {key}")
+
+        # Rebuild once stale items dominate so the heap stays O(entries)
+        if len(heap) > 2 * len(self.entries) + 64:
+            self.expiry_heap = [
+                (entry.expires_at, key) for key, entry in self.entries.items()
+            ]
+            heapq.heapify(self.expiry_heap)
+
+    def evict_oldest(self) -> None:
+        # Remove least recently used entry
+        key, entry = self.entries.popitem(last=False)
+        self.size_bytes -= entry.size_bytes
+        self.evictions += 1
+        logger.debug(f"Evicted cache entry: {key}")
 
 
 class IntelligentCache:
-    """Advanced caching system with TTL, LRU, and size-based eviction."""
+    """
+    Advanced caching system with TTL, LRU, and size-based eviction.
+
+    Keys are spread over shards with their own locks, so threads only
+    contend when they touch the same shard. The size and entry budgets are
+    global, but a full cache evicts from the shard being written, so LRU
+    order is kept per shard. Expiry is driven by a per-shard heap of
+    deadlines, and large str and bytes values are zlib compressed when
+    enable_compression is set.
+
+    With a persistent_tier, values are also written to disk, and memory
+    misses fall back to the tier and promote what they find. Disk entries
+    follow the tier's own expiry, not the in-memory TTL, since they are
+    meant to outlive the process.
+    """
 
     def __init__(
         self,
@@ -51,20 +133,42 @@ class IntelligentCache:
         max_entries: int = 1000,
         default_ttl_seconds: int = 3600,
         enable_compression: bool = True,
+        num_shards: int = 16,
+        compression_threshold_bytes: int = COMPRESSION_THRESHOLD_BYTES,
+        persistent_tier: PersistentCacheTier | None = None,
     ):
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.max_entries = max_entries
         self.default_ttl_seconds = default_ttl_seconds
         self.enable_compression = enable_compression
+        self.compression_threshold_bytes = compression_threshold_bytes
+        self.persistent_tier = persistent_tier
 
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self.current_size_bytes = 0
-        self.lock = threading.RLock()
+        num_shards = max(1, min(num_shards, max_entries // MIN_ENTRIES_PER_SHARD))
+        self._shards = [_CacheShard() for _ in range(num_shards)]
 
-        # Statistics
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
+    def _shard(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    @property
+    def current_size_bytes(self) -> int:
+        return sum(shard.size_bytes for shard in self._shards)
+
+    @property
+    def hits(self) -> int:
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        return sum(shard.misses for shard in self._shards)
+
+    @property
+    def evictions(self) -> int:
+        return sum(shard.evictions for shard in self._shards)
+
+    @property
+    def current_entries(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
 
     def _generate_key(self, *args, **kwargs) -> str:
         """Generate a deterministic cache key."""
@@ -84,124 +188,193 @@ class IntelligentCache:
         return hashlib.md5(":".join(key_parts).encode()).hexdigest()
 
     def _estimate_size(self, value: Any) -> int:
-        """Estimate the size of a value in bytes."""
-        try:
-            if isinstance(value, str):
-                return len(value.encode("utf-8"))
-            elif isinstance(value, bytes):
-                return len(value)
-            elif isinstance(value, list | tuple):
-                return sum(self._estimate_size(item) for item in value)
-            elif isinstance(value, dict):
-                return sum(
-                    self._estimate_size(k) + self._estimate_size(v)
-                    for k, v in value.items()
-                )
-            else:
-                return len(str(value).encode("utf-8"))
-        except Exception:
-            return 1024  # Default estimate
-
-    def _evict_if_needed(self) -> None:
-        """Evict entries if cache is full."""
-        while (
-            len(self.cache) > self.max_entries
-            or self.current_size_bytes > self.max_size_bytes
-        ):
-            # Remove oldest entry
-            if self.cache:
-                key, entry = self.cache.popitem(last=False)
-                self.current_size_bytes -= entry.size_bytes
-                self.evictions += 1
-                logger.debug(f"Evicted cache entry: {key}")
+        """
+        Estimate the in-memory size of a value in bytes.
+
+        Sums sys.getsizeof over the value and its nested containers in a
+        fixed order, stopping after SIZE_ESTIMATE_MAX_OBJECTS objects, so the
+        cost is bounded and the same value always gets the same estimate.
+        """
+        total = 0
+        stack = [value]
+        visited = 0
+        while stack and visited < SIZE_ESTIMATE_MAX_OBJECTS:
+            item = stack.pop()
+            visited += 1
+            try:
+                total += sys.getsizeof(item)
+            except TypeError:
+                total += 64
+            if isinstance(item, dict):
+                for key, nested in item.items():
+                    stack.append(key)
+                    stack.append(nested)
+            elif isinstance(item, list | tuple | set | frozenset):
+                stack.extend(item)
+        return total
+
+    def _encode(self, entry: CacheEntry) -> None:
+        """Compress a large str or bytes entry value when that saves space."""
+        value = entry.value
+        if not self.enable_compression or not isinstance(value, str | bytes):
+            return
+        if len(value) < self.compression_threshold_bytes:
+            return
+        raw = value.encode("utf-8") if isinstance(value, str) else value
+        packed = zlib.compress(raw, 1)
+        if len(packed) < sys.getsizeof(value):
+            entry.value = packed
+            entry.compressed = True
+            entry.is_text = isinstance(value, str)
+
+    @staticmethod
+    def _decode(entry: CacheEntry) -> Any:
+        if not entry.compressed:
+            return entry.value
+        raw = zlib.decompress(entry.value)
+        return raw.decode("utf-8") if entry.is_text else raw
 
     def _cleanup_expired(self) -> None:
         """Remove expired entries."""
-        current_time = time.time()
-        expired_keys = [
-            key
-            for key, entry in self.cache.items()
-            if current_time - entry.timestamp > entry.ttl_seconds
-        ]
-
-        for key in expired_keys:
-            entry = self.cache.pop(key)
-            self.current_size_bytes -= entry.size_bytes
-            logger.debug(f"Removed expired cache entry: {key}")
+        now = time.monotonic()
+        for shard in self._shards:
+            with shard.lock:
+                shard.purge_expired(now)
 
     def get(self, key: str) -> Any | None:
         """Get a value from cache."""
-        with self.lock:
-            self._cleanup_expired()
+        shard = self._shard(key)
+        now = time.monotonic()
+        with shard.lock:
+            shard.purge_expired(now)
 
-            if key in self.cache:
-                entry = self.cache[key]
+            entry = shard.entries.get(key)
+            if entry is not None:
                 entry.access_count += 1
                 # Move to end (most recently used)
-                self.cache.move_to_end(key)
-                self.hits += 1
-                return entry.value
+                shard.entries.move_to_end(key)
+                shard.hits += 1
+            elif self.persistent_tier is None:
+                shard.misses += 1
+                return None
+
+        if entry is None:
+            return self._get_persistent(shard, key)
+
+        # Decompress outside the lock
+        return self._decode(entry)
 
-            self.misses += 1
+    def _get_persistent(self, shard: _CacheShard, key: str) -> Any | None:
+        """Look a memory miss up in the persistent tier, promoting hits."""
+        try:
+            found = self.persistent_tier.get(key)
+        except Exception as e:
+            logger.warning(f"Persistent cache lookup failed for {key}: {e}")
+            found = None
+
+        if found is None:
+            with shard.lock:
+                shard.misses += 1
             return None
 
+        value, remaining_seconds = found
+        ttl_seconds = min(remaining_seconds, self.default_ttl_seconds)
+        self._set_memory(key, value, max(1, int(ttl_seconds)))
+        with shard.lock:
+            shard.hits += 1
+        return value
+
     def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
         """Set a value in cache."""
-        with self.lock:
-            self._cleanup_expired()
-
-            size_bytes = self._estimate_size(value)
-            entry = CacheEntry(
-                value=value,
-                timestamp=time.time(),
-                size_bytes=size_bytes,
-                ttl_seconds=ttl_seconds or self.default_ttl_seconds,
-            )
+        ttl_seconds = ttl_seconds or self.default_ttl_seconds
+        self._set_memory(key, value, ttl_seconds)
+        if self.persistent_tier is not None:
+            try:
+                self.persistent_tier.set(key, value)
+            except Exception as e:
+                logger.warning(f"Persistent cache store failed for {key}: {e}")
+
+    def _set_memory(self, key: str, value: Any, ttl_seconds: int) -> None:
+        now = time.monotonic()
+        entry = CacheEntry(
+            value=value,
+            timestamp=time.time(),
+            ttl_seconds=ttl_seconds,
+            expires_at=now + ttl_seconds,
+        )
+        # Compress and measure before taking the lock
+        self._encode(entry)
+        entry.size_bytes = self._estimate_size(entry.value)
+
+        shard = self._shard(key)
+        with shard.lock:
+            shard.purge_expired(now)
 
             # Remove existing entry if present
-            if key in self.cache:
-                old_entry = self.cache[key]
-                self.current_size_bytes -= old_entry.size_bytes
+            if key in shard.entries:
+                shard.remove(key)
 
-            self.cache[key] = entry
-            self.current_size_bytes += size_bytes
+            shard.entries[key] = entry
+            shard.size_bytes += entry.size_bytes
+            heapq.heappush(shard.expiry_heap, (entry.expires_at, key))
 
-            self._evict_if_needed()
+            self._evict_if_needed(shard)
+
+    def _evict_if_needed(self, shard: _CacheShard) -> None:
+        """Evict from a shard while the whole cache is over budget."""
+        # The totals read other shards without their locks, which is
+        # accurate enough for a budget
+        while len(shard.entries) > 1 and (
+            self.current_entries > self.max_entries
+            or self.current_size_bytes > self.max_size_bytes
+        ):
+            shard.evict_oldest()
 
     def invalidate(self, pattern: str) -> int:
         """Invalidate entries matching a pattern."""
-        with self.lock:
-            keys_to_remove = [key for key in self.cache if pattern in key]
-
-            for key in keys_to_remove:
-                entry = self.cache.pop(key)
-                self.current_size_bytes -= entry.size_bytes
-
-            return len(keys_to_remove)
-
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        with self.lock:
-            self.cache.clear()
-            self.current_size_bytes = 0
-            logger.debug("Cache cleared")
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys_to_remove = [key for key in shard.entries if pattern in key]
+                for key in keys_to_remove:
+                    shard.remove(key)
+                removed += len(keys_to_remove)
+        if self.persistent_tier is not None:
+            self.persistent_tier.invalidate(pattern)
+        return removed
+
+    def clear(self, include_persistent: bool = False) -> None:
+        """Clear all cache entries, in memory and optionally on disk."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.expiry_heap.clear()
+                shard.size_bytes = 0
+        if include_persistent and self.persistent_tier is not None:
+            self.persistent_tier.clear()
+        logger.debug("Cache cleared")
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        with self.lock:
-            total_requests = self.hits + self.misses
-            hit_rate = self.hits / total_requests if total_requests > 0 else 0
-
-            return {
-                "hits": self.hits,
-                "misses": self.misses,
-                "hit_rate": hit_rate,
-                "evictions": self.evictions,
-                "current_entries": len(self.cache),
-                "current_size_mb": self.current_size_bytes / (1024 * 1024),
-                "max_size_mb": self.max_size_bytes / (1024 * 1024),
-                "max_entries": self.max_entries,
-            }
+        hits = self.hits
+        misses = self.misses
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0
+
+        stats = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hit_rate,
+            "evictions": self.evictions,
+            "current_entries": self.current_entries,
+            "current_size_mb": self.current_size_bytes / (1024 * 1024),
+            "max_size_mb": self.max_size_bytes / (1024 * 1024),
+            "max_entries": self.max_entries,
+            "shards": len(self._shards),
+        }
+        if self.persistent_tier is not None:
+            stats["persistent"] = self.persistent_tier.get_stats()
+        return stats
 
 
 @dataclass
@@ -218,36 +391,83 @@ class PerformanceProfile:
 
 
 class MemoryMappedFileProcessor:
-    """Process large files using memory mapping for efficiency."""
+    """
+    Process large files using memory mapping for efficiency.
+
+    Chunks end on line boundaries. A newline byte never occurs inside a
+    multi-byte UTF-8 sequence, so every chunk also decodes on its own.
+    """
 
     def __init__(self, chunk_size_mb: int = 10):
         self.chunk_size = chunk_size_mb * 1024 * 1024
 
+    def chunk_offsets(self, buffer: Any) -> list[tuple[int, int]]:
+        """
+        Split a buffer into line-aligned (start, end) byte ranges.
+
+        Each chunk ends after the last newline before chunk_size bytes, or
+        after the first newline past it when a single line is longer.
+        Process pool workers can take these offsets and map the file
+        themselves with read_chunk.
+        """
+        size = len(buffer)
+        offsets = []
+        start = 0
+        while start < size:
+            target = start + self.chunk_size
+            if target >= size:
+                end = size
+            else:
+                newline = buffer.rfind(b"\n", start, target)
+                if newline < 0:
+                    newline = buffer.find(b"\n", target)
+                end = size if newline < 0 else newline + 1
+            offsets.append((start, end))
+            start = end
+        return offsets
+
     def process_large_file(
-        self, file_path: Path, processor_func: Callable[[bytes], Any]
+        self,
+        file_path: Path,
+        processor_func: Callable[[memoryview], Any],
+        parallel_processor: "ParallelProcessor | None" = None,
     ) -> list[Any]:
-        """Process a large file in chunks using memory mapping."""
+        """
+        Process a large file in chunks using memory mapping.
+
+        Chunks are memoryview slices of the mapping and are only valid
+        while processor_func runs; decode them with str(chunk, "utf-8").
+
+        Args:
+            file_path: File to map
+            processor_func: Called with each chunk
+            parallel_processor: Thread pool to process chunks concurrently
+
+        Returns:
+            Truthy chunk results in file order
+        """
         results = []
 
         try:
             with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return results
                 with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                    offset = 0
-                    while offset < len(mm):
-                        # Read chunk
-                        chunk_end = min(offset + self.chunk_size, len(mm))
-                        chunk = mm[offset:chunk_end]
-
-                        # Process chunk
-                        result = processor_func(chunk)
-                        if result:
-                            results.append(result)
-
-                        offset = chunk_end
-
-                        # Yield control to prevent blocking
-                        if offset % (self.chunk_size * 4) == 0:
-                            time.sleep(0.001)
+                    view = memoryview(mm)
+                    chunks = [view[start:end] for start, end in self.chunk_offsets(mm)]
+                    try:
+                        if parallel_processor is not None and len(chunks) > 1:
+                            chunk_results = parallel_processor.process_parallel(
+                                chunks, processor_func
+                            )
+                        else:
+                            chunk_results = [processor_func(chunk) for chunk in chunks]
+                    finally:
+                        # Release every export before the mapping closes
+                        for chunk in chunks:
+                            chunk.release()
+                        view.release()
+                    results = [result for result in chunk_results if result]
 
         except Exception as e:
             logger.exception(f"Error processing large file {file_path}: {e}")
@@ -256,6 +476,52 @@ class MemoryMappedFileProcessor:
         return results
 
 
+def _encoded_slices(content: str):
+    """Yield the UTF-8 encoding of content one ENCODE_SLICE_CHARS slice at a time."""
+    for start in range(0, len(content), ENCODE_SLICE_CHARS):
+        yield content[start : start + ENCODE_SLICE_CHARS].encode("utf-8")
+
+
+def _utf8_size(content: str) -> int:
+    """Size of content in UTF-8 bytes, without encoding all of it at once."""
+    return sum(len(piece) for piece in _encoded_slices(content))
+
+
+def _file_holds(file_path: Path, content: str, size: int | None = None) -> bool:
+    """
+    Whether a file's bytes are exactly the UTF-8 encoding of content.
+
+    The mapping is compared slice by slice, stopping at the first mismatch.
+    """
+    if size is None:
+        size = _utf8_size(content)
+    try:
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size != size:
+                return False
+            if not size:
+                return True
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                memoryview(mm) as view,
+            ):
+                offset = 0
+                for piece in _encoded_slices(content):
+                    if view[offset : offset + len(piece)] != piece:
+                        return False
+                    offset += len(piece)
+                return True
+    except OSError:
+        return False
+
+
+def read_chunk(file_path: str | Path, start: int, end: int) -> str:
+    """Decode one chunk of a file from its chunk_offsets range."""
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[start:end].decode("utf-8")
+
+
 class ParallelProcessor:
     """Parallel processing utilities for file splitting operations."""
 
@@ -375,11 +641,11 @@ class PerformanceOptimizer:
         self, file_path: Path, content: str, processor_func: Callable[[Path, str], Any]
     ) -> Any:
         """Optimize file processing based on file characteristics."""
-        file_size = len(content.encode("utf-8"))
+        file_size = _utf8_size(content)
 
         # Determine optimal processing strategy
         if file_size > 10 * 1024 * 1024:  # > 10MB
-            return self._process_large_file(file_path, content, processor_func)
+            return self._process_large_file(file_path, content, processor_func, file_size)
         elif file_size > 1024 * 1024:  # > 1MB
             return self._process_medium_file(file_path, content, processor_func)
         else:
@@ -457,39 +723,36 @@ class PerformanceOptimizer:
         return combined_result
 
     def _process_large_file(
-        self, file_path: Path, content: str, processor_func: Callable[[Path, str], Any]
+        self,
+        file_path: Path,
+        content: str,
+        processor_func: Callable[[Path, str], Any],
+        file_size: int | None = None,
     ) -> Any:
-        """Process large files with memory mapping."""
+        """Process large files by memory mapping the file itself."""
         if not self.enable_memory_mapping:
             return self._process_medium_file(file_path, content, processor_func)
 
-        start_time = time.time()
-        temp_path = None
-
-        # Write content to a unique temp file for memory mapping
-        temp_file = tempfile.NamedTemporaryFile(
-            mode="w+", suffix=".mmap", delete=False, encoding="utf-8"
-        )
-        try:
-            temp_file.write(content)
-            temp_file.flush()
-            temp_file.close()
-            temp_path = Path(temp_file.name)
+        # The mapping only stands in for content when the file on disk still
+        # holds it; otherwise chunk the content in memory
+        if not _file_holds(Path(file_path), content, file_size):
+            return self._process_medium_file(file_path, content, processor_func)
 
-            def memory_mapped_processor(chunk: bytes) -> Any:
-                chunk_str = chunk.decode("utf-8", errors="ignore")
-                return processor_func(temp_path, chunk_str)
+        start_time = time.time()
 
-            results = self.memory_mapper.process_large_file(
-                temp_path, memory_mapped_processor
-            )
+        def memory_mapped_processor(chunk: memoryview) -> Any:
+            return processor_func(file_path, str(chunk, "utf-8"))
 
-        finally:
-            try:
-                if temp_path is not None and temp_path.exists():
-                    temp_path.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to remove mmap temp file {temp_path}: {e}")
+        # Process pools cannot run the local processor above
+        parallel_processor = (
+            self.parallel_processor
+            if self.enable_parallel_processing
+            and not self.parallel_processor.use_process_pool
+            else None
+        )
+        results = self.memory_mapper.process_large_file(
+            file_path, memory_mapped_processor, parallel_processor
+        )
 
         processing_time = time.time() - start_time
 
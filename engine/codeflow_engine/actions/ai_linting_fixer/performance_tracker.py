@@ -49,6 +49,8 @@ class PerformanceTracker:
         self.session_start = time.time()
         self.session_id = f"session_{int(self.session_start)}"
         self._by_id: dict[str, PerformanceMetric] = {}
+        # error code -> fix route (ruff, transform, ai) -> number of issues
+        self.fix_routes: dict[str, dict[str, int]] = {}
         self._lock = threading.RLock()
 
     def start_operation(
@@ -112,6 +114,17 @@ class PerformanceTracker:
                 "max_duration": max(durations),
             }
 
+    def record_fix_route(self, error_code: str, route: str, count: int = 1) -> None:
+        """Record which fixer tier issues of an error code were routed to."""
+        with self._lock:
+            routes = self.fix_routes.setdefault(error_code, {})
+            routes[route] = routes.get(route, 0) + count
+
+    def get_fix_routes(self) -> dict[str, dict[str, int]]:
+        """Get the per-code fix routing counts of the session."""
+        with self._lock:
+            return {code: dict(routes) for code, routes in self.fix_routes.items()}
+
     def get_session_summary(self) -> dict[str, Any]:
         """Get a summary of the current session."""
         with self._lock:
@@ -121,6 +134,7 @@ class PerformanceTracker:
                     "total_operations": 0,
                     "session_duration": time.time() - self.session_start,
                     "success_rate": 0.0,
+                    "fix_routing": self.get_fix_routes(),
                 }
 
             completed_metrics = [m for m in self.metrics if m.is_completed]
@@ -142,6 +156,7 @@ class PerformanceTracker:
                     if completed_metrics
                     else 0.0
                 ),
+                "fix_routing": self.get_fix_routes(),
             }
 
     def generate_report(self) -> str:
@@ -182,6 +197,7 @@ class PerformanceTracker:
         with self._lock:
             self.metrics.clear()
             self._by_id.clear()
+            self.fix_routes.clear()
             self.session_start = time.time()
             self.session_id = f"session_{int(self.session_start)}"
 
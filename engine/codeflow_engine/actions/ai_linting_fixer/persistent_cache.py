@@ -0,0 +1,216 @@
+"""
+Persistent Cache Module
+
+SQLite-backed second tier for IntelligentCache, kept under the project
+cache directory so analysis results survive between runs. Callers key
+entries by content hash and analyzer version, so changed files and new
+analyzer versions simply miss. Entries therefore do not expire by default;
+the size budget evicts the least recently used ones instead.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+import zlib
+
+from codeflow_engine.actions.ai_linting_fixer.sqlite_connections import (
+    ThreadLocalConnections,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".codeflow_cache"
+DEFAULT_CACHE_FILE = "analysis_cache.db"
+DEFAULT_MAX_SIZE_MB = 256
+# Eviction trims the cache to this fraction of the budget, so it runs rarely
+EVICTION_LOW_WATERMARK = 0.9
+# Serialized values at least this long are stored zlib compressed
+COMPRESSION_THRESHOLD_BYTES = 1024
+
+
+class PersistentCacheTier:
+    """Size-bounded SQLite store of JSON-serializable cache values."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+        default_ttl_seconds: float | None = None,
+    ):
+        """
+        Initialize the persistent tier.
+
+        Args:
+            cache_dir: Directory of the cache database, created if missing
+            max_size_mb: Stored value bytes kept before least recently used
+                entries are evicted
+            default_ttl_seconds: Lifetime of entries stored without a TTL,
+                None to keep them until evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / DEFAULT_CACHE_FILE
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.default_ttl_seconds = default_ttl_seconds
+        self._connections = ThreadLocalConnections(self.db_path)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "skipped": 0}
+        self.init_database()
+
+    def init_database(self) -> None:
+        """Create the cache table if needed."""
+        with self._connections.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    compressed BOOLEAN NOT NULL,
+                    value BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_last_used "
+                "ON cache_entries(last_used_at)"
+            )
+            self._size_bytes = conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries"
+            ).fetchone()[0]
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """
+        Look up an unexpired value.
+
+        Returns:
+            Tuple of (value, seconds until it expires, infinite for entries
+            without expiry), or None on a miss
+        """
+        now = time.time()
+        conn = self._connections.connection()
+        row = conn.execute(
+            "SELECT compressed, value, expires_at FROM cache_entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None or row["expires_at"] <= now:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+
+        conn.execute(
+            "UPDATE cache_entries SET last_used_at = ? WHERE key = ?", (now, key)
+        )
+        raw = zlib.decompress(row["value"]) if row["compressed"] else row["value"]
+        with self._lock:
+            self._stats["hits"] += 1
+        return json.loads(raw), row["expires_at"] - now
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> bool:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl_seconds: Lifetime of the entry, defaulting to the tier's own
+
+        Returns:
+            False when the value is not JSON serializable and was skipped
+        """
+        try:
+            raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return False
+
+        compressed = len(raw) >= COMPRESSION_THRESHOLD_BYTES
+        if compressed:
+            raw = zlib.compress(raw)
+        if ttl_seconds is None:
+            ttl_seconds = self.default_ttl_seconds
+        now = time.time()
+        expires_at = math.inf if ttl_seconds is None else now + ttl_seconds
+        with self._connections.transaction(immediate=True) as conn:
+            previous = conn.execute(
+                "SELECT size_bytes FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO cache_entries
+                    (key, compressed, value, size_bytes, expires_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, compressed, raw, len(raw), expires_at, now),
+            )
+            with self._lock:
+                self._size_bytes += len(raw) - (previous[0] if previous else 0)
+                self._stats["stores"] += 1
+                over_budget = self._size_bytes > self.max_size_bytes
+            if over_budget:
+                self._evict(conn)
+        return True
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired, then least recently used entries down to the watermark."""
+        target = int(self.max_size_bytes * EVICTION_LOW_WATERMARK)
+        evicted = conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)
+        ).rowcount
+        size_bytes = conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries"
+        ).fetchone()[0]
+        for key, entry_size in conn.execute(
+            "SELECT key, size_bytes FROM cache_entries ORDER BY last_used_at"
+        ).fetchall():
+            if size_bytes <= target:
+                break
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            size_bytes -= entry_size
+            evicted += 1
+        with self._lock:
+            self._size_bytes = size_bytes
+            self._stats["evictions"] += evicted
+        logger.debug(f"Evicted {evicted} persistent cache entries")
+
+    def invalidate(self, pattern: str) -> int:
+        """Invalidate entries whose key contains a pattern."""
+        with self._connections.transaction(immediate=True) as conn:
+            removed = conn.execute(
+                "DELETE FROM cache_entries WHERE INSTR(key, ?) > 0", (pattern,)
+            ).rowcount
+            size_bytes = conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries"
+            ).fetchone()[0]
+        with self._lock:
+            self._size_bytes = size_bytes
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connections.transaction(immediate=True) as conn:
+            conn.execute("DELETE FROM cache_entries")
+        with self._lock:
+            self._size_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get persistent tier statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                "size_mb": self._size_bytes / (1024 * 1024),
+                "max_size_mb": self.max_size_bytes / (1024 * 1024),
+                "db_path": str(self.db_path),
+            }
+
+    def close(self) -> None:
+        """Close the database connections."""
+        self._connections.close()
@@ -0,0 +1,157 @@
+"""
+Queue Codec Module
+
+Compact, versioned binary encoding for distributed queue payloads. Records
+are positional lists packed with msgpack when it is installed (compact JSON
+otherwise) and compressed with zstd or zlib above a size threshold. Payloads
+without the codec header are read as legacy JSON documents.
+"""
+
+import hashlib
+import json
+from typing import Any
+import zlib
+
+
+# Optional msgpack dependency
+try:
+    import msgpack  # type: ignore[import-not-found, import-untyped]
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+# Optional zstandard dependency
+try:
+    import zstandard  # type: ignore[import-not-found, import-untyped]
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+# Header: magic, format version, flags (serializer | compression << 4)
+MAGIC = b"CQ"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+SERIALIZER_JSON = 0
+SERIALIZER_MSGPACK = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+
+DEFAULT_COMPRESSION_THRESHOLD = 512
+
+
+class QueueCodec:
+    """Encodes queue records to compact bytes and back."""
+
+    def __init__(
+        self,
+        compression_threshold: int | None = DEFAULT_COMPRESSION_THRESHOLD,
+        use_msgpack: bool = True,
+        use_zstd: bool = True,
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            compression_threshold: Minimum encoded size in bytes before
+                compression is tried; None disables compression
+            use_msgpack: Pack with msgpack when it is installed
+            use_zstd: Compress with zstd when it is installed, else zlib
+        """
+        self.compression_threshold = compression_threshold
+        self.serializer = (
+            SERIALIZER_MSGPACK if use_msgpack and MSGPACK_AVAILABLE else SERIALIZER_JSON
+        )
+        self.compression = (
+            COMPRESSION_ZSTD if use_zstd and ZSTD_AVAILABLE else COMPRESSION_ZLIB
+        )
+
+    def dumps(self, record: Any) -> bytes:
+        """Encode a record (lists, dicts and scalars) to bytes."""
+        if self.serializer == SERIALIZER_MSGPACK:
+            body = msgpack.packb(record, use_bin_type=True)
+        else:
+            body = json.dumps(record, separators=(",", ":")).encode()
+
+        compression = COMPRESSION_NONE
+        if (
+            self.compression_threshold is not None
+            and len(body) >= self.compression_threshold
+        ):
+            compressed = _compress(body, self.compression)
+            if len(compressed) < len(body):
+                body = compressed
+                compression = self.compression
+
+        flags = self.serializer | (compression << 4)
+        return MAGIC + bytes((FORMAT_VERSION, flags)) + body
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode bytes written by ``dumps`` or a legacy JSON document."""
+        if isinstance(data, str):
+            data = data.encode()
+        if not is_encoded(data):
+            return json.loads(data)
+
+        version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+        if version > FORMAT_VERSION:
+            msg = f"Unsupported queue payload version: {version}"
+            raise ValueError(msg)
+
+        body = _decompress(data[HEADER_SIZE:], flags >> 4)
+        serializer = flags & 0x0F
+        if serializer == SERIALIZER_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                msg = "Payload is msgpack encoded. Install with: pip install msgpack"
+                raise ImportError(msg)
+            return msgpack.unpackb(body, raw=False)
+        return json.loads(body)
+
+    def dumps_body(self, content: str) -> tuple[str, bytes]:
+        """Encode a text body, returning its content hash and stored bytes."""
+        raw = content.encode()
+        # msgpack stores bytes natively; JSON needs the text
+        record = raw if self.serializer == SERIALIZER_MSGPACK else content
+        return content_hash(raw), self.dumps(record)
+
+    def loads_body(self, data: bytes | str) -> str:
+        """Decode a text body written by ``dumps_body``."""
+        body = self.loads(data)
+        return body.decode() if isinstance(body, bytes) else body
+
+
+def is_encoded(data: bytes) -> bool:
+    """Check whether bytes carry the codec header."""
+    return data[: len(MAGIC)] == MAGIC and len(data) >= HEADER_SIZE
+
+
+def content_hash(data: bytes) -> str:
+    """Hash under which a body is stored once."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _compress(body: bytes, compression: int) -> bytes:
+    if compression == COMPRESSION_ZSTD:
+        return zstandard.ZstdCompressor().compress(body)
+    return zlib.compress(body)
+
+
+def _decompress(body: bytes, compression: int) -> bytes:
+    if compression == COMPRESSION_NONE:
+        return body
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(body)
+    if compression == COMPRESSION_ZSTD:
+        if not ZSTD_AVAILABLE:
+            msg = "Payload is zstd compressed. Install with: pip install zstandard"
+            raise ImportError(msg)
+        return zstandard.ZstdDecompressor().decompress(body)
+    msg = f"Unknown queue payload compression: {compression}"
+    raise ValueError(msg)
@@ -6,24 +6,42 @@ Manages the queue of linting issues for processing by AI agents.
 
 import json
 import logging
-import sqlite3
 from pathlib import Path
 from typing import Any
 
+from codeflow_engine.actions.ai_linting_fixer.sqlite_connections import (
+    DEFAULT_SYNCHRONOUS,
+    ThreadLocalConnections,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class IssueQueueManager:
     """Manages the queue of linting issues for AI processing."""
 
-    def __init__(self, db_path: str = "issue_queue.db"):
-        """Initialize the issue queue manager."""
+    def __init__(
+        self, db_path: str = "issue_queue.db", synchronous: str = DEFAULT_SYNCHRONOUS
+    ):
+        """
+        Initialize the issue queue manager.
+
+        Args:
+            db_path: SQLite database file
+            synchronous: SQLite synchronous level (OFF, NORMAL or FULL)
+        """
         self.db_path = Path(db_path)
+        # One long-lived WAL connection per worker thread
+        self._connections = ThreadLocalConnections(self.db_path, synchronous)
         self.init_database()
 
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        self._connections.close()
+
     def init_database(self) -> None:
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connections.transaction() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS issue_queue (
@@ -57,37 +75,59 @@ class IssueQueueManager:
                 ON issue_queue(file_path)
             """
             )
+            # Claim order scans, with and without an error code filter
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_status_created
+                ON issue_queue(status, created_at)
+            """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_status_error_code_created
+                ON issue_queue(status, error_code, created_at)
+            """
+            )
 
     def queue_issues(self, session_id: str, issues: list[dict[str, Any]]) -> int:
-        """Queue multiple issues for processing."""
-        queued_count = 0
-
-        with sqlite3.connect(self.db_path) as conn:
-            for issue in issues:
-                try:
-                    conn.execute(
-                        """
-                        INSERT INTO issue_queue (
-                            session_id, file_path, error_code, line_number,
-                            column_number, message, severity, metadata
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            session_id,
-                            issue.get("file_path", ""),
-                            issue.get("error_code", ""),
-                            issue.get("line_number", 0),
-                            issue.get("column_number", 0),
-                            issue.get("message", ""),
-                            issue.get("severity", "medium"),
-                            json.dumps(issue.get("metadata", {})),
-                        ),
+        """Queue multiple issues for processing in a single transaction."""
+        rows = []
+        for issue in issues:
+            try:
+                rows.append(
+                    (
+                        session_id,
+                        issue.get("file_path", ""),
+                        issue.get("error_code", ""),
+                        issue.get("line_number", 0),
+                        issue.get("column_number", 0),
+                        issue.get("message", ""),
+                        issue.get("severity", "medium"),
+                        json.dumps(issue.get("metadata", {})),
                     )
-                    queued_count += 1
-                except Exception as e:
-                    logger.exception(f"Failed to queue issue: {e}")
+                )
+            except Exception as e:
+                logger.exception(f"Failed to queue issue: {e}")
 
-        return queued_count
+        if not rows:
+            return 0
+
+        try:
+            with self._connections.transaction() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO issue_queue (
+                        session_id, file_path, error_code, line_number,
+                        column_number, message, severity, metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+        except Exception as e:
+            logger.exception(f"Failed to queue issues: {e}")
+            return 0
+
+        return len(rows)
 
     def get_next_issues(
         self,
@@ -96,69 +136,64 @@ class IssueQueueManager:
         filter_types: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Get the next batch of issues to process."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            # Set to autocommit mode to avoid transaction within transaction error
-            conn.isolation_level = None
-            
-            # Use a transaction to ensure atomicity
-            conn.execute("BEGIN IMMEDIATE")
-
-            try:
-                where_conditions = ["status = 'pending'"]
-                params: list[Any] = []
+        where_conditions = ["status = 'pending'"]
+        params: list[Any] = []
 
-                if filter_types:
-                    placeholders = ",".join("?" for _ in filter_types)
-                    where_conditions.append(f"error_code IN ({placeholders})")
-                    params.extend(filter_types)
+        if filter_types:
+            placeholders = ",".join("?" for _ in filter_types)
+            where_conditions.append(f"error_code IN ({placeholders})")
+            params.extend(filter_types)
 
+        try:
+            # Use a transaction to ensure atomicity
+            with self._connections.transaction(immediate=True) as conn:
                 # First, atomically select and mark issues as processing
                 if worker_id:
-                    # Use a more atomic approach: select and update in one operation
-                    # This prevents race conditions by using a subquery
+                    # Select and update in one statement; the subquery walks
+                    # idx_status_created (or the error code index) in order
                     query = f"""
                         UPDATE issue_queue
                         SET status = 'processing', worker_id = ?, updated_at = CURRENT_TIMESTAMP
                         WHERE id IN (
                             SELECT id FROM issue_queue
                             WHERE {' AND '.join(where_conditions)}
-                            ORDER BY created_at ASC
+                            ORDER BY created_at ASC, id ASC
                             LIMIT ?
                         )
                         RETURNING *
                     """
-                    params_with_worker = [worker_id] + params + [limit]
-                    
+                    params_with_worker = [worker_id, *params, limit]
+
                     cursor = conn.execute(query, params_with_worker)
-                    issues = [dict(row) for row in cursor.fetchall()]
+                    # RETURNING does not preserve the subquery order
+                    issues = sorted(
+                        (dict(row) for row in cursor.fetchall()),
+                        key=lambda issue: (issue["created_at"], issue["id"]),
+                    )
                 else:
                     # If no worker_id provided, just select without marking as processing
                     query = f"""
                         SELECT * FROM issue_queue
                         WHERE {' AND '.join(where_conditions)}
-                        ORDER BY created_at ASC
+                        ORDER BY created_at ASC, id ASC
                         LIMIT ?
                     """
                     params.append(limit)
-                    
+
                     cursor = conn.execute(query, params)
                     issues = [dict(row) for row in cursor.fetchall()]
 
-                conn.commit()
-                return issues
-                
-            except Exception as e:
-                conn.rollback()
-                logger.error(f"Error in get_next_issues: {e}")
-                return []
+            return issues
+
+        except Exception as e:
+            logger.error(f"Error in get_next_issues: {e}")
+            return []
 
     def update_issue_status(
         self, issue_id: int, status: str, fix_result: dict[str, Any] | None = None
     ) -> None:
         """Update the status of an issue."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connections.transaction() as conn:
             conn.execute(
                 """
                 UPDATE issue_queue
@@ -171,7 +206,7 @@ class IssueQueueManager:
 
     def get_queue_stats(self) -> dict[str, int | float]:
         """Get statistics about the issue queue."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connections.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT
@@ -210,7 +245,7 @@ class IssueQueueManager:
 
     def cleanup_old_queue_items(self, days_to_keep: int = 7) -> int:
         """Delete completed and failed queue items older than the retention window."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connections.transaction() as conn:
             cursor = conn.execute(
                 """
                 DELETE FROM issue_queue
@@ -223,7 +258,7 @@ class IssueQueueManager:
 
     def reset_stale_issues(self, timeout_minutes: int = 30) -> int:
         """Reset long-running processing issues back to pending."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connections.transaction() as conn:
             cursor = conn.execute(
                 """
                 UPDATE issue_queue
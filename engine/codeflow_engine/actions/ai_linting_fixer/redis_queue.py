@@ -6,7 +6,7 @@ This enables horizontal scaling across multiple workers and systems.
 """
 
 from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields, replace
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 import json
@@ -17,6 +17,8 @@ import time
 from typing import Any, TypedDict
 import uuid
 
+from codeflow_engine.actions.ai_linting_fixer.queue_codec import QueueCodec
+
 
 logger = logging.getLogger(__name__)
 
@@ -94,12 +96,26 @@ class QueuedIssue:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "QueuedIssue":
         """Create from dictionary (JSON deserialization)."""
+        # Legacy queue entries carry extra keys such as an enqueue timestamp
+        names = {field.name for field in fields(cls)}
+        data = {key: value for key, value in data.items() if key in names}
         # Convert ISO format back to datetime
         for key in ["created_at", "processing_started_at"]:
             if data.get(key):
                 data[key] = datetime.fromisoformat(data[key])
         return cls(**data)
 
+    def to_record(self) -> list[Any]:
+        """Convert to a positional record for compact serialization."""
+        return _to_record(self)
+
+    @classmethod
+    def from_record(cls, record: list[Any] | dict[str, Any]) -> "QueuedIssue":
+        """Create from a positional record, or a legacy JSON dictionary."""
+        if isinstance(record, dict):
+            return cls.from_dict(record)
+        return cls(**_from_record(cls, record))
+
 
 @dataclass
 class ProcessingResult:
@@ -125,15 +141,175 @@ class ProcessingResult:
             data["processed_at"] = data["processed_at"].isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProcessingResult":
+        """Create from dictionary (JSON deserialization)."""
+        if data.get("processed_at"):
+            data["processed_at"] = datetime.fromisoformat(data["processed_at"])
+        return cls(**data)
+
+    def to_record(self) -> list[Any]:
+        """Convert to a positional record for compact serialization."""
+        return _to_record(self)
+
+    @classmethod
+    def from_record(cls, record: list[Any] | dict[str, Any]) -> "ProcessingResult":
+        """Create from a positional record, or a legacy JSON dictionary."""
+        if isinstance(record, dict):
+            return cls.from_dict(record)
+        return cls(**_from_record(cls, record))
+
+
+# Records list field values in dataclass field order, with datetimes as epoch
+# milliseconds. New fields must be appended so older records stay readable.
+_DATETIME_FIELDS = frozenset({"created_at", "processing_started_at", "processed_at"})
+
+
+def _to_record(obj: Any) -> list[Any]:
+    record = []
+    for field in fields(obj):
+        value = getattr(obj, field.name)
+        if isinstance(value, datetime):
+            value = int(value.timestamp() * 1000)
+        record.append(value)
+    return record
+
+
+def _from_record(cls: type, record: list[Any]) -> dict[str, Any]:
+    data = {}
+    for field, value in zip(fields(cls), record, strict=False):
+        if value is not None and field.name in _DATETIME_FIELDS:
+            value = datetime.fromtimestamp(value / 1000, tz=UTC)
+        data[field.name] = value
+    return data
+
+
+# Pending issues live in a sorted set ordered by this score: higher priority
+# first, then enqueue time in milliseconds (FIFO within a priority).
+PRIORITY_SCORE_STRIDE = 10**13
+
+# Requeues claims whose visibility deadline has passed. Expired claims count
+# as a retry; issues out of retries are moved to the failed hash. Payloads
+# are opaque to Lua, so priority and retry counters live in a small JSON meta
+# record (legacy JSON payloads without one are read directly).
+# KEYS: pending, processing, issues, failed, meta
+# ARGV: now_ms, stride, failed_at, limit
+_REQUEUE_EXPIRED_LUA = """
+local function requeue_expired(now_ms, stride, failed_at, limit)
+    local expired = redis.call(
+        'ZRANGEBYSCORE', KEYS[2], '-inf', now_ms, 'LIMIT', 0, limit
+    )
+    local requeued = 0
+    local failed = 0
+    for _, id in ipairs(expired) do
+        redis.call('ZREM', KEYS[2], id)
+        local payload = redis.call('HGET', KEYS[3], id)
+        if payload then
+            local meta_json = redis.call('HGET', KEYS[5], id)
+            if not meta_json and string.sub(payload, 1, 1) == '{' then
+                meta_json = payload
+            end
+            local meta = meta_json and cjson.decode(meta_json) or {}
+            local updated = {
+                priority = tonumber(meta.priority) or 5,
+                retry_count = (tonumber(meta.retry_count) or 0) + 1,
+                max_retries = tonumber(meta.max_retries) or 3,
+            }
+            if updated.retry_count > updated.max_retries then
+                updated.final_error = 'Processing timeout'
+                updated.failed_at = failed_at
+                redis.call('HSET', KEYS[4], id, payload)
+                redis.call('HDEL', KEYS[3], id)
+                failed = failed + 1
+            else
+                local score = -updated.priority * stride + now_ms
+                redis.call('ZADD', KEYS[1], string.format('%.0f', score), id)
+                requeued = requeued + 1
+            end
+            redis.call('HSET', KEYS[5], id, cjson.encode(updated))
+        end
+    end
+    return {requeued, failed}
+end
+"""
+
+_REQUEUE_SCRIPT = (
+    _REQUEUE_EXPIRED_LUA
+    + """
+return requeue_expired(
+    tonumber(ARGV[1]), tonumber(ARGV[2]), ARGV[3], tonumber(ARGV[4])
+)
+"""
+)
+
+# Atomically claims up to ``count`` pending issues, moving them into the
+# processing set with a visibility deadline. Expired claims are requeued
+# first so crashed workers' issues are picked up without a sweeper. Members
+# that are legacy JSON issues (added by writers predating the issues hash)
+# become their own payload. Returns id, payload, meta triples (meta is empty
+# when missing) and the ids that had no payload and were dropped.
+# KEYS: pending, processing, issues, failed, meta
+# ARGV: now_ms, stride, failed_at, limit, deadline_ms, count
+_CLAIM_SCRIPT = (
+    _REQUEUE_EXPIRED_LUA
+    + """
+requeue_expired(tonumber(ARGV[1]), tonumber(ARGV[2]), ARGV[3], tonumber(ARGV[4]))
+local ids = redis.call('ZRANGE', KEYS[1], 0, tonumber(ARGV[6]) - 1)
+local claimed = {}
+local missing = {}
+for _, id in ipairs(ids) do
+    redis.call('ZREM', KEYS[1], id)
+    local payload = redis.call('HGET', KEYS[3], id)
+    if not payload and string.sub(id, 1, 1) == '{' then
+        local ok, legacy = pcall(cjson.decode, id)
+        if ok and type(legacy) == 'table' and legacy.id then
+            payload = id
+            id = tostring(legacy.id)
+            redis.call('HSET', KEYS[3], id, payload)
+        end
+    end
+    if payload then
+        redis.call('ZADD', KEYS[2], ARGV[5], id)
+        table.insert(claimed, id)
+        table.insert(claimed, payload)
+        table.insert(claimed, redis.call('HGET', KEYS[5], id) or '')
+    else
+        table.insert(missing, id)
+    end
+end
+return {claimed, missing}
+"""
+)
+
+
+def priority_score(priority: int, enqueued_ms: int) -> int:
+    """Sorted-set score of a pending issue; lower scores are claimed first."""
+    return -priority * PRIORITY_SCORE_STRIDE + enqueued_ms
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
 
 class RedisQueueManager:
-    """Manages Redis-based queues for distributed AI linting processing."""
+    """Manages Redis-based queues for distributed AI linting processing.
+
+    Pending issues are ids in a sorted set scored by priority and enqueue
+    time, with their compact-encoded payloads in a separate hash and their
+    priority and retry counters in a small meta hash. Workers claim issues
+    atomically through a Lua script that moves them into a processing
+    sorted set scored by their visibility deadline; claims that are not
+    completed or failed before the deadline are requeued automatically.
+    """
 
     def __init__(
         self,
         redis_url: str = "redis://localhost:6379/0",
         queue_prefix: str = "ai_linting",
         worker_id: str | None = None,
+        visibility_timeout: float = 1800.0,
+        requeue_batch_size: int = 100,
+        codec: QueueCodec | None = None,
     ):
         """
         Initialize Redis queue manager.
@@ -142,6 +318,10 @@ class RedisQueueManager:
             redis_url: Redis connection URL
             queue_prefix: Prefix for all queue names
             worker_id: Unique identifier for this worker
+            visibility_timeout: Seconds a claimed issue stays invisible to
+                other workers before it is requeued
+            requeue_batch_size: Maximum expired claims requeued per claim
+            codec: Encoder for issue and result payloads
         """
         if not REDIS_AVAILABLE:
             msg = "Redis is not available. Install with: pip install redis"
@@ -150,6 +330,9 @@ class RedisQueueManager:
         self.redis_url = redis_url
         self.queue_prefix = queue_prefix
         self.worker_id = worker_id or f"worker_{uuid.uuid4().hex[:8]}"
+        self.visibility_timeout = visibility_timeout
+        self.requeue_batch_size = requeue_batch_size
+        self.codec = codec or QueueCodec()
 
         # Initialize Redis connection
         self.redis_client: Any = None
@@ -158,12 +341,21 @@ class RedisQueueManager:
         # Queue names
         self.pending_queue = f"{queue_prefix}:pending"
         self.processing_queue = f"{queue_prefix}:processing"
+        self.issues_key = f"{queue_prefix}:issues"
+        self.meta_key = f"{queue_prefix}:meta"
+        self.bodies_key = f"{queue_prefix}:bodies"
         self.results_queue = f"{queue_prefix}:results"
         self.failed_queue = f"{queue_prefix}:failed"
         self.worker_heartbeat = f"{queue_prefix}:workers:heartbeat"
         self.issue_queue_key = self.pending_queue
         self.processing_count_key = f"{queue_prefix}:processing_count"
 
+        # Lua scripts (loaded lazily by redis-py, EVALSHA with EVAL fallback)
+        self._claim_script = self.redis_client.register_script(_CLAIM_SCRIPT)
+        self._requeue_script = self.redis_client.register_script(_REQUEUE_SCRIPT)
+
+        self._migrate_legacy_queues()
+
         # Statistics
         self.processed_count = 0
         self.failed_count = 0
@@ -172,7 +364,8 @@ class RedisQueueManager:
     def _connect(self):
         """Establish Redis connection."""
         try:
-            self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
+            # Payloads are binary, so responses are not decoded
+            self.redis_client = redis.from_url(self.redis_url, decode_responses=False)
             self.redis_client.ping()
             logger.info("Connected to Redis: %s", self.redis_url)
         except Exception:
@@ -194,53 +387,233 @@ class RedisQueueManager:
             msg = "Redis client is not initialized"
             raise RuntimeError(msg)
 
+    @property
+    def _script_keys(self) -> list[str]:
+        return [
+            self.pending_queue,
+            self.processing_queue,
+            self.issues_key,
+            self.failed_queue,
+            self.meta_key,
+        ]
+
+    def _requeue_args(self, now_ms: int) -> list[Any]:
+        return [
+            now_ms,
+            PRIORITY_SCORE_STRIDE,
+            datetime.now(UTC).isoformat(),
+            self.requeue_batch_size,
+        ]
+
+    @staticmethod
+    def _issue_meta(issue: QueuedIssue, **extra: Any) -> str:
+        """JSON counters the Lua scripts need without decoding the payload."""
+        return json.dumps(
+            {
+                "priority": issue.priority,
+                "retry_count": issue.retry_count,
+                "max_retries": issue.max_retries,
+                **extra,
+            }
+        )
+
+    def _migrate_legacy_queues(self) -> None:
+        """
+        Move issues queued by earlier versions into the issues hash.
+
+        Earlier versions kept whole JSON issues as members of a pending
+        list (single enqueues) or sorted set (batch enqueues), and in-flight
+        issues in a processing hash. Claimed-but-unfinished legacy issues
+        are requeued, since their workers cannot complete them any more.
+        """
+        try:
+            self._validate_redis_client()
+            self.redis_client.transaction(
+                self._migrate_legacy_pending,
+                self.pending_queue,
+                self.processing_queue,
+            )
+        except Exception:
+            logger.exception("Failed to migrate legacy queue entries")
+
+    def _migrate_legacy_pending(self, pipe: Any) -> None:
+        """Migrate legacy entries inside a WATCH transaction on both queues."""
+        pending_type = pipe.type(self.pending_queue)
+        processing_type = pipe.type(self.processing_queue)
+        stale_members: list[bytes] = []
+        if pending_type == b"list":
+            # LPUSH puts the newest issue first
+            legacy = list(reversed(pipe.lrange(self.pending_queue, 0, -1)))
+        elif pending_type == b"zset":
+            stale_members = [
+                member for member, _ in pipe.zscan_iter(self.pending_queue, match="{*")
+            ]
+            legacy = list(stale_members)
+        else:
+            legacy = []
+        if processing_type == b"hash":
+            legacy.extend(pipe.hvals(self.processing_queue))
+        if not legacy:
+            return
+
+        now_ms = _now_ms()
+        payloads: dict[str, bytes] = {}
+        metas: dict[str, str] = {}
+        scores: dict[str, int] = {}
+        for offset, data in enumerate(legacy):
+            try:
+                issue = QueuedIssue.from_dict(json.loads(data))
+            except (TypeError, ValueError):
+                logger.exception("Dropping unreadable legacy queue entry: %r", data)
+                continue
+            issue.assigned_worker = None
+            issue.processing_started_at = None
+            payloads[issue.id] = self.codec.dumps(issue.to_record())
+            metas[issue.id] = self._issue_meta(issue)
+            scores[issue.id] = priority_score(issue.priority, now_ms + offset)
+
+        pipe.multi()
+        if pending_type == b"list":
+            pipe.delete(self.pending_queue)
+        elif stale_members:
+            pipe.zrem(self.pending_queue, *stale_members)
+        if processing_type == b"hash":
+            pipe.delete(self.processing_queue)
+        if payloads:
+            pipe.hset(self.issues_key, mapping=payloads)
+            pipe.hset(self.meta_key, mapping=metas)
+            pipe.zadd(self.pending_queue, scores)
+        logger.info("Migrated %d legacy queue entries", len(payloads))
+
+    def _decode_issue(self, payload: bytes, meta: bytes | None) -> QueuedIssue:
+        issue = QueuedIssue.from_record(self.codec.loads(payload))
+        if meta:
+            # Expired claims bump the retry count in the meta record only
+            issue.retry_count = json.loads(meta)["retry_count"]
+        return issue
+
     def enqueue_issue(self, issue: QueuedIssue) -> bool:
         """Add an issue to the pending queue."""
+        return self.enqueue_issues([issue]) == 1
+
+    def enqueue_issues(self, issues: list[QueuedIssue]) -> int:
+        """Add multiple issues to the pending queue in one round trip."""
+        if not issues:
+            return 0
+
         try:
             self._validate_redis_client()
-            issue_data = issue.to_dict()
-            issue_data["timestamp"] = datetime.now(UTC).isoformat()
-            assert self.redis_client is not None
-            self.redis_client.lpush(self.issue_queue_key, json.dumps(issue_data))
-            return True
+            now_ms = _now_ms()
+            payloads = {issue.id: self.codec.dumps(issue.to_record()) for issue in issues}
+            metas = {issue.id: self._issue_meta(issue) for issue in issues}
+            scores = {issue.id: priority_score(issue.priority, now_ms) for issue in issues}
+
+            pipe = self.redis_client.pipeline()
+            pipe.hset(self.issues_key, mapping=payloads)
+            pipe.hset(self.meta_key, mapping=metas)
+            pipe.zadd(self.pending_queue, scores)
+            pipe.execute()
+
+            logger.info("Enqueued %d issues in batch", len(payloads))
+            return len(payloads)
+
         except Exception as e:
-            logger.exception(f"Failed to enqueue issue: {e}")
-            return False
+            logger.exception(f"Failed to enqueue issues in batch: {e}")
+            return 0
+
+    def claim_issues(
+        self, count: int = 1, visibility_timeout: float | None = None
+    ) -> list[QueuedIssue]:
+        """
+        Atomically claim up to ``count`` of the highest-priority issues.
+
+        Claimed issues must be passed to ``complete_issue`` or ``fail_issue``
+        before the visibility timeout expires, or they are requeued for
+        another worker.
+        """
+        if count <= 0:
+            return []
+
+        try:
+            self._validate_redis_client()
+            timeout = self.visibility_timeout if visibility_timeout is None else visibility_timeout
+            now_ms = _now_ms()
+            deadline_ms = now_ms + int(timeout * 1000)
+            claimed, missing = self._claim_script(
+                keys=self._script_keys,
+                args=[*self._requeue_args(now_ms), deadline_ms, count],
+            )
+            if missing:
+                logger.error(
+                    "Dropped %d queued issue ids without a payload: %s",
+                    len(missing),
+                    ", ".join(issue_id.decode(errors="replace") for issue_id in missing),
+                )
+
+            started_at = datetime.now(UTC)
+            issues: list[QueuedIssue] = []
+            for payload, meta in zip(claimed[1::3], claimed[2::3], strict=True):
+                issue = self._decode_issue(payload, meta)
+                issue.assigned_worker = self.worker_id
+                issue.processing_started_at = started_at
+                issues.append(issue)
+            return issues
+
+        except Exception as e:
+            logger.exception(f"Failed to claim issues: {e}")
+            return []
 
     def dequeue_issue(self, timeout: int | None = None) -> QueuedIssue | None:
-        """Remove and return the next issue from the queue."""
+        """
+        Claim the next issue from the queue.
+
+        With a timeout, polls until an issue is available or the timeout
+        elapses; the claim itself cannot block inside Redis.
+        """
+        deadline = time.monotonic() + (timeout or 0)
+        delay = 0.05
+        while True:
+            issues = self.claim_issues(1)
+            if issues:
+                return issues[0]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
+    def extend_claim(self, issue_id: str, visibility_timeout: float | None = None) -> bool:
+        """Push back the visibility deadline of an issue still being processed."""
         try:
             self._validate_redis_client()
-            assert self.redis_client is not None
-            if timeout is not None:
-                popped = self.redis_client.brpop(self.issue_queue_key, timeout=timeout)
-                result = popped[1] if popped else None
-            else:
-                result = self.redis_client.rpop(self.issue_queue_key)
-            if result:
-                data = json.loads(result)
-                return QueuedIssue.from_dict(data)
-            return None
+            timeout = self.visibility_timeout if visibility_timeout is None else visibility_timeout
+            deadline_ms = _now_ms() + int(timeout * 1000)
+            self.redis_client.zadd(self.processing_queue, {issue_id: deadline_ms}, xx=True)
+            return self.redis_client.zscore(self.processing_queue, issue_id) is not None
         except Exception as e:
-            logger.exception(f"Failed to dequeue issue: {e}")
-            return None
+            logger.exception(f"Failed to extend claim for {issue_id}: {e}")
+            return False
 
     def get_queue_length(self) -> int:
         """Get the current number of issues in the queue."""
         try:
             self._validate_redis_client()
-            assert self.redis_client is not None
-            return self.redis_client.llen(self.issue_queue_key)
+            return self.redis_client.zcard(self.pending_queue)
         except Exception as e:
             logger.exception(f"Failed to get queue length: {e}")
             return 0
 
     def clear_queue(self) -> bool:
-        """Clear all issues from the queue."""
+        """Clear all pending issues from the queue."""
         try:
             self._validate_redis_client()
-            assert self.redis_client is not None
-            self.redis_client.delete(self.issue_queue_key)
+            pending = self.redis_client.zrange(self.pending_queue, 0, -1)
+            pipe = self.redis_client.pipeline()
+            if pending:
+                pipe.hdel(self.issues_key, *pending)
+                pipe.hdel(self.meta_key, *pending)
+            pipe.delete(self.pending_queue)
+            pipe.execute()
             return True
         except Exception as e:
             logger.exception(f"Failed to clear queue: {e}")
@@ -250,8 +623,7 @@ class RedisQueueManager:
         """Get statistics about the queue."""
         try:
             self._validate_redis_client()
-            assert self.redis_client is not None
-            length = self.redis_client.llen(self.issue_queue_key)
+            length = self.redis_client.zcard(self.pending_queue)
             return {
                 "queue_length": length,
                 "queue_name": self.issue_queue_key,
@@ -269,27 +641,31 @@ class RedisQueueManager:
         """Peek at the top issues in the queue without removing them."""
         try:
             self._validate_redis_client()
-            assert self.redis_client is not None
-            results = self.redis_client.lrange(self.issue_queue_key, 0, count - 1)
-            issues: list[QueuedIssue] = []
-            for result in results:
-                data = json.loads(result)
-                issues.append(QueuedIssue.from_dict(data))
-            return issues
+            ids = self.redis_client.zrange(self.pending_queue, 0, count - 1)
+            if not ids:
+                return []
+            pipe = self.redis_client.pipeline()
+            pipe.hmget(self.issues_key, ids)
+            pipe.hmget(self.meta_key, ids)
+            payloads, metas = pipe.execute()
+            return [
+                self._decode_issue(payload, meta)
+                for payload, meta in zip(payloads, metas, strict=True)
+                if payload
+            ]
         except Exception as e:
             logger.exception(f"Failed to peek queue: {e}")
             return []
 
     def remove_issue(self, issue_id: str) -> bool:
-        """Remove a specific issue from the queue by ID."""
+        """Remove a pending issue from the queue by ID."""
         try:
             self._validate_redis_client()
-            # This is a simplified implementation - in practice you'd need to scan the queue
-            # and remove the specific issue by matching its ID
-            logger.warning(
-                "Remove issue by ID not implemented - would need queue scanning"
-            )
-            return False
+            if not self.redis_client.zrem(self.pending_queue, issue_id):
+                return False
+            self.redis_client.hdel(self.issues_key, issue_id)
+            self.redis_client.hdel(self.meta_key, issue_id)
+            return True
         except Exception as e:
             logger.exception(f"Failed to remove issue: {e}")
             return False
@@ -299,7 +675,7 @@ class RedisQueueManager:
         try:
             self._validate_redis_client()
             assert self.redis_client is not None
-            queue_length = self.redis_client.llen(self.issue_queue_key)
+            queue_length = self.redis_client.zcard(self.pending_queue)
             processing_count = self.redis_client.get(self.processing_count_key) or 0
 
             return {
@@ -360,40 +736,27 @@ class RedisQueueManager:
                 "error": str(e),
             }
 
-    def enqueue_issues(self, issues: list[QueuedIssue]) -> int:
-        """Add multiple issues to the pending queue."""
-        enqueued_count = 0
-
-        try:
-            # Batch operation for efficiency
-            mapping = {}
-            for issue in issues:
-                issue_data = json.dumps(issue.to_dict())
-                score = issue.priority * 1000 + int(time.time())
-                mapping[issue_data] = score
-
-            if mapping:
-                assert self.redis_client is not None
-                self.redis_client.zadd(self.pending_queue, mapping)
-                enqueued_count = len(mapping)
-                logger.info(f"Enqueued {enqueued_count} issues in batch")
-
-        except Exception as e:
-            logger.exception(f"Failed to enqueue issues in batch: {e}")
-
-        return enqueued_count
-
     def complete_issue(self, issue_id: str, result: ProcessingResult) -> bool:
         """Mark an issue as completed."""
         try:
-            # Remove from processing queue
-            assert self.redis_client is not None
-            self.redis_client.hdel(self.processing_queue, issue_id)
-
-            # Add result
-            result_data = json.dumps(result.to_dict())
-            assert self.redis_client is not None
-            self.redis_client.hset(self.results_queue, issue_id, result_data)
+            self._validate_redis_client()
+            # Fixed content is stored once per distinct body
+            body_hash = None
+            body = None
+            if result.fixed_content is not None:
+                body_hash, body = self.codec.dumps_body(result.fixed_content)
+            record = replace(result, fixed_content=None).to_record()
+
+            pipe = self.redis_client.pipeline()
+            pipe.zrem(self.processing_queue, issue_id)
+            # Also drop a copy requeued after the claim expired
+            pipe.zrem(self.pending_queue, issue_id)
+            pipe.hdel(self.issues_key, issue_id)
+            pipe.hdel(self.meta_key, issue_id)
+            if body_hash is not None:
+                pipe.hsetnx(self.bodies_key, body_hash, body)
+            pipe.hset(self.results_queue, issue_id, self.codec.dumps([record, body_hash]))
+            pipe.execute()
 
             # Update statistics
             if result.success:
@@ -411,9 +774,9 @@ class RedisQueueManager:
     def fail_issue(self, issue: QueuedIssue, error_message: str) -> bool:
         """Handle a failed issue processing."""
         try:
-            # Remove from processing queue
-            assert self.redis_client is not None
-            self.redis_client.hdel(self.processing_queue, issue.id)
+            self._validate_redis_client()
+            pipe = self.redis_client.pipeline()
+            pipe.zrem(self.processing_queue, issue.id)
 
             # Check if we should retry
             if issue.retry_count < issue.max_retries:
@@ -423,17 +786,26 @@ class RedisQueueManager:
 
                 # Re-enqueue with lower priority
                 issue.priority = max(1, issue.priority - 1)
-                return self.enqueue_issue(issue)
+                pipe.hset(self.issues_key, issue.id, self.codec.dumps(issue.to_record()))
+                pipe.hset(self.meta_key, issue.id, self._issue_meta(issue))
+                pipe.zadd(
+                    self.pending_queue,
+                    {issue.id: priority_score(issue.priority, _now_ms())},
+                )
+                pipe.execute()
+                return True
+
             # Move to failed queue
-            failed_data = json.dumps(
-                {
-                    **issue.to_dict(),
-                    "final_error": error_message,
-                    "failed_at": datetime.now(UTC).isoformat(),
-                }
+            meta = self._issue_meta(
+                issue,
+                final_error=error_message,
+                failed_at=datetime.now(UTC).isoformat(),
             )
-            assert self.redis_client is not None
-            self.redis_client.hset(self.failed_queue, issue.id, failed_data)
+            pipe.zrem(self.pending_queue, issue.id)
+            pipe.hdel(self.issues_key, issue.id)
+            pipe.hset(self.failed_queue, issue.id, self.codec.dumps(issue.to_record()))
+            pipe.hset(self.meta_key, issue.id, meta)
+            pipe.execute()
             self.failed_count += 1
 
             logger.warning(
@@ -447,22 +819,66 @@ class RedisQueueManager:
             logger.exception(f"Failed to handle issue failure {issue.id}: {e}")
             return False
 
+    def get_result(self, issue_id: str) -> ProcessingResult | None:
+        """Get the stored result of a completed issue."""
+        try:
+            self._validate_redis_client()
+            data = self.redis_client.hget(self.results_queue, issue_id)
+            if data is None:
+                return None
+            decoded = self.codec.loads(data)
+            if isinstance(decoded, dict):
+                return ProcessingResult.from_dict(decoded)
+
+            record, body_hash = decoded
+            result = ProcessingResult.from_record(record)
+            if body_hash is not None:
+                body = self.redis_client.hget(self.bodies_key, body_hash)
+                if body is not None:
+                    result.fixed_content = self.codec.loads_body(body)
+            return result
+
+        except Exception as e:
+            logger.exception(f"Failed to get result for {issue_id}: {e}")
+            return None
+
+    def get_failed_issue(self, issue_id: str) -> dict[str, Any] | None:
+        """Get a permanently failed issue with its final error."""
+        try:
+            self._validate_redis_client()
+            pipe = self.redis_client.pipeline()
+            pipe.hget(self.failed_queue, issue_id)
+            pipe.hget(self.meta_key, issue_id)
+            payload, meta = pipe.execute()
+            if payload is None:
+                return None
+            decoded = self.codec.loads(payload)
+            # Legacy JSON entries carry final_error and failed_at inline
+            data = (
+                decoded if isinstance(decoded, dict) else QueuedIssue.from_record(decoded).to_dict()
+            )
+            if meta:
+                data.update(json.loads(meta))
+            return data
+
+        except Exception as e:
+            logger.exception(f"Failed to get failed issue {issue_id}: {e}")
+            return None
+
     def get_queue_statistics(self) -> dict[str, Any]:
         """Get comprehensive queue statistics."""
         try:
             assert self.redis_client is not None
             return {
                 "pending_count": self.redis_client.zcard(self.pending_queue),
-                "processing_count": self.redis_client.hlen(self.processing_queue),
+                "processing_count": self.redis_client.zcard(self.processing_queue),
                 "results_count": self.redis_client.hlen(self.results_queue),
                 "failed_count": self.redis_client.hlen(self.failed_queue),
                 "worker_stats": {
                     "worker_id": self.worker_id,
                     "processed_count": self.processed_count,
                     "failed_count": self.failed_count,
-                    "uptime_seconds": (
-                        datetime.now(UTC) - self.start_time
-                    ).total_seconds(),
+                    "uptime_seconds": (datetime.now(UTC) - self.start_time).total_seconds(),
                 },
                 "active_workers": self._get_active_workers(),
             }
@@ -480,13 +896,11 @@ class RedisQueueManager:
             # Get workers that have sent heartbeat in last 5 minutes
             active_workers = []
             assert self.redis_client is not None
-            for worker_id, last_seen in self.redis_client.hgetall(
-                self.worker_heartbeat
-            ).items():
+            for worker_id, last_seen in self.redis_client.hgetall(self.worker_heartbeat).items():
                 if float(last_seen) > cutoff_timestamp:
                     active_workers.append(
                         {
-                            "worker_id": worker_id,
+                            "worker_id": worker_id.decode(),
                             "last_seen": datetime.fromtimestamp(
                                 float(last_seen), tz=UTC
                             ).isoformat(),
@@ -507,41 +921,27 @@ class RedisQueueManager:
         except Exception:
             logger.exception("Failed to send heartbeat")
 
-    def cleanup_stale_processing(self, timeout_minutes: int = 30):
-        """Clean up stale processing items."""
-        try:
-            cutoff_time = datetime.now(UTC) - timedelta(minutes=timeout_minutes)
-
-            stale_count = 0
-            assert self.redis_client is not None
-            for issue_id, issue_data in self.redis_client.hgetall(
-                self.processing_queue
-            ).items():
-                issue = QueuedIssue.from_dict(json.loads(issue_data))
-
-                if (
-                    issue.processing_started_at
-                    and issue.processing_started_at < cutoff_time
-                ):
-                    # Re-enqueue stale issue
-                    issue.assigned_worker = None
-                    issue.processing_started_at = None
-                    issue.retry_count += 1
-
-                    self.redis_client.hdel(self.processing_queue, issue_id)
-
-                    if issue.retry_count <= issue.max_retries:
-                        self.enqueue_issue(issue)
-                    else:
-                        self.fail_issue(issue, "Processing timeout")
-
-                    stale_count += 1
+    def cleanup_stale_processing(self) -> int:
+        """
+        Requeue claims whose visibility deadline has passed.
 
+        Claiming already does this, so calling it is only needed to recover
+        stale issues while no worker is claiming. Returns the number of
+        issues requeued or moved to the failed queue.
+        """
+        try:
+            self._validate_redis_client()
+            requeued, failed = self._requeue_script(
+                keys=self._script_keys, args=self._requeue_args(_now_ms())
+            )
+            stale_count = int(requeued) + int(failed)
             if stale_count > 0:
                 logger.info("Cleaned up %d stale processing items", stale_count)
+            return stale_count
 
         except Exception:
             logger.exception("Failed to cleanup stale processing")
+            return 0
 
     def clear_all_queues(self):
         """Clear all queues (for testing/debugging)."""
@@ -550,7 +950,10 @@ class RedisQueueManager:
             self.redis_client.delete(
                 self.pending_queue,
                 self.processing_queue,
+                self.issues_key,
+                self.meta_key,
                 self.results_queue,
+                self.bodies_key,
                 self.failed_queue,
             )
             logger.info("Cleared all queues")
@@ -565,6 +968,7 @@ class DistributedProcessor:
         self,
         queue_manager: RedisQueueManager,
         processor_function: Callable[[QueuedIssue], ProcessingResult],
+        batch_size: int = 1,
     ):
         """
         Initialize distributed processor.
@@ -572,9 +976,11 @@ class DistributedProcessor:
         Args:
             queue_manager: Redis queue manager
             processor_function: Function to process individual issues
+            batch_size: Number of issues claimed per round trip
         """
         self.queue_manager = queue_manager
         self.processor_function = processor_function
+        self.batch_size = max(1, batch_size)
         self.running = False
         self.heartbeat_interval = 60  # seconds
         self.last_heartbeat: float = 0.0
@@ -584,9 +990,7 @@ class DistributedProcessor:
         self.running = True
         iteration_count = 0
 
-        logger.info(
-            "Started distributed processing (worker: %s)", self.queue_manager.worker_id
-        )
+        logger.info("Started distributed processing (worker: %s)", self.queue_manager.worker_id)
 
         try:
             while self.running:
@@ -599,27 +1003,34 @@ class DistributedProcessor:
                     self.queue_manager.send_heartbeat()
                     self.last_heartbeat = current_time
 
-                # Get next issue
-                issue = self.queue_manager.dequeue_issue(timeout=10)
-                if not issue:
-                    continue  # Timeout, try again
+                # Claim the next batch of issues
+                batch_size = self.batch_size
+                if max_iterations:
+                    batch_size = min(batch_size, max_iterations - iteration_count)
+                issues = self.queue_manager.claim_issues(batch_size)
+                if not issues:
+                    issue = self.queue_manager.dequeue_issue(timeout=10)
+                    if not issue:
+                        continue  # Timeout, try again
+                    issues = [issue]
 
-                # Process the issue
-                try:
-                    start_time = time.time()
-                    result = self.processor_function(issue)
-                    processing_time = time.time() - start_time
+                for issue in issues:
+                    # Process the issue
+                    try:
+                        start_time = time.time()
+                        result = self.processor_function(issue)
+                        processing_time = time.time() - start_time
 
-                    result.processing_time = processing_time
-                    result.worker_id = self.queue_manager.worker_id
+                        result.processing_time = processing_time
+                        result.worker_id = self.queue_manager.worker_id
 
-                    self.queue_manager.complete_issue(issue.id, result)
+                        self.queue_manager.complete_issue(issue.id, result)
 
-                except Exception as e:
-                    logger.exception("Error processing issue %s: %s", issue.id, e)
-                    self.queue_manager.fail_issue(issue, str(e))
+                    except Exception as e:
+                        logger.exception("Error processing issue %s: %s", issue.id, e)
+                        self.queue_manager.fail_issue(issue, str(e))
 
-                iteration_count += 1
+                    iteration_count += 1
 
         except KeyboardInterrupt:
             logger.info("Processing interrupted by user")
@@ -649,9 +1060,7 @@ class RedisConfig:
 
         redis_url_env = os.getenv("REDIS_URL")
         redis_url: str
-        redis_url = (
-            "redis://localhost:6379/0" if redis_url_env is None else redis_url_env
-        )
+        redis_url = "redis://localhost:6379/0" if redis_url_env is None else redis_url_env
         queue_prefix_env = os.getenv("AI_LINTING_QUEUE_PREFIX")
         queue_prefix: str
         queue_prefix = "ai_linting" if queue_prefix_env is None else queue_prefix_env
@@ -0,0 +1,194 @@
+"""
+Ruff Validator Module
+
+Lints candidate file contents with ruff for fix validation. Single contents
+are piped over stdin, batches are checked in one ruff invocation, and
+results are cached by content hash so unchanged contents are never relinted.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+from pathlib import Path
+import subprocess
+import tempfile
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 4096
+# Name reported to ruff for content read from stdin
+STDIN_FILENAME = "candidate.py"
+
+
+class RuffValidator:
+    """Batched, content-addressed ruff checks."""
+
+    def __init__(
+        self,
+        ruff_command: tuple[str, ...] = ("ruff",),
+        timeout: float = 30,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Initialize the validator.
+
+        Args:
+            ruff_command: Command prefix invoking ruff
+            timeout: Seconds allowed per ruff invocation
+            cache_size: Results kept before the least recently used are dropped
+        """
+        self.ruff_command = tuple(ruff_command)
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invocations": 0}
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """Hash a file content for the result cache."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get_issue_codes(self, content: str) -> list[str]:
+        """
+        Get the ruff error codes reported for a content.
+
+        Args:
+            content: Python source
+
+        Returns:
+            Error codes, one per reported issue
+        """
+        return self.get_issue_codes_batch([content])[0]
+
+    def get_issue_codes_batch(self, contents: list[str]) -> list[list[str]]:
+        """
+        Get the ruff error codes of many contents with at most one ruff run.
+
+        Args:
+            contents: Python sources
+
+        Returns:
+            Error codes of each content, in input order
+        """
+        hashes = [self.content_hash(content) for content in contents]
+        missing: dict[str, str] = {}
+        with self._lock:
+            for digest, content in zip(hashes, contents, strict=True):
+                if digest in self._cache:
+                    self._cache.move_to_end(digest)
+                    self.stats["hits"] += 1
+                elif digest not in missing:
+                    missing[digest] = content
+                    self.stats["misses"] += 1
+                else:
+                    self.stats["hits"] += 1
+
+        if missing:
+            if len(missing) == 1:
+                results = self._check_stdin(missing)
+            else:
+                results = self._check_directory(missing)
+            # Failed runs are not cached, so the next call retries
+            if results is not None:
+                self._store(results)
+
+        return [self._lookup(digest) or [] for digest in hashes]
+
+    def _check_stdin(self, contents: dict[str, str]) -> dict[str, list[str]] | None:
+        """Lint a single content piped over stdin."""
+        ((digest, content),) = contents.items()
+        output = self._run(["--stdin-filename", STDIN_FILENAME, "-"], stdin=content)
+        if output is None:
+            return None
+        return {digest: [code for _, code in output]}
+
+    def _check_directory(self, contents: dict[str, str]) -> dict[str, list[str]] | None:
+        """Lint many contents in one ruff run over a scratch directory."""
+        with tempfile.TemporaryDirectory(prefix="ruff_validation_") as scratch:
+            for digest, content in contents.items():
+                Path(scratch, f"{digest}.py").write_text(content, encoding="utf-8")
+            output = self._run([scratch])
+        if output is None:
+            return None
+        results: dict[str, list[str]] = {digest: [] for digest in contents}
+        for filename, code in output:
+            digest = Path(filename).stem
+            if digest in results:
+                results[digest].append(code)
+        return results
+
+    def _run(
+        self, arguments: list[str], stdin: str | None = None
+    ) -> list[tuple[str, str]] | None:
+        """
+        Run ruff check with JSON output.
+
+        Args:
+            arguments: Paths, or the stdin arguments
+            stdin: Content piped to ruff
+
+        Returns:
+            (filename, code) of each reported issue, or None if ruff failed
+        """
+        cmd = [
+            *self.ruff_command,
+            "check",
+            "--isolated",
+            "--no-cache",
+            "--output-format=json",
+            *arguments,
+        ]
+        with self._lock:
+            self.stats["invocations"] += 1
+        try:
+            completed = subprocess.run(
+                cmd,
+                input=stdin,
+                check=False,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                timeout=self.timeout,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Failed to get ruff issues: {e}")
+            return None
+        if completed.returncode not in (0, 1):
+            logger.warning(f"Failed to get ruff issues: {completed.stderr.strip()}")
+            return None
+
+        try:
+            items = json.loads(completed.stdout or "[]")
+        except json.JSONDecodeError as e:
+            logger.warning(f"Could not parse ruff output: {e}")
+            return None
+        # Syntax errors carry no code and are reported by the syntax check
+        return [
+            (item.get("filename", STDIN_FILENAME), item["code"])
+            for item in items
+            if isinstance(item, dict) and item.get("code")
+        ]
+
+    def _store(self, results: dict[str, list[str]]) -> None:
+        """Cache results, dropping the least recently used beyond cache_size."""
+        with self._lock:
+            for digest, codes in results.items():
+                self._cache[digest] = codes
+                self._cache.move_to_end(digest)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _lookup(self, digest: str) -> list[str] | None:
+        """Get a cached result."""
+        with self._lock:
+            codes = self._cache.get(digest)
+        return list(codes) if codes is not None else None
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,92 @@
+"""
+SQLite Connections Module
+
+Long-lived, per-thread SQLite connections in WAL mode for the AI linting
+databases, replacing a new connection per statement.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+import sqlite3
+import threading
+
+
+# WAL keeps readers off the writer's lock; NORMAL skips the per-commit fsync
+# of FULL while staying durable across application crashes
+DEFAULT_SYNCHRONOUS = "NORMAL"
+BUSY_TIMEOUT_SECONDS = 30.0
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def open_connection(
+    db_path: str | Path, synchronous: str = DEFAULT_SYNCHRONOUS
+) -> sqlite3.Connection:
+    """
+    Open a tuned connection in autocommit mode.
+
+    Multi-statement writes must run inside an explicit transaction, for
+    example through ThreadLocalConnections.transaction.
+
+    Args:
+        db_path: SQLite database file
+        synchronous: SQLite synchronous level
+
+    Returns:
+        Connection returning sqlite3.Row rows
+    """
+    if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+        msg = f"Invalid SQLite synchronous level: {synchronous}"
+        raise ValueError(msg)
+
+    conn = sqlite3.connect(
+        db_path,
+        timeout=BUSY_TIMEOUT_SECONDS,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+    return conn
+
+
+class ThreadLocalConnections:
+    """One reusable connection per thread to a SQLite database."""
+
+    def __init__(self, db_path: str | Path, synchronous: str = DEFAULT_SYNCHRONOUS):
+        self.db_path = db_path
+        self.synchronous = synchronous
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = open_connection(self.db_path, self.synchronous)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction on this thread's connection."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
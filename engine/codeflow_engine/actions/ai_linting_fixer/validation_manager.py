@@ -13,6 +13,8 @@ import subprocess
 import tempfile
 from typing import Any
 
+from codeflow_engine.actions.ai_linting_fixer.ruff_validator import RuffValidator
+
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +57,35 @@ class ValidationConfig:
 class ValidationManager:
     """Manages validation phases and rollback decisions."""
 
-    def __init__(self, config: ValidationConfig | None = None):
+    def __init__(
+        self,
+        config: ValidationConfig | None = None,
+        ruff_validator: RuffValidator | None = None,
+    ):
         """Initialize the validation manager."""
         self.config = config or ValidationConfig()
+        self.ruff_validator = ruff_validator or RuffValidator()
         self.validation_history: list[dict[str, Any]] = []
 
+    def validate_file_fixes(
+        self, fixes: list[tuple[str, str, str, list[str]]]
+    ) -> list[tuple[bool, list[ValidationCheck]]]:
+        """
+        Validate many file fixes, linting all their contents in one ruff run.
+
+        Args:
+            fixes: (file_path, original_content, fixed_content, issue_codes)
+                of each fix
+
+        Returns:
+            validate_file_fix result of each fix, in input order
+        """
+        if self.config.enable_linting_check:
+            self.ruff_validator.get_issue_codes_batch(
+                [content for fix in fixes for content in (fix[1], fix[2])]
+            )
+        return [self.validate_file_fix(*fix) for fix in fixes]
+
     def validate_file_fix(
         self,
         file_path: str,
@@ -284,8 +310,9 @@ class ValidationManager:
 
         try:
             # Run ruff on both versions to compare
-            original_issues = self._get_ruff_issues(original_content)
-            fixed_issues = self._get_ruff_issues(fixed_content)
+            original_issues, fixed_issues = self.ruff_validator.get_issue_codes_batch(
+                [original_content, fixed_content]
+            )
 
             # Filter to target issue codes
             original_target_issues = [
@@ -341,42 +368,7 @@ class ValidationManager:
 
     def _get_ruff_issues(self, content: str) -> list[str]:
         """Get ruff issues for content."""
-        temp_file_path = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".py", delete=False
-            ) as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-
-            result = subprocess.run(
-                ["ruff", "check", temp_file_path, "--output-format=text"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            # Parse ruff output
-            issues = []
-            for line in result.stdout.splitlines():
-                if temp_file_path in line and ":" in line:
-                    # Extract error code from line like "temp.py:1:1: E501 Line too long"
-                    parts = line.split(":")
-                    if len(parts) >= 4:
-                        error_part = parts[3].strip()
-                        if " " in error_part:
-                            error_code = error_part.split()[0]
-                            issues.append(error_code)
-
-            return issues
-
-        except Exception as e:
-            logger.warning(f"Failed to get ruff issues: {e}")
-            return []
-        finally:
-            # Clean up temporary file
-            if temp_file_path:
-                Path(temp_file_path).unlink(missing_ok=True)
+        return self.ruff_validator.get_issue_codes(content)
 
     def _validate_tests(self, file_path: str) -> ValidationCheck:
         """Validate that tests still pass for the file."""
@@ -518,4 +510,5 @@ class ValidationManager:
             "keep_rate": kept_fixes / total_validations if total_validations > 0 else 0,
             "average_validation_score": avg_score,
             "check_statistics": check_stats,
+            "ruff_checks": dict(self.ruff_validator.stats),
         }
@@ -0,0 +1,166 @@
+"""
+CodeFlow Action Pool
+
+Pools of warm, reusable action instances with a per-action concurrency limit
+and per-action timing statistics.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import time
+from typing import Any
+
+from codeflow_engine.actions.base.action import Action
+
+
+DEFAULT_POOL_SIZE = 4
+
+# Latency histogram metric name for action executions
+ACTION_LATENCY_METRIC = "codeflow_action_seconds"
+
+
+class ActionPool:
+    """
+    Warm instances of one action.
+
+    Instances are created on demand up to ``max_size`` and returned to the pool
+    after each call, so clients, compiled patterns and loaded configuration held
+    by an instance are reused. ``max_size`` also bounds how many calls of the
+    action run at once; further callers wait for a free instance.
+    """
+
+    def __init__(
+        self, name: str, factory: Callable[[], Action[Any, Any]], max_size: int
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            name: Action name
+            factory: Creates a new action instance
+            max_size: Maximum number of instances and concurrent calls
+        """
+        if max_size < 1:
+            msg = f"Action pool size must be at least 1, got {max_size}"
+            raise ValueError(msg)
+        self.name = name
+        self.max_size = max_size
+        self._factory = factory
+        self._idle: list[Action[Any, Any]] = []
+        self._created = 0
+        self._in_use = 0
+        self._waiters: list[asyncio.Future[None]] = []
+        self._stats = {
+            "calls": 0,
+            "failures": 0,
+            "total_time": 0.0,
+            "max_time": 0.0,
+            "total_wait_time": 0.0,
+        }
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Action[Any, Any]]:
+        """
+        Borrow an instance for the duration of one call.
+
+        Yields:
+            A warm action instance
+        """
+        wait_start = time.perf_counter()
+        while self._in_use >= self.max_size:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # Woken but cancelled before running: hand the slot on
+                    self._wake_next()
+                raise
+        self._stats["total_wait_time"] += time.perf_counter() - wait_start
+
+        self._in_use += 1
+        try:
+            if self._idle:
+                instance = self._idle.pop()
+            else:
+                instance = self._factory()
+                self._created += 1
+        except BaseException:
+            self._release()
+            raise
+
+        try:
+            yield instance
+        finally:
+            if len(self._idle) < self.max_size:
+                self._idle.append(instance)
+            self._release()
+
+    def _release(self) -> None:
+        self._in_use -= 1
+        self._wake_next()
+
+    def _wake_next(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.pop(0)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def resize(self, max_size: int) -> None:
+        """
+        Change the concurrency limit.
+
+        Args:
+            max_size: New maximum number of instances and concurrent calls
+        """
+        if max_size < 1:
+            msg = f"Action pool size must be at least 1, got {max_size}"
+            raise ValueError(msg)
+        self.max_size = max_size
+        del self._idle[max_size:]
+        for _ in range(max_size - self._in_use):
+            self._wake_next()
+
+    def record(self, seconds: float, success: bool) -> None:
+        """
+        Record the duration of one call.
+
+        Args:
+            seconds: Execution time in seconds
+            success: Whether the call succeeded
+        """
+        self._stats["calls"] += 1
+        if not success:
+            self._stats["failures"] += 1
+        self._stats["total_time"] += seconds
+        self._stats["max_time"] = max(self._stats["max_time"], seconds)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Call counts, timings, instance counts and the concurrency limit
+        """
+        calls = self._stats["calls"]
+        return {
+            **self._stats,
+            "average_time": self._stats["total_time"] / calls if calls else 0.0,
+            "instances_created": self._created,
+            "idle_instances": len(self._idle),
+            "in_use": self._in_use,
+            "waiting": len(self._waiters),
+            "max_size": self.max_size,
+        }
+
+
+__all__ = [
+    "ACTION_LATENCY_METRIC",
+    "DEFAULT_POOL_SIZE",
+    "ActionPool",
+]
@@ -7,9 +7,17 @@ Registry for managing and discovering actions.
 from collections.abc import Callable
 from functools import lru_cache
 import logging
-from typing import Any, Protocol, TypeVar
+import time
+from typing import Any, Protocol, TypeVar, get_args, get_type_hints
+
+import pydantic
 
 from codeflow_engine.actions.base.action import Action
+from codeflow_engine.actions.pool import (
+    ACTION_LATENCY_METRIC,
+    DEFAULT_POOL_SIZE,
+    ActionPool,
+)
 
 
 T = TypeVar("T")
@@ -25,15 +33,65 @@ class ActionProtocol(Protocol):
 logger = logging.getLogger(__name__)
 
 
+def _implements_run_only(action_cls: type) -> bool:
+    """Whether an action overrides run but leaves execute abstract."""
+    return (
+        "execute" in getattr(action_cls, "__abstractmethods__", ())
+        and action_cls.run is not Action.run
+    )
+
+
+def _run_style_adapter(action_cls: type[ActionT]) -> type[ActionT]:
+    """Subclass a run-style action so it can be instantiated and executed."""
+
+    async def execute(self: Any, inputs: Any, context: dict[str, Any]) -> Any:
+        return await self.run(inputs)
+
+    return type(
+        action_cls.__name__,
+        (action_cls,),
+        {"execute": execute, "__module__": action_cls.__module__},
+    )
+
+
+def _input_model(action_cls: type) -> type[pydantic.BaseModel] | None:
+    """Find the pydantic model an action takes as inputs, if any."""
+    candidates = []
+    for method_name in ("run", "execute"):
+        try:
+            candidates.append(get_type_hints(getattr(action_cls, method_name)).get("inputs"))
+        except Exception:
+            continue
+    for base in getattr(action_cls, "__orig_bases__", ()):
+        args = get_args(base)
+        if args:
+            candidates.append(args[0])
+    for candidate in candidates:
+        if isinstance(candidate, type) and issubclass(candidate, pydantic.BaseModel):
+            return candidate
+    return None
+
+
 class ActionRegistry[ActionT: Action[Any, Any]]:
     """
     Registry for action classes with type safety.
     """
 
-    def __init__(self) -> None:
-        """Initialize the action registry."""
+    def __init__(self, default_pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        """
+        Initialize the action registry.
+
+        Args:
+            default_pool_size: Warm instances, and concurrent executions, per action
+                unless set with set_concurrency_limit
+        """
         self._actions: dict[str, type[ActionT]] = {}
+        self._executable_classes: dict[str, type[ActionT]] = {}
+        self._input_models: dict[str, type[pydantic.BaseModel] | None] = {}
         self._instances: dict[str, ActionT] = {}
+        self.default_pool_size = default_pool_size
+        self._pools: dict[str, ActionPool] = {}
+        self._pool_sizes: dict[str, int] = {}
 
         # Auto-register built-in actions
         self._register_builtin_actions()
@@ -43,6 +101,13 @@ class ActionRegistry[ActionT: Action[Any, Any]]:
     def register(self, name: str, action_cls: type[ActionT]) -> None:
         """Register an action class with type safety."""
         self._actions[name] = action_cls
+        self._executable_classes[name] = (
+            _run_style_adapter(action_cls) if _implements_run_only(action_cls) else action_cls
+        )
+        self._input_models[name] = _input_model(action_cls)
+        # Instances of a replaced class must not be reused
+        self._instances.pop(name, None)
+        self._pools.pop(name, None)
         logger.info(f"Registered action: {name}")
 
     def unregister(self, action_name: str) -> None:
@@ -54,10 +119,14 @@ class ActionRegistry[ActionT: Action[Any, Any]]:
         """
         if action_name in self._actions:
             del self._actions[action_name]
+            del self._executable_classes[action_name]
+            del self._input_models[action_name]
 
         if action_name in self._instances:
             del self._instances[action_name]
 
+        self._pools.pop(action_name, None)
+
         logger.info(f"Unregistered action: {action_name}")
 
     def get(self, name: str) -> type[ActionT] | None:
@@ -96,14 +165,118 @@ class ActionRegistry[ActionT: Action[Any, Any]]:
             Action instance or None if creation fails
         """
         try:
-            action_cls = self._actions[action_name]
-            instance = action_cls(action_name, f"Instance of {action_name}")
+            instance = self._instantiate(action_name)
             self._instances[action_name] = instance
             return instance
         except Exception as e:
             logger.exception(f"Failed to create action instance '{action_name}': {e}")
             return None
 
+    def _instantiate(self, action_name: str) -> ActionT:
+        """
+        Construct a new instance of a registered action.
+
+        Actions implementing only run are wrapped so execute calls run.
+        """
+        action_cls = self._executable_classes[action_name]
+        return action_cls(action_name, f"Instance of {action_name}")
+
+    def _coerce_inputs(self, action_name: str, inputs: Any) -> Any:
+        """Turn a dict of inputs, e.g. from YAML, into the action's input model."""
+        model = self._input_models.get(action_name)
+        if model is not None and isinstance(inputs, dict):
+            return model.model_validate(inputs)
+        return inputs
+
+    def set_concurrency_limit(self, action_name: str, limit: int) -> None:
+        """
+        Set how many executions of an action may run at once.
+
+        The limit is also the number of warm instances kept for the action.
+
+        Args:
+            action_name: Name of action
+            limit: Maximum concurrent executions
+        """
+        if limit < 1:
+            msg = f"Action concurrency limit must be at least 1, got {limit}"
+            raise ValueError(msg)
+        self._pool_sizes[action_name] = limit
+        if action_name in self._pools:
+            self._pools[action_name].resize(limit)
+
+    def _get_pool(self, action_name: str) -> ActionPool:
+        """Get or create the instance pool of an action."""
+        pool = self._pools.get(action_name)
+        if pool is None:
+            pool = ActionPool(
+                action_name,
+                lambda: self._instantiate(action_name),
+                self._pool_sizes.get(action_name, self.default_pool_size),
+            )
+            self._pools[action_name] = pool
+        return pool
+
+    async def execute_action(
+        self,
+        action_name: str,
+        inputs: Any,
+        context: dict[str, Any],
+        latency_metrics: Any | None = None,
+    ) -> Any:
+        """
+        Execute an action on a pooled, warm instance.
+
+        Waits while the action is at its concurrency limit. Dict inputs are
+        validated into the action's pydantic input model when it has one.
+
+        Args:
+            action_name: Name of action
+            inputs: Action inputs
+            context: Execution context
+            latency_metrics: Optional latency histograms receiving the
+                execution time, labelled with the action name and status
+
+        Returns:
+            Action execution result
+
+        Raises:
+            KeyError: If the action is not registered
+        """
+        if action_name not in self._actions:
+            msg = f"Action not found: {action_name}"
+            raise KeyError(msg)
+
+        inputs = self._coerce_inputs(action_name, inputs)
+        pool = self._get_pool(action_name)
+        async with pool.acquire() as action:
+            start = time.perf_counter()
+            success = False
+            try:
+                await action.validate_inputs(inputs)
+                result = await action.execute(inputs, context)
+                success = True
+            finally:
+                elapsed = time.perf_counter() - start
+                pool.record(elapsed, success)
+                if latency_metrics is not None:
+                    latency_metrics.record(
+                        ACTION_LATENCY_METRIC,
+                        elapsed,
+                        action=action_name,
+                        status="success" if success else "error",
+                    )
+        return result
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get per-action pool and timing statistics.
+
+        Returns:
+            Dictionary mapping action names to their pool statistics
+        """
+        return {name: pool.get_stats() for name, pool in self._pools.items()}
+
     def get_all_actions(self) -> list[str]:
         """
         Get list of all registered action names.
@@ -223,6 +396,9 @@ class ActionRegistry[ActionT: Action[Any, Any]]:
         return {
             "total_actions": len(self._actions),
             "instantiated_actions": len(self._instances),
+            "pooled_instances": sum(
+                pool.get_stats()["instances_created"] for pool in self._pools.values()
+            ),
             "github_actions": len(self.get_actions_by_platform("github")),
             "gitlab_actions": len(self.get_actions_by_platform("gitlab")),
         }
@@ -18,8 +18,13 @@ from codeflow_engine.actions.ai_linting_fixer.file_splitter import (
     SplitConfig,
 )
 from codeflow_engine.actions.ai_linting_fixer.performance_optimizer import (
+    IntelligentCache,
     ParallelProcessor,
 )
+from codeflow_engine.actions.ai_linting_fixer.persistent_cache import (
+    DEFAULT_CACHE_DIR,
+    PersistentCacheTier,
+)
 from codeflow_engine.actions.ai_comment_analyzer import (
     AICommentAnalyzer,
     AICommentAnalysisInputs,
@@ -146,12 +151,31 @@ def check(
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be split without creating files"
 )
+@click.option(
+    "--cache-dir",
+    default=DEFAULT_CACHE_DIR,
+    help="Directory of the persistent analysis cache",
+)
+@click.option("--no-cache", is_flag=True, help="Do not persist analysis results")
 def split(
-    file_path: str, max_lines: int, max_functions: int, output_dir: str, dry_run: bool
+    file_path: str,
+    max_lines: int,
+    max_functions: int,
+    output_dir: str,
+    dry_run: bool,
+    cache_dir: str,
+    no_cache: bool,
 ):
     """Split large files into smaller, manageable components"""
     asyncio.run(
-        _run_file_split(file_path, max_lines, max_functions, output_dir, dry_run)
+        _run_file_split(
+            file_path,
+            max_lines,
+            max_functions,
+            output_dir,
+            dry_run,
+            None if no_cache else cache_dir,
+        )
     )
 
 
@@ -214,6 +238,55 @@ async def _run_comment_analysis(comment_body: str, file_path: str, pr_diff: str)
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--db",
+    "db_path",
+    default="ai_linting_interactions.db",
+    type=click.Path(exists=True, dir_okay=False),
+    help="AI linting interaction database",
+)
+def rebuild_linting_stats(db_path: str):
+    """Rebuild AI linting statistics rollups from stored interactions."""
+    try:
+        from codeflow_engine.actions.ai_linting_fixer.database import AIInteractionDB
+
+        db = AIInteractionDB(db_path)
+        try:
+            db.rebuild_statistics()
+            total = db.get_statistics()["total_interactions"]
+        finally:
+            db.close()
+        click.echo(f"Rebuilt statistics for {total} interactions in {db_path}")
+    except Exception as e:
+        logger.exception(f"Failed to rebuild statistics: {e}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--db",
+    "db_path",
+    default="ai_linting_interactions.db",
+    type=click.Path(exists=True, dir_okay=False),
+    help="AI linting interaction database",
+)
+def migrate_linting_db(db_path: str):
+    """Move inline AI linting prompt bodies into the blob table (irreversible)."""
+    try:
+        from codeflow_engine.actions.ai_linting_fixer.database import AIInteractionDB
+
+        db = AIInteractionDB(db_path, migrate_legacy=True)
+        try:
+            total = db.get_statistics()["total_interactions"]
+        finally:
+            db.close()
+        click.echo(f"Migrated {total} interactions in {db_path}")
+    except Exception as e:
+        logger.exception(f"Failed to migrate database: {e}")
+        sys.exit(1)
+
+
 async def _run_quality_check(
     mode: str,
     files: tuple,
@@ -266,7 +339,12 @@ async def _run_quality_check(
 
 
 async def _run_file_split(
-    file_path: str, max_lines: int, max_functions: int, output_dir: str, dry_run: bool
+    file_path: str,
+    max_lines: int,
+    max_functions: int,
+    output_dir: str,
+    dry_run: bool,
+    cache_dir: str | None = None,
 ):
     """Run file splitting operation"""
     try:
@@ -274,8 +352,14 @@ async def _run_file_split(
         llm_manager = LLMProviderManager({})
         metrics_collector = MetricsCollector()
         parallel_processor = ParallelProcessor()
+        cache_manager = IntelligentCache(
+            max_size_mb=50,
+            persistent_tier=PersistentCacheTier(cache_dir) if cache_dir else None,
+        )
 
-        splitter = FileSplitter(llm_manager, metrics_collector, parallel_processor)
+        splitter = FileSplitter(
+            llm_manager, metrics_collector, parallel_processor, cache_manager
+        )
 
         # Read file content
         with open(file_path, encoding="utf-8") as f:
@@ -56,9 +56,15 @@ class CodeFlowConfig:
 
     # Engine configuration
     max_concurrent_workflows: int = 10
+    workflow_queue_depth: int = 100  # executions waiting for admission
+    workflow_concurrency_limits: dict[str, int] = field(default_factory=dict)
     workflow_timeout: int = 300  # seconds
     workflow_retry_attempts: int = 3
     workflow_retry_delay: int = 5  # seconds
+    concurrent_event_processing: bool = True
+    event_max_concurrency: int = 5  # workflows run at once per event
+    sanitization_cache_size: int = 256  # cached context verdicts, 0 disables
+    workflow_history_path: str | None = "codeflow_workflow_history.db"  # empty disables
     enable_debug_logging: bool = False
 
     # Database configuration
@@ -86,9 +92,14 @@ class CodeFlowConfig:
             "DATABASE_URL": "database_url",
             "REDIS_URL": "redis_url",
             "MAX_CONCURRENT_WORKFLOWS": "max_concurrent_workflows",
+            "WORKFLOW_QUEUE_DEPTH": "workflow_queue_depth",
             "WORKFLOW_TIMEOUT": "workflow_timeout",
             "WORKFLOW_RETRY_ATTEMPTS": "workflow_retry_attempts",
             "WORKFLOW_RETRY_DELAY": "workflow_retry_delay",
+            "CONCURRENT_EVENT_PROCESSING": "concurrent_event_processing",
+            "EVENT_MAX_CONCURRENCY": "event_max_concurrency",
+            "SANITIZATION_CACHE_SIZE": "sanitization_cache_size",
+            "WORKFLOW_HISTORY_PATH": "workflow_history_path",
             "ENABLE_DEBUG_LOGGING": "enable_debug_logging",
         }
 
@@ -98,13 +109,17 @@ class CodeFlowConfig:
                 # Handle type conversion
                 int_fields = {
                     "max_concurrent_workflows",
+                    "workflow_queue_depth",
                     "workflow_timeout",
                     "workflow_retry_attempts",
                     "workflow_retry_delay",
+                    "event_max_concurrency",
+                    "sanitization_cache_size",
                 }
+                bool_fields = {"enable_debug_logging", "concurrent_event_processing"}
                 if attr_name in int_fields:
                     setattr(self, attr_name, int(env_value))
-                elif attr_name == "enable_debug_logging":
+                elif attr_name in bool_fields:
                     setattr(
                         self, attr_name, env_value.lower() in {"true", "1", "yes", "on"}
                     )
@@ -15,6 +15,7 @@ from codeflow_engine.health import HealthChecker
 from codeflow_engine.integrations.registry import IntegrationRegistry
 from codeflow_engine.utils.error_handlers import handle_operation_error
 from codeflow_engine.workflows.engine import WorkflowEngine
+from codeflow_engine.workflows.history import history_store_from_config
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,9 @@ class CodeFlowEngine:
             log_handler: Optional logging handler to add to the root logger.
         """
         self.config = config or CodeFlowConfig()
-        self.workflow_engine = WorkflowEngine(self.config)
+        self.workflow_engine = WorkflowEngine(
+            self.config, history_store=history_store_from_config(self.config)
+        )
         self.action_registry: ActionRegistry = ActionRegistry()
         self.integration_registry = IntegrationRegistry()
         self.llm_manager = LLMProviderManager(self.config)
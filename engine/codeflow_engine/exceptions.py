@@ -168,6 +168,18 @@ class WorkflowError(CodeFlowException):
         self.workflow_name = workflow_name
 
 
+class WorkflowRejectedError(WorkflowError):
+    """Raised when a workflow execution is shed because the admission queue is full."""
+
+    def __init__(
+        self, message: str, workflow_name: str | None = None, queue_depth: int = 0
+    ):
+        super().__init__(message, workflow_name)
+        self.error_code = "WORKFLOW_REJECTED"
+        self._user_message = "The system is busy. Please try again later."
+        self.queue_depth = queue_depth
+
+
 class ActionError(CodeFlowException):
     """Raised when there's an issue with action execution."""
 
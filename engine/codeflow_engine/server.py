@@ -9,11 +9,12 @@ from pathlib import Path
 
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, PlainTextResponse, Response
 
 from codeflow_engine.config.settings import CodeFlowSettings
 from codeflow_engine.health.health_checker import HealthChecker
 from codeflow_engine.utils.logging import get_logger, setup_logging
+from codeflow_engine.workflows.latency import default_latency_metrics
 
 # Set up logging (will be configured properly in create_app)
 logger = get_logger(__name__)
@@ -205,6 +206,14 @@ def create_app(settings: CodeFlowSettings | None = None) -> FastAPI:
         result["version"] = __version__
         return result
 
+    @app.get("/metrics")
+    async def metrics():
+        """Workflow latency histograms in the Prometheus text exposition format."""
+        return PlainTextResponse(
+            default_latency_metrics.render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
+
     return app
 
 
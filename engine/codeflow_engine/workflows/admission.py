@@ -0,0 +1,177 @@
+"""
+Workflow Admission Control
+
+Bounds how many workflow executions run at once and queues the rest by priority.
+
+Executions are admitted immediately while both the global limit and the
+workflow's own limit have room. Otherwise they wait in a bounded priority queue
+(lower priority values run first, FIFO within a priority); when the queue is
+full, new executions are rejected instead of piling up.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+import itertools
+import time
+
+from codeflow_engine.exceptions import WorkflowRejectedError
+
+
+@dataclass(order=True)
+class _QueuedExecution:
+    """An execution waiting for admission."""
+
+    priority: int
+    sequence: int
+    workflow_name: str = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class AdmissionController:
+    """
+    Global and per-workflow concurrency limits with a bounded priority queue.
+
+    All state is mutated from the event loop thread, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue_depth: int,
+        workflow_limits: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Initialize the admission controller.
+
+        Args:
+            max_concurrent: Maximum executions running at once across all workflows
+            max_queue_depth: Maximum executions waiting for admission
+            workflow_limits: Optional per-workflow concurrency limits
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue_depth = max(0, max_queue_depth)
+        self.workflow_limits: dict[str, int] = dict(workflow_limits or {})
+
+        self._active = 0
+        self._active_per_workflow: dict[str, int] = {}
+        self._queue: list[_QueuedExecution] = []
+        self._sequence = itertools.count()
+
+    @property
+    def active(self) -> int:
+        """Number of admitted executions currently holding a slot."""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of executions waiting for admission."""
+        return len(self._queue)
+
+    def set_workflow_limit(self, workflow_name: str, limit: int | None) -> None:
+        """
+        Set or clear the concurrency limit of a single workflow.
+
+        Args:
+            workflow_name: Workflow to limit
+            limit: Maximum concurrent executions, or None to remove the limit
+        """
+        if limit is None:
+            self.workflow_limits.pop(workflow_name, None)
+        else:
+            self.workflow_limits[workflow_name] = max(1, limit)
+        self._dispatch()
+
+    def _has_capacity(self, workflow_name: str) -> bool:
+        """Check whether an execution of the workflow may start now."""
+        if self._active >= self.max_concurrent:
+            return False
+        limit = self.workflow_limits.get(workflow_name)
+        return limit is None or self._active_per_workflow.get(workflow_name, 0) < limit
+
+    def _admit(self, workflow_name: str) -> None:
+        """Take a global slot and a workflow slot."""
+        self._active += 1
+        self._active_per_workflow[workflow_name] = (
+            self._active_per_workflow.get(workflow_name, 0) + 1
+        )
+
+    async def acquire(self, workflow_name: str, priority: int = 0) -> float:
+        """
+        Wait until an execution of the workflow is admitted.
+
+        Args:
+            workflow_name: Workflow to execute
+            priority: Queue priority; lower values are admitted first
+
+        Returns:
+            Seconds spent waiting in the queue
+
+        Raises:
+            WorkflowRejectedError: If the queue is already full
+        """
+        if self._has_capacity(workflow_name):
+            self._admit(workflow_name)
+            return 0.0
+
+        if len(self._queue) >= self.max_queue_depth:
+            msg = f"Admission queue is full ({len(self._queue)} waiting)"
+            raise WorkflowRejectedError(msg, workflow_name, len(self._queue))
+
+        queued = _QueuedExecution(
+            priority,
+            next(self._sequence),
+            workflow_name,
+            asyncio.get_running_loop().create_future(),
+        )
+        self._queue.append(queued)
+        start = time.monotonic()
+
+        try:
+            await queued.future
+        except asyncio.CancelledError:
+            if queued.future.done() and not queued.future.cancelled():
+                # Admitted just before cancellation; hand the slot back
+                self.release(workflow_name)
+            elif queued in self._queue:
+                self._queue.remove(queued)
+            raise
+
+        return time.monotonic() - start
+
+    def release(self, workflow_name: str) -> None:
+        """
+        Release the slots held by an admitted execution and admit waiters.
+
+        Args:
+            workflow_name: Workflow whose execution finished
+        """
+        self._active = max(0, self._active - 1)
+        remaining = self._active_per_workflow.get(workflow_name, 0) - 1
+        if remaining > 0:
+            self._active_per_workflow[workflow_name] = remaining
+        else:
+            self._active_per_workflow.pop(workflow_name, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit queued executions in priority order while capacity allows."""
+        if not self._queue:
+            return
+
+        # Waiters blocked by their own workflow limit must not block the others
+        for queued in sorted(self._queue):
+            if self._active >= self.max_concurrent:
+                break
+            if queued.future.done():
+                # Cancelled while waiting; its acquire() cleans up the entry
+                continue
+            if not self._has_capacity(queued.workflow_name):
+                continue
+            self._queue.remove(queued)
+            self._admit(queued.workflow_name)
+            queued.future.set_result(None)
+
+
+__all__ = [
+    "AdmissionController",
+]
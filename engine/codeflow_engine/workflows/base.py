@@ -6,12 +6,45 @@ Base classes and interfaces for workflow implementation.
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections import deque
+from collections.abc import Callable
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
+
+from codeflow_engine.exceptions import WorkflowError
+from codeflow_engine.workflows.checkpoints import current_checkpointer
+from codeflow_engine.workflows.conditions import compile_condition
+from codeflow_engine.workflows.latency import current_latency_metrics
+
+
+if TYPE_CHECKING:
+    from codeflow_engine.actions.registry import ActionRegistry
 
 
 logger = logging.getLogger(__name__)
 
+# Latency histogram metric name for individual steps
+STEP_LATENCY_METRIC = "codeflow_workflow_step_seconds"
+
+# Trailing wildcard marking an event pattern as a prefix match ("pull_request.*", "*")
+EVENT_WILDCARD = "*"
+
+
+def event_pattern_prefix(pattern: str) -> str | None:
+    """
+    Get the prefix matched by a wildcard event pattern.
+
+    Args:
+        pattern: Supported event pattern
+
+    Returns:
+        Prefix for trailing-wildcard patterns, or None for exact event types
+    """
+    if pattern.endswith(EVENT_WILDCARD):
+        return pattern[: -len(EVENT_WILDCARD)]
+    return None
+
 
 class Workflow(ABC):
     """
@@ -21,6 +54,9 @@ class Workflow(ABC):
     or executed manually. Each workflow has inputs, outputs, and execution logic.
     """
 
+    # Callbacks notified when a supported event is added after registration
+    _event_listeners: tuple[Callable[["Workflow", str], None], ...] = ()
+
     def __init__(
         self, name: str, description: str = "", version: str = "1.0.0"
     ) -> None:
@@ -79,23 +115,55 @@ class Workflow(ABC):
         """
         Check if this workflow handles the given event type.
 
+        Supported events ending in ``*`` match any event type with that prefix.
+
         Args:
             event_type: Event type to check
 
         Returns:
             True if workflow handles this event type
         """
-        return event_type in self.supported_events
+        if event_type in self.supported_events:
+            return True
+        for pattern in self.supported_events:
+            prefix = event_pattern_prefix(pattern)
+            if prefix is not None and event_type.startswith(prefix):
+                return True
+        return False
 
     def add_supported_event(self, event_type: str) -> None:
         """
         Add a supported event type to this workflow.
 
         Args:
-            event_type: Event type to add
+            event_type: Event type or wildcard pattern to add
         """
         if event_type not in self.supported_events:
             self.supported_events.append(event_type)
+            for listener in self._event_listeners:
+                listener(self, event_type)
+
+    def add_event_listener(self, listener: Callable[["Workflow", str], None]) -> None:
+        """
+        Subscribe to supported events added to this workflow.
+
+        Args:
+            listener: Callback receiving the workflow and the added event type
+        """
+        self._event_listeners = (*self._event_listeners, listener)
+
+    def remove_event_listener(
+        self, listener: Callable[["Workflow", str], None]
+    ) -> None:
+        """
+        Unsubscribe a supported event listener.
+
+        Args:
+            listener: Callback previously passed to add_event_listener
+        """
+        self._event_listeners = tuple(
+            existing for existing in self._event_listeners if existing != listener
+        )
 
     def get_metadata(self) -> dict[str, Any]:
         """
@@ -124,15 +192,27 @@ class YAMLWorkflow(Workflow):
 
     This class provides a way to define workflows declaratively using YAML
     configuration files instead of writing Python code.
+
+    Steps run in order by default. When any step declares ``depends_on``, the
+    steps form a dependency graph instead: each step starts as soon as all of
+    its dependencies have completed and receives its own copy of the context,
+    merged from the outputs of its dependencies.
     """
 
-    def __init__(self, name: str, yaml_config: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        name: str,
+        yaml_config: dict[str, Any],
+        action_registry: "ActionRegistry[Any] | None" = None,
+    ) -> None:
         """
         Initialize YAML-based workflow.
 
         Args:
             name: Workflow name
             yaml_config: YAML configuration dictionary
+            action_registry: Registry running ``action`` steps; defaults to the
+                global action registry
         """
         description = yaml_config.get("description", "")
         version = yaml_config.get("version", "1.0.0")
@@ -142,6 +222,90 @@ class YAMLWorkflow(Workflow):
         self.config = yaml_config
         self.supported_events = yaml_config.get("triggers", {}).get("events", [])
         self.steps = yaml_config.get("steps", [])
+        self.action_registry = action_registry
+
+        # Dependency graph is built and validated once, at load time
+        self._step_dependencies: dict[str, tuple[str, ...]] = {}
+        self._step_dependents: dict[str, list[str]] = {}
+        self._step_order: list[str] = []
+        self._build_step_graph()
+        self._compile_conditions(self.steps)
+
+    @property
+    def uses_dependency_graph(self) -> bool:
+        """Whether steps are scheduled by ``depends_on`` instead of sequentially."""
+        return bool(self._step_order)
+
+    def _build_step_graph(self) -> None:
+        """
+        Build and validate the step dependency graph.
+
+        Raises:
+            WorkflowError: If step names are duplicated, a dependency is unknown,
+                or the dependencies form a cycle
+        """
+        if not any("depends_on" in step for step in self.steps):
+            return
+
+        dependencies: dict[str, tuple[str, ...]] = {}
+        for i, step in enumerate(self.steps):
+            step_name = step.get("name", f"step_{i}")
+            if step_name in dependencies:
+                msg = f"Duplicate step name '{step_name}'"
+                raise WorkflowError(msg, self.name)
+
+            depends_on = step.get("depends_on") or []
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
+            dependencies[step_name] = tuple(dict.fromkeys(depends_on))
+
+        dependents: dict[str, list[str]] = {name: [] for name in dependencies}
+        for step_name, depends_on in dependencies.items():
+            for dependency in depends_on:
+                if dependency not in dependencies:
+                    msg = f"Step '{step_name}' depends on unknown step '{dependency}'"
+                    raise WorkflowError(msg, self.name)
+                dependents[dependency].append(step_name)
+
+        # Kahn's algorithm; any step never reaching zero in-degree sits on a cycle
+        in_degree = {name: len(deps) for name, deps in dependencies.items()}
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        order: list[str] = []
+        while ready:
+            step_name = ready.popleft()
+            order.append(step_name)
+            for dependent in dependents[step_name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(dependencies):
+            cyclic = ", ".join(name for name, degree in in_degree.items() if degree)
+            msg = f"Step dependency cycle detected among: {cyclic}"
+            raise WorkflowError(msg, self.name)
+
+        self._step_dependencies = dependencies
+        self._step_dependents = dependents
+        self._step_order = order
+
+    def _compile_conditions(self, steps: list[dict[str, Any]]) -> None:
+        """
+        Compile string conditions of the given steps, including nested parallel steps.
+
+        Args:
+            steps: Step configurations to scan
+        """
+        for step in steps:
+            condition = step.get("condition")
+            if isinstance(condition, str):
+                compiled = compile_condition(condition)
+                if not compiled.is_valid:
+                    logger.warning(
+                        "Workflow %s: %s (evaluates to False)", self.name, compiled.error
+                    )
+            nested_steps = step.get("steps")
+            if isinstance(nested_steps, list):
+                self._compile_conditions(nested_steps)
 
     async def execute(self, context: dict[str, Any]) -> dict[str, Any]:
         """
@@ -153,6 +317,9 @@ class YAMLWorkflow(Workflow):
         Returns:
             Workflow execution result
         """
+        if self.uses_dependency_graph:
+            return await self._execute_step_graph(context)
+
         results = []
         workflow_context = context.copy()
 
@@ -165,15 +332,18 @@ class YAMLWorkflow(Workflow):
             logger.info("Executing step: %s (type: %s)", step_name, step_type)
 
             try:
-                step_result = await self._execute_step(step, workflow_context)
-                results.append(
-                    {
-                        "step": step_name,
-                        "type": step_type,
-                        "status": "success",
-                        "result": step_result,
-                    }
+                step_result, resumed = await self._execute_checkpointed_step(
+                    i, step_name, step, workflow_context
                 )
+                entry = {
+                    "step": step_name,
+                    "type": step_type,
+                    "status": "success",
+                    "result": step_result,
+                }
+                if resumed:
+                    entry["resumed"] = True
+                results.append(entry)
 
                 # Update context with step results
                 if isinstance(step_result, dict):
@@ -201,6 +371,199 @@ class YAMLWorkflow(Workflow):
             "final_context": workflow_context,
         }
 
+    async def _execute_step_graph(self, context: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute steps as a dependency graph, running each step once it is ready.
+
+        A failed step without ``continue_on_error`` skips everything downstream
+        of it; independent branches keep running.
+
+        Args:
+            context: Execution context
+
+        Returns:
+            Workflow execution result with steps reported in declaration order
+        """
+        logger.info("Executing YAML workflow as step graph: %s", self.name)
+
+        steps_by_name = {
+            step.get("name", f"step_{i}"): step for i, step in enumerate(self.steps)
+        }
+        step_indexes = {name: i for i, name in enumerate(steps_by_name)}
+        pending = {name: len(deps) for name, deps in self._step_dependencies.items()}
+        outputs: dict[str, dict[str, Any]] = {}
+        entries: dict[str, dict[str, Any]] = {}
+        running: dict[asyncio.Task, str] = {}
+
+        def start(step_name: str) -> None:
+            step_context = context.copy()
+            for dependency in self._step_dependencies[step_name]:
+                step_context.update(outputs[dependency])
+            task = asyncio.create_task(
+                self._execute_graph_step(
+                    step_indexes[step_name],
+                    step_name,
+                    steps_by_name[step_name],
+                    step_context,
+                )
+            )
+            running[task] = step_name
+
+        for step_name in self._step_order:
+            if pending[step_name] == 0:
+                start(step_name)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    step_name = running.pop(task)
+                    entry, output = task.result()
+                    entries[step_name] = entry
+                    if output is None:
+                        continue
+
+                    outputs[step_name] = output
+                    for dependent in self._step_dependents[step_name]:
+                        pending[dependent] -= 1
+                        if pending[dependent] == 0:
+                            start(dependent)
+        finally:
+            for task in running:
+                task.cancel()
+
+        results = []
+        for step_name, step in steps_by_name.items():
+            if step_name in entries:
+                results.append(entries[step_name])
+                continue
+            blocked_by = [
+                dependency
+                for dependency in self._step_dependencies[step_name]
+                if dependency not in outputs
+            ]
+            results.append(
+                {
+                    "step": step_name,
+                    "type": step.get("type", "unknown"),
+                    "status": "skipped",
+                    "error": f"Upstream step(s) did not complete: {', '.join(blocked_by)}",
+                }
+            )
+
+        final_context = context.copy()
+        for step_name in self._step_order:
+            if step_name in outputs:
+                final_context.update(outputs[step_name])
+
+        return {
+            "workflow": self.name,
+            "steps_executed": len(entries),
+            "steps": results,
+            "final_context": final_context,
+        }
+
+    async def _execute_graph_step(
+        self,
+        step_index: int,
+        step_name: str,
+        step: dict[str, Any],
+        step_context: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        """
+        Execute one step of the dependency graph against its isolated context.
+
+        Args:
+            step_index: Position of the step in the workflow definition
+            step_name: Step name
+            step: Step configuration
+            step_context: Context merged from the step's dependencies
+
+        Returns:
+            Tuple of the step result entry and the context handed to dependents,
+            or None for the context when dependents must be skipped
+        """
+        step_type = step.get("type", "unknown")
+        logger.info("Executing step: %s (type: %s)", step_name, step_type)
+
+        try:
+            step_result, resumed = await self._execute_checkpointed_step(
+                step_index, step_name, step, step_context
+            )
+        except Exception as err:
+            logger.exception("Step %s failed", step_name)
+            entry = {
+                "step": step_name,
+                "type": step_type,
+                "status": "error",
+                "error": str(err),
+            }
+            if step.get("continue_on_error", False):
+                return entry, step_context
+            return entry, None
+
+        if isinstance(step_result, dict):
+            step_context.update(step_result)
+
+        entry = {
+            "step": step_name,
+            "type": step_type,
+            "status": "success",
+            "result": step_result,
+        }
+        if resumed:
+            entry["resumed"] = True
+        return entry, step_context
+
+    async def _execute_checkpointed_step(
+        self,
+        step_index: int,
+        step_name: str,
+        step: dict[str, Any],
+        context: dict[str, Any],
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Execute a step unless an earlier attempt of this execution completed it.
+
+        Checkpoints are keyed by position and name, since sequential workflows
+        may repeat a step name or name a step like an unnamed one (``step_1``).
+
+        Args:
+            step_index: Position of the step in the workflow definition
+            step_name: Step name
+            step: Step configuration
+            context: Current workflow context
+
+        Returns:
+            Tuple of the step result and whether it was restored from a checkpoint
+        """
+        checkpoint_key = f"{step_index}:{step_name}"
+        checkpointer = current_checkpointer()
+        if checkpointer is not None:
+            checkpoint = await checkpointer.get(checkpoint_key)
+            if checkpoint is not None:
+                logger.info("Resuming step %s from checkpoint", step_name)
+                return checkpoint, True
+
+        start = time.perf_counter()
+        try:
+            step_result = await self._execute_step(step, context)
+        finally:
+            latency_metrics = current_latency_metrics()
+            if latency_metrics is not None:
+                latency_metrics.record(
+                    STEP_LATENCY_METRIC,
+                    time.perf_counter() - start,
+                    workflow=self.name,
+                    step=step_name,
+                )
+
+        if checkpointer is not None and isinstance(step_result, dict):
+            await checkpointer.save(checkpoint_key, step_result)
+        return step_result, False
+
     async def _execute_step(
         self, step: dict[str, Any], context: dict[str, Any]
     ) -> dict[str, Any]:
@@ -228,18 +591,35 @@ class YAMLWorkflow(Workflow):
         return {"message": f"Step type '{step_type}' not implemented yet"}
 
     async def _execute_action_step(
-        self, step: dict[str, Any], _context: dict[str, Any]
+        self, step: dict[str, Any], context: dict[str, Any]
     ) -> dict[str, Any]:
-        """Execute an action step."""
+        """
+        Execute an action step on a pooled instance from the action registry.
+
+        Raises:
+            WorkflowError: If the step names no action or an unknown one
+        """
         action_name = step.get("action")
         action_inputs = step.get("inputs", {})
 
-        # TODO: Integrate with action registry to execute actual actions
-        return {
-            "action": action_name,
-            "inputs": action_inputs,
-            "message": f"Action '{action_name}' executed (placeholder)",
-        }
+        registry = self.action_registry
+        if registry is None:
+            from codeflow_engine.actions.registry import registry
+
+        if not action_name or registry.get(action_name) is None:
+            msg = f"Unknown action '{action_name}' in step '{step.get('name')}'"
+            raise WorkflowError(msg, self.name)
+
+        output = await registry.execute_action(
+            action_name,
+            action_inputs,
+            context,
+            latency_metrics=current_latency_metrics(),
+        )
+        if hasattr(output, "model_dump"):
+            output = output.model_dump()
+
+        return {"action": action_name, "output": output}
 
     async def _execute_condition_step(
         self, step: dict[str, Any], context: dict[str, Any]
@@ -281,16 +661,10 @@ class YAMLWorkflow(Workflow):
     def _evaluate_string_condition(
         self, condition: str, context: dict[str, Any]
     ) -> bool:
-        """Evaluate a string-based condition."""
-        # Simple variable substitution and evaluation
-        for key, value in context.items():
-            condition = condition.replace(f"{{{key}}}", repr(value))
-
-        # Safe evaluation of basic boolean expressions
+        """Evaluate a string-based condition with ``{key}`` context placeholders."""
+        # Compiled once per expression text; only referenced keys are looked up
         try:
-            # Only allow specific safe operations
-            allowed_names = {"True": True, "False": False, "None": None}
-            return bool(eval(condition, {"__builtins__": {}}, allowed_names))
+            return compile_condition(condition).evaluate(context)
         except Exception:
             return False
 
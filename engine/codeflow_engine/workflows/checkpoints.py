@@ -0,0 +1,220 @@
+"""
+Workflow Step Checkpointing
+
+Stores successful step results keyed by execution id and step position and name,
+so that a retried workflow execution resumes from the step that failed instead
+of re-running expensive steps (LLM analysis, tool runs) that already succeeded.
+
+The workflow engine binds a StepCheckpointer for each execution attempt; workflow
+implementations look it up with current_checkpointer().
+"""
+
+from abc import ABC, abstractmethod
+import asyncio
+from contextvars import ContextVar
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+
+class CheckpointStore(ABC):
+    """Storage backend for step checkpoints."""
+
+    @abstractmethod
+    async def load(self, execution_id: str) -> dict[str, dict[str, Any]]:
+        """
+        Load all step checkpoints of an execution.
+
+        Args:
+            execution_id: Workflow execution identifier
+
+        Returns:
+            Mapping of step name to the step's result
+        """
+
+    @abstractmethod
+    async def save(
+        self, execution_id: str, step_name: str, result: dict[str, Any]
+    ) -> None:
+        """
+        Save the result of a successful step.
+
+        Args:
+            execution_id: Workflow execution identifier
+            step_name: Name of the completed step
+            result: Step result
+        """
+
+    @abstractmethod
+    async def clear(self, execution_id: str) -> None:
+        """
+        Delete all checkpoints of an execution.
+
+        Args:
+            execution_id: Workflow execution identifier
+        """
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """Process-local checkpoint store; checkpoints survive retries, not restarts."""
+
+    def __init__(self) -> None:
+        self._checkpoints: dict[str, dict[str, dict[str, Any]]] = {}
+
+    async def load(self, execution_id: str) -> dict[str, dict[str, Any]]:
+        return dict(self._checkpoints.get(execution_id, {}))
+
+    async def save(
+        self, execution_id: str, step_name: str, result: dict[str, Any]
+    ) -> None:
+        self._checkpoints.setdefault(execution_id, {})[step_name] = result
+
+    async def clear(self, execution_id: str) -> None:
+        self._checkpoints.pop(execution_id, None)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    SQLite-backed checkpoint store.
+
+    Checkpoints survive process restarts, so re-running an execution with the
+    same workflow id after a crash resumes from its last completed step.
+    Results are stored as JSON; values that are not JSON-serializable are
+    stored as strings.
+    """
+
+    def __init__(self, db_path: str | Path = "codeflow_checkpoints.db") -> None:
+        self.db_path = str(db_path)
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Create the checkpoint table if needed."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS step_checkpoints (
+                    execution_id TEXT NOT NULL,
+                    step_name TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (execution_id, step_name)
+                )
+            """
+            )
+
+    def _load(self, execution_id: str) -> dict[str, dict[str, Any]]:
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT step_name, result FROM step_checkpoints WHERE execution_id = ?",
+                (execution_id,),
+            ).fetchall()
+        return {step_name: json.loads(result) for step_name, result in rows}
+
+    def _save(self, execution_id: str, step_name: str, result: dict[str, Any]) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO step_checkpoints
+                    (execution_id, step_name, result, created_at)
+                VALUES (?, ?, ?, ?)
+            """,
+                (
+                    execution_id,
+                    step_name,
+                    json.dumps(result, default=str),
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+
+    def _clear(self, execution_id: str) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "DELETE FROM step_checkpoints WHERE execution_id = ?", (execution_id,)
+            )
+
+    async def load(self, execution_id: str) -> dict[str, dict[str, Any]]:
+        return await asyncio.to_thread(self._load, execution_id)
+
+    async def save(
+        self, execution_id: str, step_name: str, result: dict[str, Any]
+    ) -> None:
+        await asyncio.to_thread(self._save, execution_id, step_name, result)
+
+    async def clear(self, execution_id: str) -> None:
+        await asyncio.to_thread(self._clear, execution_id)
+
+
+class StepCheckpointer:
+    """Checkpoint access for one workflow execution."""
+
+    def __init__(self, store: CheckpointStore, execution_id: str) -> None:
+        """
+        Initialize the checkpointer.
+
+        Args:
+            store: Checkpoint storage backend
+            execution_id: Workflow execution identifier
+        """
+        self.store = store
+        self.execution_id = execution_id
+        self._loaded: dict[str, dict[str, Any]] | None = None
+
+    async def get(self, step_name: str) -> dict[str, Any] | None:
+        """
+        Get the checkpointed result of a step.
+
+        Checkpoints are loaded from the store once per attempt.
+
+        Args:
+            step_name: Step name
+
+        Returns:
+            The step result saved by an earlier attempt, or None
+        """
+        if self._loaded is None:
+            self._loaded = await self.store.load(self.execution_id)
+        return self._loaded.get(step_name)
+
+    async def save(self, step_name: str, result: dict[str, Any]) -> None:
+        """
+        Checkpoint the result of a successful step.
+
+        Args:
+            step_name: Step name
+            result: Step result
+        """
+        if self._loaded is not None:
+            self._loaded[step_name] = result
+        await self.store.save(self.execution_id, step_name, result)
+
+
+_current_checkpointer: ContextVar[StepCheckpointer | None] = ContextVar(
+    "codeflow_step_checkpointer", default=None
+)
+
+
+def current_checkpointer() -> StepCheckpointer | None:
+    """Get the checkpointer bound to the running workflow execution, if any."""
+    return _current_checkpointer.get()
+
+
+def bind_checkpointer(checkpointer: StepCheckpointer | None) -> None:
+    """
+    Bind a checkpointer to the current task's context.
+
+    Args:
+        checkpointer: Checkpointer for the running execution, or None
+    """
+    _current_checkpointer.set(checkpointer)
+
+
+__all__ = [
+    "CheckpointStore",
+    "InMemoryCheckpointStore",
+    "SQLiteCheckpointStore",
+    "StepCheckpointer",
+    "bind_checkpointer",
+    "current_checkpointer",
+]
@@ -0,0 +1,167 @@
+"""
+Workflow Condition Compilation
+
+Compiles string conditions used by YAML workflow steps into restricted,
+cached expressions that are evaluated directly against context lookups.
+
+Conditions reference context values with ``{key}`` placeholders, for example
+``"{score} > 0.5 and {status} == 'open'"``. Each expression is parsed and
+validated once; evaluation only resolves the placeholders it references, so its
+cost does not depend on the size of the context.
+"""
+
+import ast
+from functools import lru_cache
+import re
+from typing import Any
+
+
+# Context placeholders: {key}, where key is a context dictionary key
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][\w.-]*)\}")
+
+# Maximum number of distinct condition expressions kept compiled
+CONDITION_CACHE_SIZE = 1024
+
+# AST nodes permitted in a condition; anything else (calls, attributes,
+# comprehensions, lambdas) is rejected at compile time
+ALLOWED_NODES: tuple[type[ast.AST], ...] = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.Is,
+    ast.IsNot,
+    ast.IfExp,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.List,
+    ast.Tuple,
+    ast.Set,
+    ast.Dict,
+    ast.Subscript,
+)
+
+
+class CompiledCondition:
+    """
+    A condition expression parsed and validated once for repeated evaluation.
+
+    Invalid expressions compile successfully into a condition that fails on
+    evaluation, so callers keep a single error path.
+    """
+
+    def __init__(self, expression: str) -> None:
+        """
+        Compile a condition expression.
+
+        Args:
+            expression: Condition text with ``{key}`` context placeholders
+        """
+        self.expression = expression
+        self.error: str | None = None
+        self._code: Any = None
+        # Synthetic identifier -> context key referenced by the placeholder
+        self._placeholders: dict[str, str] = {}
+
+        try:
+            self._code = self._compile(expression)
+        except (SyntaxError, ValueError) as e:
+            self.error = f"Invalid condition '{expression}': {e}"
+
+    def _compile(self, expression: str) -> Any:
+        """Rewrite placeholders to identifiers, validate the AST and compile it."""
+        identifiers: dict[str, str] = {}
+
+        def to_identifier(match: re.Match[str]) -> str:
+            key = match.group(1)
+            if key not in identifiers:
+                identifiers[key] = f"__ctx_{len(identifiers)}"
+            return identifiers[key]
+
+        source = PLACEHOLDER_PATTERN.sub(to_identifier, expression)
+        tree = ast.parse(source.strip(), mode="eval")
+
+        for node in ast.walk(tree):
+            if not isinstance(node, ALLOWED_NODES):
+                msg = f"unsupported syntax: {type(node).__name__}"
+                raise ValueError(msg)
+            if isinstance(node, ast.Name) and node.id not in identifiers.values():
+                msg = f"unknown name '{node.id}' (use {{{node.id}}} for context values)"
+                raise ValueError(msg)
+
+        self._placeholders = {ident: key for key, ident in identifiers.items()}
+        return compile(tree, "<condition>", "eval")
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the expression compiled successfully."""
+        return self._code is not None
+
+    @property
+    def referenced_keys(self) -> list[str]:
+        """Context keys referenced by the expression."""
+        return list(self._placeholders.values())
+
+    def evaluate(self, context: dict[str, Any]) -> bool:
+        """
+        Evaluate the condition against a context.
+
+        Args:
+            context: Workflow context providing placeholder values
+
+        Returns:
+            Truth value of the expression
+
+        Raises:
+            ValueError: If the expression is invalid
+            KeyError: If a referenced context key is missing
+        """
+        if self._code is None:
+            raise ValueError(self.error)
+
+        namespace = {ident: context[key] for ident, key in self._placeholders.items()}
+        return bool(eval(self._code, {"__builtins__": {}}, namespace))
+
+    def __repr__(self) -> str:
+        return f"CompiledCondition({self.expression!r})"
+
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def compile_condition(expression: str) -> CompiledCondition:
+    """
+    Get the compiled form of a condition expression, cached by expression text.
+
+    Args:
+        expression: Condition text with ``{key}`` context placeholders
+
+    Returns:
+        Compiled condition shared by every step using the same expression
+    """
+    return CompiledCondition(expression)
+
+
+__all__ = [
+    "CompiledCondition",
+    "compile_condition",
+]
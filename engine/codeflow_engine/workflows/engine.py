@@ -5,16 +5,31 @@ Orchestrates workflow execution and manages workflow lifecycle.
 """
 
 import asyncio
-from datetime import datetime
+from collections import deque
+from datetime import UTC, datetime
 import logging
 import time
 from typing import Any
 
 from codeflow_engine.config import CodeFlowConfig
-from codeflow_engine.exceptions import WorkflowError
+from codeflow_engine.exceptions import WorkflowError, WorkflowRejectedError
 from codeflow_engine.utils.error_handlers import handle_workflow_error
-from codeflow_engine.workflows.base import Workflow
+from codeflow_engine.workflows.admission import AdmissionController
+from codeflow_engine.workflows.base import Workflow, event_pattern_prefix
+from codeflow_engine.workflows.checkpoints import (
+    CheckpointStore,
+    InMemoryCheckpointStore,
+    StepCheckpointer,
+    bind_checkpointer,
+)
+from codeflow_engine.workflows.history import HistoryStore, as_utc
+from codeflow_engine.workflows.latency import (
+    LatencyMetrics,
+    bind_latency_metrics,
+    default_latency_metrics,
+)
 from codeflow_engine.workflows.validation import (
+    SanitizationCache,
     validate_workflow_context,
     sanitize_workflow_parameters,
 )
@@ -25,6 +40,10 @@ logger = logging.getLogger(__name__)
 # Configuration constants
 MAX_WORKFLOW_HISTORY = 1000  # Maximum number of workflow executions to keep in history
 
+# Latency histogram metric names
+QUEUE_WAIT_METRIC = "codeflow_workflow_queue_wait_seconds"
+EXECUTION_METRIC = "codeflow_workflow_execution_seconds"
+
 
 class WorkflowEngine:
     """
@@ -33,19 +52,52 @@ class WorkflowEngine:
     Handles workflow scheduling, execution, monitoring, and lifecycle management.
     """
 
-    def __init__(self, config: CodeFlowConfig) -> None:
+    def __init__(
+        self,
+        config: CodeFlowConfig,
+        checkpoint_store: CheckpointStore | None = None,
+        latency_metrics: LatencyMetrics | None = None,
+        history_store: HistoryStore | None = None,
+    ) -> None:
         """
         Initialize the workflow engine.
 
         Args:
             config: CodeFlow configuration object
+            checkpoint_store: Step checkpoint storage used to resume retried
+                executions; defaults to an in-memory store
+            latency_metrics: Latency histograms for queue wait, execution and
+                step times; defaults to the process-wide metrics
+            history_store: Append-only execution history store; the in-memory
+                ring buffer only keeps the most recent executions
         """
         self.config = config
+        self.checkpoint_store = checkpoint_store or InMemoryCheckpointStore()
+        self.latency_metrics = latency_metrics or default_latency_metrics
+        self.history_store = history_store
         self.workflows: dict[str, Workflow] = {}
+        # Event dispatch index: exact event type / wildcard prefix -> workflow names
+        self._event_index: dict[str, list[str]] = {}
+        self._event_prefix_index: dict[str, list[str]] = {}
+        self._registration_order: dict[str, int] = {}
+        self._registration_counter = 0
         self.running_workflows: dict[str, asyncio.Task] = {}
-        self.workflow_history: list[dict[str, Any]] = []
+        # Recent executions, newest last; older ones only live in the history store
+        self.workflow_history: deque[dict[str, Any]] = deque(maxlen=MAX_WORKFLOW_HISTORY)
+        self._history_sequence = 0
         self._is_running = False
 
+        # Admission control: global/per-workflow limits and a bounded priority queue
+        self.admission = AdmissionController(
+            max_concurrent=getattr(config, "max_concurrent_workflows", 10),
+            max_queue_depth=getattr(config, "workflow_queue_depth", 100),
+            workflow_limits=getattr(config, "workflow_concurrency_limits", {}),
+        )
+
+        # Sanitization verdicts of recently seen contexts, keyed by content hash
+        cache_size = getattr(config, "sanitization_cache_size", 256)
+        self.sanitization_cache = SanitizationCache(cache_size) if cache_size > 0 else None
+
         # Metrics tracking with thread-safety
         self.metrics = {
             "total_executions": 0,
@@ -54,6 +106,11 @@ class WorkflowEngine:
             "timeout_executions": 0,
             "total_execution_time": 0.0,
             "average_execution_time": 0.0,
+            "admitted_executions": 0,
+            "rejected_executions": 0,
+            "total_queue_wait_time": 0.0,
+            "average_queue_wait_time": 0.0,
+            "max_queue_wait_time": 0.0,
         }
         self._metrics_lock = asyncio.Lock()
 
@@ -84,10 +141,22 @@ class WorkflowEngine:
         """
         Register a workflow with the engine.
 
+        Registering a workflow under an existing name replaces the previous one.
+
         Args:
             workflow: Workflow instance to register
         """
+        if workflow.name in self.workflows:
+            self._deindex_workflow(self.workflows[workflow.name])
+
         self.workflows[workflow.name] = workflow
+        self._registration_order[workflow.name] = self._registration_counter
+        self._registration_counter += 1
+
+        for event_type in getattr(workflow, "supported_events", []):
+            self._index_event(workflow.name, event_type)
+        workflow.add_event_listener(self._on_supported_event_added)
+
         logger.info(f"Registered workflow: {workflow.name}")
 
     def unregister_workflow(self, workflow_name: str) -> None:
@@ -98,27 +167,94 @@ class WorkflowEngine:
             workflow_name: Name of workflow to unregister
         """
         if workflow_name in self.workflows:
+            self._deindex_workflow(self.workflows[workflow_name])
             del self.workflows[workflow_name]
             logger.info(f"Unregistered workflow: {workflow_name}")
 
+    def _index_event(self, workflow_name: str, event_type: str) -> None:
+        """Add a workflow to the dispatch index for an event type or pattern."""
+        prefix = event_pattern_prefix(event_type)
+        if prefix is None:
+            index, key = self._event_index, event_type
+        else:
+            index, key = self._event_prefix_index, prefix
+
+        names = index.setdefault(key, [])
+        if workflow_name not in names:
+            names.append(workflow_name)
+
+    def _deindex_workflow(self, workflow: Workflow) -> None:
+        """Remove a workflow from the dispatch index and stop listening to it."""
+        workflow.remove_event_listener(self._on_supported_event_added)
+        self._registration_order.pop(workflow.name, None)
+
+        for index in (self._event_index, self._event_prefix_index):
+            for key in [k for k, names in index.items() if workflow.name in names]:
+                index[key].remove(workflow.name)
+                if not index[key]:
+                    del index[key]
+
+    def _on_supported_event_added(self, workflow: Workflow, event_type: str) -> None:
+        """Keep the dispatch index current when a registered workflow gains an event."""
+        if self.workflows.get(workflow.name) is workflow:
+            self._index_event(workflow.name, event_type)
+
+    def get_workflows_for_event(self, event_type: str) -> list[str]:
+        """
+        Get the names of registered workflows that handle an event type.
+
+        Lookup cost depends on the number of matches and the length of the
+        event type, not on the number of registered workflows.
+
+        Args:
+            event_type: Event type to dispatch
+
+        Returns:
+            Matching workflow names in registration order
+        """
+        matched = set(self._event_index.get(event_type, ()))
+        if self._event_prefix_index:
+            for end in range(len(event_type) + 1):
+                matched.update(self._event_prefix_index.get(event_type[:end], ()))
+
+        return sorted(matched, key=self._registration_order.__getitem__)
+
+    def set_workflow_concurrency_limit(
+        self, workflow_name: str, limit: int | None
+    ) -> None:
+        """
+        Set or clear the concurrency limit of a single workflow.
+
+        Args:
+            workflow_name: Workflow to limit
+            limit: Maximum concurrent executions, or None to remove the limit
+        """
+        self.admission.set_workflow_limit(workflow_name, limit)
+
     async def execute_workflow(
         self,
         workflow_name: str,
         context: dict[str, Any],
         workflow_id: str | None = None,
+        priority: int = 0,
     ) -> dict[str, Any]:
         """
         Execute a workflow by name with retry logic and input validation.
 
+        Executions beyond the global or per-workflow concurrency limit wait in
+        the admission queue; lower priority values are admitted first.
+
         Args:
             workflow_name: Name of workflow to execute
             context: Execution context data (will be validated)
             workflow_id: Optional workflow execution ID
+            priority: Admission queue priority
 
         Returns:
             Workflow execution result
 
         Raises:
+            WorkflowRejectedError: If the admission queue is full
             WorkflowError: If workflow execution fails or validation fails
         """
         if not self._is_running:
@@ -131,13 +267,14 @@ class WorkflowEngine:
 
         # Validate and sanitize workflow context to prevent injection attacks
         # TODO: PRODUCTION - Add workflow-specific validation rules
-        # TODO: PRODUCTION - Implement validation result caching for performance
         try:
             # Validate workflow context
             validated_context = validate_workflow_context(context)
 
             # Sanitize parameters for security
-            validated_context = sanitize_workflow_parameters(validated_context)
+            validated_context = sanitize_workflow_parameters(
+                validated_context, cache=self.sanitization_cache
+            )
         except ValueError as e:
             msg = f"Workflow context validation failed: {e}"
             raise WorkflowError(msg, workflow_name) from e
@@ -145,6 +282,60 @@ class WorkflowEngine:
         workflow = self.workflows[workflow_name]
         execution_id = workflow_id or f"{workflow_name}_{datetime.now().isoformat()}"
 
+        try:
+            queue_wait = await self.admission.acquire(workflow_name, priority)
+        except WorkflowRejectedError:
+            logger.warning(
+                "Rejected workflow execution %s: admission queue full", execution_id
+            )
+            await self._update_admission_metrics(rejected=True)
+            raise
+
+        await self._update_admission_metrics(queue_wait=queue_wait)
+        self.latency_metrics.record(QUEUE_WAIT_METRIC, queue_wait, workflow=workflow_name)
+
+        try:
+            result = await self._execute_with_retries(
+                workflow, workflow_name, validated_context, execution_id
+            )
+        except WorkflowError:
+            await self._clear_checkpoints(execution_id)
+            raise
+        finally:
+            self.admission.release(workflow_name)
+
+        await self._clear_checkpoints(execution_id)
+        return result
+
+    async def _clear_checkpoints(self, execution_id: str) -> None:
+        """Drop step checkpoints once an execution has finished for good."""
+        try:
+            await self.checkpoint_store.clear(execution_id)
+        except Exception:
+            logger.exception("Failed to clear checkpoints for %s", execution_id)
+
+    async def _execute_with_retries(
+        self,
+        workflow: Workflow,
+        workflow_name: str,
+        validated_context: dict[str, Any],
+        execution_id: str,
+    ) -> dict[str, Any]:
+        """
+        Run an admitted workflow execution with retry logic and exponential backoff.
+
+        Args:
+            workflow: Workflow instance to execute
+            workflow_name: Name of workflow to execute
+            validated_context: Validated and sanitized execution context
+            execution_id: Unique execution identifier
+
+        Returns:
+            Workflow execution result
+
+        Raises:
+            WorkflowError: If every attempt fails or times out
+        """
         # Retry logic with exponential backoff
         max_attempts = getattr(self.config, "workflow_retry_attempts", 3)
         base_delay = getattr(self.config, "workflow_retry_delay", 5)
@@ -187,10 +378,10 @@ class WorkflowEngine:
 
                 # Update metrics
                 execution_time = time.time() - start_time
-                await self._update_metrics("success", execution_time)
+                await self._update_metrics("success", execution_time, workflow_name)
 
                 # Record successful execution
-                self._record_execution(execution_id, workflow_name, "completed", result)
+                await self._record_execution(execution_id, workflow_name, "completed", result)
 
                 logger.info(f"Workflow execution completed: {execution_id}")
                 return result
@@ -205,9 +396,9 @@ class WorkflowEngine:
                     logger.exception("Workflow execution timed out: %s", execution_id)
 
                     # Update metrics
-                    await self._update_metrics("timeout", execution_time)
+                    await self._update_metrics("timeout", execution_time, workflow_name)
 
-                    self._record_execution(
+                    await self._record_execution(
                         execution_id, workflow_name, "timeout", {"error": error_msg}
                     )
                     raise WorkflowError(error_msg, workflow_name)
@@ -230,9 +421,9 @@ class WorkflowEngine:
                     )
 
                     # Update metrics
-                    await self._update_metrics("failed", execution_time)
+                    await self._update_metrics("failed", execution_time, workflow_name)
 
-                    self._record_execution(
+                    await self._record_execution(
                         execution_id, workflow_name, "failed", {"error": str(e)}
                     )
                     raise WorkflowError(error_msg, workflow_name)
@@ -261,6 +452,9 @@ class WorkflowEngine:
         """
         Internal method to execute workflow task.
 
+        Binds a step checkpointer for the execution so that steps completed by
+        an earlier attempt are restored instead of re-run.
+
         Args:
             workflow: Workflow instance to execute
             context: Execution context
@@ -269,6 +463,10 @@ class WorkflowEngine:
         Returns:
             Workflow execution result
         """
+        # Runs inside its own task, so the bindings do not leak to the caller
+        bind_checkpointer(StepCheckpointer(self.checkpoint_store, execution_id))
+        bind_latency_metrics(self.latency_metrics)
+
         try:
             # Validate workflow inputs
             await workflow.validate_inputs(context)
@@ -286,77 +484,126 @@ class WorkflowEngine:
             raise
 
     async def process_event(
-        self, event_type: str, event_data: dict[str, Any]
+        self,
+        event_type: str,
+        event_data: dict[str, Any],
+        concurrent: bool | None = None,
+        max_concurrency: int | None = None,
     ) -> dict[str, Any]:
         """
         Process an event and trigger appropriate workflows.
 
+        Matching workflows are fanned out concurrently by default. A failing
+        workflow is reported in its own result entry and never cancels the others.
+
         Args:
             event_type: Type of event
             event_data: Event payload
+            concurrent: Run matching workflows concurrently; defaults to
+                ``config.concurrent_event_processing``
+            max_concurrency: Maximum workflows running at once for this event;
+                defaults to ``config.event_max_concurrency``
 
         Returns:
             Processing result
         """
-        results = []
-
         # Find workflows that handle this event type
-        for workflow_name, workflow in self.workflows.items():
-            if workflow.handles_event(event_type):
-                try:
-                    result = await self.execute_workflow(
-                        workflow_name,
-                        {"event_type": event_type, "event_data": event_data},
-                    )
-                    results.append(
-                        {
-                            "workflow": workflow_name,
-                            "status": "success",
-                            "result": result,
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(
-                        "Failed to execute workflow %s for event %s: %s",
-                        workflow_name,
-                        event_type,
-                        e,
-                    )
-                    results.append(
-                        {"workflow": workflow_name, "status": "error", "error": str(e)}
+        matching_workflows = self.get_workflows_for_event(event_type)
+
+        if concurrent is None:
+            concurrent = getattr(self.config, "concurrent_event_processing", True)
+
+        if concurrent and len(matching_workflows) > 1:
+            if max_concurrency is None:
+                max_concurrency = getattr(self.config, "event_max_concurrency", 5)
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+            async def run_limited(workflow_name: str) -> dict[str, Any]:
+                async with semaphore:
+                    return await self._execute_event_workflow(
+                        workflow_name, event_type, event_data
                     )
 
+            # Each entry handles its own errors, so gather never short-circuits
+            results = list(
+                await asyncio.gather(
+                    *(run_limited(name) for name in matching_workflows)
+                )
+            )
+        else:
+            results = [
+                await self._execute_event_workflow(name, event_type, event_data)
+                for name in matching_workflows
+            ]
+
         return {
             "event_type": event_type,
             "processed_workflows": len(results),
             "results": results,
         }
 
-    def _record_execution(
+    async def _execute_event_workflow(
+        self, workflow_name: str, event_type: str, event_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Execute a single event-triggered workflow and capture its outcome.
+
+        Args:
+            workflow_name: Name of workflow to execute
+            event_type: Type of event that triggered the workflow
+            event_data: Event payload
+
+        Returns:
+            Per-workflow result entry with ``success`` or ``error`` status
+        """
+        try:
+            result = await self.execute_workflow(
+                workflow_name,
+                {"event_type": event_type, "event_data": event_data},
+            )
+        except Exception as e:
+            logger.exception(
+                "Failed to execute workflow %s for event %s: %s",
+                workflow_name,
+                event_type,
+                e,
+            )
+            return {"workflow": workflow_name, "status": "error", "error": str(e)}
+
+        return {"workflow": workflow_name, "status": "success", "result": result}
+
+    async def _record_execution(
         self, execution_id: str, workflow_name: str, status: str, result: dict[str, Any]
     ) -> None:
         """
         Record workflow execution in history.
 
-        TODO: CONCURRENCY - Consider making this async for consistency
-        TODO: PERFORMANCE - History limit already enforced (Good!)
-        """
-        # Note: This is called from async context, providing some thread safety
-        self.workflow_history.append(
-            {
-                "execution_id": execution_id,
-                "workflow_name": workflow_name,
-                "status": status,
-                "timestamp": datetime.now().isoformat(),
-                "result": result,
-            }
-        )
+        The record goes to the bounded in-memory ring buffer and, when a history
+        store is configured, is appended to the store. A store failure is logged
+        and never fails the execution.
+        """
+        record: dict[str, Any] = {
+            "execution_id": execution_id,
+            "workflow_name": workflow_name,
+            "status": status,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "result": result,
+        }
+
+        sequence = None
+        if self.history_store is not None:
+            try:
+                sequence = await self.history_store.append(record)
+            except Exception:
+                logger.exception("Failed to persist history of execution %s", execution_id)
 
-        # Keep only last MAX_WORKFLOW_HISTORY executions
-        if len(self.workflow_history) > MAX_WORKFLOW_HISTORY:
-            self.workflow_history = self.workflow_history[-MAX_WORKFLOW_HISTORY:]
+        self._history_sequence = max(self._history_sequence + 1, sequence or 0)
+        record["sequence"] = self._history_sequence
+        self.workflow_history.append(record)
 
-    async def _update_metrics(self, status: str, execution_time: float) -> None:
+    async def _update_metrics(
+        self, status: str, execution_time: float, workflow_name: str | None = None
+    ) -> None:
         """
         Update workflow execution metrics with thread-safety.
 
@@ -365,7 +612,13 @@ class WorkflowEngine:
         Args:
             status: Execution status (success, failed, timeout)
             execution_time: Time taken for execution in seconds
+            workflow_name: Workflow whose latency histogram receives the sample
         """
+        if workflow_name is not None:
+            self.latency_metrics.record(
+                EXECUTION_METRIC, execution_time, workflow=workflow_name, status=status
+            )
+
         async with self._metrics_lock:
             self.metrics["total_executions"] += 1
             self.metrics["total_execution_time"] += execution_time
@@ -384,6 +637,31 @@ class WorkflowEngine:
                     / self.metrics["total_executions"]
                 )
 
+    async def _update_admission_metrics(
+        self, queue_wait: float = 0.0, rejected: bool = False
+    ) -> None:
+        """
+        Update admission metrics with thread-safety.
+
+        Args:
+            queue_wait: Seconds an admitted execution waited in the queue
+            rejected: Whether the execution was shed because the queue was full
+        """
+        async with self._metrics_lock:
+            if rejected:
+                self.metrics["rejected_executions"] += 1
+                return
+
+            self.metrics["admitted_executions"] += 1
+            self.metrics["total_queue_wait_time"] += queue_wait
+            self.metrics["max_queue_wait_time"] = max(
+                self.metrics["max_queue_wait_time"], queue_wait
+            )
+            self.metrics["average_queue_wait_time"] = (
+                self.metrics["total_queue_wait_time"]
+                / self.metrics["admitted_executions"]
+            )
+
     async def get_status(self) -> dict[str, Any]:
         """
         Get workflow engine status with thread-safe metrics access.
@@ -399,6 +677,7 @@ class WorkflowEngine:
             "running": self._is_running,
             "registered_workflows": len(self.workflows),
             "running_workflows": len(self.running_workflows),
+            "queued_workflows": self.admission.queue_depth,
             "total_executions": len(self.workflow_history),
             "workflows": list(self.workflows.keys()),
             "metrics": metrics_snapshot,
@@ -423,11 +702,123 @@ class WorkflowEngine:
             return {
                 **self.metrics,
                 "success_rate_percent": round(success_rate, 2),
+                "active_executions": self.admission.active,
+                "queue_depth": self.admission.queue_depth,
+                "latency": self.latency_metrics.snapshot(),
             }
 
-    def get_workflow_history(self, limit: int = 100) -> list[dict[str, Any]]:
-        """Get workflow execution history."""
-        return self.workflow_history[-limit:]
+    def render_prometheus_metrics(self) -> str:
+        """
+        Render latency histograms in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text for queue wait, execution and step latencies
+        """
+        return self.latency_metrics.render_prometheus()
+
+    def get_workflow_history(
+        self,
+        limit: int = 100,
+        workflow_name: str | None = None,
+        status: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        before: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get recent workflow execution history from the in-memory ring buffer.
+
+        Args:
+            limit: Maximum number of executions
+            workflow_name: Only executions of this workflow
+            status: Only executions with this status
+            since: Only executions at or after this time (naive means UTC)
+            until: Only executions before this time (naive means UTC)
+            before: Keyset cursor; only executions with a lower ``sequence``
+
+        Returns:
+            Matching executions, oldest first
+        """
+        if limit <= 0:
+            return []
+        since = as_utc(since) if since is not None else None
+        until = as_utc(until) if until is not None else None
+
+        matches: list[dict[str, Any]] = []
+        for record in reversed(self.workflow_history):
+            if before is not None and record["sequence"] >= before:
+                continue
+            if workflow_name is not None and record["workflow_name"] != workflow_name:
+                continue
+            if status is not None and record["status"] != status:
+                continue
+            if since is not None or until is not None:
+                timestamp = as_utc(datetime.fromisoformat(record["timestamp"]))
+                if since is not None and timestamp < since:
+                    continue
+                if until is not None and timestamp >= until:
+                    continue
+            matches.append(record)
+            if len(matches) >= limit:
+                break
+
+        matches.reverse()
+        return matches
+
+    async def query_workflow_history(
+        self,
+        limit: int = 100,
+        workflow_name: str | None = None,
+        status: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: int | None = None,
+        include_results: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Page through the full execution history, newest first.
+
+        Uses the history store when configured and the in-memory ring buffer
+        otherwise. Pass the returned ``next_cursor`` back as ``cursor`` to fetch
+        the next page; it is None on the last page.
+
+        Args:
+            limit: Page size
+            workflow_name: Only executions of this workflow
+            status: Only executions with this status
+            since: Only executions at or after this time (naive means UTC)
+            until: Only executions before this time (naive means UTC)
+            cursor: Cursor returned by the previous page
+            include_results: Whether to include result payloads
+
+        Returns:
+            Dictionary with ``executions`` and ``next_cursor``
+        """
+        if self.history_store is not None:
+            executions = await self.history_store.query(
+                workflow_name=workflow_name,
+                status=status,
+                since=since,
+                until=until,
+                before=cursor,
+                limit=limit,
+                include_results=include_results,
+            )
+        else:
+            executions = self.get_workflow_history(
+                limit, workflow_name, status, since, until, before=cursor
+            )
+            executions.reverse()
+            if not include_results:
+                executions = [
+                    {key: value for key, value in record.items() if key != "result"}
+                    for record in executions
+                ]
+
+        next_cursor = (
+            executions[-1]["sequence"] if executions and len(executions) == limit else None
+        )
+        return {"executions": executions, "next_cursor": next_cursor}
 
     def get_running_workflows(self) -> list[str]:
         """Get list of currently running workflow execution IDs."""
@@ -0,0 +1,269 @@
+"""
+Workflow Execution History
+
+Append-only storage for workflow execution records with indexed lookup by
+workflow name, status and time range, and keyset pagination.
+
+Index rows (name, status, time) are kept apart from result payloads so history
+scans never read large results; payloads are fetched only when asked for.
+Times are compared in UTC; naive datetimes are taken to be UTC.
+"""
+
+from abc import ABC, abstractmethod
+import asyncio
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+
+DEFAULT_HISTORY_PATH = "codeflow_workflow_history.db"
+
+
+def as_utc(moment: datetime) -> datetime:
+    """
+    Normalize a datetime to UTC.
+
+    Args:
+        moment: Aware datetime, or naive datetime taken to be UTC
+
+    Returns:
+        The same instant as an aware UTC datetime
+    """
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC)
+
+
+class HistoryStore(ABC):
+    """Append-only store for workflow execution records."""
+
+    @abstractmethod
+    async def append(self, record: dict[str, Any]) -> int:
+        """
+        Append an execution record.
+
+        Args:
+            record: Record with ``execution_id``, ``workflow_name``, ``status``,
+                ``timestamp`` (ISO format) and ``result``
+
+        Returns:
+            Sequence number assigned to the record; sequences increase with
+            every append and serve as the pagination cursor
+        """
+
+    @abstractmethod
+    async def query(
+        self,
+        workflow_name: str | None = None,
+        status: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        before: int | None = None,
+        limit: int = 100,
+        include_results: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Query records newest first.
+
+        Args:
+            workflow_name: Only records of this workflow
+            status: Only records with this status
+            since: Only records at or after this time (naive means UTC)
+            until: Only records before this time (naive means UTC)
+            before: Keyset cursor; only records with a lower sequence
+            limit: Maximum number of records
+            include_results: Whether to load result payloads
+
+        Returns:
+            Matching records, newest first
+        """
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """
+    SQLite-backed execution history.
+
+    Index rows live in ``workflow_history`` with composite indexes leading on
+    workflow name, status and time; result payloads live in
+    ``workflow_history_results`` keyed by the same sequence number.
+    """
+
+    def __init__(self, db_path: str | Path = DEFAULT_HISTORY_PATH) -> None:
+        self.db_path = str(db_path)
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self) -> None:
+        """Create history tables and indexes if needed."""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS workflow_history (
+                    sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+                    execution_id TEXT NOT NULL,
+                    workflow_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    recorded_at REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS workflow_history_results (
+                    sequence INTEGER PRIMARY KEY,
+                    result TEXT NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_workflow "
+                "ON workflow_history(workflow_name, sequence)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_status "
+                "ON workflow_history(status, sequence)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_workflow_status "
+                "ON workflow_history(workflow_name, status, sequence)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_recorded_at "
+                "ON workflow_history(recorded_at)"
+            )
+
+    def _append(self, record: dict[str, Any]) -> int:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO workflow_history
+                    (execution_id, workflow_name, status, timestamp, recorded_at)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    record["execution_id"],
+                    record["workflow_name"],
+                    record["status"],
+                    record["timestamp"],
+                    as_utc(datetime.fromisoformat(record["timestamp"])).timestamp(),
+                ),
+            )
+            sequence = cursor.lastrowid
+            conn.execute(
+                "INSERT INTO workflow_history_results (sequence, result) VALUES (?, ?)",
+                (sequence, json.dumps(record.get("result"), default=str)),
+            )
+        return sequence
+
+    def _query(
+        self,
+        workflow_name: str | None,
+        status: str | None,
+        since: datetime | None,
+        until: datetime | None,
+        before: int | None,
+        limit: int,
+        include_results: bool,
+    ) -> list[dict[str, Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if workflow_name is not None:
+            clauses.append("h.workflow_name = ?")
+            params.append(workflow_name)
+        if status is not None:
+            clauses.append("h.status = ?")
+            params.append(status)
+        if since is not None:
+            clauses.append("h.recorded_at >= ?")
+            params.append(as_utc(since).timestamp())
+        if until is not None:
+            clauses.append("h.recorded_at < ?")
+            params.append(as_utc(until).timestamp())
+        if before is not None:
+            clauses.append("h.sequence < ?")
+            params.append(before)
+
+        columns = "h.sequence, h.execution_id, h.workflow_name, h.status, h.timestamp"
+        join = ""
+        if include_results:
+            columns += ", r.result"
+            join = " LEFT JOIN workflow_history_results r ON r.sequence = h.sequence"
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT {columns} FROM workflow_history h{join}{where} "  # noqa: S608 - clauses are fixed strings
+            "ORDER BY h.sequence DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        records = []
+        for row in rows:
+            record = {
+                "sequence": row["sequence"],
+                "execution_id": row["execution_id"],
+                "workflow_name": row["workflow_name"],
+                "status": row["status"],
+                "timestamp": row["timestamp"],
+            }
+            if include_results:
+                record["result"] = json.loads(row["result"]) if row["result"] else None
+            records.append(record)
+        return records
+
+    async def append(self, record: dict[str, Any]) -> int:
+        return await asyncio.to_thread(self._append, record)
+
+    async def query(
+        self,
+        workflow_name: str | None = None,
+        status: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        before: int | None = None,
+        limit: int = 100,
+        include_results: bool = False,
+    ) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(
+            self._query,
+            workflow_name,
+            status,
+            since,
+            until,
+            before,
+            limit,
+            include_results,
+        )
+
+
+def history_store_from_config(config: Any) -> HistoryStore | None:
+    """
+    Create the execution history store a configuration asks for.
+
+    Args:
+        config: Configuration with a ``workflow_history_path`` setting
+
+    Returns:
+        A SQLite store at the configured path, or None when history
+        persistence is disabled with an empty path
+    """
+    db_path = getattr(config, "workflow_history_path", DEFAULT_HISTORY_PATH)
+    return SQLiteHistoryStore(db_path) if db_path else None
+
+
+__all__ = [
+    "DEFAULT_HISTORY_PATH",
+    "HistoryStore",
+    "SQLiteHistoryStore",
+    "as_utc",
+    "history_store_from_config",
+]
@@ -0,0 +1,316 @@
+"""
+Workflow Latency Histograms
+
+Fixed log-scale latency histograms over a sliding time window, with percentile
+estimates, plus process-lifetime bucket counts for Prometheus text exposition.
+
+Buckets grow by a factor of 2**(1/4) from 1ms to about one hour, so a percentile
+estimate is within roughly 10% of the true value. The window is a ring of time
+slots; a slot is reset when it is reused, so old observations age out without a
+background task. Prometheus expects histogram buckets to be cumulative counters,
+so the exposition uses counts that never age out; windowed percentiles stay in
+the snapshot. Recording takes a single uncontended lock around a handful of
+integer updates.
+"""
+
+from bisect import bisect_left
+from contextvars import ContextVar
+import math
+import threading
+import time
+from typing import Any
+
+
+# Bucket upper bounds in seconds: 1ms * 2**(i/4), up to ~1 hour
+BUCKET_BOUNDS: tuple[float, ...] = tuple(
+    0.001 * 2 ** (i / 4) for i in range(int(4 * math.log2(3600 / 0.001)) + 2)
+)
+
+DEFAULT_WINDOW_SECONDS = 300.0
+DEFAULT_WINDOW_SLOTS = 10
+PERCENTILES = (50, 95, 99)
+
+
+class _WindowSlot:
+    """Observations recorded during one slot of the sliding window."""
+
+    __slots__ = ("counts", "epoch", "max", "sum", "total")
+
+    def __init__(self) -> None:
+        self.epoch = -1
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)  # last bucket is +Inf
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def reset(self, epoch: int) -> None:
+        self.epoch = epoch
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class LatencyHistogram:
+    """Log-scale latency histogram over a sliding time window.
+
+    Alongside the window it keeps monotonic counts since creation, which the
+    Prometheus exposition uses.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slots: int = DEFAULT_WINDOW_SLOTS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            window_seconds: Length of the sliding window
+            slots: Number of slots the window is divided into
+        """
+        self.window_seconds = window_seconds
+        self._slot_seconds = window_seconds / slots
+        self._slots = [_WindowSlot() for _ in range(slots)]
+        self._lifetime_counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._lifetime_total = 0
+        self._lifetime_sum = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, now: float | None = None) -> None:
+        """
+        Record one observation.
+
+        Args:
+            seconds: Observed latency in seconds
+            now: Observation time (monotonic seconds); defaults to now
+        """
+        epoch = int((time.monotonic() if now is None else now) // self._slot_seconds)
+        bucket = bisect_left(BUCKET_BOUNDS, seconds)
+
+        with self._lock:
+            slot = self._slots[epoch % len(self._slots)]
+            if slot.epoch != epoch:
+                slot.reset(epoch)
+            slot.counts[bucket] += 1
+            slot.total += 1
+            slot.sum += seconds
+            if seconds > slot.max:
+                slot.max = seconds
+            self._lifetime_counts[bucket] += 1
+            self._lifetime_total += 1
+            self._lifetime_sum += seconds
+
+    def _merged(self, now: float | None) -> tuple[list[int], int, float, float]:
+        """Merge the slots still inside the window."""
+        epoch = int((time.monotonic() if now is None else now) // self._slot_seconds)
+        oldest = epoch - len(self._slots) + 1
+        counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        total = 0
+        total_sum = 0.0
+        maximum = 0.0
+
+        with self._lock:
+            for slot in self._slots:
+                if slot.epoch < oldest or slot.total == 0:
+                    continue
+                for i, count in enumerate(slot.counts):
+                    counts[i] += count
+                total += slot.total
+                total_sum += slot.sum
+                maximum = max(maximum, slot.max)
+
+        return counts, total, total_sum, maximum
+
+    @staticmethod
+    def _percentile(counts: list[int], total: int, maximum: float, pct: float) -> float:
+        """Estimate a percentile by interpolating inside its bucket."""
+        rank = pct / 100 * total
+        cumulative = 0
+        for i, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                lower = BUCKET_BOUNDS[i - 1] if i > 0 else 0.0
+                upper = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else maximum
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(estimate, maximum)
+            cumulative += count
+        return maximum
+
+    def snapshot(self, now: float | None = None) -> dict[str, Any]:
+        """
+        Summarize the observations inside the window.
+
+        Args:
+            now: Snapshot time (monotonic seconds); defaults to now
+
+        Returns:
+            Count, mean, max and p50/p95/p99 latency in seconds
+        """
+        counts, total, total_sum, maximum = self._merged(now)
+        summary: dict[str, Any] = {
+            "count": total,
+            "mean": total_sum / total if total else 0.0,
+            "max": maximum,
+        }
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = (
+                self._percentile(counts, total, maximum, pct) if total else 0.0
+            )
+        return summary
+
+    def prometheus_buckets(self) -> tuple[list[tuple[float, int]], int, float]:
+        """
+        Get cumulative bucket counts since creation for Prometheus exposition.
+
+        Unlike the window these never decrease, so scrapers do not mistake
+        expired observations for a counter reset.
+
+        Returns:
+            Tuple of (upper bound, cumulative count) pairs, total count and sum
+        """
+        with self._lock:
+            counts = list(self._lifetime_counts)
+            total = self._lifetime_total
+            total_sum = self._lifetime_sum
+        cumulative = 0
+        buckets = []
+        for bound, count in zip(BUCKET_BOUNDS, counts, strict=False):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return buckets, total, total_sum
+
+
+class LatencyMetrics:
+    """Named, labelled latency histograms."""
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slots: int = DEFAULT_WINDOW_SLOTS,
+    ) -> None:
+        """
+        Initialize the metric set.
+
+        Args:
+            window_seconds: Sliding window length of every histogram
+            slots: Number of slots per window
+        """
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, metric: str, **labels: str) -> LatencyHistogram:
+        """
+        Get or create the histogram for a metric and label set.
+
+        Args:
+            metric: Metric name
+            **labels: Label values identifying the series
+
+        Returns:
+            The series histogram
+        """
+        key = (metric, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    key, LatencyHistogram(self.window_seconds, self.slots)
+                )
+        return histogram
+
+    def record(self, metric: str, seconds: float, **labels: str) -> None:
+        """
+        Record one observation.
+
+        Args:
+            metric: Metric name
+            seconds: Observed latency in seconds
+            **labels: Label values identifying the series
+        """
+        self.histogram(metric, **labels).record(seconds)
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Summarize every series.
+
+        Returns:
+            Mapping of metric name to a list of series summaries with their labels
+        """
+        result: dict[str, list[dict[str, Any]]] = {}
+        for (metric, labels), histogram in list(self._histograms.items()):
+            result.setdefault(metric, []).append(
+                {"labels": dict(labels), **histogram.snapshot()}
+            )
+        return result
+
+    def render_prometheus(self) -> str:
+        """
+        Render every series in the Prometheus text exposition format.
+
+        Buckets, sum and count cover the process lifetime; windowed
+        percentiles are available from ``snapshot``.
+
+        Returns:
+            Exposition text with ``_bucket``, ``_sum`` and ``_count`` samples
+        """
+        lines: list[str] = []
+        seen_metrics: set[str] = set()
+        for (metric, labels), histogram in sorted(self._histograms.items()):
+            if metric not in seen_metrics:
+                seen_metrics.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+
+            label_text = ",".join(
+                f'{name}="{_escape_label(value)}"' for name, value in labels
+            )
+            prefix = f"{label_text}," if label_text else ""
+            buckets, total, total_sum = histogram.prometheus_buckets()
+            for bound, cumulative in buckets:
+                lines.append(f'{metric}_bucket{{{prefix}le="{bound:.6g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{prefix}le="+Inf"}} {total}')
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{metric}_sum{suffix} {total_sum:.6f}")
+            lines.append(f"{metric}_count{suffix} {total}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Process-wide default metrics, exposed by the server's /metrics endpoint
+default_latency_metrics = LatencyMetrics()
+
+_current_latency_metrics: ContextVar[LatencyMetrics | None] = ContextVar(
+    "codeflow_latency_metrics", default=None
+)
+
+
+def current_latency_metrics() -> LatencyMetrics | None:
+    """Get the latency metrics bound to the running workflow execution, if any."""
+    return _current_latency_metrics.get()
+
+
+def bind_latency_metrics(metrics: LatencyMetrics | None) -> None:
+    """
+    Bind latency metrics to the current task's context.
+
+    Args:
+        metrics: Metrics receiving step latencies, or None
+    """
+    _current_latency_metrics.set(metrics)
+
+
+__all__ = [
+    "BUCKET_BOUNDS",
+    "LatencyHistogram",
+    "LatencyMetrics",
+    "bind_latency_metrics",
+    "current_latency_metrics",
+    "default_latency_metrics",
+]
@@ -5,6 +5,11 @@ Provides comprehensive validation for workflow inputs to prevent injection attac
 and ensure data integrity.
 """
 
+from collections import OrderedDict
+import hashlib
+import json
+import re
+import threading
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -96,7 +101,105 @@ def validate_workflow_context(context: dict[str, Any]) -> dict[str, Any]:
         raise ValueError(msg) from e
 
 
-def sanitize_workflow_parameters(params: dict[str, Any]) -> dict[str, Any]:
+MAX_STRING_LENGTH = 10000
+MAX_NESTING_DEPTH = 10
+
+# TODO: Make configurable via settings
+# Extended list of suspicious patterns for XSS and injection attacks
+SUSPICIOUS_PATTERNS = (
+    "<script", "javascript:", "onerror=", "eval(",
+    "vbscript:", "data:", "<iframe", "expression(",
+    "onload=", "onclick=", "onmouseover=",
+    "document.cookie", "window.location", "document.write",
+)
+
+# All patterns as one case-insensitive alternation, so each string is scanned once
+_SUSPICIOUS_PATTERN_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in SUSPICIOUS_PATTERNS), re.IGNORECASE
+)
+
+
+class SanitizationCache:
+    """
+    LRU cache of sanitization verdicts keyed by content hash.
+
+    Identical payloads (for example a webhook delivered again, or a retried
+    execution) are checked once; later calls only hash the content.
+    Failures are cached too, so a rejected payload is rejected again cheaply.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached verdicts
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._verdicts: OrderedDict[tuple[int, bytes], str | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_key(value: Any, depth: int) -> tuple[int, bytes] | None:
+        """
+        Build the cache key of a sub-tree.
+
+        Args:
+            value: Dictionary, list or tuple sub-tree
+            depth: Nesting depth of the sub-tree, since depth limits depend on it
+
+        Returns:
+            Cache key, or None if the sub-tree has no canonical JSON form
+        """
+        try:
+            canonical = json.dumps(value, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+        return depth, hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+    def get(self, key: tuple[int, bytes]) -> tuple[bool, str | None]:
+        """
+        Look up a verdict.
+
+        Returns:
+            Tuple of (found, error message or None when the sub-tree is clean)
+        """
+        with self._lock:
+            if key in self._verdicts:
+                self._verdicts.move_to_end(key)
+                self.hits += 1
+                return True, self._verdicts[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: tuple[int, bytes], error: str | None) -> None:
+        """Store a verdict; ``error`` is None for a clean sub-tree."""
+        with self._lock:
+            self._verdicts[key] = error
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.maxsize:
+                self._verdicts.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached verdicts."""
+        with self._lock:
+            self._verdicts.clear()
+
+
+def _copy_tree(value: Any) -> Any:
+    """Rebuild dictionaries and lists of an already sanitized sub-tree."""
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return type(value)(_copy_tree(item) for item in value)
+    return value
+
+
+def sanitize_workflow_parameters(
+    params: dict[str, Any], cache: SanitizationCache | None = None
+) -> dict[str, Any]:
     """
     Sanitize workflow parameters to prevent injection attacks.
     
@@ -104,6 +207,8 @@ def sanitize_workflow_parameters(params: dict[str, Any]) -> dict[str, Any]:
     
     Args:
         params: Parameters dictionary to sanitize
+        cache: Optional verdict cache; the parameters and each of their
+            top-level values are looked up by content hash
         
     Returns:
         Sanitized parameters dictionary
@@ -116,19 +221,19 @@ def sanitize_workflow_parameters(params: dict[str, Any]) -> dict[str, Any]:
     Production TODO:
         - Make suspicious_patterns configurable via settings
         - Add custom pattern lists per workflow type
-        - Implement pattern matching performance optimization
     """
-    MAX_STRING_LENGTH = 10000
-    MAX_NESTING_DEPTH = 10
     
-    # TODO: Make configurable via settings
-    # Extended list of suspicious patterns for XSS and injection attacks
-    SUSPICIOUS_PATTERNS = [
-        "<script", "javascript:", "onerror=", "eval(",
-        "vbscript:", "data:", "<iframe", "expression(",
-        "onload=", "onclick=", "onmouseover=",
-        "document.cookie", "window.location", "document.write"
-    ]
+    def check_string(value: str) -> None:
+        # Check string length
+        if len(value) > MAX_STRING_LENGTH:
+            msg = f"String parameter exceeds maximum length of {MAX_STRING_LENGTH}"
+            raise ValueError(msg)
+        
+        # Check for suspicious patterns (case-insensitive) in a single scan
+        match = _SUSPICIOUS_PATTERN_RE.search(value)
+        if match:
+            msg = f"Parameter contains suspicious pattern: {match.group(0).lower()}"
+            raise ValueError(msg)
     
     def sanitize_value(value: Any, depth: int = 0) -> Any:
         """Recursively sanitize values."""
@@ -137,34 +242,44 @@ def sanitize_workflow_parameters(params: dict[str, Any]) -> dict[str, Any]:
             raise ValueError(msg)
         
         if isinstance(value, str):
-            # Check string length
-            if len(value) > MAX_STRING_LENGTH:
-                msg = f"String parameter exceeds maximum length of {MAX_STRING_LENGTH}"
-                raise ValueError(msg)
-            
-            # Check for suspicious patterns (case-insensitive)
-            lower_value = value.lower()
-            for pattern in SUSPICIOUS_PATTERNS:
-                if pattern in lower_value:
-                    msg = f"Parameter contains suspicious pattern: {pattern}"
-                    raise ValueError(msg)
-            
+            check_string(value)
             return value
         
-        elif isinstance(value, dict):
-            return {k: sanitize_value(v, depth + 1) for k, v in value.items()}
-        
-        elif isinstance(value, list):
-            return [sanitize_value(item, depth + 1) for item in value]
-        
-        else:
+        # Tuples are checked like lists; they share a canonical JSON form
+        if not isinstance(value, dict | list | tuple):
             # Numbers, booleans, None are safe
             return value
+        
+        key = None
+        if cache is not None and depth <= 1 and value:
+            key = cache.content_key(value, depth)
+            if key is not None:
+                found, error = cache.get(key)
+                if found:
+                    if error is not None:
+                        raise ValueError(error)
+                    return _copy_tree(value)
+        
+        try:
+            if isinstance(value, dict):
+                result = {k: sanitize_value(v, depth + 1) for k, v in value.items()}
+            else:
+                result = type(value)(sanitize_value(item, depth + 1) for item in value)
+        except ValueError as e:
+            if key is not None:
+                cache.put(key, str(e))
+            raise
+        
+        if key is not None:
+            cache.put(key, None)
+        return result
     
     return sanitize_value(params)
 
 
 __all__ = [
+    "SUSPICIOUS_PATTERNS",
+    "SanitizationCache",
     "WorkflowContextValidator",
     "validate_workflow_context",
     "sanitize_workflow_parameters",
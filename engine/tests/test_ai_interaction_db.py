@@ -0,0 +1,349 @@
+"""
+Tests for the batched AI interaction writer.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer.database import (
+    INTERACTION_FIELDS,
+    AIInteractionDB,
+)
+from codeflow_engine.exceptions import ConfigurationError
+
+
+def make_interaction(index, **overrides):
+    data = {
+        "timestamp": f"2026-01-01T00:00:{index % 60:02d}",
+        "file_path": f"module_{index}.py",
+        "issue_type": "E501",
+        "issue_details": "line too long",
+        "provider_used": "openai",
+        "model_used": "gpt-4",
+        "system_prompt": "You are a linting specialist.",
+        "user_prompt": f"Fix line {index}",
+        "ai_response": "shortened the line",
+        "fix_successful": True,
+        "confidence_score": 0.9,
+    }
+    data.update(overrides)
+    return data
+
+
+def count_rows(db_path, table="ai_interactions"):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_rows_are_committed_in_batches(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path, batch_size=50, flush_interval_ms=60_000)
+
+    for index in range(120):
+        db.log_interaction(make_interaction(index))
+    db.flush()
+
+    assert count_rows(db_path) == 120
+    db.close()
+
+
+def test_reads_see_buffered_rows(tmp_path):
+    db = AIInteractionDB(str(tmp_path / "interactions.db"), flush_interval_ms=60_000)
+
+    db.log_interaction(make_interaction(1, user_prompt="unique marker"))
+
+    assert len(db.search_interactions("marker")) == 1
+    assert db.get_statistics()["total_interactions"] == 1
+    db.close()
+
+
+def test_close_writes_pending_rows(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path, flush_interval_ms=60_000)
+
+    for index in range(10):
+        db.log_interaction(make_interaction(index))
+    db.log_performance_session(
+        {
+            "session_timestamp": "2026-01-01T00:00:00",
+            "total_duration": 1.0,
+            "files_processed": 1,
+            "issues_found": 10,
+            "issues_fixed": 10,
+            "success_rate": 100.0,
+            "average_confidence": 0.9,
+            "throughput_files_per_sec": 1.0,
+            "throughput_issues_per_sec": 10.0,
+            "parallel_workers": 1,
+            "total_tokens": 100,
+            "total_api_calls": 10,
+            "average_api_response_time": 0.1,
+            "provider_used": "openai",
+            "model_used": "gpt-4",
+        }
+    )
+    db.close()
+
+    assert count_rows(db_path) == 10
+    assert count_rows(db_path, "performance_sessions") == 1
+
+
+def test_bad_row_does_not_lose_its_batch(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path, flush_interval_ms=60_000)
+
+    db.log_interaction(make_interaction(1))
+    db.log_interaction(make_interaction(2, file_path=None))  # NOT NULL column
+    db.log_interaction(make_interaction(3))
+    db.close()
+
+    assert count_rows(db_path) == 2
+
+
+def test_missing_fields_fail_in_the_caller(tmp_path):
+    db = AIInteractionDB(str(tmp_path / "interactions.db"))
+
+    with pytest.raises(KeyError):
+        db.log_interaction({"timestamp": "2026-01-01T00:00:00"})
+    db.close()
+
+
+def test_parallel_logging(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path, max_pending=100)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: db.log_interaction(make_interaction(i)), range(2000)))
+    db.close()
+
+    assert count_rows(db_path) == 2000
+
+
+def test_repeated_bodies_are_stored_once(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path)
+    system_prompt = "You are a linting specialist. " * 50
+
+    for index in range(20):
+        db.log_interaction(make_interaction(index, system_prompt=system_prompt))
+    db.flush()
+
+    # One shared system prompt and response, plus one user prompt per row
+    assert count_rows(db_path, "ai_blobs") == 22
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute(
+            "SELECT compressed FROM ai_blobs WHERE LENGTH(body) < ?", (len(system_prompt),)
+        ).fetchall()
+    interactions = db.get_all_interactions()
+    assert all(item["system_prompt"] == system_prompt for item in interactions)
+    db.close()
+
+
+def test_search_matches_bodies_and_fields_with_original_shape(tmp_path):
+    db = AIInteractionDB(str(tmp_path / "interactions.db"))
+    db.log_interaction(make_interaction(1, ai_response="wrapped the call"))
+    db.log_interaction(make_interaction(2, issue_type="F401"))
+    db.log_interaction(make_interaction(3))
+
+    by_body = db.search_interactions("wrapped")
+    by_field = db.search_interactions("F401")
+
+    assert [item["file_path"] for item in by_body] == ["module_1.py"]
+    assert [item["file_path"] for item in by_field] == ["module_2.py"]
+    assert list(by_body[0]) == list(INTERACTION_FIELDS)
+    assert by_body[0]["user_prompt"] == "Fix line 1"
+    assert len(db.search_interactions("linting")) == 3
+    db.close()
+
+
+def test_search_terms_span_fields_and_bodies(tmp_path):
+    db = AIInteractionDB(str(tmp_path / "interactions.db"))
+    db.log_interaction(make_interaction(1, user_prompt="Please wrap line 1"))
+    db.log_interaction(make_interaction(2, issue_type="F401", user_prompt="Please wrap line 2"))
+
+    assert [item["file_path"] for item in db.search_interactions("E501 wrap")] == [
+        "module_1.py"
+    ]
+    assert [item["file_path"] for item in db.search_interactions("issue_type:F401")] == [
+        "module_2.py"
+    ]
+    assert len(db.search_interactions("system_prompt:linting")) == 2
+    assert db.search_interactions("user_prompt:E501") == []
+    db.close()
+
+
+def test_search_index_is_built_for_existing_interactions(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path)
+    db.log_interaction(make_interaction(1, ai_response="wrapped the call"))
+    db.close()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE interaction_search_fts")
+
+    reopened = AIInteractionDB(db_path)
+
+    assert [item["file_path"] for item in reopened.search_interactions("E501 wrapped")] == [
+        "module_1.py"
+    ]
+    reopened.close()
+
+
+def test_cleanup_deletes_unreferenced_bodies(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path)
+    db.log_interaction(make_interaction(1, timestamp="2000-01-01T00:00:00", ai_response="old"))
+    db.log_interaction(make_interaction(2, timestamp="2999-01-01T00:00:00"))
+
+    db.cleanup_old_interactions(days_to_keep=30)
+
+    assert count_rows(db_path) == 1
+    assert count_rows(db_path, "ai_blobs") == 3
+    assert db.search_interactions("old") == []
+    assert len(db.search_interactions("shortened")) == 1
+    db.close()
+
+
+def test_legacy_inline_bodies_are_migrated(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE ai_interactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                issue_type TEXT NOT NULL,
+                issue_details TEXT NOT NULL,
+                provider_used TEXT NOT NULL,
+                model_used TEXT NOT NULL,
+                system_prompt TEXT NOT NULL,
+                user_prompt TEXT NOT NULL,
+                ai_response TEXT NOT NULL,
+                fix_successful BOOLEAN NOT NULL,
+                confidence_score REAL NOT NULL,
+                fixed_codes TEXT,
+                error_message TEXT,
+                syntax_valid_before BOOLEAN,
+                syntax_valid_after BOOLEAN,
+                file_size_chars INTEGER,
+                prompt_tokens INTEGER,
+                response_tokens INTEGER,
+                processing_duration REAL,
+                api_response_time REAL,
+                queue_wait_time REAL,
+                file_complexity_score REAL,
+                parallel_worker_id INTEGER,
+                retry_count INTEGER,
+                memory_usage_mb REAL,
+                tokens_per_second REAL,
+                agent_type TEXT
+            )
+            """
+        )
+        conn.executemany(
+            """
+            INSERT INTO ai_interactions (
+                timestamp, file_path, issue_type, issue_details, provider_used,
+                model_used, system_prompt, user_prompt, ai_response,
+                fix_successful, confidence_score
+            ) VALUES (?, ?, 'E501', '', 'openai', 'gpt-4', 'shared', ?, 'legacy reply', 1, 0.5)
+            """,
+            [(f"2026-01-01T00:00:0{i}", f"old_{i}.py", f"prompt {i}") for i in range(3)],
+        )
+
+    with pytest.raises(ConfigurationError, match="migrate-linting-db"):
+        AIInteractionDB(db_path)
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(ai_interactions)")}
+    assert {"system_prompt", "user_prompt", "ai_response"} <= columns
+    assert count_rows(db_path) == 3
+
+    db = AIInteractionDB(db_path, migrate_legacy=True)
+
+    assert count_rows(db_path, "ai_blobs") == 5
+    migrated = db.search_interactions("legacy")
+    assert sorted(item["user_prompt"] for item in migrated) == [
+        "prompt 0",
+        "prompt 1",
+        "prompt 2",
+    ]
+    assert len(db.search_interactions("old_1")) == 1
+    db.close()
+
+
+def test_statistics_come_from_rollups(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path, batch_size=7)
+    for index in range(30):
+        db.log_interaction(
+            make_interaction(
+                index,
+                provider_used="openai" if index % 3 else "anthropic",
+                issue_type="E501" if index % 2 else "F401",
+                fix_successful=index % 4 != 0,
+                confidence_score=index / 30,
+                file_size_chars=100,
+                prompt_tokens=10,
+                response_tokens=5,
+                api_response_time=0.1 * index,
+                agent_type=None if index % 5 else "specialist",
+            )
+        )
+
+    stats = db.get_statistics()
+
+    assert stats["total_interactions"] == 30
+    assert stats["successful_fixes"] == 22
+    assert stats["failed_fixes"] == 8
+    assert stats["issue_type_breakdown"] == {"E501": 15, "F401": 15}
+    assert stats["provider_performance"]["anthropic"]["success_rate"] == pytest.approx(
+        100 * 7 / 10
+    )
+    assert stats["confidence_stats"]["average_confidence"] == pytest.approx(29 / 60)
+    assert stats["confidence_stats"]["max_confidence"] == pytest.approx(29 / 30)
+    assert stats["confidence_stats"]["high_confidence_count"] == 5
+    assert stats["file_stats"]["unique_files"] == 30
+    assert stats["file_stats"]["average_file_size"] == 100
+    assert stats["token_usage"] == {"prompt_tokens": 300, "response_tokens": 150}
+    assert sum(stats["latency_stats"]["histogram"].values()) == 30
+    assert stats["latency_stats"]["histogram"]["<=0.5s"] == 6
+
+    # The aggregates no longer scan ai_interactions
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM ai_interactions")
+    assert db.get_statistics()["total_interactions"] == 30
+    db.close()
+
+
+def test_rebuild_statistics_backfills_rollups(tmp_path):
+    db_path = str(tmp_path / "interactions.db")
+    db = AIInteractionDB(db_path)
+    for index in range(5):
+        db.log_interaction(make_interaction(index))
+    db.flush()
+    expected = db.get_statistics()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM interaction_rollups")
+        conn.execute("DELETE FROM file_rollups")
+
+    db.rebuild_statistics()
+
+    assert db.get_statistics() == expected
+    db.close()
+
+
+def test_cleanup_removes_old_days_from_rollups(tmp_path):
+    db = AIInteractionDB(str(tmp_path / "interactions.db"))
+    db.log_interaction(make_interaction(1, timestamp="2000-01-01T00:00:00", file_path="a.py"))
+    db.log_interaction(make_interaction(2, timestamp="2999-01-01T00:00:00", file_path="a.py"))
+    db.log_interaction(make_interaction(3, timestamp="2000-01-01T00:00:00", file_path="b.py"))
+
+    db.cleanup_old_interactions(days_to_keep=30)
+
+    stats = db.get_statistics()
+    assert stats["total_interactions"] == 1
+    assert stats["file_stats"]["unique_files"] == 1
+    assert stats["file_stats"]["most_processed_file"] == "a.py"
+    db.close()
@@ -0,0 +1,210 @@
+"""
+Tests for the deterministic fixer tier run before the AI specialists.
+"""
+
+import shutil
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer.ai_linting_fixer import AILintingFixer
+from codeflow_engine.actions.ai_linting_fixer.detection import LintingIssue
+from codeflow_engine.actions.ai_linting_fixer.deterministic_fixer import (
+    ROUTE_AI,
+    ROUTE_RUFF,
+    ROUTE_TRANSFORM,
+    DeterministicFixer,
+)
+from codeflow_engine.actions.ai_linting_fixer.display import DisplayConfig, OutputMode
+from codeflow_engine.actions.ai_linting_fixer.models import AILintingFixerInputs
+
+
+# "<ws>" marks trailing whitespace
+SOURCE = '''import os, sys
+from typing import Any, List
+import json
+DOC = """keep<ws>
+   trailing"""
+
+
+
+def first():<ws>
+    return sys.argv, json
+def second():
+    unused = 1
+    return unused
+'''.replace("<ws>", "   ")
+
+EXPECTED = '''import sys
+import json
+DOC = """keep<ws>
+   trailing"""
+
+
+def first():
+    return sys.argv, json
+
+
+def second():
+    unused = 1
+    return unused
+'''.replace("<ws>", "   ")
+
+
+def _issues(path):
+    specs = [
+        (1, "F401", "'os' imported but unused"),
+        (2, "F401", "'typing.Any' imported but unused"),
+        (2, "F401", "`typing.List` imported but unused"),
+        (4, "W291", "trailing whitespace"),
+        (9, "E303", "too many blank lines (3)"),
+        (9, "W291", "trailing whitespace"),
+        (11, "E302", "expected 2 blank lines, found 0"),
+        (12, "F841", "local variable 'unused' is assigned to but never used"),
+    ]
+    return [
+        LintingIssue(str(path), line, 0, code, message) for line, code, message in specs
+    ]
+
+
+def test_transforms_fix_mechanical_issues(tmp_path):
+    """Test that transforms fix what they can and remap the rest."""
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    issues = _issues(path)
+
+    result = DeterministicFixer(use_ruff=False).fix_issues(issues)
+
+    assert path.read_text(encoding="utf-8") == EXPECTED
+    # Whitespace inside the string literal is data, so that issue goes to the AI
+    assert [(i.line_number, i.error_code) for i in result.remaining] == [
+        (3, "W291"),
+        (12, "F841"),
+    ]
+    assert result.remaining[0].line_content == 'DOC = """keep   '
+    assert result.routes == {
+        "F401": {ROUTE_TRANSFORM: 3},
+        "W291": {ROUTE_AI: 1, ROUTE_TRANSFORM: 1},
+        "E303": {ROUTE_TRANSFORM: 1},
+        "E302": {ROUTE_TRANSFORM: 1},
+        "F841": {ROUTE_AI: 1},
+    }
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    """Test that dry runs report fixes without touching files or line numbers."""
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE, encoding="utf-8")
+
+    result = DeterministicFixer(use_ruff=False).fix_issues(_issues(path), dry_run=True)
+
+    assert path.read_text(encoding="utf-8") == SOURCE
+    assert len(result.fixed) == 6
+    assert result.remaining[-1].line_number == 12
+
+
+@pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff is not installed")
+def test_ruff_batch_fix(tmp_path):
+    """Test that ruff fixes its codes in one run over all files."""
+    paths = [tmp_path / f"module_{index}.py" for index in range(3)]
+    issues = []
+    for path in paths:
+        path.write_text("import os\nimport sys\n\nprint(sys.argv)\n", encoding="utf-8")
+        issues.append(LintingIssue(str(path), 1, 1, "F401", "`os` imported but unused"))
+
+    result = DeterministicFixer().fix_issues(issues)
+
+    assert result.routes == {"F401": {ROUTE_RUFF: 3}}
+    for path in paths:
+        assert path.read_text(encoding="utf-8").startswith("import sys\n")
+
+
+@pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff is not installed")
+def test_ruff_fixes_only_the_requested_issues(tmp_path):
+    """Test that other occurrences of the codes are left alone."""
+    path = tmp_path / "module.py"
+    path.write_text(
+        "import os\nimport json\nimport sys\n\nprint(f\"x\", sys.argv)\n",
+        encoding="utf-8",
+    )
+    issues = [LintingIssue(str(path), 1, 1, "F401", "`os` imported but unused")]
+
+    result = DeterministicFixer().fix_issues(issues)
+
+    assert result.routes == {"F401": {ROUTE_RUFF: 1}}
+    assert path.read_text(encoding="utf-8") == (
+        "import json\nimport sys\n\nprint(f\"x\", sys.argv)\n"
+    )
+
+
+PROBE = """try:
+    import zstandard
+    HAVE = True
+except ImportError:
+    HAVE = False
+"""
+
+
+@pytest.mark.parametrize("use_ruff", [False, True])
+def test_availability_probes_and_reexports_go_to_ai(tmp_path, use_ruff):
+    """Test that imports ruff refuses to remove are never transformed."""
+    if use_ruff and shutil.which("ruff") is None:
+        pytest.skip("ruff is not installed")
+    probe = tmp_path / "probe.py"
+    probe.write_text(PROBE, encoding="utf-8")
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "mod.py").write_text("thing = 1\n", encoding="utf-8")
+    init = package / "__init__.py"
+    init.write_text("from pkg.mod import thing\n", encoding="utf-8")
+    issues = [
+        LintingIssue(str(probe), 2, 12, "F401", "`zstandard` imported but unused"),
+        LintingIssue(str(init), 1, 21, "F401", "`pkg.mod.thing` imported but unused"),
+    ]
+
+    result = DeterministicFixer(use_ruff=use_ruff).fix_issues(issues)
+
+    assert result.routes == {"F401": {ROUTE_AI: 2}}
+    assert probe.read_text(encoding="utf-8") == PROBE
+    assert init.read_text(encoding="utf-8") == "from pkg.mod import thing\n"
+
+
+class RecordingIssueFixer:
+    """Issue fixer stand-in recording the issues sent to the AI."""
+
+    def __init__(self):
+        self.issues = []
+
+    def fix_single_issue(self, file_path, content, issue, provider=None, model=None):
+        self.issues.append((issue.error_code, issue.line_number))
+        return {"success": True, "content": content, "confidence": 0.9}
+
+
+def test_only_remaining_issues_reach_ai(tmp_path, monkeypatch):
+    """Test that the fixer run routes mechanical issues away from the AI."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    issues = _issues(path)
+
+    fixer = AILintingFixer(DisplayConfig(mode=OutputMode.QUIET))
+    fixer.issue_detector = type("Detector", (), {"detect_issues": lambda _self, _p: issues})()
+    fixer.issue_fixer = RecordingIssueFixer()
+    fixer.deterministic_fixer = DeterministicFixer(fixer.file_manager, use_ruff=False)
+    fixer.llm_manager = object()
+    fixer.ai_agent_manager = object()
+
+    outputs = fixer.run(
+        AILintingFixerInputs(
+            target_path=str(tmp_path),
+            fix_types=["F401", "W291", "E302", "E303", "F841"],
+            max_fixes=100,
+            create_backups=False,
+            quiet=True,
+            use_fix_cache=False,
+        )
+    )
+
+    assert fixer.issue_fixer.issues == [("W291", 3), ("F841", 12)]
+    assert outputs.issues_fixed == 8
+    assert outputs.fix_routing["F401"] == {ROUTE_TRANSFORM: 3}
+    assert outputs.fix_routing["F841"] == {ROUTE_AI: 1}
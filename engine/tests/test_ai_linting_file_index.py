@@ -0,0 +1,122 @@
+"""
+Tests for the per-run file index used when parsing linter output.
+"""
+
+import json
+from unittest.mock import patch
+
+from codeflow_engine.actions.ai_linting_fixer.detection import (
+    Flake8Parser,
+    IssueDetector,
+    RuffParser,
+)
+from codeflow_engine.actions.ai_linting_fixer.file_index import FileIndex, FileIndexCache
+
+
+SOURCE = """import os
+
+
+class Service:
+    @staticmethod
+    def run():
+        def helper():
+            return 1
+        return helper()
+
+    value = 2
+
+
+async def fetch():
+    return os.getcwd()
+
+RESULT = fetch
+"""
+
+
+def test_line_lookup():
+    """Test that lines are sliced from offsets without line endings."""
+    index = FileIndex("first\r\nsecond\nthird")
+
+    assert [index.get_line(n) for n in range(0, 5)] == ["", "first", "second", "third", ""]
+
+
+def test_form_feeds_do_not_end_lines():
+    """Test that only newline sequences split lines, as for linters."""
+    index = FileIndex("import os\n\x0c\ndef f():\n    x = 1  \u2028\x85\n")
+
+    assert index.line_count == 4
+    assert index.get_line(2) == "\x0c"
+    assert index.get_line(4) == "    x = 1  \u2028\x85"
+
+
+def test_context_from_ast():
+    """Test that context lookups return the innermost function and class."""
+    index = FileIndex(SOURCE)
+
+    contexts = [index.get_context(line) for line in (1, 5, 6, 8, 9, 11, 15, 17)]
+
+    assert contexts == [
+        (None, None),
+        ("run", "Service"),
+        ("run", "Service"),
+        ("helper", "Service"),
+        ("run", "Service"),
+        (None, "Service"),
+        ("fetch", None),
+        (None, None),
+    ]
+
+
+def test_context_of_unparsable_file():
+    """Test that files that do not parse fall back to indentation."""
+    index = FileIndex(SOURCE.replace("return 1", "return (1"))
+
+    assert index.get_context(8) == ("helper", "Service")
+    assert index.get_context(11) == (None, "Service")
+    assert index.get_context(15) == ("fetch", None)
+
+
+def test_each_file_read_once(tmp_path):
+    """Test that all issues of both tools share one read per file."""
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    flake8_output = "\n".join(f"{path}:{line}:1: E501 line too long" for line in range(1, 18))
+    ruff_output = json.dumps(
+        [
+            {
+                "code": "F841",
+                "message": "unused",
+                "filename": str(path),
+                "location": {"row": 8, "column": 13},
+            }
+        ]
+    )
+    runs = {
+        "flake8": type("Result", (), {"stdout": flake8_output, "returncode": 1})(),
+        "ruff": type("Result", (), {"stdout": ruff_output, "returncode": 1})(),
+    }
+
+    def fake_run(cmd, **_kwargs):
+        return runs["ruff" if cmd[0] == "ruff" else "flake8"]
+
+    with (
+        patch("codeflow_engine.actions.ai_linting_fixer.detection.subprocess.run", fake_run),
+        patch.object(FileIndex, "__init__", autospec=True, side_effect=FileIndex.__init__) as init,
+    ):
+        issues = IssueDetector().detect_issues(str(tmp_path), tools=["flake8", "ruff"])
+
+    assert init.call_count == 1
+    assert len(issues) == 18
+    assert issues[7].line_content == "            return 1"
+    assert (issues[7].function_name, issues[7].class_name) == ("helper", "Service")
+    assert (issues[-1].function_name, issues[-1].class_name) == ("helper", "Service")
+
+
+def test_missing_file():
+    """Test that unreadable files yield empty content and no context."""
+    cache = FileIndexCache()
+
+    assert Flake8Parser()._get_line_content("missing.py", 1, cache) == ""
+    assert Flake8Parser()._extract_context("missing.py", 1, cache) == (None, None)
+    assert RuffParser()._get_line_content("missing.py", 1, cache) == ""
+    assert len(cache) == 1
@@ -0,0 +1,150 @@
+"""
+Tests for the persistent cache of AI fixes.
+"""
+
+import json
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer.ai_agent_manager import AIAgentManager
+from codeflow_engine.actions.ai_linting_fixer.context_extractor import CodeRegion
+from codeflow_engine.actions.ai_linting_fixer.error_handler import ErrorHandler
+from codeflow_engine.actions.ai_linting_fixer.file_manager import FileManager
+from codeflow_engine.actions.ai_linting_fixer.fix_cache import AIFixCache
+from codeflow_engine.actions.ai_linting_fixer.issue_fixer import IssueFixer
+from codeflow_engine.actions.ai_linting_fixer.models import LintingIssue
+
+
+MODULE = """import os
+
+
+def compute():
+    unused = os.getcwd()
+    return 1
+"""
+
+# The same function nested in a class, further down a different file
+NESTED = """import os
+
+VALUE = 2
+
+
+class Holder:
+    def compute():
+        unused = os.getcwd()
+        return 1
+"""
+
+
+class PatchLLM:
+    """LLM manager stand-in deleting the reported line."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def complete(self, payload):
+        self.requests += 1
+        prompt = payload["messages"][1]["content"]
+        line = int(prompt.split("- Line ", 1)[1].split(" ", 1)[0])
+        return {"content": json.dumps({"start_line": line, "end_line": line, "replacement": ""})}
+
+
+class RecordingValidator:
+    """Validation manager stand-in recording calls."""
+
+    def __init__(self, keep=True):
+        self.keep = keep
+        self.calls = []
+
+    def validate_file_fix(self, file_path, original_content, fixed_content, issue_codes):
+        self.calls.append((file_path, issue_codes))
+        return self.keep, []
+
+
+def _issue(content, line):
+    return LintingIssue(
+        file_path="module.py",
+        line_number=line,
+        column_number=0,
+        error_code="F841",
+        message="Local variable `unused` is assigned to but never used",
+        line_content=content.split("\n")[line - 1],
+    )
+
+
+def _fixer(llm, cache, validator):
+    return IssueFixer(
+        AIAgentManager(llm),
+        FileManager(),
+        ErrorHandler(),
+        fix_cache=cache,
+        validation_manager=validator,
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AIFixCache(str(tmp_path / "interactions.db"))
+
+
+def test_hit_skips_llm_and_is_validated(cache):
+    """Test that a fix for the same snippet is reused without an LLM call."""
+    llm = PatchLLM()
+    validator = RecordingValidator()
+
+    first = _fixer(llm, cache, validator).fix_single_issue("a.py", MODULE, _issue(MODULE, 5))
+    second = _fixer(llm, cache, validator).fix_single_issue("b.py", NESTED, _issue(NESTED, 8))
+
+    assert first["success"] and second["success"]
+    assert second["cached"]
+    assert llm.requests == 1
+    assert "unused" not in second["content"]
+    assert "    def compute():\n        return 1" in second["content"]
+    assert validator.calls == [("b.py", ["F841"])]
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_rejected_hit_falls_back_to_llm(cache):
+    """Test that a cached fix failing validation is dropped and refetched."""
+    llm = PatchLLM()
+    _fixer(llm, cache, RecordingValidator()).fix_single_issue("a.py", MODULE, _issue(MODULE, 5))
+
+    result = _fixer(llm, cache, RecordingValidator(keep=False)).fix_single_issue(
+        "a.py", MODULE, _issue(MODULE, 5)
+    )
+
+    assert result["success"] and not result.get("cached")
+    assert llm.requests == 2
+    assert cache.get_stats()["rejected"] == 1
+
+
+def test_different_model_misses(cache):
+    """Test that fixes are not shared between models."""
+    llm = PatchLLM()
+    fixer = _fixer(llm, cache, RecordingValidator())
+    fixer.fix_single_issue("a.py", MODULE, _issue(MODULE, 5), model="model-a")
+    fixer.fix_single_issue("a.py", MODULE, _issue(MODULE, 5), model="model-b")
+
+    assert llm.requests == 2
+
+
+def test_eviction(tmp_path):
+    """Test that expired and least recently used entries are evicted."""
+    cache = AIFixCache(str(tmp_path / "interactions.db"), max_entries=10)
+    region = CodeRegion(start_line=1, end_line=1, text="x = 1", scope="lines")
+    patch = {"start_line": 1, "end_line": 1, "replacement": "x = 2"}
+    for key in range(10):
+        cache.put(f"key-{key}", region, patch, "F841", "agent", "model")
+    cache.get("key-0", region)
+
+    cache.put("key-10", region, patch, "F841", "agent", "model")
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 9
+    assert stats["evictions"] == 2
+    assert cache.get("key-0", region) is not None
+    assert cache.get("key-1", region) is None
+
+    cache.max_age_seconds = -1
+    assert cache.get("key-10", region) is None
@@ -0,0 +1,138 @@
+"""
+Tests for the concurrent per-file issue pipeline of AILintingFixer.
+"""
+
+import threading
+import time
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer.ai_linting_fixer import AILintingFixer
+from codeflow_engine.actions.ai_linting_fixer.detection import LintingIssue
+from codeflow_engine.actions.ai_linting_fixer.display import DisplayConfig, OutputMode
+from codeflow_engine.actions.ai_linting_fixer.models import AILintingFixerInputs
+
+
+class RecordingIssueFixer:
+    """Issue fixer stand-in tagging the reported line, with a simulated LLM delay."""
+
+    def __init__(self, delay=0.05, fail_codes=()):
+        self.delay = delay
+        self.fail_codes = set(fail_codes)
+        self.active = 0
+        self.peak = 0
+        self.seen_content = []
+        self._lock = threading.Lock()
+
+    def fix_single_issue(self, file_path, content, issue, provider=None, model=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.seen_content.append((file_path, issue.line_number, content))
+        try:
+            time.sleep(self.delay)
+            if issue.error_code in self.fail_codes:
+                return {"success": False, "error": "model refused"}
+            lines = content.split("\n")
+            lines[issue.line_number - 1] += f"  # fixed {issue.error_code}"
+            return {"success": True, "content": "\n".join(lines), "confidence": 0.9}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class StaticDetector:
+    """Issue detector returning a fixed list of issues."""
+
+    def __init__(self, issues):
+        self.issues = issues
+
+    def detect_issues(self, _target_path):
+        return list(self.issues)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Create four source files with three issues each."""
+    monkeypatch.chdir(tmp_path)
+    issues = []
+    for file_index in range(4):
+        path = tmp_path / f"module_{file_index}.py"
+        path.write_text("a = 1\nb = 2\nc = 3\n", encoding="utf-8")
+        for line, code in ((1, "E501"), (2, "F401"), (3, "E722")):
+            issues.append(LintingIssue(str(path), line, 0, code, f"{code} message"))
+    return tmp_path, issues
+
+
+def _make_fixer(issues, issue_fixer):
+    fixer = AILintingFixer(DisplayConfig(mode=OutputMode.QUIET))
+    fixer.issue_detector = StaticDetector(issues)
+    fixer.issue_fixer = issue_fixer
+    fixer.llm_manager = object()
+    fixer.ai_agent_manager = object()
+    return fixer
+
+
+def _run(fixer, tmp_path, **overrides):
+    inputs = AILintingFixerInputs(
+        target_path=str(tmp_path),
+        fix_types=["E501", "F401", "E722"],
+        max_fixes=100,
+        create_backups=False,
+        quiet=True,
+        **overrides,
+    )
+    return fixer.run(inputs)
+
+
+def test_concurrent_matches_sequential(workspace):
+    """Test that concurrent processing produces the same files and counts."""
+    tmp_path, issues = workspace
+    sequential = _run(
+        _make_fixer(issues, RecordingIssueFixer(delay=0, fail_codes={"F401"})),
+        tmp_path,
+        max_workers=1,
+    )
+    sequential_files = {p.name: p.read_text() for p in tmp_path.glob("*.py")}
+
+    for path in tmp_path.glob("*.py"):
+        path.write_text("a = 1\nb = 2\nc = 3\n", encoding="utf-8")
+    concurrent = _run(
+        _make_fixer(issues, RecordingIssueFixer(delay=0, fail_codes={"F401"})),
+        tmp_path,
+        max_workers=4,
+    )
+
+    assert {p.name: p.read_text() for p in tmp_path.glob("*.py")} == sequential_files
+    assert concurrent.issues_fixed == sequential.issues_fixed == 8
+    assert concurrent.issues_failed == sequential.issues_failed == 4
+    assert sorted(concurrent.files_modified) == sorted(sequential.files_modified)
+
+
+def test_same_file_issues_applied_in_order(workspace):
+    """Test that each issue of a file sees the edits of the previous ones."""
+    tmp_path, issues = workspace
+    issue_fixer = RecordingIssueFixer(delay=0.01)
+    _run(_make_fixer(issues, issue_fixer), tmp_path, max_workers=4)
+
+    for path in tmp_path.glob("*.py"):
+        seen = [entry for entry in issue_fixer.seen_content if entry[0] == str(path)]
+        assert [line for _, line, _ in seen] == [1, 2, 3]
+        assert "# fixed E501" in seen[1][2]
+        assert "# fixed F401" in seen[2][2]
+        assert path.read_text().count("# fixed") == 3
+
+
+def test_llm_concurrency_limit(workspace):
+    """Test that files run concurrently but LLM requests stay within the limit."""
+    tmp_path, issues = workspace
+    issue_fixer = RecordingIssueFixer(delay=0.05)
+    _run(
+        _make_fixer(issues, issue_fixer),
+        tmp_path,
+        max_workers=4,
+        max_concurrent_llm_requests=2,
+    )
+
+    # Requests overlapped, but never more than the limit
+    assert issue_fixer.peak == 2
@@ -0,0 +1,159 @@
+"""
+Tests for batching the issues of one file into a single LLM fix request.
+"""
+
+import json
+import re
+
+from codeflow_engine.actions.ai_linting_fixer.ai_agent_manager import AIAgentManager
+from codeflow_engine.actions.ai_linting_fixer.error_handler import ErrorHandler
+from codeflow_engine.actions.ai_linting_fixer.file_manager import FileManager
+from codeflow_engine.actions.ai_linting_fixer.issue_fixer import (
+    BATCH_PROMPT_OVERHEAD_CHARS,
+    BATCH_TOKEN_BUDGET,
+    CHARS_PER_TOKEN,
+    IssueFixer,
+)
+from codeflow_engine.actions.ai_linting_fixer.models import LintingIssue
+
+
+SOURCE = """import os
+import sys
+
+
+def main():
+    value = 1
+    other = 2
+    return 0
+"""
+
+
+class ScriptedLLM:
+    """LLM manager stand-in answering batch and single-issue prompts."""
+
+    def __init__(self, skip_lines=(), split_lines=(), invalid_batch=False):
+        self.skip_lines = set(skip_lines)
+        self.split_lines = set(split_lines)
+        self.invalid_batch = invalid_batch
+        self.requests = []
+
+    def complete(self, payload):
+        prompt = payload["messages"][1]["content"]
+        self.requests.append(prompt)
+        code = prompt.split("```python\n", 1)[1].split("\n```", 1)[0].split("\n")
+
+        if "Respond with JSON only" in prompt:
+            fixes = []
+            for line in map(int, re.findall(r"- Line (\d+) \[", prompt)):
+                if line in self.skip_lines:
+                    continue
+                fixed = f"{code[line - 1].strip()}  # batch"
+                if self.invalid_batch:
+                    fixed = "def broken(:"
+                elif line in self.split_lines:
+                    fixed = f"# note\n{fixed}"
+                fixes.append({"line_number": line, "fixed_code": fixed})
+            return {"content": json.dumps({"fixes": fixes})}
+
+        line = int(re.search(r"- Line (\d+) \[", prompt).group(1))
+        region = dict(re.findall(r"^ *(\d+)\| (.*)$", prompt, re.MULTILINE))
+        fixed = f"{region[str(line)]}  # single"
+        return {
+            "content": json.dumps(
+                {"start_line": line, "end_line": line, "replacement": fixed}
+            )
+        }
+
+
+def _issue(line, code="E501"):
+    return LintingIssue(
+        file_path="module.py",
+        line_number=line,
+        column_number=0,
+        error_code=code,
+        message=f"{code} on line {line}",
+        line_content=SOURCE.split("\n")[line - 1],
+    )
+
+
+def _fixer(llm):
+    return IssueFixer(
+        AIAgentManager(llm),
+        FileManager(),
+        ErrorHandler(),
+        batch_fixes=True,
+    )
+
+
+def test_issues_share_one_request():
+    """Test that compatible issues of a file are fixed by one request."""
+    llm = ScriptedLLM()
+    result = _fixer(llm).fix_issues_batched("module.py", SOURCE, [_issue(6), _issue(7)])
+
+    assert result["outcomes"] == [True, True]
+    assert result["requests"] == len(llm.requests) == 1
+    assert "    value = 1  # batch" in result["content"]
+    assert "    other = 2  # batch" in result["content"]
+
+
+def test_partial_failure_falls_back_per_issue():
+    """Test that issues the batch leaves unfixed get individual requests."""
+    llm = ScriptedLLM(skip_lines={7}, split_lines={6})
+    result = _fixer(llm).fix_issues_batched(
+        "module.py", SOURCE, [_issue(6), _issue(7), _issue(8)]
+    )
+
+    assert result["outcomes"] == [True, True, True]
+    assert result["requests"] == 2
+    lines = result["content"].split("\n")
+    assert lines[5:9] == [
+        "    # note",
+        "    value = 1  # batch",
+        "    other = 2  # single",
+        "    return 0  # batch",
+    ]
+    # The fallback prompt used the line number shifted by the inserted comment
+    assert "- Line 8 [" in llm.requests[1]
+
+
+def test_invalid_batch_discarded():
+    """Test that a batch producing a syntax error is replaced by single fixes."""
+    llm = ScriptedLLM(invalid_batch=True)
+    result = _fixer(llm).fix_issues_batched("module.py", SOURCE, [_issue(6), _issue(7)])
+
+    assert result["outcomes"] == [True, True]
+    assert result["requests"] == 3
+    assert "broken" not in result["content"]
+
+
+def test_batches_split_by_specialist_and_budget(monkeypatch):
+    """Test that batches never mix specialists and respect the token budget."""
+    fixer = _fixer(ScriptedLLM())
+    monkeypatch.setattr(
+        fixer.ai_agent_manager,
+        "select_agent_for_issues",
+        lambda issues: f"agent-{issues[0].error_code}",
+    )
+    issues = [_issue(1, "F401"), _issue(2, "F401"), _issue(6), _issue(7)]
+
+    batches = fixer.plan_issue_batches(issues)
+    assert [[i.line_number for i in batch] for batch in batches] == [[1, 2], [6, 7]]
+
+    fixer.batch_token_budget = (BATCH_PROMPT_OVERHEAD_CHARS + 150) // CHARS_PER_TOKEN
+    batches = fixer.plan_issue_batches(issues)
+    assert all(len(batch) == 1 for batch in batches)
+
+
+def test_file_larger_than_budget_still_batches():
+    """Test that the file size does not count toward the batch budget."""
+    padding = "\n".join(f"PADDING_{i} = {i}" for i in range(4000))
+    content = f"{SOURCE}{padding}\n"
+    assert len(content) > BATCH_TOKEN_BUDGET * CHARS_PER_TOKEN
+    llm = ScriptedLLM()
+    fixer = _fixer(llm)
+
+    assert len(fixer.plan_issue_batches([_issue(6), _issue(7)])) == 1
+
+    result = fixer.fix_issues_batched("module.py", content, [_issue(6), _issue(7)])
+    assert result["outcomes"] == [True, True]
+    assert result["requests"] == 1
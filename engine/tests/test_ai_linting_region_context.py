@@ -0,0 +1,147 @@
+"""
+Tests for region-scoped fix prompts and line-range patch application.
+"""
+
+import json
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer.ai_agent_manager import AIAgentManager
+from codeflow_engine.actions.ai_linting_fixer.context_extractor import ContextExtractor
+from codeflow_engine.actions.ai_linting_fixer.error_handler import ErrorHandler
+from codeflow_engine.actions.ai_linting_fixer.file_manager import FileManager
+from codeflow_engine.actions.ai_linting_fixer.issue_fixer import IssueFixer
+from codeflow_engine.actions.ai_linting_fixer.models import LintingIssue
+
+
+SOURCE = '''"""Module docstring."""
+
+import os
+import sys
+
+CONSTANT = 1
+
+
+def unrelated():
+    return os.getcwd()
+
+
+class Service:
+    """A service."""
+
+    @staticmethod
+    def run():
+        unused = 1
+        try:
+            return sys.argv
+        except:
+            return []
+'''
+
+
+def _issue(line, code, **context):
+    return LintingIssue(
+        file_path="module.py",
+        line_number=line,
+        column_number=0,
+        error_code=code,
+        message=f"{code} message",
+        line_content=SOURCE.split("\n")[line - 1],
+        **context,
+    )
+
+
+class PatchLLM:
+    """LLM manager stand-in returning a fixed patch."""
+
+    def __init__(self, patch):
+        self.patch = patch
+        self.prompts = []
+
+    def complete(self, payload):
+        self.prompts.append(payload["messages"][1]["content"])
+        return {"content": json.dumps(self.patch)}
+
+
+def _fixer(llm):
+    return IssueFixer(AIAgentManager(llm), FileManager(), ErrorHandler())
+
+
+class TestContextExtractor:
+    """Test suite for region selection."""
+
+    def test_function_scope_with_imports(self):
+        """Test that function-level codes get the innermost scope and the imports."""
+        region = ContextExtractor().extract(SOURCE, _issue(18, "F841"))
+
+        assert (region.scope, region.name) == ("function", "run")
+        assert (region.start_line, region.end_line) == (16, 22)
+        assert region.text.startswith("    @staticmethod")
+        assert region.imports == "import os\nimport sys"
+
+    def test_import_scope(self):
+        """Test that import codes get the imports block only."""
+        region = ContextExtractor().extract(SOURCE, _issue(3, "F401"))
+
+        assert region.scope == "imports"
+        assert (region.start_line, region.end_line) == (3, 4)
+        assert region.imports == ""
+
+    def test_line_scope(self):
+        """Test that line-level codes get a small window without imports."""
+        region = ContextExtractor(line_window=1).extract(SOURCE, _issue(10, "E501"))
+
+        assert region.scope == "lines"
+        assert (region.start_line, region.end_line) == (9, 11)
+        assert region.imports == ""
+
+    def test_large_scope_narrowed(self):
+        """Test that scopes over the size limit fall back to the enclosing class or a window."""
+        extractor = ContextExtractor(max_region_lines=6)
+        region = extractor.extract(SOURCE, _issue(18, "F841"))
+
+        assert region.scope == "lines"
+        assert (region.start_line, region.end_line) == (17, 19)
+
+    def test_unparsable_file_uses_issue_context(self):
+        """Test that the captured function name locates the scope of a broken file."""
+        broken = SOURCE.replace("return sys.argv", "return sys.argv(")
+        issue = _issue(18, "F841", function_name="run", class_name="Service")
+
+        region = ContextExtractor().extract(broken, issue)
+
+        assert (region.scope, region.name) == ("function", "run")
+        assert (region.start_line, region.end_line) == (17, 22)
+
+
+class TestRegionPatches:
+    """Test suite for patch-based fixes."""
+
+    def test_patch_applied_to_region(self):
+        """Test that only the region is sent and the patch replaces its lines."""
+        llm = PatchLLM({"start_line": 18, "end_line": 18, "replacement": ""})
+        result = _fixer(llm).fix_single_issue("module.py", SOURCE, _issue(18, "F841"))
+
+        assert result["success"]
+        expected = SOURCE.split("\n")
+        del expected[17]
+        assert result["content"] == "\n".join(expected)
+        assert "unrelated" not in llm.prompts[0]
+        assert "18|         unused = 1" in llm.prompts[0]
+
+    @pytest.mark.parametrize(
+        ("patch", "error"),
+        [
+            ({"start_line": 9, "end_line": 10, "replacement": "pass"}, "outside the region"),
+            ({"start_line": 19, "end_line": 19, "replacement": "        try"}, "invalid syntax"),
+            ({"start_line": 18, "end_line": "x", "replacement": ""}, "Malformed patch"),
+        ],
+    )
+    def test_bad_patch_rejected(self, patch, error):
+        """Test that patches outside the region or breaking the file are rejected."""
+        result = _fixer(PatchLLM(patch)).fix_single_issue(
+            "module.py", SOURCE, _issue(18, "F841")
+        )
+
+        assert not result["success"]
+        assert error in result["error"]
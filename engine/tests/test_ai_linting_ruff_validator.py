@@ -0,0 +1,106 @@
+"""
+Tests for batched, cached ruff checks used by fix validation.
+"""
+
+import json
+from pathlib import Path
+import sys
+
+from codeflow_engine.actions.ai_linting_fixer.ruff_validator import RuffValidator
+from codeflow_engine.actions.ai_linting_fixer.validation_manager import (
+    ValidationConfig,
+    ValidationManager,
+    ValidationResult,
+)
+
+
+# Stand-in for ruff: reports E501 for lines containing "long" and F401 for
+# lines starting with "import", and logs each invocation
+FAKE_RUFF = """
+import json, pathlib, sys
+
+args = sys.argv[1:]
+pathlib.Path(sys.argv[0]).with_suffix(".log").open("a").write(json.dumps(args) + "\\n")
+if "--stdin-filename" in args:
+    sources = [(args[args.index("--stdin-filename") + 1], sys.stdin.read())]
+else:
+    sources = [(str(p), p.read_text()) for p in sorted(pathlib.Path(args[-1]).glob("*.py"))]
+items = []
+for filename, text in sources:
+    for row, line in enumerate(text.splitlines(), 1):
+        if "long" in line:
+            items.append({"filename": filename, "code": "E501", "location": {"row": row}})
+        if line.startswith("import"):
+            items.append({"filename": filename, "code": "F401", "location": {"row": row}})
+print(json.dumps(items))
+sys.exit(1 if items else 0)
+"""
+
+
+def _validator(tmp_path):
+    script = tmp_path / "fake_ruff.py"
+    script.write_text(FAKE_RUFF, encoding="utf-8")
+    return RuffValidator(ruff_command=(sys.executable, str(script)))
+
+
+def _invocations(tmp_path):
+    log = Path(tmp_path / "fake_ruff.log")
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+def test_single_content_uses_stdin_and_cache(tmp_path):
+    """Test that one content is piped over stdin and linted only once."""
+    validator = _validator(tmp_path)
+
+    first = validator.get_issue_codes("import os\nx = 'long'\n")
+    second = validator.get_issue_codes("import os\nx = 'long'\n")
+
+    assert first == second == ["F401", "E501"]
+    calls = _invocations(tmp_path)
+    assert len(calls) == 1
+    assert "--stdin-filename" in calls[0]
+    assert validator.stats == {"hits": 1, "misses": 1, "invocations": 1}
+
+
+def test_batch_uses_one_invocation(tmp_path):
+    """Test that many contents are linted in a single run, deduplicated."""
+    validator = _validator(tmp_path)
+    contents = [f"x = {index}\n" + "long\n" * index for index in range(5)]
+
+    results = validator.get_issue_codes_batch([*contents, contents[2]])
+
+    assert [len(codes) for codes in results] == [0, 1, 2, 3, 4, 2]
+    assert len(_invocations(tmp_path)) == 1
+    assert validator.get_issue_codes_batch(contents[:3]) == results[:3]
+    assert len(_invocations(tmp_path)) == 1
+
+
+def test_failed_run_is_not_cached(tmp_path):
+    """Test that a missing ruff yields no issues and is retried later."""
+    validator = RuffValidator(ruff_command=(str(tmp_path / "missing-ruff"),))
+
+    assert validator.get_issue_codes("import os\n") == []
+    assert validator.get_issue_codes("import os\n") == []
+    assert validator.stats["invocations"] == 2
+
+
+def test_validation_manager_batches_fixes(tmp_path):
+    """Test that validating many fixes spawns ruff once."""
+    validator = _validator(tmp_path)
+    manager = ValidationManager(
+        ValidationConfig(enable_test_validation=False, enable_import_validation=False),
+        ruff_validator=validator,
+    )
+    fixes = [
+        (f"module_{index}.py", f"import os\nx = {index}\n", f"x = {index}\n", ["F401"])
+        for index in range(10)
+    ]
+
+    results = manager.validate_file_fixes(fixes)
+
+    assert all(keep for keep, _ in results)
+    assert all(checks[-1].result == ValidationResult.PASSED for _, checks in results)
+    assert len(_invocations(tmp_path)) == 1
+    assert manager.get_validation_stats()["ruff_checks"]["misses"] == 20
@@ -0,0 +1,137 @@
+"""
+Tests for the sharded IntelligentCache.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import time
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer.performance_optimizer import (
+    IntelligentCache,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def test_entries_expire_without_full_scans(monkeypatch):
+    cache = IntelligentCache(max_entries=100)
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+    cache.set("short", "value", ttl_seconds=1)
+    cache.set("long", "value", ttl_seconds=60)
+    assert cache.get("short") == "value"
+
+    clock[0] += 2
+    assert cache.get("short") is None
+    assert cache.get("long") == "value"
+    cache._cleanup_expired()
+    assert cache.current_entries == 1
+
+
+def test_overwritten_keys_do_not_grow_the_expiry_heap():
+    cache = IntelligentCache(max_entries=100, num_shards=1)
+
+    for index in range(10_000):
+        cache.set("key", index)
+
+    assert cache.get("key") == 9999
+    assert len(cache._shards[0].expiry_heap) < 200
+
+
+def test_lru_eviction_by_entries_and_size():
+    cache = IntelligentCache(max_entries=3, num_shards=1)
+    for key in "abc":
+        cache.set(key, key)
+    cache.get("a")
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["a", "c", "d"]
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_large_text_and_bytes_are_compressed():
+    cache = IntelligentCache(max_entries=100)
+    text = "def function():\n    return 1\n" * 1000
+    data = text.encode()
+
+    cache.set("text", text)
+    cache.set("data", data)
+
+    assert cache.get("text") == text
+    assert cache.get("data") == data
+    assert cache.current_size_bytes < len(data) // 4
+
+
+def test_compression_can_be_disabled():
+    cache = IntelligentCache(max_entries=100, enable_compression=False)
+    text = "x" * 100_000
+
+    cache.set("text", text)
+
+    assert cache.get("text") is text
+    assert cache.current_size_bytes >= len(text)
+
+
+def test_size_estimate_is_deterministic_and_bounded():
+    cache = IntelligentCache()
+    nested = {"lines": [f"line {i}" for i in range(100_000)], "score": 1.5}
+
+    start = time.perf_counter()
+    size = cache._estimate_size(nested)
+    elapsed = time.perf_counter() - start
+
+    assert size == cache._estimate_size(nested)
+    assert size > 0
+    assert elapsed < 0.05
+
+
+def test_parallel_access_across_shards():
+    cache = IntelligentCache(max_entries=100_000)
+
+    def work(worker):
+        for index in range(2000):
+            cache.set(f"{worker}:{index}", index)
+            assert cache.get(f"{worker}:{index}") == index
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+
+    stats = cache.get_stats()
+    assert stats["current_entries"] == 16_000
+    assert stats["hits"] == 16_000
+    assert stats["shards"] == 16
+
+
+@pytest.mark.skipif(
+    not os.environ.get("CODEFLOW_TEST_BENCHMARKS"),
+    reason="set CODEFLOW_TEST_BENCHMARKS=1 to run benchmarks",
+)
+def test_benchmark_100k_entries():
+    """Benchmark: set and get throughput for 100k entries."""
+    cache = IntelligentCache(max_entries=100_000)
+    keys = [f"analysis:{index}" for index in range(100_000)]
+    value = {"complexity_score": 3.5, "total_lines": 120}
+
+    start = time.perf_counter()
+    for key in keys:
+        cache.set(key, value)
+    set_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hits = sum(cache.get(key) is not None for key in keys)
+    get_time = time.perf_counter() - start
+
+    logger.info(
+        "set: %.0f entries/s, get: %.0f entries/s",
+        100_000 / set_time,
+        100_000 / get_time,
+    )
+    assert hits == 100_000
+    # A full expiry scan on every read made this quadratic
+    assert get_time < 5
@@ -0,0 +1,149 @@
+"""
+Tests for memory-mapped processing of large files.
+"""
+
+import tempfile
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer import performance_optimizer
+from codeflow_engine.actions.ai_linting_fixer.performance_optimizer import (
+    MemoryMappedFileProcessor,
+    ParallelProcessor,
+    PerformanceOptimizer,
+    read_chunk,
+)
+
+
+CONTENT = "".join(f"value_{i} = 'héllo wörld ✓ {i}'\n" for i in range(500))
+
+
+def make_processor(chunk_size):
+    processor = MemoryMappedFileProcessor()
+    processor.chunk_size = chunk_size
+    return processor
+
+
+def test_chunk_offsets_are_line_aligned_and_cover_the_file():
+    data = CONTENT.encode("utf-8")
+
+    offsets = make_processor(100).chunk_offsets(data)
+
+    assert offsets[0][0] == 0
+    assert offsets[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(offsets, offsets[1:]))
+    assert all(data[end - 1 : end] == b"\n" for _, end in offsets)
+    decoded = "".join(data[start:end].decode("utf-8") for start, end in offsets)
+    assert decoded == CONTENT
+
+
+def test_lines_longer_than_a_chunk_stay_whole():
+    data = b"short\n" + b"x" * 300 + b"\nend"
+
+    offsets = make_processor(100).chunk_offsets(data)
+
+    assert [data[start:end] for start, end in offsets] == [
+        b"short\n",
+        b"x" * 300 + b"\n",
+        b"end",
+    ]
+
+
+def test_process_large_file_hands_out_memoryviews(tmp_path):
+    path = tmp_path / "large.py"
+    path.write_text(CONTENT, encoding="utf-8")
+    seen = []
+
+    def process(chunk):
+        seen.append(type(chunk))
+        return str(chunk, "utf-8")
+
+    chunks = make_processor(512).process_large_file(
+        path, process, ParallelProcessor(max_workers=4)
+    )
+
+    assert "".join(chunks) == CONTENT
+    assert set(seen) == {memoryview}
+    offsets = make_processor(512).chunk_offsets(CONTENT.encode("utf-8"))
+    assert "".join(read_chunk(path, start, end) for start, end in offsets) == CONTENT
+
+
+def test_empty_file_has_no_chunks(tmp_path):
+    path = tmp_path / "empty.py"
+    path.write_bytes(b"")
+
+    assert make_processor(100).process_large_file(path, str) == []
+
+
+def test_large_file_path_maps_the_original_file(tmp_path, monkeypatch):
+    path = tmp_path / "large.py"
+    path.write_text(CONTENT, encoding="utf-8")
+    optimizer = PerformanceOptimizer(max_workers=2)
+    optimizer.memory_mapper = make_processor(1024)
+
+    def no_temp_files(*args, **kwargs):
+        raise AssertionError("content was copied to a temp file")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+    paths = set()
+
+    def count_lines(file_path, chunk):
+        paths.add(file_path)
+        return chunk.splitlines()
+
+    lines = optimizer._process_large_file(path, CONTENT, count_lines)
+
+    assert lines == CONTENT.splitlines()
+    assert paths == {path}
+
+
+def test_large_file_path_uses_content_when_file_differs(tmp_path):
+    path = tmp_path / "large.py"
+    path.write_text("stale\n", encoding="utf-8")
+    optimizer = PerformanceOptimizer(max_workers=2)
+    optimizer.memory_mapper = make_processor(1024)
+
+    lines = optimizer._process_large_file(
+        path, CONTENT, lambda file_path, chunk: chunk.splitlines()
+    )
+
+    assert lines == CONTENT.splitlines()
+
+
+def test_large_file_path_uses_content_when_same_size_file_differs(tmp_path, monkeypatch):
+    path = tmp_path / "large.py"
+    path.write_text(CONTENT.replace("value_1 ", "other_1 "), encoding="utf-8")
+    optimizer = PerformanceOptimizer(max_workers=2)
+    optimizer.memory_mapper = make_processor(1024)
+
+    def no_mapping(*args, **kwargs):
+        raise AssertionError("mapped a file that does not hold the content")
+
+    monkeypatch.setattr(optimizer.memory_mapper, "process_large_file", no_mapping)
+
+    lines = optimizer._process_large_file(
+        path, CONTENT, lambda file_path, chunk: chunk.splitlines()
+    )
+
+    assert lines == CONTENT.splitlines()
+
+
+def test_file_comparison_streams_multibyte_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(performance_optimizer, "ENCODE_SLICE_CHARS", 7)
+    path = tmp_path / "large.py"
+    path.write_text(CONTENT, encoding="utf-8")
+    size = len(CONTENT.encode("utf-8"))
+
+    assert performance_optimizer._utf8_size(CONTENT) == size
+    assert performance_optimizer._file_holds(path, CONTENT)
+    assert not performance_optimizer._file_holds(path, CONTENT[:-2] + "✓\n", size)
+    assert not performance_optimizer._file_holds(path, CONTENT[:-1])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 16])
+def test_tiny_chunks_still_split_on_lines(chunk_size):
+    data = CONTENT.encode("utf-8")[:2000]
+
+    offsets = make_processor(chunk_size).chunk_offsets(data)
+
+    assert all(data[start:end].count(b"\n") <= 1 for start, end in offsets)
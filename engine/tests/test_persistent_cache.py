@@ -0,0 +1,111 @@
+"""
+Tests for the persistent second tier of IntelligentCache.
+"""
+
+import time
+
+from codeflow_engine.actions.ai_linting_fixer.analyzers.complexity_analyzer import (
+    FileComplexityAnalyzer,
+)
+from codeflow_engine.actions.ai_linting_fixer.performance_optimizer import (
+    IntelligentCache,
+)
+from codeflow_engine.actions.ai_linting_fixer.persistent_cache import (
+    PersistentCacheTier,
+)
+
+
+CONTENT = "def compute():\n    if True:\n        return 1\n"
+
+
+def make_cache(cache_dir, **kwargs):
+    return IntelligentCache(persistent_tier=PersistentCacheTier(cache_dir, **kwargs))
+
+
+def test_values_survive_a_new_process_and_are_promoted(tmp_path):
+    first = make_cache(tmp_path)
+    first.set("analysis", {"score": 1.5, "lines": [1, 2]})
+    first.persistent_tier.close()
+
+    second = make_cache(tmp_path)
+    assert second.get("analysis") == {"score": 1.5, "lines": [1, 2]}
+    assert second.current_entries == 1
+    assert second.get("analysis") == {"score": 1.5, "lines": [1, 2]}
+
+    stats = second.get_stats()
+    assert stats["hits"] == 2
+    assert stats["persistent"]["hits"] == 1
+
+
+def test_unserializable_values_are_not_persisted(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("object", object())
+    cache.clear()
+
+    assert cache.get("object") is None
+    assert cache.persistent_tier.get_stats()["skipped"] == 1
+
+
+def test_disk_entries_outlive_the_memory_ttl(tmp_path, monkeypatch):
+    first = make_cache(tmp_path)
+    first.set("analysis", {"score": 1.5}, ttl_seconds=1800)
+    first.persistent_tier.close()
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 7 * 24 * 3600)
+    second = make_cache(tmp_path)
+
+    assert second.get("analysis") == {"score": 1.5}
+    assert second.get_stats()["persistent"]["hits"] == 1
+
+
+def test_tier_expiry_is_its_own(tmp_path, monkeypatch):
+    tier = PersistentCacheTier(tmp_path, default_ttl_seconds=60)
+    tier.set("default", "value")
+    tier.set("explicit", "value", ttl_seconds=3600)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert tier.get("default") is None
+    assert tier.get("explicit")[0] == "value"
+
+
+def test_size_budget_evicts_least_recently_used(tmp_path):
+    tier = PersistentCacheTier(tmp_path, max_size_mb=0.01)
+    value = "x" * 600
+    for index in range(30):
+        tier.set(f"key-{index}", value, ttl_seconds=60)
+
+    stats = tier.get_stats()
+    assert stats["evictions"] > 0
+    assert stats["size_mb"] <= 0.01
+    assert tier.get("key-29") is not None
+    assert tier.get("key-0") is None
+
+
+def test_invalidate_and_clear_reach_the_disk(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("complexity_analysis:a", 1)
+    cache.set("split_decision:a", 2)
+
+    cache.invalidate("complexity_analysis")
+    cache.clear()
+    assert cache.get("complexity_analysis:a") is None
+    assert cache.get("split_decision:a") == 2
+
+    cache.clear(include_persistent=True)
+    assert cache.get("split_decision:a") is None
+
+
+def test_complexity_analyzer_reuses_results_across_runs(tmp_path, monkeypatch):
+    FileComplexityAnalyzer(make_cache(tmp_path)).analyze_file_complexity("a.py", CONTENT)
+
+    def recompute(content):
+        raise AssertionError("recomputed")
+
+    analyzer = FileComplexityAnalyzer(make_cache(tmp_path))
+    monkeypatch.setattr(analyzer, "_perform_complexity_analysis", recompute)
+    # Same content under another path hits too
+    result = analyzer.analyze_file_complexity("b.py", CONTENT)
+
+    assert result["total_functions"] == 1
@@ -0,0 +1,88 @@
+"""
+Tests for the compact queue payload encoding.
+"""
+
+from datetime import UTC, datetime
+import json
+
+import pytest
+
+from codeflow_engine.actions.ai_linting_fixer import queue_codec
+from codeflow_engine.actions.ai_linting_fixer.queue_codec import QueueCodec
+from codeflow_engine.actions.ai_linting_fixer.redis_queue import (
+    ProcessingResult,
+    QueuedIssue,
+)
+
+
+def make_issue(**kwargs):
+    return QueuedIssue(
+        id="issue-1",
+        session_id="session",
+        file_path="package/module.py",
+        line_number=42,
+        column_number=4,
+        error_code="F841",
+        message="local variable 'unused' is assigned to but never used",
+        line_content="    unused = compute()",
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("use_msgpack", [True, False])
+def test_issue_round_trip(use_msgpack):
+    codec = QueueCodec(use_msgpack=use_msgpack)
+    # Timestamps are stored with millisecond precision
+    issue = make_issue(
+        created_at=datetime(2026, 1, 2, 3, 4, 5, 123000, tzinfo=UTC),
+        processing_started_at=datetime(2026, 1, 2, 3, 4, 6, tzinfo=UTC),
+    )
+
+    decoded = QueuedIssue.from_record(codec.loads(codec.dumps(issue.to_record())))
+
+    assert decoded == issue
+
+
+def test_encoding_is_smaller_than_json():
+    issue = make_issue()
+    legacy = json.dumps(issue.to_dict()).encode()
+
+    assert len(QueueCodec().dumps(issue.to_record())) < len(legacy) * 0.6
+
+
+def test_large_payloads_are_compressed():
+    codec = QueueCodec(compression_threshold=256)
+    content = "x = 1\n" * 1000
+
+    body_hash, encoded = codec.dumps_body(content)
+
+    assert len(encoded) < 200
+    assert encoded[queue_codec.HEADER_SIZE - 1] >> 4 != queue_codec.COMPRESSION_NONE
+    assert codec.loads_body(encoded) == content
+    assert body_hash == codec.dumps_body(content)[0]
+
+
+def test_small_payloads_are_not_compressed():
+    codec = QueueCodec(compression_threshold=256)
+
+    encoded = codec.dumps([1, 2, 3])
+
+    assert encoded[queue_codec.HEADER_SIZE - 1] >> 4 == queue_codec.COMPRESSION_NONE
+
+
+def test_legacy_json_payloads_are_read():
+    issue = make_issue()
+    result = ProcessingResult("issue-1", success=True, fixed_content="fixed")
+
+    assert QueuedIssue.from_record(QueueCodec().loads(json.dumps(issue.to_dict()))) == issue
+    assert ProcessingResult.from_record(
+        QueueCodec().loads(json.dumps(result.to_dict()))
+    ) == result
+
+
+def test_newer_format_versions_are_rejected():
+    encoded = bytearray(QueueCodec().dumps([1]))
+    encoded[len(queue_codec.MAGIC)] = queue_codec.FORMAT_VERSION + 1
+
+    with pytest.raises(ValueError, match="Unsupported queue payload version"):
+        QueueCodec().loads(bytes(encoded))
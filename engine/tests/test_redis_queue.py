@@ -0,0 +1,277 @@
+"""
+Tests for the Redis priority queue with visibility timeouts.
+
+Runs against fakeredis (with Lua support) when it is installed.
+"""
+
+import json
+import time
+
+import pytest
+
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from codeflow_engine.actions.ai_linting_fixer import redis_queue  # noqa: E402
+from codeflow_engine.actions.ai_linting_fixer.redis_queue import (  # noqa: E402
+    DistributedProcessor,
+    ProcessingResult,
+    QueuedIssue,
+    RedisQueueManager,
+)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def make_manager(monkeypatch, server):
+    monkeypatch.setattr(
+        redis_queue.redis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs),
+    )
+
+    def factory(**kwargs):
+        return RedisQueueManager(queue_prefix="test", **kwargs)
+
+    return factory
+
+
+def make_issue(issue_id, priority=5, **kwargs):
+    return QueuedIssue(
+        id=issue_id,
+        session_id="session",
+        file_path="module.py",
+        line_number=1,
+        column_number=0,
+        error_code="E501",
+        message="line too long",
+        priority=priority,
+        **kwargs,
+    )
+
+
+def test_single_and_batch_enqueue_share_one_queue(make_manager):
+    manager = make_manager()
+    assert manager.enqueue_issue(make_issue("single"))
+    assert manager.enqueue_issues([make_issue("a"), make_issue("b")]) == 2
+
+    assert manager.get_queue_length() == 3
+    claimed = manager.claim_issues(10)
+    assert sorted(issue.id for issue in claimed) == ["a", "b", "single"]
+    assert manager.get_queue_length() == 0
+
+
+def test_claims_by_priority_then_fifo(make_manager):
+    manager = make_manager()
+    manager.enqueue_issue(make_issue("normal-1"))
+    manager.enqueue_issue(make_issue("low", priority=1))
+    manager.enqueue_issue(make_issue("critical", priority=10))
+    time.sleep(0.005)
+    manager.enqueue_issue(make_issue("normal-2"))
+
+    assert [issue.id for issue in manager.peek_queue(10)] == [
+        "critical",
+        "normal-1",
+        "normal-2",
+        "low",
+    ]
+    assert [issue.id for issue in manager.claim_issues(2)] == ["critical", "normal-1"]
+    assert manager.dequeue_issue().id == "normal-2"
+
+
+def test_claim_is_exclusive_between_workers(make_manager):
+    first = make_manager(worker_id="first")
+    second = make_manager(worker_id="second")
+    first.enqueue_issues([make_issue(f"issue-{i}") for i in range(5)])
+
+    claimed_first = first.claim_issues(3)
+    claimed_second = second.claim_issues(3)
+
+    assert len(claimed_first) == 3
+    assert len(claimed_second) == 2
+    assert not {i.id for i in claimed_first} & {i.id for i in claimed_second}
+    assert all(issue.assigned_worker == "first" for issue in claimed_first)
+    assert first.get_queue_statistics()["processing_count"] == 5
+
+
+def test_complete_issue_stores_result_and_releases_claim(make_manager):
+    manager = make_manager()
+    manager.enqueue_issue(make_issue("done"))
+    issue = manager.dequeue_issue()
+
+    assert manager.complete_issue(issue.id, ProcessingResult(issue.id, success=True))
+
+    stats = manager.get_queue_statistics()
+    assert stats["processing_count"] == 0
+    assert stats["results_count"] == 1
+    assert manager.redis_client.hlen(manager.issues_key) == 0
+
+
+def test_fail_issue_requeues_with_lower_priority_then_fails(make_manager):
+    manager = make_manager()
+    manager.enqueue_issue(make_issue("flaky", max_retries=1))
+
+    issue = manager.dequeue_issue()
+    assert manager.fail_issue(issue, "boom")
+    retried = manager.dequeue_issue()
+    assert retried.retry_count == 1
+    assert retried.priority == 4
+
+    assert manager.fail_issue(retried, "boom again")
+    stats = manager.get_queue_statistics()
+    assert stats["pending_count"] == 0
+    assert stats["processing_count"] == 0
+    failed = manager.get_failed_issue("flaky")
+    assert failed["final_error"] == "boom again"
+    assert failed["retry_count"] == 1
+
+
+def test_expired_claims_are_requeued_on_next_claim(make_manager):
+    crashed = make_manager(worker_id="crashed", visibility_timeout=0.01)
+    healthy = make_manager(worker_id="healthy")
+    crashed.enqueue_issue(make_issue("orphan"))
+
+    assert crashed.claim_issues(1)
+    assert healthy.claim_issues(1) == []
+    time.sleep(0.02)
+
+    reclaimed = healthy.claim_issues(1)
+    assert [issue.id for issue in reclaimed] == ["orphan"]
+    assert reclaimed[0].retry_count == 1
+
+
+def test_cleanup_stale_processing_fails_exhausted_issues(make_manager):
+    manager = make_manager(visibility_timeout=0.01)
+    manager.enqueue_issues([make_issue("retry"), make_issue("exhausted", max_retries=0)])
+    manager.claim_issues(2)
+    time.sleep(0.02)
+
+    assert manager.cleanup_stale_processing() == 2
+    assert [issue.id for issue in manager.peek_queue()] == ["retry"]
+    failed = manager.get_failed_issue("exhausted")
+    assert failed["final_error"] == "Processing timeout"
+    assert failed["retry_count"] == 1
+
+
+def test_extend_claim_keeps_issue_invisible(make_manager):
+    manager = make_manager(visibility_timeout=0.05)
+    manager.enqueue_issue(make_issue("slow"))
+    manager.claim_issues(1)
+
+    assert manager.extend_claim("slow", visibility_timeout=60)
+    time.sleep(0.06)
+    assert manager.cleanup_stale_processing() == 0
+    assert not manager.extend_claim("unknown")
+
+
+def test_remove_issue_only_removes_pending(make_manager):
+    manager = make_manager()
+    manager.enqueue_issues([make_issue("keep"), make_issue("drop")])
+
+    assert manager.remove_issue("drop")
+    assert not manager.remove_issue("drop")
+    assert [issue.id for issue in manager.peek_queue()] == ["keep"]
+
+
+def test_distributed_processor_claims_in_batches(make_manager):
+    manager = make_manager()
+    manager.enqueue_issues([make_issue(f"issue-{i}") for i in range(5)])
+    seen = []
+
+    def process(issue):
+        seen.append(issue.id)
+        return ProcessingResult(issue.id, success=True)
+
+    processor = DistributedProcessor(manager, process, batch_size=3)
+    processor.start_processing(max_iterations=5)
+
+    assert len(seen) == 5
+    assert manager.get_queue_statistics()["results_count"] == 5
+
+
+def test_results_store_fixed_content_once(make_manager):
+    manager = make_manager()
+    manager.enqueue_issues([make_issue("a"), make_issue("b")])
+    fixed = "def compute():\n    return 1\n" * 100
+    for issue in manager.claim_issues(2):
+        manager.complete_issue(
+            issue.id, ProcessingResult(issue.id, success=True, fixed_content=fixed)
+        )
+
+    assert manager.redis_client.hlen(manager.bodies_key) == 1
+    result = manager.get_result("a")
+    assert result.fixed_content == fixed
+    assert result.success
+    assert result.processed_at is not None
+
+
+def test_legacy_json_items_are_still_processed(make_manager):
+    manager = make_manager(visibility_timeout=0.01)
+    legacy = make_issue("legacy", priority=8)
+    manager.redis_client.hset(manager.issues_key, "legacy", json.dumps(legacy.to_dict()))
+    manager.redis_client.zadd(manager.pending_queue, {"legacy": 0})
+    manager.redis_client.hset(
+        manager.results_queue,
+        "old",
+        json.dumps(ProcessingResult("old", success=True, fixed_content="x").to_dict()),
+    )
+
+    assert manager.claim_issues(1)[0].priority == 8
+    time.sleep(0.02)
+    reclaimed = manager.claim_issues(1)
+    assert reclaimed[0].id == "legacy"
+    assert reclaimed[0].retry_count == 1
+    assert manager.get_result("old").fixed_content == "x"
+
+
+def test_legacy_sorted_set_members_are_migrated(make_manager, server):
+    client = fakeredis.FakeRedis(server=server)
+    client.zadd(
+        "test:pending",
+        {json.dumps(make_issue(f"old{index}").to_dict()): 5000 + index for index in range(3)},
+    )
+
+    manager = make_manager()
+
+    assert manager.get_queue_length() == 3
+    claimed = manager.claim_issues(5)
+    assert sorted(issue.id for issue in claimed) == ["old0", "old1", "old2"]
+    assert manager.get_queue_length() == 0
+
+
+def test_legacy_list_and_processing_hash_are_migrated(make_manager, server):
+    client = fakeredis.FakeRedis(server=server)
+    for issue_id in ("first", "second"):
+        data = {**make_issue(issue_id).to_dict(), "timestamp": "2024-01-01T00:00:00"}
+        client.lpush("test:pending", json.dumps(data))
+    client.hset("test:processing", "stuck", json.dumps(make_issue("stuck").to_dict()))
+
+    manager = make_manager()
+
+    assert [issue.id for issue in manager.claim_issues(5)] == ["first", "second", "stuck"]
+    assert manager.get_queue_statistics()["processing_count"] == 3
+
+
+def test_legacy_members_added_after_startup_are_claimed(make_manager):
+    manager = make_manager()
+    legacy = make_issue("late", priority=8)
+    manager.redis_client.zadd(manager.pending_queue, {json.dumps(legacy.to_dict()): 0})
+
+    claimed = manager.claim_issues(1)
+
+    assert [issue.id for issue in claimed] == ["late"]
+    assert manager.complete_issue("late", ProcessingResult("late", success=True))
+    assert manager.get_queue_statistics()["processing_count"] == 0
+
+
+def test_ids_without_payload_are_logged(make_manager, caplog):
+    manager = make_manager()
+    manager.redis_client.zadd(manager.pending_queue, {"orphan": 0})
+
+    assert manager.claim_issues(1) == []
+    assert "orphan" in caplog.text
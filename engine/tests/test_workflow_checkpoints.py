@@ -0,0 +1,141 @@
+"""
+Tests for step-level checkpointing of workflow retries.
+"""
+
+import asyncio
+
+import pytest
+
+from codeflow_engine.config import CodeFlowConfig
+from codeflow_engine.workflows.base import YAMLWorkflow
+from codeflow_engine.workflows.checkpoints import (
+    InMemoryCheckpointStore,
+    SQLiteCheckpointStore,
+    StepCheckpointer,
+    bind_checkpointer,
+)
+from codeflow_engine.workflows.engine import WorkflowEngine
+
+
+class CountingWorkflow(YAMLWorkflow):
+    """YAML workflow counting step runs; the slow step hangs on its first run."""
+
+    def __init__(self):
+        super().__init__(
+            name="checkpointed",
+            yaml_config={
+                "steps": [
+                    {"name": "analyze"},
+                    {"name": "slow"},
+                ]
+            },
+        )
+        self.runs = {"analyze": 0, "slow": 0}
+
+    async def _execute_step(self, step, context):
+        name = step["name"]
+        self.runs[name] += 1
+        if name == "slow" and self.runs[name] == 1:
+            await asyncio.sleep(5)
+        return {f"{name}_done": True}
+
+
+@pytest.fixture
+def config():
+    """Create a configuration with a short timeout and no retry delay."""
+    config = CodeFlowConfig()
+    config.workflow_timeout = 0.3
+    config.workflow_retry_attempts = 2
+    config.workflow_retry_delay = 0
+    return config
+
+
+@pytest.mark.asyncio
+async def test_retry_resumes_from_failed_step(config):
+    """Test that a retried execution skips steps completed by earlier attempts."""
+    store = InMemoryCheckpointStore()
+    engine = WorkflowEngine(config, checkpoint_store=store)
+    await engine.start()
+    workflow = CountingWorkflow()
+    engine.register_workflow(workflow)
+
+    result = await engine.execute_workflow(
+        "checkpointed", {"workflow_name": "checkpointed"}, workflow_id="exec-1"
+    )
+
+    assert workflow.runs == {"analyze": 1, "slow": 2}
+    steps = {entry["step"]: entry for entry in result["steps"]}
+    assert steps["analyze"]["resumed"] is True
+    assert "resumed" not in steps["slow"]
+    assert result["final_context"]["analyze_done"] is True
+    # Checkpoints are dropped once the execution has finished
+    assert await store.load("exec-1") == {}
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_scoped_to_execution_id(config):
+    """Test that separate executions never share checkpoints."""
+    store = InMemoryCheckpointStore()
+    await store.save("other-exec", "analyze", {"analyze_done": "stale"})
+    engine = WorkflowEngine(config, checkpoint_store=store)
+    await engine.start()
+    workflow = CountingWorkflow()
+    workflow.runs["slow"] = 1  # never hang
+    engine.register_workflow(workflow)
+
+    result = await engine.execute_workflow(
+        "checkpointed", {"workflow_name": "checkpointed"}, workflow_id="exec-2"
+    )
+
+    assert workflow.runs["analyze"] == 1
+    assert result["final_context"]["analyze_done"] is True
+    assert await store.load("other-exec") == {"analyze": {"analyze_done": "stale"}}
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_repeated_step_names_checkpoint_separately():
+    """Test that repeated and colliding step names never share a checkpoint."""
+    store = InMemoryCheckpointStore()
+    workflow = YAMLWorkflow(
+        name="repeated",
+        yaml_config={
+            "steps": [
+                {"name": "lint", "type": "delay", "seconds": 0},
+                {"name": "lint", "type": "delay", "seconds": 0},
+                {"type": "delay", "seconds": 0},
+                {"name": "step_2", "type": "delay", "seconds": 0},
+            ]
+        },
+    )
+    bind_checkpointer(StepCheckpointer(store, "exec-4"))
+    try:
+        result = await workflow.execute({})
+    finally:
+        bind_checkpointer(None)
+
+    assert [entry["step"] for entry in result["steps"]] == [
+        "lint",
+        "lint",
+        "step_2",
+        "step_2",
+    ]
+    assert not any(entry.get("resumed") for entry in result["steps"])
+    assert len(await store.load("exec-4")) == 4
+
+
+@pytest.mark.asyncio
+async def test_sqlite_checkpoint_store_persists(tmp_path):
+    """Test that the SQLite store keeps checkpoints across store instances."""
+    db_path = tmp_path / "checkpoints.db"
+    store = SQLiteCheckpointStore(db_path)
+    checkpointer = StepCheckpointer(store, "exec-3")
+    await checkpointer.save("analyze", {"score": 0.9, "labels": ["bug"]})
+
+    reopened = StepCheckpointer(SQLiteCheckpointStore(db_path), "exec-3")
+    assert await reopened.get("analyze") == {"score": 0.9, "labels": ["bug"]}
+    assert await reopened.get("missing") is None
+
+    await store.clear("exec-3")
+    assert await store.load("exec-3") == {}
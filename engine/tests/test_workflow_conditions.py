@@ -3,7 +3,9 @@ Tests for workflow condition evaluation improvements.
 """
 import unittest
 import asyncio
+import timeit
 from codeflow_engine.workflows.base import YAMLWorkflow
+from codeflow_engine.workflows.conditions import compile_condition
 
 
 class TestWorkflowConditions(unittest.TestCase):
@@ -282,5 +284,90 @@ class TestParallelExecution(unittest.TestCase):
         self.assertEqual(result["completed"], 0)
 
 
+class TestCompiledConditions(unittest.TestCase):
+    """Test suite for compiled string conditions."""
+
+    def test_placeholder_comparison(self):
+        """Test that placeholders resolve to context values."""
+        condition = compile_condition("{score} > 0.5 and {status} == 'open'")
+
+        self.assertTrue(condition.evaluate({"score": 0.8, "status": "open"}))
+        self.assertFalse(condition.evaluate({"score": 0.2, "status": "open"}))
+        self.assertEqual(sorted(condition.referenced_keys), ["score", "status"])
+
+    def test_values_used_without_repr_round_trip(self):
+        """Test that non-literal values compare directly instead of via repr."""
+        labels = ("bug", "security")
+        condition = compile_condition("'bug' in {labels}")
+
+        self.assertTrue(condition.evaluate({"labels": labels}))
+
+    def test_compiled_once_per_expression(self):
+        """Test that identical expressions share one compiled condition."""
+        self.assertIs(
+            compile_condition("{count} >= 3"), compile_condition("{count} >= 3")
+        )
+
+    def test_unsafe_syntax_rejected(self):
+        """Test that calls and attribute access are rejected at compile time."""
+        for expression in [
+            "__import__('os').system('true')",
+            "{value}.__class__",
+            "[x for x in {items}]",
+            "bare_name == 1",
+        ]:
+            condition = compile_condition(expression)
+            self.assertFalse(condition.is_valid, expression)
+            with self.assertRaises(ValueError):
+                condition.evaluate({"value": 1, "items": []})
+
+    def test_invalid_or_missing_evaluates_false_in_step(self):
+        """Test that invalid expressions and missing keys evaluate to False."""
+        workflow = YAMLWorkflow(name="conditions", yaml_config={"steps": []})
+
+        self.assertFalse(workflow._evaluate_string_condition("{missing} == 1", {}))
+        self.assertFalse(workflow._evaluate_string_condition("${{ a.b }}", {}))
+
+    def test_conditions_compiled_at_registration(self):
+        """Test that step conditions, including nested ones, compile on load."""
+        compile_condition.cache_clear()
+        YAMLWorkflow(
+            name="precompiled",
+            yaml_config={
+                "steps": [
+                    {"type": "condition", "condition": "{a} == 1"},
+                    {
+                        "type": "parallel",
+                        "steps": [{"type": "condition", "condition": "{b} == 2"}],
+                    },
+                ]
+            },
+        )
+
+        self.assertEqual(compile_condition.cache_info().currsize, 2)
+
+    def test_cost_independent_of_context_size(self):
+        """Benchmark: evaluation cost does not grow with the context size."""
+        condition = "{score} > 0.5 and {status} == 'open'"
+        workflow = YAMLWorkflow(name="benchmark", yaml_config={"steps": []})
+        small = {"score": 0.8, "status": "open"}
+        large = {**{f"key_{i}": {"payload": "x" * 50} for i in range(5000)}, **small}
+
+        def best_of(context):
+            return min(
+                timeit.repeat(
+                    lambda: workflow._evaluate_string_condition(condition, context),
+                    number=200,
+                    repeat=5,
+                )
+            )
+
+        small_time = best_of(small)
+        large_time = best_of(large)
+
+        # Substituting every context key made this ~thousands of times slower
+        self.assertLess(large_time, small_time * 3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -10,7 +10,8 @@ import pytest
 import pytest_asyncio
 
 from codeflow_engine.config import CodeFlowConfig
-from codeflow_engine.exceptions import WorkflowError
+from codeflow_engine.exceptions import WorkflowError, WorkflowRejectedError
+from codeflow_engine.workflows.admission import AdmissionController
 from codeflow_engine.workflows.engine import WorkflowEngine
 from codeflow_engine.workflows.base import Workflow
 
@@ -311,5 +312,189 @@ async def test_metrics_accuracy_under_load(workflow_engine):
     assert metrics["average_execution_time"] < 1.0  # Should complete quickly
 
 
+@pytest.mark.asyncio
+async def test_process_event_runs_workflows_concurrently(workflow_engine):
+    """Test that matching workflows are fanned out concurrently per event."""
+    for i in range(5):
+        workflow = MockWorkflow(f"event-{i}", delay=0.2)
+        workflow.supported_events = ["pull_request"]
+        workflow_engine.register_workflow(workflow)
+
+    start = asyncio.get_running_loop().time()
+    result = await workflow_engine.process_event("pull_request", {"number": 1})
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert result["processed_workflows"] == 5
+    assert [r["workflow"] for r in result["results"]] == [
+        f"event-{i}" for i in range(5)
+    ]
+    assert all(r["status"] == "success" for r in result["results"])
+    # Five 0.2s workflows finish together instead of adding up to 1s
+    assert elapsed < 0.6
+
+
+@pytest.mark.asyncio
+async def test_process_event_respects_concurrency_cap(workflow_engine):
+    """Test that the per-event concurrency cap limits in-flight workflows."""
+    in_flight = 0
+    peak = 0
+
+    class TrackingWorkflow(MockWorkflow):
+        async def execute(self, context: dict) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await super().execute(context)
+            finally:
+                in_flight -= 1
+
+    for i in range(6):
+        workflow = TrackingWorkflow(f"capped-{i}", delay=0.05)
+        workflow.supported_events = ["push"]
+        workflow_engine.register_workflow(workflow)
+
+    result = await workflow_engine.process_event("push", {}, max_concurrency=2)
+
+    assert result["processed_workflows"] == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_process_event_failure_does_not_cancel_others(workflow_engine):
+    """Test that one failing workflow keeps its error entry without cancelling others."""
+    workflow_engine.config.workflow_retry_attempts = 1
+
+    class BrokenWorkflow(MockWorkflow):
+        async def execute(self, context: dict) -> dict:
+            raise RuntimeError("boom")
+
+    broken = BrokenWorkflow("broken")
+    broken.supported_events = ["issues"]
+    workflow_engine.register_workflow(broken)
+
+    healthy = MockWorkflow("healthy", delay=0.05)
+    healthy.supported_events = ["issues"]
+    workflow_engine.register_workflow(healthy)
+
+    result = await workflow_engine.process_event("issues", {})
+
+    by_name = {r["workflow"]: r for r in result["results"]}
+    assert by_name["broken"]["status"] == "error"
+    assert "boom" in by_name["broken"]["error"]
+    assert by_name["healthy"]["status"] == "success"
+    assert healthy.execute_count == 1
+
+
+@pytest.mark.asyncio
+async def test_process_event_sequential_mode(workflow_engine):
+    """Test that sequential mode still processes every matching workflow."""
+    for i in range(3):
+        workflow = MockWorkflow(f"sequential-{i}", delay=0.01)
+        workflow.supported_events = ["release"]
+        workflow_engine.register_workflow(workflow)
+
+    result = await workflow_engine.process_event("release", {}, concurrent=False)
+
+    assert result["processed_workflows"] == 3
+    assert all(r["status"] == "success" for r in result["results"])
+
+
+@pytest.mark.asyncio
+async def test_global_admission_limit_queues_excess(config):
+    """Test that executions beyond the global limit wait and report queue time."""
+    config.max_concurrent_workflows = 2
+    engine = WorkflowEngine(config)
+    await engine.start()
+    engine.register_workflow(MockWorkflow("limited", delay=0.1))
+
+    results = await asyncio.gather(
+        *(
+            engine.execute_workflow("limited", {"workflow_name": "limited"})
+            for _ in range(4)
+        )
+    )
+
+    assert all(r["status"] == "success" for r in results)
+    metrics = await engine.get_metrics()
+    assert metrics["admitted_executions"] == 4
+    assert metrics["max_queue_wait_time"] >= 0.09
+    assert metrics["average_queue_wait_time"] > 0
+    assert metrics["active_executions"] == 0
+    assert metrics["queue_depth"] == 0
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_admission_queue_sheds_load(config):
+    """Test that a full admission queue rejects new executions clearly."""
+    config.max_concurrent_workflows = 1
+    config.workflow_queue_depth = 1
+    engine = WorkflowEngine(config)
+    await engine.start()
+    engine.register_workflow(MockWorkflow("busy", delay=0.1))
+
+    results = await asyncio.gather(
+        *(engine.execute_workflow("busy", {"workflow_name": "busy"}) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    rejected = [r for r in results if isinstance(r, WorkflowRejectedError)]
+    assert len(rejected) == 1
+    assert rejected[0].error_code == "WORKFLOW_REJECTED"
+    assert "queue is full" in str(rejected[0])
+    metrics = await engine.get_metrics()
+    assert metrics["rejected_executions"] == 1
+    assert metrics["successful_executions"] == 2
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_per_workflow_limit_does_not_block_others(workflow_engine):
+    """Test that a per-workflow limit only throttles that workflow."""
+    slow = MockWorkflow("throttled", delay=0.1)
+    fast = MockWorkflow("unthrottled", delay=0.1)
+    workflow_engine.register_workflow(slow)
+    workflow_engine.register_workflow(fast)
+    workflow_engine.set_workflow_concurrency_limit("throttled", 1)
+
+    start = asyncio.get_running_loop().time()
+    await asyncio.gather(
+        *(
+            workflow_engine.execute_workflow(name, {"workflow_name": name})
+            for name in ["throttled", "throttled", "unthrottled", "unthrottled"]
+        )
+    )
+    elapsed = asyncio.get_running_loop().time() - start
+
+    # Two throttled runs serialize (~0.2s); unthrottled ones run alongside
+    assert 0.19 <= elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_admission_queue_priority_order():
+    """Test that queued executions are admitted by priority, then FIFO."""
+    controller = AdmissionController(max_concurrent=1, max_queue_depth=10)
+    await controller.acquire("holder")
+    admitted = []
+
+    async def wait_for_slot(name, priority):
+        await controller.acquire(name, priority)
+        admitted.append(name)
+        controller.release(name)
+
+    tasks = [
+        asyncio.create_task(wait_for_slot(name, priority))
+        for name, priority in [("low", 5), ("high", 0), ("low-2", 5), ("high-2", 0)]
+    ]
+    await asyncio.sleep(0)
+    assert controller.queue_depth == 4
+
+    controller.release("holder")
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["high", "high-2", "low", "low-2"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,147 @@
+"""
+Tests for persistent, indexed workflow execution history.
+"""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from codeflow_engine.config import CodeFlowConfig
+from codeflow_engine.workflows.base import YAMLWorkflow
+from codeflow_engine.workflows.engine import MAX_WORKFLOW_HISTORY, WorkflowEngine
+from codeflow_engine.workflows.history import SQLiteHistoryStore, history_store_from_config
+
+
+def _record(name, status="completed", timestamp=None, result=None):
+    return {
+        "execution_id": f"{name}-{status}",
+        "workflow_name": name,
+        "status": status,
+        "timestamp": (timestamp or datetime.now(UTC)).isoformat(),
+        "result": result or {"ok": True},
+    }
+
+
+async def _engine(history_store=None):
+    engine = WorkflowEngine(CodeFlowConfig(), history_store=history_store)
+    await engine.start()
+    for name in ("alpha", "beta"):
+        engine.register_workflow(YAMLWorkflow(name, {"steps": [{"name": "noop"}]}))
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_filters_and_paginates(tmp_path):
+    """Test indexed filtering and keyset pagination over the SQLite store."""
+    store = SQLiteHistoryStore(tmp_path / "history.db")
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    for i in range(10):
+        await store.append(
+            _record(
+                "alpha" if i % 2 else "beta",
+                "failed" if i % 3 == 0 else "completed",
+                timestamp=start + timedelta(minutes=i),
+            )
+        )
+
+    first = await store.query(workflow_name="alpha", limit=3)
+    second = await store.query(workflow_name="alpha", before=first[-1]["sequence"], limit=3)
+    sequences = [r["sequence"] for r in first + second]
+    assert sequences == sorted(sequences, reverse=True)
+    assert len(set(sequences)) == 5
+    assert all(r["workflow_name"] == "alpha" for r in first + second)
+    assert "result" not in first[0]
+
+    failed = await store.query(status="failed")
+    assert len(failed) == 4
+
+    window = await store.query(
+        since=start + timedelta(minutes=2), until=start + timedelta(minutes=5)
+    )
+    assert len(window) == 3
+
+    (latest,) = await store.query(limit=1, include_results=True)
+    assert latest["result"] == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_bounds_in_any_timezone_select_the_same_records(tmp_path):
+    """Test that aware and naive bounds are compared as UTC instants."""
+    store = SQLiteHistoryStore(tmp_path / "history.db")
+    engine = await _engine(store)
+    await engine.execute_workflow("alpha", {"workflow_name": "alpha"})
+    await engine.stop()
+
+    recorded = datetime.fromisoformat(engine.get_workflow_history()[0]["timestamp"])
+    assert recorded.tzinfo is not None
+
+    plus_two = timezone(timedelta(hours=2))
+    since_bounds = (
+        recorded - timedelta(minutes=1),
+        (recorded - timedelta(minutes=1)).astimezone(plus_two),
+        (recorded - timedelta(minutes=1)).replace(tzinfo=None),
+    )
+    for since in since_bounds:
+        assert len(engine.get_workflow_history(since=since)) == 1
+        assert len(await store.query(since=since)) == 1
+        assert engine.get_workflow_history(until=since) == []
+        assert await store.query(until=since) == []
+
+
+def test_history_store_comes_from_config(tmp_path):
+    """Test that the configured path enables the SQLite store and an empty one disables it."""
+    config = CodeFlowConfig(workflow_history_path=str(tmp_path / "history.db"))
+    store = history_store_from_config(config)
+
+    assert isinstance(store, SQLiteHistoryStore)
+    assert store.db_path == str(tmp_path / "history.db")
+    assert history_store_from_config(CodeFlowConfig(workflow_history_path="")) is None
+
+
+@pytest.mark.asyncio
+async def test_history_survives_restart(tmp_path):
+    """Test that history beyond the ring buffer is kept by the store across engines."""
+    db_path = tmp_path / "history.db"
+    engine = await _engine(SQLiteHistoryStore(db_path))
+    for _ in range(3):
+        await engine.execute_workflow("alpha", {"workflow_name": "alpha"})
+    await engine.execute_workflow("beta", {"workflow_name": "beta"})
+    await engine.stop()
+
+    restarted = await _engine(SQLiteHistoryStore(db_path))
+    assert restarted.get_workflow_history() == []
+
+    page = await restarted.query_workflow_history(limit=2, workflow_name="alpha")
+    assert len(page["executions"]) == 2
+    assert page["next_cursor"] is not None
+
+    rest = await restarted.query_workflow_history(
+        limit=2, workflow_name="alpha", cursor=page["next_cursor"]
+    )
+    assert len(rest["executions"]) == 1
+    assert rest["next_cursor"] is None
+
+    await restarted.execute_workflow("beta", {"workflow_name": "beta"})
+    newest = await restarted.query_workflow_history(limit=1)
+    (in_memory,) = restarted.get_workflow_history()
+    assert newest["executions"][0]["sequence"] == in_memory["sequence"] == 5
+    await restarted.stop()
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_is_bounded_and_filterable():
+    """Test the in-memory fast path without a store."""
+    engine = await _engine()
+    assert engine.workflow_history.maxlen == MAX_WORKFLOW_HISTORY
+
+    for name in ("alpha", "beta", "alpha"):
+        await engine.execute_workflow(name, {"workflow_name": name})
+
+    alpha = engine.get_workflow_history(workflow_name="alpha")
+    assert [r["sequence"] for r in alpha] == [1, 3]
+    assert engine.get_workflow_history(before=3, workflow_name="alpha")[0]["sequence"] == 1
+
+    page = await engine.query_workflow_history(limit=2)
+    assert [r["sequence"] for r in page["executions"]] == [3, 2]
+    assert "result" not in page["executions"][0]
+    await engine.stop()
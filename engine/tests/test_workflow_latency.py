@@ -0,0 +1,121 @@
+"""
+Tests for workflow latency histograms.
+"""
+
+import random
+
+import pytest
+
+from codeflow_engine.config import CodeFlowConfig
+from codeflow_engine.workflows.base import YAMLWorkflow
+from codeflow_engine.workflows.engine import (
+    EXECUTION_METRIC,
+    QUEUE_WAIT_METRIC,
+    WorkflowEngine,
+)
+from codeflow_engine.workflows.latency import LatencyHistogram, LatencyMetrics
+
+
+def test_percentiles_within_bucket_resolution():
+    """Test that p50/p95/p99 estimates stay within the bucket error bound."""
+    histogram = LatencyHistogram()
+    rng = random.Random(7)
+    samples = sorted(rng.uniform(0.01, 2.0) for _ in range(5000))
+    for sample in samples:
+        histogram.record(sample, now=0.0)
+
+    snapshot = histogram.snapshot(now=0.0)
+
+    assert snapshot["count"] == 5000
+    assert snapshot["max"] == pytest.approx(samples[-1])
+    for pct in (50, 95, 99):
+        exact = samples[int(pct / 100 * len(samples)) - 1]
+        assert snapshot[f"p{pct}"] == pytest.approx(exact, rel=0.1)
+
+
+def test_tail_latency_visible():
+    """Test that a slow tail shows in p99 while the mean stays low."""
+    histogram = LatencyHistogram()
+    for _ in range(980):
+        histogram.record(0.05, now=0.0)
+    for _ in range(20):
+        histogram.record(4.0, now=0.0)
+
+    snapshot = histogram.snapshot(now=0.0)
+
+    assert snapshot["p50"] < 0.06
+    assert snapshot["p99"] > 3.0
+
+
+def test_sliding_window_expires_old_observations():
+    """Test that observations older than the window are dropped."""
+    histogram = LatencyHistogram(window_seconds=60, slots=6)
+    histogram.record(1.0, now=0.0)
+    histogram.record(2.0, now=55.0)
+
+    assert histogram.snapshot(now=55.0)["count"] == 2
+    assert histogram.snapshot(now=65.0)["count"] == 1
+    assert histogram.snapshot(now=200.0)["count"] == 0
+
+
+def test_prometheus_rendering():
+    """Test that histograms render cumulative buckets, sum and count."""
+    metrics = LatencyMetrics()
+    metrics.record("codeflow_test_seconds", 0.002, workflow="a")
+    metrics.record("codeflow_test_seconds", 0.5, workflow="a")
+
+    text = metrics.render_prometheus()
+
+    assert "# TYPE codeflow_test_seconds histogram" in text
+    assert 'codeflow_test_seconds_bucket{workflow="a",le="+Inf"} 2' in text
+    assert 'codeflow_test_seconds_count{workflow="a"} 2' in text
+    assert 'codeflow_test_seconds_sum{workflow="a"} 0.502000' in text
+
+
+def test_prometheus_buckets_do_not_expire():
+    """Test that exported buckets stay monotonic after the window moves on."""
+    histogram = LatencyHistogram(window_seconds=60, slots=6)
+    histogram.record(1.0, now=0.0)
+    histogram.record(2.0, now=200.0)
+
+    buckets, total, total_sum = histogram.prometheus_buckets()
+
+    assert histogram.snapshot(now=200.0)["count"] == 1
+    assert total == 2
+    assert total_sum == pytest.approx(3.0)
+    assert buckets[-1][1] == 2
+
+
+@pytest.mark.asyncio
+async def test_engine_reports_workflow_and_step_latency():
+    """Test that the engine records queue wait, execution and step latency separately."""
+    metrics = LatencyMetrics()
+    engine = WorkflowEngine(CodeFlowConfig(), latency_metrics=metrics)
+    await engine.start()
+    engine.register_workflow(
+        YAMLWorkflow(
+            "timed",
+            {"steps": [{"name": "pause", "type": "delay", "seconds": 0.05}]},
+        )
+    )
+
+    for _ in range(3):
+        await engine.execute_workflow("timed", {"workflow_name": "timed"})
+
+    latency = (await engine.get_metrics())["latency"]
+
+    (execution,) = latency[EXECUTION_METRIC]
+    assert execution["labels"] == {"workflow": "timed", "status": "success"}
+    assert execution["count"] == 3
+    assert execution["p50"] >= 0.04
+
+    (queue_wait,) = latency[QUEUE_WAIT_METRIC]
+    assert queue_wait["count"] == 3
+    assert queue_wait["max"] < 0.01
+
+    (step,) = latency["codeflow_workflow_step_seconds"]
+    assert step["labels"] == {"workflow": "timed", "step": "pause"}
+    assert step["count"] == 3
+
+    assert EXECUTION_METRIC in engine.render_prometheus_metrics()
+    await engine.stop()
@@ -0,0 +1,155 @@
+"""
+Tests for dependency-graph scheduling of YAML workflow steps.
+"""
+import asyncio
+import time
+import unittest
+
+from codeflow_engine.exceptions import WorkflowError
+from codeflow_engine.workflows.base import YAMLWorkflow
+
+
+class RecordingWorkflow(YAMLWorkflow):
+    """YAML workflow whose steps record their context and emit fixed outputs."""
+
+    def __init__(self, steps):
+        super().__init__(name="graph_workflow", yaml_config={"steps": steps})
+        self.seen_contexts = {}
+
+    async def _execute_step(self, step, context):
+        self.seen_contexts[step["name"]] = dict(context)
+        await asyncio.sleep(step.get("seconds", 0))
+        if step.get("fail"):
+            raise RuntimeError(f"{step['name']} failed")
+        return step.get("outputs", {})
+
+
+class TestStepGraphValidation(unittest.TestCase):
+    """Test suite for step graph construction."""
+
+    def test_sequential_workflow_has_no_graph(self):
+        """Test that workflows without depends_on keep sequential execution."""
+        workflow = YAMLWorkflow(
+            name="sequential",
+            yaml_config={"steps": [{"name": "a"}, {"name": "b"}]},
+        )
+
+        self.assertFalse(workflow.uses_dependency_graph)
+
+    def test_cycle_detected(self):
+        """Test that dependency cycles are rejected at load time."""
+        steps = [
+            {"name": "a", "depends_on": ["c"]},
+            {"name": "b", "depends_on": ["a"]},
+            {"name": "c", "depends_on": ["b"]},
+        ]
+
+        with self.assertRaises(WorkflowError) as ctx:
+            YAMLWorkflow(name="cyclic", yaml_config={"steps": steps})
+
+        self.assertIn("cycle", str(ctx.exception))
+
+    def test_unknown_dependency_rejected(self):
+        """Test that depending on a missing step is rejected."""
+        steps = [{"name": "a", "depends_on": "missing"}]
+
+        with self.assertRaises(WorkflowError) as ctx:
+            YAMLWorkflow(name="unknown", yaml_config={"steps": steps})
+
+        self.assertIn("missing", str(ctx.exception))
+
+    def test_duplicate_step_name_rejected(self):
+        """Test that duplicate step names are rejected in graph mode."""
+        steps = [{"name": "a"}, {"name": "a", "depends_on": []}]
+
+        with self.assertRaises(WorkflowError):
+            YAMLWorkflow(name="duplicate", yaml_config={"steps": steps})
+
+
+class TestStepGraphExecution(unittest.TestCase):
+    """Test suite for step graph execution."""
+
+    def test_independent_steps_run_concurrently(self):
+        """Test that steps without mutual dependencies overlap."""
+        workflow = RecordingWorkflow(
+            [
+                {"name": "label", "seconds": 0.2, "depends_on": []},
+                {"name": "size", "seconds": 0.2, "depends_on": []},
+                {"name": "license", "seconds": 0.2, "depends_on": []},
+            ]
+        )
+
+        start = time.monotonic()
+        result = asyncio.run(workflow.execute({}))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(result["steps_executed"], 3)
+        self.assertLess(elapsed, 0.5)
+
+    def test_context_merged_from_parents_only(self):
+        """Test that each step sees its dependencies' outputs and nothing else."""
+        workflow = RecordingWorkflow(
+            [
+                {"name": "fetch", "outputs": {"diff": "patch"}, "depends_on": []},
+                {"name": "lint", "outputs": {"lint_ok": True}, "depends_on": ["fetch"]},
+                {"name": "size", "outputs": {"size": "S"}, "depends_on": ["fetch"]},
+                {"name": "report", "depends_on": ["lint", "size"]},
+            ]
+        )
+
+        result = asyncio.run(workflow.execute({"pr": 1}))
+
+        self.assertEqual(workflow.seen_contexts["fetch"], {"pr": 1})
+        self.assertEqual(workflow.seen_contexts["lint"], {"pr": 1, "diff": "patch"})
+        self.assertNotIn("lint_ok", workflow.seen_contexts["size"])
+        self.assertEqual(
+            workflow.seen_contexts["report"],
+            {"pr": 1, "diff": "patch", "lint_ok": True, "size": "S"},
+        )
+        self.assertEqual(
+            [entry["step"] for entry in result["steps"]],
+            ["fetch", "lint", "size", "report"],
+        )
+        self.assertEqual(result["final_context"]["size"], "S")
+
+    def test_failure_skips_dependents_only(self):
+        """Test that a failed step skips its dependents but not other branches."""
+        workflow = RecordingWorkflow(
+            [
+                {"name": "broken", "fail": True, "depends_on": []},
+                {"name": "after_broken", "depends_on": ["broken"]},
+                {"name": "independent", "outputs": {"ok": True}, "depends_on": []},
+            ]
+        )
+
+        result = asyncio.run(workflow.execute({}))
+        statuses = {entry["step"]: entry["status"] for entry in result["steps"]}
+
+        self.assertEqual(statuses["broken"], "error")
+        self.assertEqual(statuses["after_broken"], "skipped")
+        self.assertEqual(statuses["independent"], "success")
+        self.assertEqual(result["steps_executed"], 2)
+
+    def test_continue_on_error_unblocks_dependents(self):
+        """Test that continue_on_error lets dependents run after a failure."""
+        workflow = RecordingWorkflow(
+            [
+                {
+                    "name": "flaky",
+                    "fail": True,
+                    "continue_on_error": True,
+                    "depends_on": [],
+                },
+                {"name": "after_flaky", "depends_on": ["flaky"]},
+            ]
+        )
+
+        result = asyncio.run(workflow.execute({}))
+        statuses = {entry["step"]: entry["status"] for entry in result["steps"]}
+
+        self.assertEqual(statuses["flaky"], "error")
+        self.assertEqual(statuses["after_flaky"], "success")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,8 @@ Tests security-critical input validation and sanitization functions.
 import pytest
 
 from codeflow_engine.workflows.validation import (
+    SUSPICIOUS_PATTERNS,
+    SanitizationCache,
     WorkflowContextValidator,
     validate_workflow_context,
     sanitize_workflow_parameters,
@@ -299,5 +301,68 @@ class TestSecurityPatterns:
             assert "suspicious pattern" in str(exc_info.value).lower()
 
 
+class TestSinglePassMatching:
+    """Tests for the combined suspicious-pattern matcher."""
+    
+    def test_every_pattern_detected_case_insensitively(self):
+        """Test that each pattern is found in any case and reported lowercased."""
+        for pattern in SUSPICIOUS_PATTERNS:
+            params = {"text": f"prefix {pattern.upper()} suffix"}
+            with pytest.raises(ValueError) as exc_info:
+                sanitize_workflow_parameters(params)
+            assert f"suspicious pattern: {pattern}" in str(exc_info.value)
+    
+    def test_tuples_checked_like_lists(self):
+        """Test that strings inside tuples are checked too."""
+        with pytest.raises(ValueError):
+            sanitize_workflow_parameters({"items": ("safe", "<script>")})
+
+
+class TestSanitizationCache:
+    """Tests for content-hash caching of sanitization verdicts."""
+    
+    def test_identical_payload_served_from_cache(self):
+        """Test that a repeated payload hits the cache and is returned as a copy."""
+        cache = SanitizationCache()
+        params = {"pr": {"title": "Fix bug", "files": ["a.py", "b.py"]}}
+        
+        first = sanitize_workflow_parameters(params, cache=cache)
+        second = sanitize_workflow_parameters(dict(params), cache=cache)
+        
+        assert first == second == params
+        assert cache.hits == 1
+        assert second["pr"] is not params["pr"]
+    
+    def test_rejection_cached(self):
+        """Test that a rejected payload is rejected again from the cache."""
+        cache = SanitizationCache()
+        params = {"body": {"html": "<script>alert(1)</script>"}}
+        
+        for _ in range(2):
+            with pytest.raises(ValueError) as exc_info:
+                sanitize_workflow_parameters(params, cache=cache)
+            assert "suspicious pattern" in str(exc_info.value)
+        assert cache.hits == 1
+    
+    def test_shared_subtree_reused(self):
+        """Test that a top-level value shared by different payloads is cached."""
+        cache = SanitizationCache()
+        diff = {"files": [{"patch": "+ print('hi')"}] * 50}
+        
+        sanitize_workflow_parameters({"run": 1, "diff": diff}, cache=cache)
+        sanitize_workflow_parameters({"run": 2, "diff": diff}, cache=cache)
+        
+        assert cache.hits == 1
+    
+    def test_eviction_bounded(self):
+        """Test that the cache keeps at most maxsize verdicts."""
+        cache = SanitizationCache(maxsize=2)
+        for i in range(5):
+            sanitize_workflow_parameters({"n": i}, cache=cache)
+        
+        sanitize_workflow_parameters({"n": 0}, cache=cache)
+        assert cache.hits == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,176 @@
+"""Unit tests for pooled action execution through the action registry."""
+
+import asyncio
+from typing import Any
+
+import pydantic
+import pytest
+
+from codeflow_engine.actions.base.action import Action
+from codeflow_engine.actions.pool import ACTION_LATENCY_METRIC
+from codeflow_engine.actions.registry import ActionRegistry
+from codeflow_engine.workflows.base import YAMLWorkflow
+from codeflow_engine.workflows.latency import LatencyMetrics
+
+
+class SlowEcho(Action[dict[str, Any], dict[str, Any]]):
+    """Action echoing its inputs after a short delay, tracking concurrency."""
+
+    constructed = 0
+    active = 0
+    peak = 0
+
+    def __init__(self, name: str, description: str = "") -> None:
+        super().__init__(name, description)
+        type(self).constructed += 1
+
+    async def execute(self, inputs: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            await asyncio.sleep(0.01)
+            if inputs.get("fail"):
+                msg = "requested failure"
+                raise RuntimeError(msg)
+            return {"echo": inputs.get("value"), "pr": context.get("pr_number")}
+        finally:
+            cls.active -= 1
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with only the test action registered."""
+    SlowEcho.constructed = SlowEcho.active = SlowEcho.peak = 0
+    action_registry = ActionRegistry(default_pool_size=2)
+    for name in action_registry.get_all_actions():
+        action_registry.unregister(name)
+    action_registry.register("echo", SlowEcho)
+    return action_registry
+
+
+class TestActionPool:
+    """Test suite for warm action instances."""
+
+    @pytest.mark.asyncio
+    async def test_instances_reused(self, registry):
+        """Test that sequential calls reuse one warm instance."""
+        for i in range(20):
+            result = await registry.execute_action("echo", {"value": i}, {})
+            assert result["echo"] == i
+
+        assert SlowEcho.constructed == 1
+        stats = registry.get_pool_stats()["echo"]
+        assert stats["calls"] == 20
+        assert stats["instances_created"] == 1
+        assert stats["average_time"] > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, registry):
+        """Test that concurrent calls never exceed the per-action limit."""
+        registry.set_concurrency_limit("echo", 3)
+
+        await asyncio.gather(
+            *(registry.execute_action("echo", {"value": i}, {}) for i in range(12))
+        )
+
+        assert SlowEcho.peak == 3
+        assert SlowEcho.constructed == 3
+        assert registry.get_pool_stats()["echo"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_timed_and_instance_kept(self, registry):
+        """Test that failures are recorded with latency and the instance stays warm."""
+        metrics = LatencyMetrics()
+
+        with pytest.raises(RuntimeError):
+            await registry.execute_action("echo", {"fail": True}, {}, metrics)
+        await registry.execute_action("echo", {"value": 1}, {}, metrics)
+
+        stats = registry.get_pool_stats()["echo"]
+        assert stats["failures"] == 1
+        assert SlowEcho.constructed == 1
+        series = {
+            entry["labels"]["status"]: entry["count"]
+            for entry in metrics.snapshot()[ACTION_LATENCY_METRIC]
+        }
+        assert series == {"error": 1, "success": 1}
+
+    @pytest.mark.asyncio
+    async def test_unknown_action(self, registry):
+        """Test that an unknown action raises KeyError."""
+        with pytest.raises(KeyError):
+            await registry.execute_action("missing", {}, {})
+
+
+class TestYAMLActionSteps:
+    """Test suite for YAML action steps running registry actions."""
+
+    @pytest.mark.asyncio
+    async def test_action_step_runs_registered_action(self, registry):
+        """Test that an action step executes the action with the workflow context."""
+        workflow = YAMLWorkflow(
+            "echo-workflow",
+            {
+                "steps": [
+                    {"name": "first", "type": "action", "action": "echo",
+                     "inputs": {"value": "a"}},
+                    {"name": "second", "type": "action", "action": "echo",
+                     "inputs": {"value": "b"}},
+                ]
+            },
+            action_registry=registry,
+        )
+
+        result = await workflow.execute({"pr_number": 7})
+
+        outputs = [step["result"]["output"] for step in result["steps"]]
+        assert outputs == [{"echo": "a", "pr": 7}, {"echo": "b", "pr": 7}]
+        assert SlowEcho.constructed == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_action_step_fails(self, registry):
+        """Test that a step naming an unregistered action fails."""
+        workflow = YAMLWorkflow(
+            "broken",
+            {"steps": [{"name": "bad", "type": "action", "action": "missing"}]},
+            action_registry=registry,
+        )
+
+        result = await workflow.execute({})
+
+        assert result["steps"][0]["status"] == "error"
+        assert "Unknown action 'missing'" in result["steps"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_action_step_runs_builtin_run_style_action(self):
+        """Test that a YAML step runs a built-in action implementing only run."""
+        workflow = YAMLWorkflow(
+            "comment-workflow",
+            {
+                "steps": [
+                    {
+                        "name": "comment",
+                        "type": "action",
+                        "action": "post_comment",
+                        "inputs": {"pull_request_number": 101, "comment": "Looks good"},
+                    }
+                ]
+            },
+            action_registry=ActionRegistry(),
+        )
+
+        result = await workflow.execute({})
+
+        step = result["steps"][0]
+        assert step["status"] == "success"
+        assert step["result"]["output"]["success"] is True
+        assert step["result"]["output"]["comment_url"].endswith("/issues/101#issuecomment-12345")
+
+    @pytest.mark.asyncio
+    async def test_invalid_inputs_fail_the_step(self):
+        """Test that inputs not matching the action's model fail validation."""
+        registry = ActionRegistry()
+
+        with pytest.raises(pydantic.ValidationError):
+            await registry.execute_action("post_comment", {"comment": "missing number"}, {})
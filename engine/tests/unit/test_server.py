@@ -114,6 +114,19 @@ class TestServerEndpoints:
         data = response.json()
         assert "openapi" in data or "info" in data
 
+    def test_metrics_endpoint(self, client):
+        """Test Prometheus latency metrics endpoint."""
+        from codeflow_engine.workflows.latency import default_latency_metrics
+
+        default_latency_metrics.record(
+            "codeflow_workflow_execution_seconds", 0.25, workflow="scraped", status="success"
+        )
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'codeflow_workflow_execution_seconds_count{status="success",workflow="scraped"}' in response.text
+
     def test_favicon_endpoint(self, client):
         """Test favicon endpoint."""
         response = client.get("/favicon.ico")
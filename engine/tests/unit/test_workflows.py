@@ -17,6 +17,10 @@ class TestWorkflowEngine:
         config.workflow_timeout = 300
         config.workflow_retry_attempts = 3
         config.workflow_retry_delay = 5
+        config.max_concurrent_workflows = 10
+        config.workflow_queue_depth = 100
+        config.sanitization_cache_size = 256
+        config.workflow_concurrency_limits = {}
         return config
 
     @pytest.fixture
@@ -102,3 +106,98 @@ class TestWorkflowEngine:
         running = engine.get_running_workflows()
         assert isinstance(running, list)
 
+
+class TestWorkflowEventIndex:
+    """Test cases for WorkflowEngine event dispatch index."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create a workflow engine instance."""
+        config = Mock(spec=CodeFlowConfig)
+        config.workflow_timeout = 300
+        config.max_concurrent_workflows = 10
+        config.workflow_queue_depth = 100
+        config.sanitization_cache_size = 256
+        config.workflow_concurrency_limits = {}
+        return WorkflowEngine(config)
+
+    @staticmethod
+    def make_workflow(name, events):
+        """Create a concrete workflow handling the given events."""
+        from codeflow_engine.workflows.base import Workflow
+
+        class EventWorkflow(Workflow):
+            async def execute(self, context):
+                return {}
+
+        workflow = EventWorkflow(name)
+        for event_type in events:
+            workflow.add_supported_event(event_type)
+        return workflow
+
+    def test_exact_event_lookup(self, engine):
+        """Test that only workflows registered for an event are matched."""
+        engine.register_workflow(self.make_workflow("labeler", ["pull_request"]))
+        engine.register_workflow(self.make_workflow("triage", ["issues"]))
+        engine.register_workflow(self.make_workflow("review", ["pull_request"]))
+
+        assert engine.get_workflows_for_event("pull_request") == ["labeler", "review"]
+        assert engine.get_workflows_for_event("issues") == ["triage"]
+        assert engine.get_workflows_for_event("push") == []
+
+    def test_wildcard_event_lookup(self, engine):
+        """Test that trailing-wildcard patterns match by prefix."""
+        engine.register_workflow(self.make_workflow("all", ["*"]))
+        engine.register_workflow(self.make_workflow("pr_any", ["pull_request.*"]))
+        engine.register_workflow(self.make_workflow("pr_opened", ["pull_request.opened"]))
+
+        assert engine.get_workflows_for_event("pull_request.opened") == [
+            "all",
+            "pr_any",
+            "pr_opened",
+        ]
+        assert engine.get_workflows_for_event("pull_request.closed") == ["all", "pr_any"]
+        assert engine.get_workflows_for_event("issues.opened") == ["all"]
+
+    def test_index_matches_handles_event(self, engine):
+        """Test that index dispatch agrees with Workflow.handles_event."""
+        workflows = [
+            self.make_workflow("a", ["push", "pull_request.*"]),
+            self.make_workflow("b", ["pull_request.opened"]),
+            self.make_workflow("c", ["issue*"]),
+        ]
+        for workflow in workflows:
+            engine.register_workflow(workflow)
+
+        for event_type in ["push", "pull_request.opened", "pull_request", "issues"]:
+            expected = [w.name for w in workflows if w.handles_event(event_type)]
+            assert engine.get_workflows_for_event(event_type) == expected
+
+    def test_add_supported_event_updates_index(self, engine):
+        """Test that events added after registration are indexed."""
+        workflow = self.make_workflow("late", [])
+        engine.register_workflow(workflow)
+        assert engine.get_workflows_for_event("push") == []
+
+        workflow.add_supported_event("push")
+        assert engine.get_workflows_for_event("push") == ["late"]
+
+    def test_unregister_removes_from_index(self, engine):
+        """Test that unregistered workflows are no longer dispatched or tracked."""
+        workflow = self.make_workflow("gone", ["push", "release.*"])
+        engine.register_workflow(workflow)
+        engine.unregister_workflow("gone")
+
+        assert engine.get_workflows_for_event("push") == []
+        assert engine.get_workflows_for_event("release.published") == []
+
+        workflow.add_supported_event("issues")
+        assert engine.get_workflows_for_event("issues") == []
+
+    def test_reregister_replaces_index_entries(self, engine):
+        """Test that re-registering a name drops the previous workflow's events."""
+        engine.register_workflow(self.make_workflow("same", ["push"]))
+        engine.register_workflow(self.make_workflow("same", ["issues"]))
+
+        assert engine.get_workflows_for_event("push") == []
+        assert engine.get_workflows_for_event("issues") == ["same"]